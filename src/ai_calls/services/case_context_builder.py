@@ -98,9 +98,8 @@ class CaseContextBuilder:
     def _get_case_facts(case) -> Dict[str, Any]:
         """Get case facts as dictionary, optimized with caching."""
         try:
-            case_facts = CaseFactSelector.get_by_case(case, use_cache=True)
-            # Convert to dict efficiently
-            return {fact.fact_key: fact.fact_value for fact in case_facts}
+            # Latest value per fact key, in one query
+            return CaseFactSelector.get_latest_facts(case.id, use_cache=True)
         except Exception as e:
             logger.warning(f"Error getting case facts for case {case.id}: {e}")
             return {}
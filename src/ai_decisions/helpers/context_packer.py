@@ -0,0 +1,158 @@
+"""
+Context Packer
+
+Fits retrieved context chunks into a token budget before they go into the AI
+reasoning prompt (AIReasoningService.run_ai_reasoning):
+
+1. Near-duplicates are dropped - chunks whose word shingles overlap heavily with a more
+   relevant chunk, e.g. the same passage from successive document versions.
+2. Adjacent chunks of the same document version are merged into one passage, removing
+   the text they share through the chunking overlap. A run is split where the merged
+   passage would exceed the token budget, so merging never makes text unusable.
+3. Passages are added by relevance (similarity) while they fit the token budget. If not
+   even the most relevant passage fits, it is truncated to the budget, so the prompt
+   always gets some context.
+
+Context dicts are those of AIReasoningService.retrieve_context ('text', 'source',
+'metadata', 'similarity', 'chunk_id', 'document_version_id', 'chunk_index'). Packed
+passages keep that shape and list every chunk they contain in 'chunk_ids'.
+"""
+import math
+from typing import Any, Dict, List, Optional, Set
+
+# Rough OpenAI tokenizer ratio for English text
+CHARS_PER_TOKEN = 4
+# Word shingle size and Jaccard similarity above which two chunks are near-duplicates
+SHINGLE_SIZE = 5
+DUPLICATE_JACCARD_THRESHOLD = 0.8
+# Shortest shared suffix/prefix treated as chunking overlap when merging adjacent chunks
+MIN_MERGE_OVERLAP_CHARS = 20
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text (~4 characters per token)."""
+    return math.ceil(len(text or '') / CHARS_PER_TOKEN)
+
+
+def pack_context(
+    chunks: List[Dict[str, Any]],
+    token_budget: Optional[int] = None,
+    duplicate_threshold: float = DUPLICATE_JACCARD_THRESHOLD
+) -> List[Dict[str, Any]]:
+    """
+    Deduplicate, merge and budget context chunks.
+
+    Args:
+        chunks: Context dicts (see module docstring)
+        token_budget: Maximum estimated tokens of passage text (None = unlimited)
+        duplicate_threshold: Shingle Jaccard similarity at which a chunk is a duplicate
+
+    Returns:
+        Packed passages, most relevant first, each with 'tokens' and 'chunk_ids'
+    """
+    if not chunks:
+        return []
+
+    by_relevance = sorted(chunks, key=lambda chunk: chunk.get('similarity') or 0.0, reverse=True)
+
+    # 1. Drop near-duplicates of more relevant chunks
+    kept: List[Dict[str, Any]] = []
+    kept_shingles: List[Set[int]] = []
+    for chunk in by_relevance:
+        chunk_shingles = _shingles(chunk.get('text', ''))
+        if any(_jaccard(chunk_shingles, other) >= duplicate_threshold for other in kept_shingles):
+            continue
+        kept.append(chunk)
+        kept_shingles.append(chunk_shingles)
+
+    # 2. Merge runs of adjacent chunks from the same document version
+    passages = _merge_adjacent(kept, token_budget)
+
+    # 3. Fill the budget by relevance, skipping passages that no longer fit
+    packed = []
+    used = 0
+    for passage in sorted(passages, key=lambda p: p.get('similarity') or 0.0, reverse=True):
+        if token_budget is not None and used + passage['tokens'] > token_budget:
+            continue
+        packed.append(passage)
+        used += passage['tokens']
+
+    if not packed and passages:
+        packed.append(_truncate(max(passages, key=lambda p: p.get('similarity') or 0.0), token_budget))
+    return packed
+
+
+def _merge_adjacent(chunks: List[Dict[str, Any]], token_budget: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Merge chunks with consecutive chunk_index in the same document version (within the budget)."""
+    passages = []
+    groups: Dict[Any, List[Dict[str, Any]]] = {}
+    for chunk in chunks:
+        version_id = chunk.get('document_version_id')
+        if version_id is None or chunk.get('chunk_index') is None:
+            passages.append(_passage([chunk]))
+        else:
+            groups.setdefault(version_id, []).append(chunk)
+
+    for group in groups.values():
+        group.sort(key=lambda chunk: chunk['chunk_index'])
+        run = [group[0]]
+        for chunk in group[1:]:
+            if chunk['chunk_index'] == run[-1]['chunk_index'] + 1 and _fits(run + [chunk], token_budget):
+                run.append(chunk)
+            else:
+                passages.append(_passage(run))
+                run = [chunk]
+        passages.append(_passage(run))
+    return passages
+
+
+def _fits(run: List[Dict[str, Any]], token_budget: Optional[int]) -> bool:
+    return token_budget is None or _passage(run)['tokens'] <= token_budget
+
+
+def _truncate(passage: Dict[str, Any], token_budget: Optional[int]) -> Dict[str, Any]:
+    """Cut a passage down to the token budget."""
+    if token_budget is None or passage['tokens'] <= token_budget:
+        return passage
+    passage = dict(passage)
+    passage['text'] = passage['text'][:token_budget * CHARS_PER_TOKEN]
+    passage['tokens'] = estimate_tokens(passage['text'])
+    passage['truncated'] = True
+    return passage
+
+
+def _passage(run: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """One passage from a run of adjacent chunks (or a single chunk)."""
+    best = max(run, key=lambda chunk: chunk.get('similarity') or 0.0)
+    text = run[0].get('text', '')
+    for chunk in run[1:]:
+        text = _join_overlapping(text, chunk.get('text', ''))
+
+    passage = dict(best)
+    passage['text'] = text
+    passage['chunk_id'] = run[0].get('chunk_id')
+    passage['chunk_ids'] = [chunk.get('chunk_id') for chunk in run if chunk.get('chunk_id')]
+    passage['chunk_index'] = run[0].get('chunk_index')
+    passage['tokens'] = estimate_tokens(text)
+    return passage
+
+
+def _join_overlapping(first: str, second: str) -> str:
+    """Concatenate two consecutive chunks, dropping the text they share at the seam."""
+    for size in range(min(len(first), len(second)), MIN_MERGE_OVERLAP_CHARS - 1, -1):
+        if first.endswith(second[:size]):
+            return first + second[size:]
+    return f"{first}\n{second}"
+
+
+def _shingles(text: str) -> Set[int]:
+    words = text.lower().split()
+    if len(words) <= SHINGLE_SIZE:
+        return {hash(' '.join(words))} if words else set()
+    return {hash(' '.join(words[i:i + SHINGLE_SIZE])) for i in range(len(words) - SHINGLE_SIZE + 1)}
+
+
+def _jaccard(first: Set[int], second: Set[int]) -> float:
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
@@ -0,0 +1,88 @@
+"""
+Eligibility Recheck Queue
+
+Debounces the incremental eligibility re-checks queued by CaseFact writes, so a client
+filling in many facts one request at a time triggers one re-check per case, not one
+per fact.
+
+State lives in the shared Django cache, so batching holds across web workers:
+
+- Each committed write takes a sequence number for the case and stores its changed
+  fact keys under it (no read-modify-write, so concurrent writers lose no keys).
+- The first write of a batch claims the case's "scheduled" marker and enqueues the
+  re-check task with a countdown (ELIGIBILITY_RECHECK_DEBOUNCE_SECONDS); later writes
+  only add their keys.
+- The task releases the marker before collecting the keys, so a write landing while
+  it runs schedules the next batch rather than being dropped.
+"""
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+
+from main_system.utils.cache_utils import cache_add, cache_delete, cache_get, cache_incr, cache_set
+
+KEY_PREFIX = 'eligibility_recheck'
+# Entries outlive any debounce window; expired ones only mean a missed re-check
+STATE_TTL_SECONDS = 24 * 60 * 60
+
+
+class EligibilityRecheckQueue:
+    """Per-case batches of changed fact keys waiting for a re-check."""
+
+    @staticmethod
+    def debounce_seconds() -> int:
+        return getattr(settings, 'ELIGIBILITY_RECHECK_DEBOUNCE_SECONDS', 30)
+
+    @staticmethod
+    def add(case_id: str, fact_keys: Iterable[str]) -> Optional[int]:
+        """
+        Add changed fact keys to the case's pending batch.
+
+        Returns:
+            Sequence number to start the batch from if this call opened a new batch
+            (the caller schedules the re-check), else None
+        """
+        seq = _next_seq(case_id)
+        cache_set(_keys_key(case_id, seq), sorted(set(fact_keys)), timeout=STATE_TTL_SECONDS)
+        if cache_add(_scheduled_key(case_id), seq, timeout=STATE_TTL_SECONDS):
+            return seq
+        return None
+
+    @staticmethod
+    def take(case_id: str, first_seq: int) -> List[str]:
+        """
+        Release the case's batch and return its changed fact keys (sorted).
+
+        Keys already taken by an overlapping batch are skipped.
+        """
+        cache_delete(_scheduled_key(case_id))
+        last_seq = int(cache_get(_seq_key(case_id), first_seq) or first_seq)
+        changed = set()
+        for seq in range(first_seq, last_seq + 1):
+            key = _keys_key(case_id, seq)
+            changed.update(cache_get(key) or ())
+            cache_delete(key)
+        return sorted(changed)
+
+
+def _next_seq(case_id: str) -> int:
+    key = _seq_key(case_id)
+    cache_add(key, 0, timeout=STATE_TTL_SECONDS)
+    try:
+        return cache_incr(key)
+    except ValueError:
+        # Expired between add and incr
+        cache_add(key, 1, timeout=STATE_TTL_SECONDS)
+        return 1
+
+
+def _seq_key(case_id: str) -> str:
+    return f"{KEY_PREFIX}:{case_id}:seq"
+
+
+def _keys_key(case_id: str, seq: int) -> str:
+    return f"{KEY_PREFIX}:{case_id}:keys:{seq}"
+
+
+def _scheduled_key(case_id: str) -> str:
+    return f"{KEY_PREFIX}:{case_id}:scheduled"
@@ -0,0 +1,75 @@
+"""
+Embedding Cache
+
+Process-local LRU of embeddings keyed by (sha256(text), model).
+
+This is the in-memory front of the persistent `EmbeddingCacheEntry` store used by
+EmbeddingService.generate_embeddings: lookups go LRU -> database -> embedding API,
+and every level fills the ones above it. Embeddings for a given text and model never
+change, so entries need no invalidation; the LRU is only bounded in size.
+
+Vectors are held as float32 arrays (~6 KB per 1536-dim embedding instead of ~49 KB
+as a tuple of Python floats), which is the precision pgvector stores them in.
+"""
+import hashlib
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Tuple
+
+from django.conf import settings
+
+
+class EmbeddingCache:
+    """Bounded LRU of embedding vectors."""
+
+    DEFAULT_MAX_ENTRIES = 5000
+
+    _entries: "OrderedDict[Tuple[str, str], array]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def content_hash(text: str) -> str:
+        """SHA-256 hex digest used as the cache key for a text."""
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def max_entries(cls) -> int:
+        return getattr(settings, 'EMBEDDING_CACHE_MAX_ENTRIES', cls.DEFAULT_MAX_ENTRIES)
+
+    @classmethod
+    def get_many(cls, model: str, content_hashes: Iterable[str]) -> Dict[str, List[float]]:
+        """
+        Look up embeddings for several hashes.
+
+        Returns:
+            Mapping of content hash -> embedding for the hashes that are cached
+        """
+        found = {}
+        with cls._lock:
+            for content_hash in content_hashes:
+                key = (content_hash, model)
+                embedding = cls._entries.get(key)
+                if embedding is not None:
+                    cls._entries.move_to_end(key)
+                    found[content_hash] = embedding.tolist()
+        return found
+
+    @classmethod
+    def put_many(cls, model: str, embeddings_by_hash: Dict[str, List[float]]) -> None:
+        """Store embeddings, evicting the least recently used entries beyond the bound."""
+        max_entries = cls.max_entries()
+        if max_entries <= 0:
+            return
+        with cls._lock:
+            for content_hash, embedding in embeddings_by_hash.items():
+                key = (content_hash, model)
+                cls._entries[key] = array('f', embedding)
+                cls._entries.move_to_end(key)
+            while len(cls._entries) > max_entries:
+                cls._entries.popitem(last=False)
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._entries.clear()
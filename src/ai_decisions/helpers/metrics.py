@@ -150,6 +150,20 @@ if Counter and Histogram:
         buckets=(128, 256, 512, 768, 1024, 1536, 2048)
     )
     
+    embedding_cache_lookups_total = _safe_create_metric(
+        Counter,
+        'ai_decisions_embedding_cache_lookups_total',
+        'Total number of texts looked up in the embedding cache',
+        ['model', 'result']  # result: memory_hit, store_hit, miss
+    )
+    
+    reasoning_cache_lookups_total = _safe_create_metric(
+        Counter,
+        'ai_decisions_reasoning_cache_lookups_total',
+        'Total number of AI reasoning cache lookups',
+        ['model', 'result']  # result: exact_hit, semantic_hit, miss
+    )
+    
     # Citation Metrics
     citations_extracted_total = _safe_create_metric(
         Counter,
@@ -198,6 +212,8 @@ else:
     embedding_generations_total = None
     embedding_generation_duration_seconds = None
     embedding_dimensions = None
+    embedding_cache_lookups_total = None
+    reasoning_cache_lookups_total = None
     citations_extracted_total = None
     citations_per_reasoning = None
     eligibility_conflicts_total = None
@@ -302,6 +318,31 @@ def track_embedding_generation(model: str, status: str, duration: float, dimensi
         embedding_dimensions.labels(model=model).observe(dimensions)
 
 
+def track_embedding_cache_lookup(model: str, result: str, count: int = 1):
+    """
+    Track embedding cache lookups.
+    
+    Args:
+        model: Model name (e.g., 'text-embedding-ada-002')
+        result: 'memory_hit', 'store_hit', 'miss'
+        count: Number of texts
+    """
+    if embedding_cache_lookups_total and count:
+        embedding_cache_lookups_total.labels(model=model, result=result).inc(count)
+
+
+def track_reasoning_cache_lookup(model: str, result: str):
+    """
+    Track AI reasoning cache lookups.
+    
+    Args:
+        model: LLM model name
+        result: 'exact_hit', 'semantic_hit', 'miss'
+    """
+    if reasoning_cache_lookups_total:
+        reasoning_cache_lookups_total.labels(model=model, result=result).inc()
+
+
 def track_citations_extracted(source_type: str, count: int):
     """
     Track citation extraction metrics.
@@ -0,0 +1,37 @@
+"""
+Rank Fusion
+
+Reciprocal-rank fusion (RRF) of several ranked result lists, used by
+PgVectorService.search_hybrid to merge the full-text and vector rankings.
+
+RRF only looks at positions, so it needs no calibration between ts_rank scores and
+cosine distances: score(d) = sum over lists of 1 / (k + rank(d)), rank starting at 1.
+"""
+from typing import Hashable, Iterable, List, Sequence, Tuple
+
+DEFAULT_RRF_K = 60
+
+
+def reciprocal_rank_fusion(
+    rankings: Iterable[Sequence[Hashable]],
+    k: int = DEFAULT_RRF_K
+) -> List[Tuple[Hashable, float]]:
+    """
+    Merge ranked lists with reciprocal-rank fusion.
+
+    Args:
+        rankings: Ranked lists of ids (best first); duplicates within a list count once
+        k: Damping constant; larger values flatten the advantage of top ranks
+
+    Returns:
+        List of (id, score) ordered by fused score (ties keep first-seen order)
+    """
+    scores = {}
+    for ranking in rankings:
+        seen = set()
+        for rank, item in enumerate(ranking, start=1):
+            if item in seen:
+                continue
+            seen.add(item)
+            scores[item] = scores.get(item, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda entry: entry[1], reverse=True)
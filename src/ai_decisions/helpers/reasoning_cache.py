@@ -0,0 +1,239 @@
+"""
+Reasoning Cache
+
+Shared cache (Django cache / Redis) of LLM responses for AI eligibility reasoning.
+
+Cases for the same visa type often have the same fact pattern, the same rule results
+and the same retrieved context, so they would produce the same prompt. Entries are
+grouped by a *scope* and keyed within it by the normalized case facts:
+
+- scope: LLM model, prompt template version, rule_version_id, the rule results
+  (minus the evaluation timestamp), the `rules_knowledge:rule_versions` namespace
+  version, and the id + text hash of every context chunk
+- entry: sha256 of the normalized facts (strings lowercased and whitespace-collapsed,
+  empty values dropped, integral floats written as ints; values are otherwise exact)
+
+Changing the rule version, editing rules (namespace bump), or any change to the
+retrieved chunks therefore yields a new scope, so stale entries are never read and
+simply expire (TTL). Within a scope, AI_REASONING_CACHE_SEMANTIC_THRESHOLD optionally
+allows reuse for facts whose query embedding is at least that cosine-similar to a
+cached entry's; each scope keeps the embeddings of its most recently used entries
+(bounded LRU list).
+
+Cache failures never fail reasoning: lookups degrade to misses.
+"""
+import hashlib
+import json
+import logging
+import math
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from main_system.utils.cache_utils import bump_namespace, get_namespace_version
+from rules_knowledge.helpers.active_rule_version_cache import NAMESPACE as RULE_VERSIONS_NAMESPACE
+
+logger = logging.getLogger('django')
+
+NAMESPACE = 'ai_decisions:reasoning_cache'
+
+
+class ReasoningCache:
+    """Exact and semantic lookup of cached LLM reasoning responses."""
+
+    KEY_PREFIX = 'ai_reasoning_cache'
+    DEFAULT_TTL_SECONDS = 24 * 60 * 60
+    DEFAULT_SEMANTIC_CANDIDATES = 20
+    # Rule result fields that differ between otherwise identical evaluations
+    VOLATILE_RULE_RESULT_KEYS = ('evaluation_date',)
+    # Rule result lists built from sets (their order differs between processes)
+    UNORDERED_RULE_RESULT_KEYS = ('missing_facts',)
+
+    @staticmethod
+    def enabled() -> bool:
+        return getattr(settings, 'AI_REASONING_CACHE_ENABLED', True)
+
+    @classmethod
+    def ttl(cls) -> int:
+        return getattr(settings, 'AI_REASONING_CACHE_TTL_SECONDS', cls.DEFAULT_TTL_SECONDS)
+
+    @staticmethod
+    def semantic_threshold() -> Optional[float]:
+        """Minimum cosine similarity for semantic reuse (None = exact matches only)."""
+        return getattr(settings, 'AI_REASONING_CACHE_SEMANTIC_THRESHOLD', None)
+
+    @classmethod
+    def max_candidates(cls) -> int:
+        return getattr(settings, 'AI_REASONING_CACHE_SEMANTIC_CANDIDATES', cls.DEFAULT_SEMANTIC_CANDIDATES)
+
+    @staticmethod
+    def normalize_facts(case_facts: Dict[str, Any]) -> Dict[str, Any]:
+        """Canonical form of case facts used as the exact-match key."""
+        return _normalize(case_facts or {})
+
+    @classmethod
+    def scope_key(
+        cls,
+        model: str,
+        template_version: str,
+        rule_results: Optional[Dict[str, Any]],
+        context_chunks: Optional[List[Dict[str, Any]]]
+    ) -> str:
+        """
+        Scope of entries that share model, prompt template, rules and context.
+
+        Args:
+            model: LLM model name
+            template_version: Prompt template version
+            rule_results: Rule engine results included in the prompt
+            context_chunks: Context dicts included in the prompt
+
+        Returns:
+            Hex digest identifying the scope
+        """
+        rule_results = {
+            key: sorted(value, key=str) if key in cls.UNORDERED_RULE_RESULT_KEYS and value else value
+            for key, value in (rule_results or {}).items()
+            if key not in cls.VOLATILE_RULE_RESULT_KEYS
+        }
+        material = {
+            'model': model,
+            'template': template_version,
+            'rule_version_id': rule_results.get('rule_version_id'),
+            'rule_results': rule_results,
+            'rules_namespace': get_namespace_version(RULE_VERSIONS_NAMESPACE),
+            'cache_namespace': get_namespace_version(NAMESPACE),
+            'chunks': [
+                [chunk.get('chunk_ids') or [chunk.get('chunk_id')], _sha256(chunk.get('text', ''))]
+                for chunk in (context_chunks or [])
+            ],
+        }
+        return _sha256(_dumps(material))
+
+    @classmethod
+    def get(
+        cls,
+        scope: str,
+        case_facts: Dict[str, Any],
+        fact_embedding: Optional[List[float]] = None
+    ) -> Tuple[Optional[Dict[str, Any]], str]:
+        """
+        Look up a cached response.
+
+        Args:
+            scope: scope_key() of the prompt
+            case_facts: Case facts of the prompt
+            fact_embedding: Query embedding of the facts (enables semantic lookup)
+
+        Returns:
+            Tuple of (cached value or None, 'exact_hit' | 'semantic_hit' | 'miss')
+        """
+        try:
+            fact_hash = _sha256(_dumps(cls.normalize_facts(case_facts)))
+            value = cache.get(cls._entry_key(scope, fact_hash))
+            if value is not None:
+                cls._touch_candidate(scope, fact_hash)
+                return value, 'exact_hit'
+
+            threshold = cls.semantic_threshold()
+            if threshold is None or not fact_embedding:
+                return None, 'miss'
+
+            best_hash, best_similarity = None, threshold
+            candidates = cache.get(cls._candidates_key(scope)) or []
+            for candidate_hash, packed_embedding in candidates:
+                similarity = _cosine(fact_embedding, array('f', packed_embedding))
+                if similarity >= best_similarity:
+                    best_hash, best_similarity = candidate_hash, similarity
+            if best_hash is None:
+                return None, 'miss'
+
+            value = cache.get(cls._entry_key(scope, best_hash))
+            if value is None:
+                return None, 'miss'
+            cls._touch_candidate(scope, best_hash)
+            return value, 'semantic_hit'
+        except Exception as e:
+            logger.warning(f"Reasoning cache lookup failed: {e}")
+            return None, 'miss'
+
+    @classmethod
+    def put(
+        cls,
+        scope: str,
+        case_facts: Dict[str, Any],
+        value: Dict[str, Any],
+        fact_embedding: Optional[List[float]] = None
+    ) -> None:
+        """Store a response for a scope and case facts (and its embedding for semantic lookup)."""
+        try:
+            fact_hash = _sha256(_dumps(cls.normalize_facts(case_facts)))
+            cache.set(cls._entry_key(scope, fact_hash), value, timeout=cls.ttl())
+            if fact_embedding and cls.semantic_threshold() is not None:
+                cls._touch_candidate(scope, fact_hash, array('f', fact_embedding).tobytes())
+        except Exception as e:
+            logger.warning(f"Reasoning cache store failed: {e}")
+
+    @staticmethod
+    def invalidate() -> None:
+        """Invalidate every cached response (e.g. after a prompt or model change without a version bump)."""
+        bump_namespace(NAMESPACE)
+
+    @classmethod
+    def _entry_key(cls, scope: str, fact_hash: str) -> str:
+        return f"{cls.KEY_PREFIX}:entry:{scope}:{fact_hash}"
+
+    @classmethod
+    def _candidates_key(cls, scope: str) -> str:
+        return f"{cls.KEY_PREFIX}:candidates:{scope}"
+
+    @classmethod
+    def _touch_candidate(cls, scope: str, fact_hash: str, packed_embedding: Optional[bytes] = None) -> None:
+        """Move (or add) an entry to the front of its scope's semantic candidate list."""
+        if cls.semantic_threshold() is None:
+            return
+        key = cls._candidates_key(scope)
+        candidates = cache.get(key) or []
+        existing = next((packed for candidate_hash, packed in candidates if candidate_hash == fact_hash), None)
+        packed_embedding = packed_embedding or existing
+        if packed_embedding is None:
+            return
+        candidates = [(fact_hash, packed_embedding)] + [
+            candidate for candidate in candidates if candidate[0] != fact_hash
+        ]
+        cache.set(key, candidates[:cls.max_candidates()], timeout=cls.ttl())
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, str):
+        return ' '.join(value.lower().split())
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else value
+    if isinstance(value, dict):
+        return {
+            str(key): _normalize(item) for key, item in sorted(value.items(), key=lambda kv: str(kv[0]))
+            if item is not None and item != '' and item != [] and item != {}
+        }
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, default=str, separators=(',', ':'))
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _cosine(first, second) -> float:
+    if len(first) != len(second):
+        return -1.0
+    dot = sum(a * b for a, b in zip(first, second))
+    norm = math.sqrt(sum(a * a for a in first)) * math.sqrt(sum(b * b for b in second))
+    return dot / norm if norm else -1.0
@@ -0,0 +1,116 @@
+"""
+Retrieval Benchmark
+
+Measures the latency and quality of a vector backend over a query set, for a grid of
+search settings (limit, similarity_threshold, IVF probes). Used by
+`manage.py benchmark_vector_search` against the in-process NumPy backend, so
+retrieval settings can be tuned without touching the production database.
+
+Quality is reported two ways:
+- recall_vs_exact: overlap with an exact (brute-force) search under the same limit and
+  threshold - what approximate search loses.
+- relevant_recall / mrr: against the relevant chunk ids of each query, when known
+  (labelled queries, or the source chunk of a sampled query).
+"""
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+
+@dataclass
+class BenchmarkQuery:
+    embedding: List[float]
+    relevant_ids: Set[str] = field(default_factory=set)
+    filters: Optional[Dict[str, Any]] = None
+
+
+def sample_queries(backend: Any, count: int, seed: int = 0) -> List[BenchmarkQuery]:
+    """
+    Use stored chunk embeddings as queries; each query's relevant result is its own chunk.
+
+    Args:
+        backend: NumpyVectorBackend
+        count: Number of chunks to sample
+        seed: Random seed
+    """
+    positions = random.Random(seed).sample(range(len(backend)), min(count, len(backend)))
+    queries = []
+    for position in positions:
+        record, embedding = backend.chunk_embedding(position)
+        queries.append(BenchmarkQuery(embedding=[float(x) for x in embedding], relevant_ids={record.id}))
+    return queries
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def run_retrieval_benchmark(
+    backend: Any,
+    queries: List[BenchmarkQuery],
+    limits: Iterable[int] = (5, 10),
+    thresholds: Iterable[float] = (0.7,),
+    probes: Iterable[Optional[int]] = (None,)
+) -> List[Dict[str, Any]]:
+    """
+    Run every query for every combination of settings.
+
+    Args:
+        backend: NumpyVectorBackend (search() must accept n_probes)
+        queries: Benchmark queries
+        limits: Result limits to try
+        thresholds: Similarity thresholds to try
+        probes: IVF probes to try (None = backend default, 0 = exact search)
+
+    Returns:
+        One dict per combination with limit, similarity_threshold, n_probes, p50_ms,
+        p95_ms, mean_results, recall_vs_exact, relevant_recall and mrr
+    """
+    rows = []
+    for limit in limits:
+        for threshold in thresholds:
+            exact = [
+                {chunk.id for chunk in backend.search(
+                    [query.embedding], limit=limit, filters=[query.filters],
+                    similarity_threshold=threshold, n_probes=0
+                )[0]}
+                for query in queries
+            ]
+            for n_probes in probes:
+                latencies, results = [], []
+                for query in queries:
+                    start = time.perf_counter()
+                    found = backend.search(
+                        [query.embedding], limit=limit, filters=[query.filters],
+                        similarity_threshold=threshold, n_probes=n_probes
+                    )[0]
+                    latencies.append((time.perf_counter() - start) * 1000)
+                    results.append([chunk.id for chunk in found])
+
+                overlaps = [
+                    len(expected & set(found)) / len(expected)
+                    for expected, found in zip(exact, results) if expected
+                ]
+                labelled = [(query.relevant_ids, found) for query, found in zip(queries, results) if query.relevant_ids]
+                relevant_recall = [len(relevant & set(found)) / len(relevant) for relevant, found in labelled]
+                reciprocal_ranks = [
+                    next((1.0 / rank for rank, chunk_id in enumerate(found, start=1) if chunk_id in relevant), 0.0)
+                    for relevant, found in labelled
+                ]
+
+                rows.append({
+                    'limit': limit,
+                    'similarity_threshold': threshold,
+                    'n_probes': n_probes,
+                    'p50_ms': _percentile(latencies, 0.5),
+                    'p95_ms': _percentile(latencies, 0.95),
+                    'mean_results': sum(len(found) for found in results) / len(results) if results else 0.0,
+                    'recall_vs_exact': sum(overlaps) / len(overlaps) if overlaps else None,
+                    'relevant_recall': sum(relevant_recall) / len(relevant_recall) if relevant_recall else None,
+                    'mrr': sum(reciprocal_ranks) / len(reciprocal_ranks) if reciprocal_ranks else None,
+                })
+    return rows
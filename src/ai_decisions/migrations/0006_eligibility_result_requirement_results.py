@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_decisions", "0005_ai_decisions_soft_delete_and_optimistic_locking"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="eligibilityresult",
+            name="requirement_results",
+            field=models.JSONField(
+                blank=True,
+                help_text="Per-requirement rule engine results (used for incremental re-evaluation)",
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-16 21:45
+
+import uuid
+
+import pgvector.django.vector
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_decisions", "0006_eligibility_result_requirement_results"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EmbeddingCacheEntry",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False
+                    ),
+                ),
+                (
+                    "content_hash",
+                    models.CharField(help_text="SHA-256 hex digest of the embedded text", max_length=64),
+                ),
+                (
+                    "model",
+                    models.CharField(help_text="Embedding model that produced the vector", max_length=100),
+                ),
+                ("embedding", pgvector.django.vector.VectorField(help_text="Embedding vector")),
+                ("dimensions", models.IntegerField(help_text="Number of dimensions of the embedding")),
+                ("created_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                "verbose_name_plural": "Embedding Cache Entries",
+                "db_table": "embedding_cache_entries",
+                "constraints": [
+                    models.UniqueConstraint(fields=("content_hash", "model"), name="uniq_embedding_cache_hash_model")
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_decisions", "0007_embedding_cache_entry"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="aireasoninglog",
+            name="cached_from",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="Reasoning log whose LLM response was reused from the reasoning cache (null = fresh LLM call)",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="cache_reuses",
+                to="ai_decisions.aireasoninglog",
+            ),
+        ),
+    ]
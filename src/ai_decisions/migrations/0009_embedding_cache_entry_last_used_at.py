@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_decisions", "0008_ai_reasoning_log_cached_from"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="embeddingcacheentry",
+            name="last_used_at",
+            field=models.DateTimeField(
+                db_index=True,
+                default=django.utils.timezone.now,
+                help_text="Last time the entry was read (refreshed at most once per day); unused entries are pruned",
+            ),
+        ),
+    ]
@@ -1,10 +1,12 @@
 from .eligibility_result import EligibilityResult
 from .ai_reasoning_log import AIReasoningLog
 from .ai_citation import AICitation
+from .embedding_cache_entry import EmbeddingCacheEntry
 
 __all__ = [
     'EligibilityResult',
     'AIReasoningLog',
     'AICitation',
+    'EmbeddingCacheEntry',
 ]
 
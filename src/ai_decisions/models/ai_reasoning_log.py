@@ -38,6 +38,15 @@ class AIReasoningLog(models.Model):
         help_text="Number of tokens used in the API call"
     )
     
+    cached_from = models.ForeignKey(
+        'self',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='cache_reuses',
+        help_text="Reasoning log whose LLM response was reused from the reasoning cache (null = fresh LLM call)"
+    )
+    
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
 
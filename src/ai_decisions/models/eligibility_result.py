@@ -67,6 +67,12 @@ class EligibilityResult(models.Model):
         help_text="List of missing facts if outcome is 'missing_facts'"
     )
     
+    requirement_results = models.JSONField(
+        null=True,
+        blank=True,
+        help_text="Per-requirement rule engine results (used for incremental re-evaluation)"
+    )
+    
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -0,0 +1,50 @@
+import uuid
+from django.db import models
+from django.utils import timezone
+from pgvector.django import VectorField
+
+
+class EmbeddingCacheEntry(models.Model):
+    """
+    Persistent embedding cache keyed by (sha256(text), model).
+    Shared by the ingestion (chunk embedding) and query (RAG retrieval) paths so
+    identical texts are only sent to the embedding API once per model.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False, db_index=True)
+
+    content_hash = models.CharField(
+        max_length=64,
+        help_text="SHA-256 hex digest of the embedded text"
+    )
+
+    model = models.CharField(
+        max_length=100,
+        help_text="Embedding model that produced the vector"
+    )
+
+    # No fixed dimensions: different models produce different vector sizes
+    embedding = VectorField(
+        help_text="Embedding vector"
+    )
+
+    dimensions = models.IntegerField(
+        help_text="Number of dimensions of the embedding"
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    last_used_at = models.DateTimeField(
+        default=timezone.now,
+        db_index=True,
+        help_text="Last time the entry was read (refreshed at most once per day); unused entries are pruned"
+    )
+
+    class Meta:
+        db_table = 'embedding_cache_entries'
+        constraints = [
+            models.UniqueConstraint(fields=['content_hash', 'model'], name='uniq_embedding_cache_hash_model'),
+        ]
+        verbose_name_plural = 'Embedding Cache Entries'
+
+    def __str__(self):
+        return f"{self.model}:{self.content_hash[:12]}"
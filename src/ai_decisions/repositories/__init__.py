@@ -1,10 +1,12 @@
 from .eligibility_result_repository import EligibilityResultRepository
 from .ai_reasoning_log_repository import AIReasoningLogRepository
 from .ai_citation_repository import AICitationRepository
+from .embedding_cache_repository import EmbeddingCacheRepository
 
 __all__ = [
     'EligibilityResultRepository',
     'AIReasoningLogRepository',
     'AICitationRepository',
+    'EmbeddingCacheRepository',
 ]
 
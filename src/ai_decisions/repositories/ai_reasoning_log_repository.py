@@ -11,7 +11,7 @@ class AIReasoningLogRepository:
 
     @staticmethod
     def create_reasoning_log(case: Case, prompt: str, response: str, model_name: str,
-                            tokens_used: int = None):
+                            tokens_used: int = None, cached_from_id: str = None):
         """Create a new AI reasoning log."""
         with transaction.atomic():
             log = AIReasoningLog.objects.create(
@@ -20,6 +20,7 @@ class AIReasoningLogRepository:
                 response=response,
                 model_name=model_name,
                 tokens_used=tokens_used,
+                cached_from_id=cached_from_id,
                 version=1,
                 is_deleted=False,
             )
@@ -14,7 +14,7 @@ class EligibilityResultRepository:
     @staticmethod
     def create_eligibility_result(case: Case, visa_type: VisaType, rule_version: VisaRuleVersion,
                                  outcome: str, confidence: float = 0.0, reasoning_summary: str = None,
-                                 missing_facts: dict = None):
+                                 missing_facts: dict = None, requirement_results: list = None):
         """Create a new eligibility result."""
         with transaction.atomic():
             result = EligibilityResult.objects.create(
@@ -25,6 +25,7 @@ class EligibilityResultRepository:
                 confidence=confidence,
                 reasoning_summary=reasoning_summary,
                 missing_facts=missing_facts,
+                requirement_results=requirement_results,
                 version=1,
                 is_deleted=False,
             )
@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List
+from django.db import transaction
+from django.utils import timezone
+from ai_decisions.models.embedding_cache_entry import EmbeddingCacheEntry
+
+
+class EmbeddingCacheRepository:
+    """Repository for EmbeddingCacheEntry write operations."""
+
+    BATCH_SIZE = 500
+    # last_used_at is refreshed at most this often, so hot entries cost one UPDATE a day
+    TOUCH_INTERVAL = timedelta(days=1)
+
+    @staticmethod
+    def store_many(model: str, embeddings_by_hash: Dict[str, List[float]]) -> int:
+        """
+        Store embeddings for a model; entries that already exist are left unchanged.
+
+        Args:
+            model: Embedding model name
+            embeddings_by_hash: Mapping of content hash -> embedding vector
+
+        Returns:
+            Number of entries submitted
+        """
+        if not embeddings_by_hash:
+            return 0
+        entries = [
+            EmbeddingCacheEntry(
+                content_hash=content_hash,
+                model=model,
+                embedding=embedding,
+                dimensions=len(embedding),
+            )
+            for content_hash, embedding in embeddings_by_hash.items()
+        ]
+        with transaction.atomic():
+            EmbeddingCacheEntry.objects.bulk_create(
+                entries,
+                batch_size=EmbeddingCacheRepository.BATCH_SIZE,
+                ignore_conflicts=True,
+            )
+        return len(entries)
+
+    @staticmethod
+    def delete_by_model(model: str) -> int:
+        """Delete all cached embeddings for a model (e.g. after a model is retired)."""
+        with transaction.atomic():
+            count, _ = EmbeddingCacheEntry.objects.filter(model=model).delete()
+            return count
+
+    @staticmethod
+    def touch_many(model: str, content_hashes: Iterable[str]) -> int:
+        """
+        Mark entries as used (only those not refreshed within TOUCH_INTERVAL).
+
+        Returns:
+            Number of entries updated
+        """
+        hashes = list(dict.fromkeys(content_hashes))
+        if not hashes:
+            return 0
+        now = timezone.now()
+        updated = 0
+        for start in range(0, len(hashes), EmbeddingCacheRepository.BATCH_SIZE):
+            updated += EmbeddingCacheEntry.objects.filter(
+                model=model,
+                content_hash__in=hashes[start:start + EmbeddingCacheRepository.BATCH_SIZE],
+                last_used_at__lt=now - EmbeddingCacheRepository.TOUCH_INTERVAL
+            ).update(last_used_at=now)
+        return updated
+
+    @staticmethod
+    def delete_unused_since(cutoff: datetime) -> int:
+        """Delete cached embeddings not used since `cutoff`."""
+        with transaction.atomic():
+            count, _ = EmbeddingCacheEntry.objects.filter(last_used_at__lt=cutoff).delete()
+            return count
@@ -1,10 +1,12 @@
 from .eligibility_result_selector import EligibilityResultSelector
 from .ai_reasoning_log_selector import AIReasoningLogSelector
 from .ai_citation_selector import AICitationSelector
+from .embedding_cache_selector import EmbeddingCacheSelector
 
 __all__ = [
     'EligibilityResultSelector',
     'AIReasoningLogSelector',
     'AICitationSelector',
+    'EmbeddingCacheSelector',
 ]
 
@@ -28,6 +28,15 @@ class EligibilityResultSelector:
             'rule_version__visa_type'
         ).filter(case=case, is_deleted=False).order_by('-created_at')
 
+    @staticmethod
+    def get_latest_by_case_and_visa_type(case: Case, visa_type_id):
+        """Get the most recent eligibility result of a case for one visa type."""
+        return EligibilityResult.objects.select_related(
+            'case',
+            'visa_type',
+            'rule_version'
+        ).filter(case=case, visa_type_id=visa_type_id, is_deleted=False).order_by('-created_at').first()
+
     @staticmethod
     def get_by_visa_type(visa_type: VisaType):
         """Get eligibility results by visa type."""
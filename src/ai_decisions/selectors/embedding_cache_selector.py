@@ -0,0 +1,31 @@
+from typing import Dict, Iterable, List
+from ai_decisions.models.embedding_cache_entry import EmbeddingCacheEntry
+
+
+class EmbeddingCacheSelector:
+    """Selector for EmbeddingCacheEntry read operations."""
+
+    BATCH_SIZE = 500
+
+    @staticmethod
+    def get_many(model: str, content_hashes: Iterable[str]) -> Dict[str, List[float]]:
+        """
+        Bulk lookup of cached embeddings.
+
+        Args:
+            model: Embedding model name
+            content_hashes: SHA-256 hex digests of the texts
+
+        Returns:
+            Mapping of content hash -> embedding for the hashes that are cached
+        """
+        hashes = list(dict.fromkeys(content_hashes))
+        found = {}
+        for start in range(0, len(hashes), EmbeddingCacheSelector.BATCH_SIZE):
+            rows = EmbeddingCacheEntry.objects.filter(
+                model=model,
+                content_hash__in=hashes[start:start + EmbeddingCacheSelector.BATCH_SIZE]
+            ).values_list('content_hash', 'embedding')
+            for content_hash, embedding in rows:
+                found[content_hash] = [float(x) for x in embedding]
+        return found
@@ -23,6 +23,7 @@ class AIReasoningLogSerializer(serializers.ModelSerializer):
             'prompt',
             'response',
             'tokens_used',
+            'cached_from',
             'created_at',
         ]
         read_only_fields = (
@@ -32,6 +33,7 @@ class AIReasoningLogSerializer(serializers.ModelSerializer):
             'prompt',
             'response',
             'tokens_used',
+            'cached_from',
             'created_at',
         )
 
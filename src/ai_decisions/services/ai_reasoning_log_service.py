@@ -18,8 +18,8 @@ class AIReasoningLogService:
     @staticmethod
     @invalidate_cache(namespace, predicate=lambda log: log is not None)
     def create_reasoning_log(case_id: str, prompt: str, response: str, model_name: str,
-                            tokens_used: int = None) -> Optional[AIReasoningLog]:
-        """Create a new AI reasoning log."""
+                            tokens_used: int = None, cached_from_id: str = None) -> Optional[AIReasoningLog]:
+        """Create a new AI reasoning log (cached_from_id: log whose cached response is reused)."""
         try:
             case = CaseSelector.get_by_id(case_id)
             return AIReasoningLogRepository.create_reasoning_log(
@@ -27,7 +27,8 @@ class AIReasoningLogService:
                 prompt=prompt,
                 response=response,
                 model_name=model_name,
-                tokens_used=tokens_used
+                tokens_used=tokens_used,
+                cached_from_id=cached_from_id
             )
         except Exception as e:
             logger.error(f"Error creating AI reasoning log: {e}")
@@ -9,17 +9,21 @@ This service:
 4. Extracts citations and stores reasoning logs
 """
 import logging
+import threading
 import time
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from django.conf import settings
 from ai_decisions.services.vector_db_service import PgVectorService
 from ai_decisions.services.embedding_service import EmbeddingService
 from ai_decisions.services.ai_reasoning_log_service import AIReasoningLogService
 from ai_decisions.services.ai_citation_service import AICitationService
+from ai_decisions.helpers.context_packer import pack_context
+from ai_decisions.helpers.reasoning_cache import ReasoningCache
 from ai_decisions.helpers.metrics import (
     track_ai_reasoning,
     track_vector_search,
-    track_citations_extracted
+    track_citations_extracted,
+    track_reasoning_cache_lookup
 )
 
 logger = logging.getLogger('django')
@@ -39,6 +43,10 @@ class AIReasoningService:
     No separate vector database is required.
     """
 
+    LLM_MODEL = "gpt-4"
+    # Bump when construct_prompt changes so cached responses to old prompts are not reused
+    PROMPT_TEMPLATE_VERSION = "1"
+
     @staticmethod
     def retrieve_context(
         case_facts: Dict[str, Any],
@@ -52,7 +60,8 @@ class AIReasoningService:
         Step 1: Retrieve relevant context using pgvector similarity search.
         
         Uses pgvector (PostgreSQL extension) to perform cosine similarity search
-        on document chunk embeddings stored in PostgreSQL.
+        on document chunk embeddings stored in PostgreSQL, combined with full-text
+        search when VECTOR_SEARCH_MODE is 'hybrid'.
         
         Args:
             case_facts: Dictionary of case facts
@@ -84,36 +93,25 @@ class AIReasoningService:
             
             # Search similar chunks using pgvector
             search_start = time.time()
-            chunks = PgVectorService.search_similar(
-                query_embedding=query_embedding,
-                limit=limit,
-                filters=filters,
-                similarity_threshold=similarity_threshold
-            )
+            if AIReasoningService._use_hybrid_search():
+                chunks = PgVectorService.search_hybrid(
+                    query_embedding=query_embedding,
+                    query_text=query_text,
+                    limit=limit,
+                    filters=filters,
+                    similarity_threshold=similarity_threshold
+                )
+            else:
+                chunks = PgVectorService.search_similar(
+                    query_embedding=query_embedding,
+                    limit=limit,
+                    filters=filters,
+                    similarity_threshold=similarity_threshold
+                )
             search_duration = time.time() - search_start
             
             # Format context
-            context = []
-            similarity_scores = []
-            for chunk in chunks:
-                # Calculate similarity from distance
-                # distance = 0 means similarity = 1.0
-                # distance = 2 means similarity = 0.0
-                distance = getattr(chunk, 'distance', None)
-                if distance is not None:
-                    similarity = 1.0 - (distance / 2.0)
-                else:
-                    similarity = 0.8  # Default if distance not available
-                
-                similarity_scores.append(similarity)
-                
-                context.append({
-                    'text': chunk.chunk_text,
-                    'source': chunk.document_version.source_document.source_url,
-                    'metadata': chunk.metadata,
-                    'similarity': similarity,
-                    'chunk_id': str(chunk.id)
-                })
+            context, similarity_scores = AIReasoningService._format_context(chunks)
             
             # Track vector search metrics
             track_vector_search(
@@ -133,6 +131,201 @@ class AIReasoningService:
             logger.error(f"Error retrieving context: {e}", exc_info=True)
             return []
 
+    @staticmethod
+    def retrieve_context_many(
+        queries: List[Dict[str, Any]],
+        limit: int = 5,
+        similarity_threshold: float = 0.7
+    ) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        Retrieve context for several queries at once (e.g. one per visa type).
+        
+        All query texts are embedded in one embeddings call (identical texts once)
+        and the similarity searches run in one round trip via
+        PgVectorService.search_similar_many.
+        
+        Args:
+            queries: One dict per query with 'case_facts' and optional 'visa_code'
+                and 'jurisdiction' (same meaning as in retrieve_context)
+            limit: Maximum number of context chunks per query
+            similarity_threshold: Minimum similarity score (0-1)
+            
+        Returns:
+            One context list per query, in query order (same format as
+            retrieve_context), or None entries if retrieval failed
+        """
+        if not queries:
+            return []
+        
+        search_start = None
+        try:
+            query_texts = [AIReasoningService._construct_query(query['case_facts']) for query in queries]
+            query_embeddings = EmbeddingService.generate_embeddings(query_texts)
+            if len(query_embeddings) != len(queries):
+                logger.error(f"Failed to generate query embeddings: got {len(query_embeddings)} for {len(queries)} queries")
+                return [None] * len(queries)
+            
+            filters = []
+            for query in queries:
+                query_filters = {}
+                if query.get('visa_code'):
+                    query_filters['visa_code'] = query['visa_code']
+                if query.get('jurisdiction'):
+                    query_filters['jurisdiction'] = query['jurisdiction']
+                filters.append(query_filters)
+            
+            search_start = time.time()
+            if AIReasoningService._use_hybrid_search():
+                chunk_lists = [
+                    PgVectorService.search_hybrid(
+                        query_embedding=query_embedding,
+                        query_text=query_text,
+                        limit=limit,
+                        filters=query_filters,
+                        similarity_threshold=similarity_threshold
+                    )
+                    for query_embedding, query_text, query_filters in zip(query_embeddings, query_texts, filters)
+                ]
+            else:
+                chunk_lists = PgVectorService.search_similar_many(
+                    query_embeddings=query_embeddings,
+                    limit=limit,
+                    filters=filters,
+                    similarity_threshold=similarity_threshold
+                )
+            search_duration = time.time() - search_start
+            
+            contexts = []
+            all_scores = []
+            for chunks in chunk_lists:
+                context, similarity_scores = AIReasoningService._format_context(chunks)
+                contexts.append(context)
+                all_scores.extend(similarity_scores)
+            
+            track_vector_search(
+                status='success',
+                duration=search_duration,
+                results_count=sum(len(context) for context in contexts),
+                similarity_scores=all_scores
+            )
+            
+            logger.info(
+                f"Retrieved {sum(len(context) for context in contexts)} context chunks "
+                f"for {len(queries)} queries"
+            )
+            return contexts
+            
+        except Exception as e:
+            search_duration = time.time() - search_start if search_start else 0
+            track_vector_search(status='failure', duration=search_duration, results_count=0)
+            logger.error(f"Error retrieving context for {len(queries)} queries: {e}", exc_info=True)
+            return [None] * len(queries)
+
+    @staticmethod
+    def _use_hybrid_search() -> bool:
+        """Whether retrieval uses PgVectorService.search_hybrid (VECTOR_SEARCH_MODE='hybrid')."""
+        return getattr(settings, 'VECTOR_SEARCH_MODE', 'vector') == 'hybrid'
+
+    @staticmethod
+    def _format_context(chunks: List[Any]) -> Tuple[List[Dict[str, Any]], List[float]]:
+        """
+        Format retrieved chunks as context dicts.
+        
+        Chunks must have document_version__source_document preloaded.
+        
+        Returns:
+            Tuple of (context dicts, similarity scores)
+        """
+        context = []
+        similarity_scores = []
+        for chunk in chunks:
+            # Calculate similarity from distance
+            # distance = 0 means similarity = 1.0
+            # distance = 2 means similarity = 0.0
+            distance = getattr(chunk, 'distance', None)
+            if distance is not None:
+                similarity = 1.0 - (distance / 2.0)
+            else:
+                similarity = 0.8  # Default if distance not available
+            
+            similarity_scores.append(similarity)
+            
+            context.append({
+                'text': chunk.chunk_text,
+                'source': chunk.document_version.source_document.source_url,
+                'metadata': chunk.metadata,
+                'similarity': similarity,
+                'chunk_id': str(chunk.id),
+                'document_version_id': AIReasoningService._document_version_id(chunk),
+                'chunk_index': getattr(chunk, 'chunk_index', None)
+            })
+        return context, similarity_scores
+
+    @staticmethod
+    def _document_version_id(chunk: Any) -> Optional[str]:
+        version_id = getattr(chunk, 'document_version_id', None)
+        return str(version_id) if version_id is not None else None
+
+    @staticmethod
+    def pack_context(context_chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Fit retrieved context into AI_REASONING_CONTEXT_TOKEN_BUDGET.
+        
+        Drops near-duplicate chunks, merges adjacent chunks of the same document
+        version and keeps the most relevant passages that fit (see
+        ai_decisions.helpers.context_packer).
+        
+        Args:
+            context_chunks: Context dicts from retrieve_context
+            
+        Returns:
+            Packed context dicts, most relevant first
+        """
+        token_budget = getattr(settings, 'AI_REASONING_CONTEXT_TOKEN_BUDGET', None) or None
+        packed = pack_context(context_chunks, token_budget=token_budget)
+        if len(packed) != len(context_chunks):
+            logger.info(
+                f"Packed {len(context_chunks)} context chunks into {len(packed)} passages "
+                f"({sum(p['tokens'] for p in packed)} tokens, budget {token_budget})"
+            )
+        return packed
+
+    @staticmethod
+    def _get_cached_response(
+        case_facts: Dict[str, Any],
+        rule_results: Optional[Dict[str, Any]],
+        context_chunks: List[Dict[str, Any]]
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str], Optional[List[float]]]:
+        """
+        Look up the reasoning cache for a prompt's inputs.
+        
+        Returns:
+            Tuple of (cached value or None, cache scope or None when caching is off,
+            fact embedding used for semantic lookup or None)
+        """
+        if not ReasoningCache.enabled():
+            return None, None, None
+        try:
+            scope = ReasoningCache.scope_key(
+                model=AIReasoningService.LLM_MODEL,
+                template_version=AIReasoningService.PROMPT_TEMPLATE_VERSION,
+                rule_results=rule_results,
+                context_chunks=context_chunks
+            )
+            fact_embedding = None
+            if ReasoningCache.semantic_threshold() is not None:
+                # Same text as the retrieval query, so normally an embedding cache hit
+                fact_embedding = EmbeddingService.generate_embedding(
+                    AIReasoningService._construct_query(case_facts)
+                ) or None
+        except Exception as e:
+            logger.warning(f"Reasoning cache unavailable: {e}")
+            return None, None, None
+
+        cached, result = ReasoningCache.get(scope, case_facts, fact_embedding)
+        track_reasoning_cache_lookup(AIReasoningService.LLM_MODEL, result)
+        return cached, scope, fact_embedding
+
     @staticmethod
     def _construct_query(case_facts: Dict[str, Any]) -> str:
         """
@@ -380,6 +573,25 @@ class AIReasoningService:
         
         return citations
 
+    @staticmethod
+    def _cancelled(cancel_event: Optional[threading.Event], case_id: str) -> bool:
+        if cancel_event is None or not cancel_event.is_set():
+            return False
+        logger.info(f"AI reasoning for case {case_id} abandoned by the caller, nothing stored")
+        return True
+    
+    @staticmethod
+    def _cancelled_result() -> Dict[str, Any]:
+        return {
+            'success': False,
+            'cancelled': True,
+            'error': 'AI reasoning cancelled',
+            'response': None,
+            'context_chunks': [],
+            'citations': [],
+            'reasoning_log_id': None
+        }
+    
     @staticmethod
     def run_ai_reasoning(
         case_id: str,
@@ -387,7 +599,9 @@ class AIReasoningService:
         rule_results: Optional[Dict[str, Any]] = None,
         visa_type_id: Optional[str] = None,
         visa_code: Optional[str] = None,
-        jurisdiction: Optional[str] = None
+        jurisdiction: Optional[str] = None,
+        context_chunks: Optional[List[Dict[str, Any]]] = None,
+        cancel_event: Optional[threading.Event] = None
     ) -> Dict[str, Any]:
         """
         Main method: Run complete AI reasoning workflow.
@@ -400,6 +614,11 @@ class AIReasoningService:
         3. Call LLM
         4. Store reasoning log and citations
         
+        Retrieved context is packed into AI_REASONING_CONTEXT_TOKEN_BUDGET
+        before the prompt is built (see pack_context). When the reasoning cache
+        holds a response for the same inputs, the LLM is not called; the log and
+        citations are still stored, with the log linked to the original one.
+        
         Args:
             case_id: UUID of the case
             case_facts: Dictionary of case facts
@@ -407,6 +626,10 @@ class AIReasoningService:
             visa_type_id: Optional visa type ID
             visa_code: Optional visa code for filtering
             jurisdiction: Optional jurisdiction for filtering
+            context_chunks: Optional already-retrieved context (see
+                retrieve_context_many); retrieved here when omitted
+            cancel_event: Optional event set when the caller abandons the call (e.g.
+                timed out); the LLM is not called and nothing is stored once it is set
             
         Returns:
             Dict with reasoning results:
@@ -439,13 +662,15 @@ class AIReasoningService:
                         'reasoning_log_id': None
                     }
             # Step 1: Retrieve context
-            context_chunks = AIReasoningService.retrieve_context(
-                case_facts=case_facts,
-                visa_code=visa_code,
-                jurisdiction=jurisdiction,
-                limit=5,
-                similarity_threshold=0.7
-            )
+            if context_chunks is None:
+                context_chunks = AIReasoningService.retrieve_context(
+                    case_facts=case_facts,
+                    visa_code=visa_code,
+                    jurisdiction=jurisdiction,
+                    limit=5,
+                    similarity_threshold=0.7
+                )
+            context_chunks = AIReasoningService.pack_context(context_chunks)
             
             # Step 2: Construct prompt
             prompt = AIReasoningService.construct_prompt(
@@ -454,17 +679,44 @@ class AIReasoningService:
                 context_chunks=context_chunks
             )
             
-            # Step 3: Call LLM
-            llm_result = AIReasoningService.call_llm(prompt)
-            
-            # Step 4: Store reasoning log
+            # Step 3: Call LLM, unless the reasoning cache has a response for the same inputs
+            cached, cache_scope, fact_embedding = AIReasoningService._get_cached_response(
+                case_facts=case_facts,
+                rule_results=rule_results,
+                context_chunks=context_chunks
+            )
+            if cached:
+                llm_result = {**cached, 'tokens_used': 0}
+            elif AIReasoningService._cancelled(cancel_event, case_id):
+                return AIReasoningService._cancelled_result()
+            else:
+                llm_result = AIReasoningService.call_llm(prompt, model=AIReasoningService.LLM_MODEL)
+            
+            # The caller dropped the result: no log or citations for it
+            if AIReasoningService._cancelled(cancel_event, case_id):
+                return AIReasoningService._cancelled_result()
+            
+            # Step 4: Store reasoning log (also for cached responses, linked to the original log)
             reasoning_log = AIReasoningLogService.create_reasoning_log(
                 case_id=case_id,
                 prompt=prompt,
                 response=llm_result['response'],
                 model_name=llm_result['model'],
-                tokens_used=llm_result.get('tokens_used')
+                tokens_used=llm_result.get('tokens_used'),
+                cached_from_id=cached.get('reasoning_log_id') if cached else None
             )
+            if cache_scope and not cached:
+                ReasoningCache.put(
+                    scope=cache_scope,
+                    case_facts=case_facts,
+                    value={
+                        'response': llm_result['response'],
+                        'model': llm_result['model'],
+                        'citations': llm_result.get('citations', []),
+                        'reasoning_log_id': str(reasoning_log.id) if reasoning_log else None,
+                    },
+                    fact_embedding=fact_embedding
+                )
             
             # Step 5: Store citations
             citations_created = 0
@@ -510,10 +762,12 @@ class AIReasoningService:
             logger.info(
                 f"AI reasoning completed for case {case_id}: "
                 f"{len(context_chunks)} context chunks, {citations_created} citations stored"
+                f"{' (cached response)' if cached else ''}"
             )
             
             return {
                 'success': True,
+                'cached': bool(cached),
                 'response': llm_result['response'],
                 'context_chunks': context_chunks,
                 'citations': llm_result.get('citations', []),
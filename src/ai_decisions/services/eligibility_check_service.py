@@ -12,9 +12,12 @@ Design Principles:
 - Compliant: Follows OISC boundaries (decision support, not legal advice)
 """
 import logging
+import threading
 import time
-from typing import Dict, List, Optional, Any
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
+from django.conf import settings
 from django.utils import timezone
 from ai_decisions.helpers.metrics import (
     track_eligibility_check,
@@ -30,10 +33,13 @@ from ai_decisions.services.ai_reasoning_service import AIReasoningService
 from ai_decisions.services.eligibility_result_service import EligibilityResultService
 from ai_decisions.services.ai_citation_service import AICitationService
 from ai_decisions.models.eligibility_result import EligibilityResult
+from ai_decisions.selectors.eligibility_result_selector import EligibilityResultSelector
 from immigration_cases.selectors.case_selector import CaseSelector
 from rules_knowledge.selectors.visa_type_selector import VisaTypeSelector
 from rules_knowledge.selectors.visa_rule_version_selector import VisaRuleVersionSelector
+from rules_knowledge.selectors.visa_requirement_selector import VisaRequirementSelector
 from human_reviews.services.review_service import ReviewService
+from main_system.utils.thread_pool import DBThreadPoolExecutor
 
 logger = logging.getLogger('django')
 
@@ -51,6 +57,7 @@ class EligibilityCheckResult:
         self.rule_engine_result: Optional[RuleEngineEvaluationResult] = None
         self.ai_reasoning_result: Optional[Dict[str, Any]] = None
         self.ai_reasoning_available: bool = False
+        self.ai_reasoning_timed_out: bool = False
         self.requires_human_review: bool = False
         self.conflict_detected: bool = False
         self.conflict_reason: Optional[str] = None
@@ -70,6 +77,7 @@ class EligibilityCheckResult:
             'outcome': self.outcome,
             'confidence': round(self.confidence, 2),
             'ai_reasoning_available': self.ai_reasoning_available,
+            'ai_reasoning_timed_out': self.ai_reasoning_timed_out,
             'requires_human_review': self.requires_human_review,
             'conflict_detected': self.conflict_detected,
             'conflict_reason': self.conflict_reason,
@@ -105,7 +113,8 @@ class EligibilityCheckService:
         case_id: str,
         visa_type_id: str,
         evaluation_date: Optional[datetime] = None,
-        enable_ai_reasoning: bool = True
+        enable_ai_reasoning: bool = True,
+        changed_fact_keys: Optional[List[str]] = None
     ) -> EligibilityCheckResult:
         """
         Main orchestration method: Run complete eligibility check.
@@ -118,6 +127,10 @@ class EligibilityCheckService:
             visa_type_id: UUID of the visa type to evaluate
             evaluation_date: Optional date to evaluate against (defaults to now)
             enable_ai_reasoning: Whether to run AI reasoning (default: True)
+            changed_fact_keys: Fact keys changed since the last check. When given,
+                the rule engine re-evaluates only the requirements referencing them
+                and reuses the last stored per-requirement results (falls back to
+                a full evaluation if the last result cannot be reused)
             
         Returns:
             EligibilityCheckResult with complete evaluation results
@@ -165,123 +178,574 @@ class EligibilityCheckService:
                 return result
             
             # Step 2: Run rule engine evaluation
-            logger.info(f"Running rule engine evaluation for case {case_id}, visa type {visa_type_id}")
-            rule_engine_result = RuleEngineService.run_eligibility_evaluation(
-                case_id=case_id,
+            rule_engine_result = EligibilityCheckService._evaluate_rules(
+                case=case,
                 visa_type_id=visa_type_id,
-                evaluation_date=evaluation_date
+                case_facts=case_facts,
+                evaluation_date=evaluation_date,
+                changed_fact_keys=changed_fact_keys,
+                visa_type=visa_type
             )
-            
-            if not rule_engine_result:
-                result.error = "Rule engine evaluation failed - no active rule version found"
-                result.warnings.append("No active rule version found for this visa type")
-                logger.warning(f"No active rule version for visa type {visa_type_id}")
+            if not EligibilityCheckService._apply_rule_engine_result(result, rule_engine_result):
                 return result
             
-            result.rule_engine_result = rule_engine_result
-            result.warnings.extend(rule_engine_result.warnings)
-            result.missing_facts = rule_engine_result.missing_facts
-            
             # Step 3: Run AI reasoning (if enabled)
             ai_reasoning_result = None
             if enable_ai_reasoning:
                 try:
-                    logger.info(f"Running AI reasoning for case {case_id}, visa type {visa_type_id}")
-                    ai_reasoning_result = AIReasoningService.run_ai_reasoning(
-                        case_id=case_id,
+                    ai_reasoning_result = EligibilityCheckService._call_ai_reasoning(
+                        case=case,
                         case_facts=case_facts,
-                        rule_results=rule_engine_result.to_dict(),
-                        visa_type_id=visa_type_id,
-                        visa_code=visa_type.code,
-                        jurisdiction=case.jurisdiction if hasattr(case, 'jurisdiction') else None
+                        rule_engine_result=rule_engine_result,
+                        visa_type=visa_type
                     )
-                    
-                    if ai_reasoning_result and ai_reasoning_result.get('success'):
-                        result.ai_reasoning_available = True
-                        result.ai_reasoning_result = ai_reasoning_result
-                    else:
-                        # AI reasoning failed, but we can continue with rule engine only
-                        result.warnings.append("AI reasoning unavailable - using rule engine only")
-                        logger.warning(f"AI reasoning failed for case {case_id}: {ai_reasoning_result.get('error') if ai_reasoning_result else 'Unknown error'}")
-                        
+                    EligibilityCheckService._apply_ai_reasoning_result(result, ai_reasoning_result)
                 except Exception as e:
                     # AI service failure - fallback to rule engine only
                     result.warnings.append("AI reasoning service unavailable - using rule engine only")
                     logger.error(f"AI reasoning error for case {case_id}: {e}", exc_info=True)
             
-            # Step 4: Combine outcomes
-            combined_result = EligibilityCheckService._combine_outcomes(
+            # Steps 4-6: Combine outcomes, store, escalate
+            return EligibilityCheckService._complete_check(
+                result=result,
                 rule_engine_result=rule_engine_result,
                 ai_reasoning_result=ai_reasoning_result,
-                result=result
+                start_time=start_time
             )
             
-            # Step 5: Store eligibility result
-            eligibility_result = EligibilityCheckService._store_eligibility_result(
-                case_id=case_id,
-                visa_type_id=visa_type_id,
-                rule_version_id=str(rule_engine_result.rule_version_id),
-                outcome=combined_result['outcome'],
-                confidence=combined_result['confidence'],
-                reasoning_summary=combined_result['reasoning_summary'],
-                missing_facts=result.missing_facts if result.missing_facts else None,
-                ai_reasoning_log_id=ai_reasoning_result.get('reasoning_log_id') if ai_reasoning_result else None
+        except Exception as e:
+            result.error = str(e)
+            # Track failure metrics
+            duration = time.time() - start_time
+            track_eligibility_check(
+                outcome='error',
+                requires_review=False,
+                conflict_detected=False,
+                duration=duration,
+                confidence=0.0
             )
+            logger.error(f"Error running eligibility check for case {case_id}: {e}", exc_info=True)
+            return result
+    
+    @staticmethod
+    def run_multi_visa_eligibility_check(
+        case_id: str,
+        visa_type_ids: List[str],
+        evaluation_date: Optional[datetime] = None,
+        enable_ai_reasoning: bool = True,
+        changed_fact_keys: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+        ai_timeout_seconds: Optional[float] = None
+    ) -> Dict[str, EligibilityCheckResult]:
+        """
+        Run eligibility checks for several visa types of one case.
+        
+        With max_workers > 1 the case, payment and facts are loaded once, the
+        deterministic rule pass runs for every visa type as one batch, and only the
+        AI reasoning calls (RAG + LLM) fan out over a bounded thread pool. A visa
+        type whose AI reasoning exceeds `ai_timeout_seconds` falls back to its rule
+        engine outcome (ai_reasoning_timed_out=True). Combining, storing and
+        escalation then run in the calling thread. With max_workers <= 1 each visa
+        type goes through run_eligibility_check sequentially.
+        
+        Args:
+            case_id: UUID of the case
+            visa_type_ids: Visa type UUIDs to check
+            evaluation_date: Optional date to evaluate against (defaults to now)
+            enable_ai_reasoning: Whether to run AI reasoning (default: True)
+            changed_fact_keys: See run_eligibility_check
+            max_workers: Concurrent AI reasoning calls (defaults to ELIGIBILITY_CHECK_MAX_WORKERS)
+            ai_timeout_seconds: Per-visa-type AI reasoning timeout
+                (defaults to ELIGIBILITY_CHECK_AI_TIMEOUT_SECONDS)
             
-            if eligibility_result:
-                result.eligibility_result_id = str(eligibility_result.id)
-            
-            # Step 6: Check for human review escalation
-            if combined_result['requires_human_review']:
-                EligibilityCheckService._escalate_to_human_review(
+        Returns:
+            Mapping of visa_type_id -> EligibilityCheckResult, in input order
+        """
+        if max_workers is None:
+            max_workers = getattr(settings, 'ELIGIBILITY_CHECK_MAX_WORKERS', 1)
+        if ai_timeout_seconds is None:
+            ai_timeout_seconds = getattr(settings, 'ELIGIBILITY_CHECK_AI_TIMEOUT_SECONDS', 60)
+        
+        if max_workers <= 1 or len(visa_type_ids) <= 1:
+            extra = {'changed_fact_keys': changed_fact_keys} if changed_fact_keys is not None else {}
+            return {
+                visa_type_id: EligibilityCheckService.run_eligibility_check(
                     case_id=case_id,
-                    reason=combined_result.get('escalation_reason', 'low_confidence_or_conflict')
+                    visa_type_id=visa_type_id,
+                    evaluation_date=evaluation_date,
+                    enable_ai_reasoning=enable_ai_reasoning,
+                    **extra
                 )
-                result.requires_human_review = True
+                for visa_type_id in visa_type_ids
+            }
+        
+        start_time = time.time()
+        results: Dict[str, EligibilityCheckResult] = {}
+        for visa_type_id in visa_type_ids:
+            result = EligibilityCheckResult()
+            result.case_id = case_id
+            result.visa_type_id = visa_type_id
+            results[visa_type_id] = result
+        
+        def _fail_all(error: str, warning: Optional[str] = None) -> Dict[str, EligibilityCheckResult]:
+            for result in results.values():
+                result.error = error
+                if warning:
+                    result.warnings.append(warning)
+            return results
+        
+        # Step 1: Load shared prerequisites once
+        try:
+            case = CaseSelector.get_by_id(case_id)
+            if not case:
+                logger.error(f"Case {case_id} not found")
+                return _fail_all(f"Case {case_id} not found")
             
-            result.success = True
-            result.outcome = combined_result['outcome']
-            result.confidence = combined_result['confidence']
-            result.reasoning_summary = combined_result['reasoning_summary']
+            from payments.helpers.payment_validator import PaymentValidator
+            is_valid, error = PaymentValidator.validate_case_has_payment(case, operation_name="eligibility check")
+            if not is_valid:
+                logger.warning(f"Eligibility check blocked for case {case_id}: {error}")
+                return _fail_all(error, "Payment validation failed")
             
-            # Track metrics
-            duration = time.time() - start_time
-            track_eligibility_check(
-                outcome=result.outcome,
-                requires_review=result.requires_human_review,
-                conflict_detected=result.conflict_detected,
-                duration=duration,
-                confidence=result.confidence
+            case_facts = RuleEngineService.load_case_facts(case_id)
+            if not case_facts:
+                logger.warning(f"Case {case_id} has no facts")
+                return _fail_all("Case has no facts", "Case has no facts - cannot evaluate eligibility")
+        except Exception as e:
+            logger.error(f"Error loading eligibility prerequisites for case {case_id}: {e}", exc_info=True)
+            return _fail_all(str(e))
+        
+        # Step 2: Deterministic rule pass for every visa type, as one batch
+        ready: Dict[str, Tuple[Any, RuleEngineEvaluationResult]] = {}
+        for visa_type_id, result in results.items():
+            try:
+                visa_type = VisaTypeSelector.get_by_id(visa_type_id)
+                if not visa_type:
+                    result.error = f"Visa type {visa_type_id} not found"
+                    logger.error(result.error)
+                    continue
+                result.visa_code = visa_type.code
+                
+                rule_engine_result = EligibilityCheckService._evaluate_rules(
+                    case=case,
+                    visa_type_id=visa_type_id,
+                    case_facts=case_facts,
+                    evaluation_date=evaluation_date,
+                    changed_fact_keys=changed_fact_keys,
+                    visa_type=visa_type
+                )
+                if EligibilityCheckService._apply_rule_engine_result(result, rule_engine_result):
+                    ready[visa_type_id] = (visa_type, rule_engine_result)
+            except Exception as e:
+                result.error = str(e)
+                logger.error(
+                    f"Error running rule evaluation for case {case_id}, visa type {visa_type_id}: {e}",
+                    exc_info=True
+                )
+        
+        # Step 3: Retrieve context for every visa type in one batch, then fan out AI reasoning
+        ai_outcomes: Dict[str, Tuple[Optional[Dict[str, Any]], Optional[BaseException]]] = {}
+        if enable_ai_reasoning and ready:
+            jurisdiction = case.jurisdiction if hasattr(case, 'jurisdiction') else None
+            contexts = AIReasoningService.retrieve_context_many([
+                {'case_facts': case_facts, 'visa_code': visa_type.code, 'jurisdiction': jurisdiction}
+                for visa_type, _ in ready.values()
+            ])
+            ai_outcomes = EligibilityCheckService._run_ai_reasoning_concurrently(
+                jobs={
+                    visa_type_id: {
+                        'case': case,
+                        'case_facts': case_facts,
+                        'rule_engine_result': rule_engine_result,
+                        'visa_type': visa_type,
+                        'context_chunks': context_chunks,
+                    }
+                    for (visa_type_id, (visa_type, rule_engine_result)), context_chunks
+                    in zip(ready.items(), contexts)
+                },
+                max_workers=max_workers,
+                timeout_seconds=ai_timeout_seconds
             )
+        
+        # Steps 4-6: Combine, store and escalate in the calling thread
+        for visa_type_id, (visa_type, rule_engine_result) in ready.items():
+            result = results[visa_type_id]
+            ai_reasoning_result = None
+            if enable_ai_reasoning:
+                ai_reasoning_result, ai_error = ai_outcomes.get(visa_type_id, (None, None))
+                if isinstance(ai_error, TimeoutError):
+                    result.ai_reasoning_timed_out = True
+                    result.warnings.append("AI reasoning timed out - using rule engine only")
+                elif ai_error is not None:
+                    result.warnings.append("AI reasoning service unavailable - using rule engine only")
+                    logger.error(f"AI reasoning error for case {case_id}, visa type {visa_type_id}: {ai_error}")
+                else:
+                    EligibilityCheckService._apply_ai_reasoning_result(result, ai_reasoning_result)
             
-            if result.conflict_detected:
-                track_eligibility_conflict(conflict_type=result.conflict_reason or 'unknown')
-            
-            if result.requires_human_review:
-                escalation_reason = combined_result.get('escalation_reason', 'low_confidence')
-                track_auto_escalation(reason=escalation_reason)
+            try:
+                EligibilityCheckService._complete_check(
+                    result=result,
+                    rule_engine_result=rule_engine_result,
+                    ai_reasoning_result=ai_reasoning_result,
+                    start_time=start_time
+                )
+            except Exception as e:
+                result.error = str(e)
+                track_eligibility_check(
+                    outcome='error',
+                    requires_review=False,
+                    conflict_detected=False,
+                    duration=time.time() - start_time,
+                    confidence=0.0
+                )
+                logger.error(
+                    f"Error completing eligibility check for case {case_id}, visa type {visa_type_id}: {e}",
+                    exc_info=True
+                )
+        
+        logger.info(
+            f"Multi-visa eligibility check for case {case_id}: {len(results)} visa types, "
+            f"{sum(1 for r in results.values() if r.success)} succeeded, "
+            f"{sum(1 for r in results.values() if r.ai_reasoning_timed_out)} AI timeouts, "
+            f"{time.time() - start_time:.2f}s"
+        )
+        return results
+    
+    @staticmethod
+    def _run_ai_reasoning_concurrently(
+        jobs: Dict[str, Dict[str, Any]],
+        max_workers: int,
+        timeout_seconds: float
+    ) -> Dict[str, Tuple[Optional[Dict[str, Any]], Optional[BaseException]]]:
+        """
+        Run _call_ai_reasoning for several visa types on a bounded thread pool.
+        
+        Each job's timeout starts when a worker picks it up. A timed-out call is
+        abandoned: its cancel event is set, so the thread stops before calling the LLM
+        or storing a reasoning log and citations, and its result is ignored.
+        
+        Args:
+            jobs: Mapping of visa_type_id -> _call_ai_reasoning kwargs
+            max_workers: Maximum concurrent calls
+            timeout_seconds: Per-job timeout
             
-            logger.info(
-                f"Eligibility check completed for case {case_id}, visa {visa_type_id}: "
-                f"outcome={result.outcome}, confidence={result.confidence:.2f}, "
-                f"requires_review={result.requires_human_review}"
+        Returns:
+            Mapping of visa_type_id -> (AI reasoning result, exception or TimeoutError)
+        """
+        started: Dict[str, float] = {}
+        cancel_events = {visa_type_id: threading.Event() for visa_type_id in jobs}
+        
+        def _worker(visa_type_id: str, kwargs: Dict[str, Any]):
+            started[visa_type_id] = time.monotonic()
+            return EligibilityCheckService._call_ai_reasoning(
+                **kwargs, cancel_event=cancel_events[visa_type_id]
+            )
+        
+        outcomes: Dict[str, Tuple[Optional[Dict[str, Any]], Optional[BaseException]]] = {}
+        executor = DBThreadPoolExecutor(
+            max_workers=min(max_workers, len(jobs)),
+            thread_name_prefix='eligibility-ai'
+        )
+        futures = {
+            executor.submit(_worker, visa_type_id, kwargs): visa_type_id
+            for visa_type_id, kwargs in jobs.items()
+        }
+        pending = set(futures)
+        try:
+            while pending:
+                now = time.monotonic()
+                deadlines = [
+                    started[futures[future]] + timeout_seconds
+                    for future in pending if futures[future] in started
+                ]
+                wait_for = max(0.01, min(deadlines) - now) if deadlines else timeout_seconds
+                done, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    visa_type_id = futures[future]
+                    try:
+                        outcomes[visa_type_id] = (future.result(), None)
+                    except Exception as e:
+                        outcomes[visa_type_id] = (None, e)
+                
+                now = time.monotonic()
+                for future in list(pending):
+                    visa_type_id = futures[future]
+                    if visa_type_id in started and now - started[visa_type_id] >= timeout_seconds:
+                        cancel_events[visa_type_id].set()
+                        future.cancel()
+                        pending.discard(future)
+                        outcomes[visa_type_id] = (None, TimeoutError(f"AI reasoning exceeded {timeout_seconds}s"))
+                        logger.warning(f"AI reasoning timed out for visa type {visa_type_id} after {timeout_seconds}s")
+        finally:
+            for future in pending:
+                cancel_events[futures[future]].set()
+            executor.shutdown(wait=False, cancel_futures=True)
+        return outcomes
+    
+    @staticmethod
+    def _evaluate_rules(
+        case: Any,
+        visa_type_id: str,
+        case_facts: Dict[str, Any],
+        evaluation_date: Optional[datetime] = None,
+        changed_fact_keys: Optional[List[str]] = None,
+        visa_type: Optional[Any] = None
+    ) -> Optional[RuleEngineEvaluationResult]:
+        """
+        Deterministic rule pass: incremental when possible, otherwise a full evaluation.
+        
+        The case (payment already validated) and facts loaded by the caller are passed
+        through, so checking several visa types does not reload them per visa type.
+        """
+        rule_engine_result = None
+        if changed_fact_keys is not None:
+            rule_engine_result = EligibilityCheckService._run_incremental_rule_evaluation(
+                case=case,
+                visa_type_id=visa_type_id,
+                case_facts=case_facts,
+                changed_fact_keys=changed_fact_keys,
+                evaluation_date=evaluation_date
+            )
+        
+        if rule_engine_result is None:
+            logger.info(f"Running rule engine evaluation for case {case.id}, visa type {visa_type_id}")
+            rule_engine_result = RuleEngineService.run_eligibility_evaluation(
+                case_id=str(case.id),
+                visa_type_id=visa_type_id,
+                evaluation_date=evaluation_date,
+                case_facts=case_facts,
+                case=case,
+                visa_type=visa_type,
+                payment_validated=True
+            )
+        return rule_engine_result
+    
+    @staticmethod
+    def _apply_rule_engine_result(
+        result: EligibilityCheckResult,
+        rule_engine_result: Optional[RuleEngineEvaluationResult]
+    ) -> bool:
+        """
+        Record the rule pass on the check result.
+        
+        Returns:
+            False when there is no rule engine result (the check cannot continue)
+        """
+        if not rule_engine_result:
+            result.error = "Rule engine evaluation failed - no active rule version found"
+            result.warnings.append("No active rule version found for this visa type")
+            logger.warning(f"No active rule version for visa type {result.visa_type_id}")
+            return False
+        
+        result.rule_engine_result = rule_engine_result
+        result.warnings.extend(rule_engine_result.warnings)
+        result.missing_facts = rule_engine_result.missing_facts
+        return True
+    
+    @staticmethod
+    def _call_ai_reasoning(
+        case: Any,
+        case_facts: Dict[str, Any],
+        rule_engine_result: RuleEngineEvaluationResult,
+        visa_type: Any,
+        context_chunks: Optional[List[Dict[str, Any]]] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Run AI reasoning (RAG + LLM) for one visa type.
+        
+        Does not touch the check result, so it is safe to run in a worker thread.
+        Context is retrieved per call unless `context_chunks` was prefetched.
+        `cancel_event` is set when the caller abandons the call (see
+        AIReasoningService.run_ai_reasoning).
+        """
+        logger.info(f"Running AI reasoning for case {case.id}, visa type {visa_type.id}")
+        return AIReasoningService.run_ai_reasoning(
+            case_id=str(case.id),
+            case_facts=case_facts,
+            rule_results=rule_engine_result.to_dict(),
+            visa_type_id=str(visa_type.id),
+            visa_code=visa_type.code,
+            jurisdiction=case.jurisdiction if hasattr(case, 'jurisdiction') else None,
+            context_chunks=context_chunks,
+            cancel_event=cancel_event
+        )
+    
+    @staticmethod
+    def _apply_ai_reasoning_result(
+        result: EligibilityCheckResult,
+        ai_reasoning_result: Optional[Dict[str, Any]]
+    ) -> None:
+        """Record an AI reasoning outcome on the check result."""
+        if ai_reasoning_result and ai_reasoning_result.get('success'):
+            result.ai_reasoning_available = True
+            result.ai_reasoning_result = ai_reasoning_result
+        else:
+            # AI reasoning failed, but we can continue with rule engine only
+            result.warnings.append("AI reasoning unavailable - using rule engine only")
+            logger.warning(
+                f"AI reasoning failed for case {result.case_id}: "
+                f"{ai_reasoning_result.get('error') if ai_reasoning_result else 'Unknown error'}"
+            )
+    
+    @staticmethod
+    def _complete_check(
+        result: EligibilityCheckResult,
+        rule_engine_result: RuleEngineEvaluationResult,
+        ai_reasoning_result: Optional[Dict[str, Any]],
+        start_time: float
+    ) -> EligibilityCheckResult:
+        """Steps 4-6: combine outcomes, store the eligibility result, escalate, track metrics."""
+        case_id = result.case_id
+        visa_type_id = result.visa_type_id
+        
+        # Step 4: Combine outcomes
+        combined_result = EligibilityCheckService._combine_outcomes(
+            rule_engine_result=rule_engine_result,
+            ai_reasoning_result=ai_reasoning_result,
+            result=result
+        )
+        
+        # Step 5: Store eligibility result
+        eligibility_result = EligibilityCheckService._store_eligibility_result(
+            case_id=case_id,
+            visa_type_id=visa_type_id,
+            rule_version_id=str(rule_engine_result.rule_version_id),
+            outcome=combined_result['outcome'],
+            confidence=combined_result['confidence'],
+            reasoning_summary=combined_result['reasoning_summary'],
+            missing_facts=result.missing_facts if result.missing_facts else None,
+            ai_reasoning_log_id=ai_reasoning_result.get('reasoning_log_id') if ai_reasoning_result else None,
+            requirement_results=getattr(rule_engine_result, 'evaluation_results', None) or None
+        )
+        
+        if eligibility_result:
+            result.eligibility_result_id = str(eligibility_result.id)
+        
+        # Step 6: Check for human review escalation
+        if combined_result['requires_human_review']:
+            EligibilityCheckService._escalate_to_human_review(
+                case_id=case_id,
+                reason=combined_result.get('escalation_reason', 'low_confidence_or_conflict')
             )
+            result.requires_human_review = True
+        
+        result.success = True
+        result.outcome = combined_result['outcome']
+        result.confidence = combined_result['confidence']
+        result.reasoning_summary = combined_result['reasoning_summary']
+        
+        # Track metrics
+        duration = time.time() - start_time
+        track_eligibility_check(
+            outcome=result.outcome,
+            requires_review=result.requires_human_review,
+            conflict_detected=result.conflict_detected,
+            duration=duration,
+            confidence=result.confidence
+        )
+        
+        if result.conflict_detected:
+            track_eligibility_conflict(conflict_type=result.conflict_reason or 'unknown')
+        
+        if result.requires_human_review:
+            escalation_reason = combined_result.get('escalation_reason', 'low_confidence')
+            track_auto_escalation(reason=escalation_reason)
+        
+        logger.info(
+            f"Eligibility check completed for case {case_id}, visa {visa_type_id}: "
+            f"outcome={result.outcome}, confidence={result.confidence:.2f}, "
+            f"requires_review={result.requires_human_review}"
+        )
+        
+        return result
+    
+    @staticmethod
+    def _get_reusable_result(
+        case: Any,
+        visa_type_id: str,
+        evaluation_date: Optional[datetime] = None
+    ) -> Optional[EligibilityResult]:
+        """
+        Latest eligibility result whose per-requirement results can be reused.
+        
+        Reusable means it stored requirement_results and was produced against the
+        rule version that is still active for the visa type.
+        """
+        previous = EligibilityResultSelector.get_latest_by_case_and_visa_type(case, visa_type_id)
+        if not previous or not previous.requirement_results:
+            return None
+        rule_version = RuleEngineService.load_active_rule_version(visa_type_id, evaluation_date)
+        if not rule_version or rule_version.id != previous.rule_version_id:
+            return None
+        return previous
+    
+    @staticmethod
+    def requires_reevaluation(
+        case: Any,
+        visa_type_id: str,
+        changed_fact_keys: List[str],
+        evaluation_date: Optional[datetime] = None
+    ) -> bool:
+        """
+        Whether changing `changed_fact_keys` can affect a case's eligibility for a visa type.
+        
+        Returns False only when the latest result is reusable and none of its rule
+        version's requirements reference the changed keys.
+        """
+        try:
+            previous = EligibilityCheckService._get_reusable_result(case, visa_type_id, evaluation_date)
+            if previous is None:
+                return True
+            fact_key_index = VisaRequirementSelector.get_fact_key_index(previous.rule_version)
+            return any(fact_key in fact_key_index for fact_key in changed_fact_keys)
+        except Exception as e:
+            logger.warning(f"Could not determine affected requirements for case {case.id}: {e}")
+            return True
+    
+    @staticmethod
+    def _run_incremental_rule_evaluation(
+        case: Any,
+        visa_type_id: str,
+        case_facts: Dict[str, Any],
+        changed_fact_keys: List[str],
+        evaluation_date: Optional[datetime] = None
+    ) -> Optional[RuleEngineEvaluationResult]:
+        """
+        Re-evaluate only the requirements affected by changed facts, then re-aggregate.
+        
+        Returns:
+            RuleEngineEvaluationResult, or None when the last result cannot be reused
+            (the caller then runs a full evaluation)
+        """
+        try:
+            previous = EligibilityCheckService._get_reusable_result(case, visa_type_id, evaluation_date)
+            if previous is None:
+                return None
             
-            return result
+            evaluation_results, reevaluated = RuleEngineService.reevaluate_requirements(
+                rule_version=previous.rule_version,
+                case_facts=case_facts,
+                previous_results=previous.requirement_results,
+                changed_fact_keys=changed_fact_keys,
+                changed_since=previous.created_at
+            )
+            if not evaluation_results:
+                return None
             
+            logger.info(
+                f"Incremental rule engine evaluation for case {case.id}, visa type {visa_type_id}: "
+                f"{reevaluated}/{len(evaluation_results)} requirements re-evaluated"
+            )
+            return RuleEngineService.aggregate_results(evaluation_results, previous.rule_version)
         except Exception as e:
-            result.error = str(e)
-            # Track failure metrics
-            duration = time.time() - start_time
-            track_eligibility_check(
-                outcome='error',
-                requires_review=False,
-                conflict_detected=False,
-                duration=duration,
-                confidence=0.0
+            logger.warning(
+                f"Incremental evaluation failed for case {case.id}, visa type {visa_type_id}, "
+                f"falling back to full evaluation: {e}",
+                exc_info=True
             )
-            logger.error(f"Error running eligibility check for case {case_id}: {e}", exc_info=True)
-            return result
+            return None
     
     @staticmethod
     def _combine_outcomes(
@@ -471,7 +935,8 @@ class EligibilityCheckService:
         confidence: float,
         reasoning_summary: Optional[str],
         missing_facts: Optional[List[str]],
-        ai_reasoning_log_id: Optional[str]
+        ai_reasoning_log_id: Optional[str],
+        requirement_results: Optional[List[Dict[str, Any]]] = None
     ) -> Optional[EligibilityResult]:
         """
         Store eligibility result in database.
@@ -489,6 +954,8 @@ class EligibilityCheckService:
             reasoning_summary: Summary text
             missing_facts: List of missing facts
             ai_reasoning_log_id: Optional AI reasoning log ID
+            requirement_results: Per-requirement rule engine results, kept for
+                incremental re-evaluation
             
         Returns:
             Created EligibilityResult or None
@@ -516,7 +983,8 @@ class EligibilityCheckService:
                 outcome=model_outcome,
                 confidence=confidence,
                 reasoning_summary=reasoning_summary,
-                missing_facts={'missing_facts': missing_facts} if missing_facts else None
+                missing_facts={'missing_facts': missing_facts} if missing_facts else None,
+                requirement_results=requirement_results
             )
             
             logger.info(
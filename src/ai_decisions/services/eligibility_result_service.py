@@ -21,7 +21,7 @@ class EligibilityResultService:
     @invalidate_cache(namespace, predicate=lambda r: r is not None)
     def create_eligibility_result(case_id: str, visa_type_id: str, rule_version_id: str,
                                  outcome: str, confidence: float = 0.0, reasoning_summary: str = None,
-                                 missing_facts: dict = None) -> Optional[EligibilityResult]:
+                                 missing_facts: dict = None, requirement_results: list = None) -> Optional[EligibilityResult]:
         """
         Create a new eligibility result.
         
@@ -52,7 +52,8 @@ class EligibilityResultService:
                 outcome=outcome,
                 confidence=confidence,
                 reasoning_summary=reasoning_summary,
-                missing_facts=missing_facts
+                missing_facts=missing_facts,
+                requirement_results=requirement_results
             )
         except Exception as e:
             logger.error(f"Error creating eligibility result: {e}")
@@ -1,6 +1,10 @@
 import logging
-from typing import List, Dict, Optional
+import re
+import zlib
+from typing import List, Dict, Optional, Tuple
 from django.conf import settings
+from ai_decisions.helpers.embedding_cache import EmbeddingCache
+from ai_decisions.helpers.metrics import track_embedding_cache_lookup
 
 logger = logging.getLogger('django')
 
@@ -11,22 +15,47 @@ class EmbeddingService:
     Handles chunking, embedding generation, and error handling.
     """
 
-    # OpenAI text-embedding-ada-002 dimensions
+    # OpenAI text-embedding-ada-002 dimensions (default model)
     EMBEDDING_DIMENSIONS = 1536
+    DEFAULT_MODEL = 'text-embedding-ada-002'
+    # Native output dimensions per model
+    MODEL_DIMENSIONS = {
+        'text-embedding-ada-002': 1536,
+        'text-embedding-3-small': 1536,
+        'text-embedding-3-large': 3072,
+    }
+    # Models that accept a `dimensions` parameter (shortened embeddings)
+    REDUCIBLE_MODELS = ('text-embedding-3-small', 'text-embedding-3-large')
     # Maximum tokens per chunk (roughly 8000 characters)
     MAX_CHUNK_SIZE = 8000
     # Overlap between chunks for context preservation
     CHUNK_OVERLAP = 200
+    # Content-defined chunking: candidate boundaries are sentence/line ends; a candidate
+    # becomes a boundary when the hash of the text just before it matches, so chunk
+    # boundaries depend only on nearby content and survive edits elsewhere.
+    CDC_MIN_CHUNK_SIZE = 500
+    CDC_TARGET_CHUNK_SIZE = 2000
+    CDC_BOUNDARY_WINDOW = 64
+    CDC_AVG_SENTENCE_CHARS = 100
+    CDC_CANDIDATE_PATTERN = re.compile(r'[.!?\n]')
 
     @staticmethod
-    def chunk_document(text: str, chunk_size: int = None, overlap: int = None) -> List[Dict]:
+    def chunk_document(
+        text: str,
+        chunk_size: int = None,
+        overlap: int = None,
+        content_defined: bool = False
+    ) -> List[Dict]:
         """
         Split document text into chunks for embedding.
         
         Args:
             text: Full document text
             chunk_size: Maximum characters per chunk (default: MAX_CHUNK_SIZE)
-            overlap: Characters to overlap between chunks (default: CHUNK_OVERLAP)
+            overlap: Characters to overlap between chunks (default: CHUNK_OVERLAP;
+                not used for content-defined chunking)
+            content_defined: Use content-defined boundaries, which stay stable under
+                local edits so unchanged chunks can be reused across document versions
             
         Returns:
             List of dicts with 'text' and 'metadata' keys
@@ -34,6 +63,11 @@ class EmbeddingService:
         if not text or len(text.strip()) == 0:
             return []
         
+        if content_defined:
+            return EmbeddingService._chunk_content_defined(
+                text, max_size=chunk_size or EmbeddingService.MAX_CHUNK_SIZE
+            )
+        
         chunk_size = chunk_size or EmbeddingService.MAX_CHUNK_SIZE
         overlap = overlap or EmbeddingService.CHUNK_OVERLAP
         
@@ -77,23 +111,209 @@ class EmbeddingService:
         return chunks
 
     @staticmethod
-    def generate_embeddings(texts: List[str], model: str = "text-embedding-ada-002") -> List[List[float]]:
+    def _chunk_content_defined(
+        text: str,
+        max_size: int,
+        min_size: int = None,
+        target_size: int = None
+    ) -> List[Dict]:
+        """
+        Content-defined chunking at sentence/line boundaries.
+        
+        A candidate boundary is taken once the chunk has min_size characters and the
+        CRC32 of the preceding CDC_BOUNDARY_WINDOW characters is divisible by a
+        divisor chosen so chunks average about target_size. Chunks longer than
+        max_size are cut at the last candidate (or hard-split if there is none).
+        """
+        min_size = min(min_size or EmbeddingService.CDC_MIN_CHUNK_SIZE, max_size)
+        target_size = max(target_size or EmbeddingService.CDC_TARGET_CHUNK_SIZE, min_size)
+        window = min(EmbeddingService.CDC_BOUNDARY_WINDOW, min_size)
+        divisor = max(1, (target_size - min_size) // EmbeddingService.CDC_AVG_SENTENCE_CHARS)
+        
+        spans = []
+        start = 0
+        last_candidate = None
+        candidates = [m.end() for m in EmbeddingService.CDC_CANDIDATE_PATTERN.finditer(text)]
+        for end in candidates + [len(text)]:
+            while end - start > max_size:
+                cut = last_candidate if last_candidate and last_candidate > start else start + max_size
+                spans.append((start, cut))
+                start, last_candidate = cut, None
+            
+            if end - start >= min_size and end < len(text):
+                boundary_hash = zlib.crc32(text[end - window:end].encode('utf-8'))
+                if boundary_hash % divisor == 0:
+                    spans.append((start, end))
+                    start, last_candidate = end, None
+                    continue
+            last_candidate = end
+        if start < len(text):
+            spans.append((start, len(text)))
+        
+        chunks = []
+        for start, end in spans:
+            chunk_text = text[start:end].strip()
+            if chunk_text:
+                chunks.append({
+                    'text': chunk_text,
+                    'metadata': {
+                        'chunk_index': len(chunks),
+                        'start_char': start,
+                        'end_char': end,
+                        'length': len(chunk_text)
+                    }
+                })
+        
+        logger.info(f"Chunked document into {len(chunks)} content-defined chunks")
+        return chunks
+
+    @staticmethod
+    def embed_chunks(
+        chunks: List[Dict],
+        previous_chunks: Optional[List] = None,
+        model: Optional[str] = None
+    ) -> Tuple[List[List[float]], int]:
+        """
+        Embed chunks, reusing embeddings of byte-identical chunks from a previous
+        document version.
+        
+        Only previous chunks whose metadata records the same embedding space
+        ('embedding_model', see embedding_space) are reused: models of the same size
+        (e.g. ada-002 and 3-small) produce incompatible vectors.
+        
+        Args:
+            chunks: List of dicts with 'text' (as returned by chunk_document)
+            previous_chunks: DocumentChunk objects of the previous document version
+            model: OpenAI embedding model (defaults to EMBEDDING_MODEL)
+            
+        Returns:
+            Tuple of (embeddings in chunk order, number of embeddings reused)
+        """
+        space = EmbeddingService.embedding_space(model)
+        reusable = {}
+        for previous in previous_chunks or []:
+            embedding = getattr(previous, 'embedding', None)
+            if (
+                embedding is not None
+                and (getattr(previous, 'metadata', None) or {}).get('embedding_model') == space
+                and previous.chunk_text not in reusable
+            ):
+                reusable[previous.chunk_text] = [float(x) for x in embedding]
+        
+        to_embed = [chunk['text'] for chunk in chunks if chunk['text'] not in reusable]
+        generated = iter(EmbeddingService.generate_embeddings(to_embed, model=model) if to_embed else [])
+        
+        embeddings = []
+        for chunk in chunks:
+            if chunk['text'] in reusable:
+                embeddings.append(reusable[chunk['text']])
+            else:
+                embedding = next(generated, None)
+                if embedding is None:
+                    break
+                embeddings.append(embedding)
+        
+        return embeddings, len(chunks) - len(to_embed)
+
+    @staticmethod
+    def generate_embeddings(
+        texts: List[str],
+        model: Optional[str] = None,
+        use_cache: bool = True
+    ) -> List[List[float]]:
         """
-        Generate embeddings for a list of texts using OpenAI API.
+        Generate embeddings for a list of texts.
+        
+        Embeddings are looked up by (sha256(text), model) in the in-process LRU, then
+        in the persistent embedding cache; only the remaining texts (deduplicated) are
+        sent to the OpenAI API, and their embeddings are written back to both levels.
         
         Args:
             texts: List of text strings to embed
-            model: OpenAI embedding model (default: text-embedding-ada-002)
+            model: OpenAI embedding model (defaults to EMBEDDING_MODEL)
+            use_cache: Whether to use the embedding cache (default: True; also
+                disabled by EMBEDDING_CACHE_ENABLED=False)
             
         Returns:
-            List of embedding vectors (each is a list of 1536 floats)
+            List of embedding vectors (get_dimensions(model) floats each), in input order
             
         Raises:
             Exception: If OpenAI API call fails
+            ValueError: If the API returns a different number of embeddings than texts
         """
         if not texts:
             return []
         
+        model = EmbeddingService.get_model(model)
+        dimensions = EmbeddingService.get_dimensions(model)
+        if not use_cache or not getattr(settings, 'EMBEDDING_CACHE_ENABLED', True):
+            return EmbeddingService._request_embeddings(texts, model, dimensions)
+        
+        cache_model = EmbeddingService.embedding_space(model)
+        
+        hashes = [EmbeddingCache.content_hash(text) for text in texts]
+        found = EmbeddingCache.get_many(cache_model, hashes)
+        memory_hits = len(found)
+        
+        missing = [h for h in dict.fromkeys(hashes) if h not in found]
+        if missing:
+            try:
+                from ai_decisions.selectors.embedding_cache_selector import EmbeddingCacheSelector
+                stored = EmbeddingCacheSelector.get_many(cache_model, missing)
+            except Exception as e:
+                logger.warning(f"Embedding cache lookup failed, embedding without it: {e}")
+                stored = {}
+            if stored:
+                found.update(stored)
+                EmbeddingCache.put_many(cache_model, stored)
+                try:
+                    from ai_decisions.repositories.embedding_cache_repository import EmbeddingCacheRepository
+                    EmbeddingCacheRepository.touch_many(cache_model, stored.keys())
+                except Exception as e:
+                    logger.warning(f"Failed to mark {len(stored)} cached embeddings as used: {e}")
+        
+        texts_by_hash = {}
+        for content_hash, text in zip(hashes, texts):
+            if content_hash not in found:
+                texts_by_hash.setdefault(content_hash, text)
+        
+        if texts_by_hash:
+            embeddings = EmbeddingService._request_embeddings(list(texts_by_hash.values()), model, dimensions)
+            if len(embeddings) != len(texts_by_hash):
+                # Vectors that cannot be matched to their texts are neither cached nor returned
+                raise ValueError(
+                    f"Embedding API returned {len(embeddings)} embeddings for {len(texts_by_hash)} texts"
+                )
+            generated = dict(zip(texts_by_hash.keys(), embeddings))
+            found.update(generated)
+            EmbeddingCache.put_many(cache_model, generated)
+            try:
+                from ai_decisions.repositories.embedding_cache_repository import EmbeddingCacheRepository
+                EmbeddingCacheRepository.store_many(cache_model, generated)
+            except Exception as e:
+                logger.warning(f"Failed to persist {len(generated)} embeddings to the embedding cache: {e}")
+        
+        track_embedding_cache_lookup(model=cache_model, result='memory_hit', count=memory_hits)
+        track_embedding_cache_lookup(model=cache_model, result='store_hit', count=len(missing) - len(texts_by_hash))
+        track_embedding_cache_lookup(model=cache_model, result='miss', count=len(texts_by_hash))
+        logger.debug(
+            f"Embedding cache for {len(texts)} texts ({cache_model}): {memory_hits} memory hits, "
+            f"{len(missing) - len(texts_by_hash)} store hits, {len(texts_by_hash)} generated"
+        )
+        
+        return [list(found[content_hash]) for content_hash in hashes]
+
+    @staticmethod
+    def _request_embeddings(texts: List[str], model: str, dimensions: Optional[int] = None) -> List[List[float]]:
+        """
+        Call the OpenAI embeddings API for a list of texts (no caching).
+        
+        `dimensions` below the model's native size is sent as the API's `dimensions`
+        parameter (shortened embeddings, text-embedding-3 models only).
+        
+        Raises:
+            Exception: If OpenAI API call fails
+        """
         try:
             # Import OpenAI client (will be available when openai package is installed)
             try:
@@ -111,10 +331,14 @@ class EmbeddingService:
             client = OpenAI(api_key=api_key)
             
             # Generate embeddings
-            response = client.embeddings.create(
-                model=model,
-                input=texts
-            )
+            request = {'model': model, 'input': texts}
+            if (
+                dimensions
+                and model in EmbeddingService.REDUCIBLE_MODELS
+                and dimensions < EmbeddingService.MODEL_DIMENSIONS[model]
+            ):
+                request['dimensions'] = dimensions
+            response = client.embeddings.create(**request)
             
             embeddings = [item.embedding for item in response.data]
             
@@ -126,27 +350,72 @@ class EmbeddingService:
             raise
 
     @staticmethod
-    def generate_embedding(text: str, model: str = "text-embedding-ada-002") -> List[float]:
+    def generate_embedding(
+        text: str,
+        model: Optional[str] = None,
+        use_cache: bool = True
+    ) -> List[float]:
         """
         Generate a single embedding for text.
         
         Args:
             text: Text to embed
-            model: OpenAI embedding model
+            model: OpenAI embedding model (defaults to EMBEDDING_MODEL)
+            use_cache: Whether to use the embedding cache (default: True)
             
         Returns:
-            Embedding vector (list of 1536 floats)
+            Embedding vector (list of get_dimensions(model) floats)
         """
-        embeddings = EmbeddingService.generate_embeddings([text], model=model)
+        embeddings = EmbeddingService.generate_embeddings([text], model=model, use_cache=use_cache)
         return embeddings[0] if embeddings else []
 
     @staticmethod
-    def validate_embedding(embedding: List[float]) -> bool:
+    def get_model(model: Optional[str] = None) -> str:
+        """Embedding model to use: the given one, else EMBEDDING_MODEL."""
+        return model or getattr(settings, 'EMBEDDING_MODEL', None) or EmbeddingService.DEFAULT_MODEL
+
+    @staticmethod
+    def embedding_space(model: Optional[str] = None) -> str:
+        """
+        Identifier of the vectors a model produces: the model name, suffixed with
+        '@<dimensions>' for shortened embeddings (which are different vectors).
+        
+        Used as the embedding cache key and recorded on stored chunks.
+        """
+        model = EmbeddingService.get_model(model)
+        dimensions = EmbeddingService.get_dimensions(model)
+        native = EmbeddingService.MODEL_DIMENSIONS.get(model, EmbeddingService.EMBEDDING_DIMENSIONS)
+        return model if dimensions == native else f"{model}@{dimensions}"
+    
+    @staticmethod
+    def get_dimensions(model: Optional[str] = None) -> int:
+        """
+        Dimensions of the embeddings produced for a model.
+        
+        EMBEDDING_DIMENSIONS shortens the embeddings of models that support it;
+        other models always produce their native size.
+        
+        Args:
+            model: Embedding model (defaults to EMBEDDING_MODEL)
+            
+        Returns:
+            Number of dimensions
+        """
+        model = EmbeddingService.get_model(model)
+        native = EmbeddingService.MODEL_DIMENSIONS.get(model, EmbeddingService.EMBEDDING_DIMENSIONS)
+        configured = getattr(settings, 'EMBEDDING_DIMENSIONS', None)
+        if configured and model in EmbeddingService.REDUCIBLE_MODELS and configured < native:
+            return configured
+        return native
+
+    @staticmethod
+    def validate_embedding(embedding: List[float], model: Optional[str] = None) -> bool:
         """
         Validate that embedding has correct dimensions.
         
         Args:
             embedding: Embedding vector to validate
+            model: Embedding model (defaults to EMBEDDING_MODEL)
             
         Returns:
             True if valid, False otherwise
@@ -154,10 +423,11 @@ class EmbeddingService:
         if not embedding:
             return False
         
-        if len(embedding) != EmbeddingService.EMBEDDING_DIMENSIONS:
+        dimensions = EmbeddingService.get_dimensions(model)
+        if len(embedding) != dimensions:
             logger.warning(
                 f"Embedding has {len(embedding)} dimensions, "
-                f"expected {EmbeddingService.EMBEDDING_DIMENSIONS}"
+                f"expected {dimensions}"
             )
             return False
         
@@ -0,0 +1,59 @@
+"""
+Vector Search Backends.
+
+Pluggable similarity search behind PgVectorService. VECTOR_SEARCH_BACKEND selects it:
+- 'pgvector' (default): PostgreSQL/pgvector queries in PgVectorService itself.
+- 'numpy': NumpyVectorBackend over the export at VECTOR_SEARCH_NUMPY_PATH
+  (see `manage.py benchmark_vector_search --export`).
+"""
+import threading
+from typing import Optional
+
+from django.conf import settings
+
+from .base import ChunkRecord, VectorBackend, metadata_matches
+
+_backend: Optional[VectorBackend] = None
+_backend_lock = threading.Lock()
+
+
+def get_vector_backend() -> Optional[VectorBackend]:
+    """
+    The configured non-database backend, or None to search with pgvector.
+
+    A backend installed with set_vector_backend() takes precedence over settings.
+    """
+    global _backend
+    if _backend is not None:
+        return _backend
+
+    backend_name = getattr(settings, 'VECTOR_SEARCH_BACKEND', 'pgvector') or 'pgvector'
+    if backend_name == 'pgvector':
+        return None
+    if backend_name != 'numpy':
+        raise ValueError(f"Unknown VECTOR_SEARCH_BACKEND '{backend_name}', expected 'pgvector' or 'numpy'")
+
+    path = getattr(settings, 'VECTOR_SEARCH_NUMPY_PATH', None)
+    if not path:
+        raise ValueError("VECTOR_SEARCH_NUMPY_PATH must be set when VECTOR_SEARCH_BACKEND is 'numpy'")
+    with _backend_lock:
+        if _backend is None:
+            from .numpy_backend import NumpyVectorBackend
+            _backend = NumpyVectorBackend.load(path)
+    return _backend
+
+
+def set_vector_backend(backend: Optional[VectorBackend]) -> None:
+    """Install a backend instance (offline evaluation, tests); None restores settings-based selection."""
+    global _backend
+    with _backend_lock:
+        _backend = backend
+
+
+__all__ = [
+    'ChunkRecord',
+    'VectorBackend',
+    'metadata_matches',
+    'get_vector_backend',
+    'set_vector_backend',
+]
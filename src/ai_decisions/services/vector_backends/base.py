@@ -0,0 +1,103 @@
+"""
+Vector Search Backend Interface
+
+PgVectorService searches document chunks with PostgreSQL/pgvector. When
+VECTOR_SEARCH_BACKEND selects another backend, its similarity searches are answered
+by a VectorBackend instead - e.g. the NumPy backend, which searches an exported copy
+of document_chunks in process (offline retrieval benchmarks, tests without pgvector).
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class ChunkRecord:
+    """
+    A document chunk held by a non-database backend.
+
+    Exposes the attributes RAG code reads from DocumentChunk search results
+    (id, chunk_text, metadata, distance, document_version.source_document.source_url).
+    """
+    id: str
+    chunk_text: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    chunk_index: int = 0
+    document_version_id: Optional[str] = None
+    source_url: Optional[str] = None
+    distance: Optional[float] = None
+
+    @property
+    def document_version(self) -> SimpleNamespace:
+        return SimpleNamespace(
+            id=self.document_version_id,
+            source_document=SimpleNamespace(source_url=self.source_url)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'chunk_text': self.chunk_text,
+            'metadata': self.metadata,
+            'chunk_index': self.chunk_index,
+            'document_version_id': self.document_version_id,
+            'source_url': self.source_url,
+        }
+
+
+def metadata_matches(metadata: Dict[str, Any], filters: Optional[Dict[str, Any]]) -> bool:
+    """
+    Whether chunk metadata satisfies PgVectorService metadata filters.
+
+    Mirrors the database semantics: scalar values must be equal, lists/dicts are
+    matched by JSON containment (`metadata @> {key: value}`).
+    """
+    for key, value in (filters or {}).items():
+        if key not in metadata or not _contains(metadata[key], value):
+            return False
+    return True
+
+
+def _contains(actual: Any, expected: Any) -> bool:
+    if isinstance(expected, dict):
+        return isinstance(actual, dict) and all(
+            key in actual and _contains(actual[key], value) for key, value in expected.items()
+        )
+    if isinstance(expected, list):
+        if not isinstance(actual, list):
+            return False
+        return all(any(_contains(item, value) for item in actual) for value in expected)
+    if isinstance(actual, list):
+        # jsonb: an array contains a primitive element
+        return expected in actual
+    return actual == expected
+
+
+class VectorBackend(ABC):
+    """Similarity search over document chunk embeddings (cosine distance)."""
+
+    name = ''
+
+    @abstractmethod
+    def search(
+        self,
+        query_embeddings: List[List[float]],
+        limit: int = 10,
+        filters: Optional[List[Optional[Dict]]] = None,
+        similarity_threshold: float = 0.7,
+        document_version_id: Optional[str] = None
+    ) -> List[List[ChunkRecord]]:
+        """
+        Run one similarity search per query embedding.
+
+        Args:
+            query_embeddings: Query vectors
+            limit: Maximum number of results per query
+            filters: Optional metadata filters, one dict (or None) per query
+            similarity_threshold: Minimum similarity score (0-1, where 1 is identical)
+            document_version_id: Optional filter by specific document version
+
+        Returns:
+            One list of chunks (with `distance`) per query, most similar first
+        """
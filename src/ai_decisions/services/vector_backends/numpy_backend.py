@@ -0,0 +1,358 @@
+"""
+NumPy Vector Backend
+
+In-process similarity search over an exported copy of document_chunks.
+
+An export directory holds:
+- embeddings.npy: float32 matrix (one L2-normalised row per chunk), loaded memory-mapped
+  so large exports are paged in by the OS instead of read into memory.
+- chunks.jsonl: one ChunkRecord per line, in row order.
+
+Search is exact (brute force, one matrix-vector product) by default. build_ivf()
+adds an inverted-file index (spherical k-means lists); searches then scan only the
+`n_probes` lists nearest to the query, trading recall for latency like pgvector's
+IVFFlat. Distances are cosine distances (0 = identical, 2 = opposite), as in pgvector.
+"""
+import json
+import logging
+import os
+from dataclasses import replace
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ai_decisions.services.vector_backends.base import ChunkRecord, VectorBackend, metadata_matches
+
+logger = logging.getLogger('django')
+
+EMBEDDINGS_FILE = 'embeddings.npy'
+CHUNKS_FILE = 'chunks.jsonl'
+
+# Metadata keys with an inverted index (the hot filters of PgVectorService)
+INDEXED_METADATA_KEYS = ('jurisdiction', 'visa_code')
+
+
+class NumpyVectorBackend(VectorBackend):
+    """Brute-force or IVF cosine search over a (memory-mapped) float32 matrix."""
+
+    name = 'numpy'
+
+    # Rows per block when assigning rows to IVF lists (bounds the rows x lists score matrix)
+    ASSIGN_BLOCK_ROWS = 8192
+
+    def __init__(self, embeddings: np.ndarray, records: List[ChunkRecord], normalized: bool = False):
+        """
+        Args:
+            embeddings: (n_chunks, dimensions) matrix, row i belonging to records[i]
+            records: Chunk records
+            normalized: Whether rows are already L2-normalised (exports are)
+        """
+        if embeddings.ndim != 2 or embeddings.shape[0] != len(records):
+            raise ValueError(
+                f"Embeddings shape {embeddings.shape} does not match {len(records)} chunk records"
+            )
+        self.embeddings = embeddings if normalized else self._normalize(np.asarray(embeddings, dtype=np.float32))
+        self.records = records
+        self.default_probes: Optional[int] = None
+        self._centroids: Optional[np.ndarray] = None
+        self._lists: List[np.ndarray] = []
+        self._metadata_index: Dict[str, Dict[Any, np.ndarray]] = {}
+        self._version_index: Optional[Dict[str, np.ndarray]] = None
+
+    @property
+    def dimensions(self) -> int:
+        return self.embeddings.shape[1]
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    # ---- construction / persistence ----
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[Any]) -> 'NumpyVectorBackend':
+        """Build from DocumentChunk-like objects (chunks without an embedding are skipped)."""
+        rows, records = [], []
+        for chunk in chunks:
+            embedding = getattr(chunk, 'embedding', None)
+            if embedding is None or not len(embedding):
+                continue
+            rows.append(np.asarray(embedding, dtype=np.float32))
+            records.append(cls._record_for(chunk))
+        if not rows:
+            raise ValueError("No embedded chunks to build a vector backend from")
+        return cls(np.vstack(rows), records)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> 'NumpyVectorBackend':
+        """
+        Load an export directory.
+
+        Args:
+            path: Directory written by save() or export_document_chunks()
+            mmap: Memory-map the embedding matrix (read-only) instead of reading it
+        """
+        embeddings = np.load(os.path.join(path, EMBEDDINGS_FILE), mmap_mode='r' if mmap else None)
+        with open(os.path.join(path, CHUNKS_FILE), encoding='utf-8') as f:
+            records = [ChunkRecord(**json.loads(line)) for line in f if line.strip()]
+        logger.info(f"Loaded {len(records)} chunks ({embeddings.shape[1]} dims) from {path}")
+        return cls(embeddings, records, normalized=True)
+
+    def save(self, path: str) -> None:
+        """Write this backend's chunks as an export directory."""
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, EMBEDDINGS_FILE), np.asarray(self.embeddings, dtype=np.float32))
+        with open(os.path.join(path, CHUNKS_FILE), 'w', encoding='utf-8') as f:
+            for record in self.records:
+                f.write(json.dumps(record.to_dict()) + '\n')
+
+    @classmethod
+    def export_document_chunks(cls, path: str, queryset=None, batch_size: int = 1000) -> int:
+        """
+        Stream embedded document chunks from the database into an export directory.
+
+        Rows are written straight into a memory-mapped .npy file, so exports larger
+        than memory work.
+
+        Args:
+            path: Output directory
+            queryset: DocumentChunk queryset (default: all embedded, non-deleted chunks)
+            batch_size: Rows fetched per database round trip
+
+        Returns:
+            Number of chunks exported
+        """
+        from data_ingestion.models.document_chunk import DocumentChunk
+
+        if queryset is None:
+            queryset = DocumentChunk.objects.filter(embedding__isnull=False, is_deleted=False)
+        queryset = queryset.select_related('document_version__source_document').order_by('id')
+
+        total = queryset.count()
+        first = queryset.first()
+        if not total or first is None:
+            raise ValueError("No embedded document chunks to export")
+
+        os.makedirs(path, exist_ok=True)
+        matrix_path = os.path.join(path, EMBEDDINGS_FILE)
+        matrix = np.lib.format.open_memmap(
+            matrix_path, mode='w+', dtype=np.float32, shape=(total, len(first.embedding))
+        )
+        written = 0
+        with open(os.path.join(path, CHUNKS_FILE), 'w', encoding='utf-8') as f:
+            for chunk in queryset.iterator(chunk_size=batch_size):
+                if written == total:
+                    break  # rows added after counting
+                if chunk.embedding is None or len(chunk.embedding) != matrix.shape[1]:
+                    continue
+                matrix[written] = cls._normalize(np.asarray(chunk.embedding, dtype=np.float32)[None, :])[0]
+                f.write(json.dumps(cls._record_for(chunk).to_dict()) + '\n')
+                written += 1
+        matrix.flush()
+        del matrix
+
+        if written < total:
+            # Rows were skipped or deleted while exporting; drop the unused tail
+            np.save(matrix_path, np.load(matrix_path)[:written])
+
+        logger.info(f"Exported {written} document chunks to {path}")
+        return written
+
+    @staticmethod
+    def _record_for(chunk: Any) -> ChunkRecord:
+        document_version = getattr(chunk, 'document_version', None)
+        source_document = getattr(document_version, 'source_document', None)
+        return ChunkRecord(
+            id=str(chunk.id),
+            chunk_text=chunk.chunk_text,
+            metadata=dict(chunk.metadata or {}),
+            chunk_index=getattr(chunk, 'chunk_index', 0),
+            document_version_id=str(document_version.id) if document_version is not None else None,
+            source_url=getattr(source_document, 'source_url', None),
+        )
+
+    @staticmethod
+    def _normalize(matrix: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (matrix / norms).astype(np.float32, copy=False)
+
+    # ---- IVF ----
+
+    def build_ivf(
+        self,
+        n_lists: Optional[int] = None,
+        iterations: int = 10,
+        default_probes: Optional[int] = None,
+        seed: int = 0
+    ) -> None:
+        """
+        Build an inverted-file index with spherical k-means.
+
+        Args:
+            n_lists: Number of lists (default: sqrt(n_chunks))
+            iterations: k-means iterations
+            default_probes: Lists scanned per query when search() gets no n_probes
+                (default: sqrt(n_lists))
+            seed: Random seed for the initial centroids
+        """
+        n_rows = len(self.records)
+        n_lists = max(1, min(n_lists or int(np.sqrt(n_rows)), n_rows))
+        rng = np.random.default_rng(seed)
+        centroids = np.array(self.embeddings[rng.choice(n_rows, size=n_lists, replace=False)], dtype=np.float32)
+
+        assignments = np.zeros(n_rows, dtype=np.int64)
+        for _ in range(iterations):
+            assignments = self._assign(centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, self.embeddings)
+            counts = np.bincount(assignments, minlength=n_lists)
+            empty = counts == 0
+            if empty.any():
+                # Re-seed empty lists with random rows
+                sums[empty] = self.embeddings[rng.choice(n_rows, size=int(empty.sum()))]
+            centroids = self._normalize(sums)
+
+        assignments = self._assign(centroids)
+        self._centroids = centroids
+        self._lists = [np.flatnonzero(assignments == i) for i in range(n_lists)]
+        self.default_probes = default_probes or max(1, int(np.sqrt(n_lists)))
+        logger.info(f"Built IVF index: {n_lists} lists over {n_rows} chunks, {self.default_probes} default probes")
+
+    def _assign(self, centroids: np.ndarray) -> np.ndarray:
+        assignments = np.empty(len(self.records), dtype=np.int64)
+        for start in range(0, len(self.records), self.ASSIGN_BLOCK_ROWS):
+            block = self.embeddings[start:start + self.ASSIGN_BLOCK_ROWS]
+            assignments[start:start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+        return assignments
+
+    def _ivf_candidates(self, query: np.ndarray, n_probes: int) -> np.ndarray:
+        probes = min(n_probes, len(self._lists))
+        nearest = np.argpartition(-(self._centroids @ query), probes - 1)[:probes]
+        return np.sort(np.concatenate([self._lists[i] for i in nearest]))
+
+    # ---- search ----
+
+    def search(
+        self,
+        query_embeddings: List[List[float]],
+        limit: int = 10,
+        filters: Optional[List[Optional[Dict]]] = None,
+        similarity_threshold: float = 0.7,
+        document_version_id: Optional[str] = None,
+        n_probes: Optional[int] = None
+    ) -> List[List[ChunkRecord]]:
+        """
+        See VectorBackend.search.
+
+        Args:
+            n_probes: IVF lists to scan per query (default: default_probes; 0 or no
+                IVF index = exact search)
+        """
+        if filters is None:
+            filters = [None] * len(query_embeddings)
+        if len(filters) != len(query_embeddings):
+            raise ValueError(f"Mismatch: {len(query_embeddings)} queries but {len(filters)} filters")
+        if n_probes is None:
+            n_probes = self.default_probes
+
+        max_distance = 2 * (1 - similarity_threshold)
+        allowed_by_filters: Dict[str, Optional[np.ndarray]] = {}
+        results = []
+        for query_embedding, query_filters in zip(query_embeddings, filters):
+            if query_embedding is None or len(query_embedding) != self.dimensions:
+                logger.error(
+                    f"Query embedding has {len(query_embedding) if query_embedding is not None else 0} "
+                    f"dimensions, expected {self.dimensions}"
+                )
+                results.append([])
+                continue
+            query = np.asarray(query_embedding, dtype=np.float32)
+            norm = np.linalg.norm(query)
+            if norm == 0:
+                results.append([])
+                continue
+            query = query / norm
+
+            filter_key = json.dumps(query_filters or {}, sort_keys=True, default=str)
+            if filter_key not in allowed_by_filters:
+                allowed_by_filters[filter_key] = self._allowed_rows(query_filters, document_version_id)
+            rows = allowed_by_filters[filter_key]
+            if n_probes and self._centroids is not None:
+                candidates = self._ivf_candidates(query, n_probes)
+                rows = candidates if rows is None else np.intersect1d(candidates, rows, assume_unique=True)
+
+            results.append(self._top_k(query, rows, limit, max_distance))
+        return results
+
+    def _top_k(
+        self,
+        query: np.ndarray,
+        rows: Optional[np.ndarray],
+        limit: int,
+        max_distance: float
+    ) -> List[ChunkRecord]:
+        """Nearest `limit` rows (all rows when `rows` is None) within max_distance."""
+        if limit <= 0 or (rows is not None and not len(rows)):
+            return []
+        matrix = self.embeddings if rows is None else self.embeddings[rows]
+        distances = 1.0 - matrix @ query
+        within = np.flatnonzero(distances <= max_distance)
+        if len(within) > limit:
+            within = within[np.argpartition(distances[within], limit - 1)[:limit]]
+        within = within[np.argsort(distances[within], kind='stable')]
+        positions = within if rows is None else rows[within]
+        return [
+            replace(self.records[position], distance=float(distance))
+            for position, distance in zip(positions, distances[within])
+        ]
+
+    def _allowed_rows(
+        self,
+        filters: Optional[Dict],
+        document_version_id: Optional[str] = None
+    ) -> Optional[np.ndarray]:
+        """Sorted row positions matching the filters, or None when nothing is filtered."""
+        rows: Optional[np.ndarray] = None
+        remaining = {}
+        for key, value in (filters or {}).items():
+            if key in INDEXED_METADATA_KEYS and isinstance(value, (str, int, bool)):
+                matched = self._indexed_rows(key, value)
+                rows = matched if rows is None else np.intersect1d(rows, matched, assume_unique=True)
+            else:
+                remaining[key] = value
+
+        if document_version_id:
+            matched = self._version_rows(str(document_version_id))
+            rows = matched if rows is None else np.intersect1d(rows, matched, assume_unique=True)
+
+        if remaining:
+            candidates = range(len(self.records)) if rows is None else rows
+            rows = np.array(
+                [i for i in candidates if metadata_matches(self.records[i].metadata, remaining)],
+                dtype=np.int64
+            )
+        return rows
+
+    def _indexed_rows(self, key: str, value: Any) -> np.ndarray:
+        if key not in self._metadata_index:
+            index: Dict[Any, List[int]] = {}
+            for i, record in enumerate(self.records):
+                if key in record.metadata:
+                    try:
+                        index.setdefault(record.metadata[key], []).append(i)
+                    except TypeError:
+                        continue  # unhashable value (list/dict) - only matched by containment
+            self._metadata_index[key] = {k: np.array(v, dtype=np.int64) for k, v in index.items()}
+        return self._metadata_index[key].get(value, np.empty(0, dtype=np.int64))
+
+    def _version_rows(self, document_version_id: str) -> np.ndarray:
+        if self._version_index is None:
+            index: Dict[str, List[int]] = {}
+            for i, record in enumerate(self.records):
+                index.setdefault(record.document_version_id, []).append(i)
+            self._version_index = {k: np.array(v, dtype=np.int64) for k, v in index.items()}
+        return self._version_index.get(document_version_id, np.empty(0, dtype=np.int64))
+
+    def chunk_embedding(self, position: int) -> Tuple[ChunkRecord, np.ndarray]:
+        """Record and (normalised) embedding at a row position."""
+        return self.records[position], np.asarray(self.embeddings[position])
@@ -11,9 +11,19 @@ Benefits of pgvector:
 - Cost-effective (no additional service costs)
 - Simple architecture (single database)
 """
+import copy
 import logging
-from typing import List, Dict, Optional
-from pgvector.django import CosineDistance
+from typing import Any, Callable, List, Dict, Optional, Tuple
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import BooleanField, FloatField, Func, IntegerField, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Cast
+from pgvector.django import BitField, CosineDistance, HalfVector, HalfVectorField, HammingDistance, VectorField
+from ai_decisions.helpers.rank_fusion import DEFAULT_RRF_K, reciprocal_rank_fusion
+from ai_decisions.services.embedding_service import EmbeddingService
+from ai_decisions.services.vector_backends import get_vector_backend
+from data_ingestion.helpers.vector_index import get_precision
 from data_ingestion.models.document_chunk import DocumentChunk
 from data_ingestion.models.document_version import DocumentVersion
 from main_system.utils.cache_utils import bump_namespace
@@ -25,6 +35,11 @@ def namespace(*args, **kwargs) -> str:
     return "document_chunks"
 
 
+class BinaryQuantize(Func):
+    """pgvector binary_quantize(): one bit per dimension, set where the value is > 0."""
+    function = 'binary_quantize'
+
+
 class PgVectorService:
     """
     Service for vector similarity search using pgvector (PostgreSQL extension).
@@ -36,6 +51,22 @@ class PgVectorService:
     application data, providing ACID compliance and simplified architecture.
     """
 
+    # Metadata keys with expression indexes on document_chunks (see DocumentChunk.Meta);
+    # scalar filters on these use `metadata -> key = value` instead of `metadata @> {...}`
+    INDEXED_METADATA_KEYS = ('jurisdiction', 'visa_code')
+
+    # Rows per INSERT in store_chunks (each row carries an embedding-sized float vector)
+    STORE_BATCH_SIZE = 200
+
+    # Binary-quantized search: Hamming-distance shortlist size as a multiple of the limit,
+    # re-ranked by float cosine distance (overridden by VECTOR_SEARCH_BINARY_RERANK_FACTOR)
+    DEFAULT_BINARY_RERANK_FACTOR = 4
+    PGVECTOR_DEFAULT_EF_SEARCH = 40
+
+    # Text search configuration of the generated document_chunks.search_vector column
+    # (data_ingestion migration 0006); queries must use the same one to hit the GIN index
+    TEXT_SEARCH_CONFIG = 'english'
+
     @staticmethod
     def store_chunks(
         document_version: DocumentVersion,
@@ -45,10 +76,13 @@ class PgVectorService:
         """
         Store document chunks with embeddings.
         
+        Chunks are inserted with batched bulk INSERTs (STORE_BATCH_SIZE rows each)
+        in one transaction, followed by a single namespace bump.
+        
         Args:
             document_version: DocumentVersion instance
             chunks: List of dicts with 'text' and 'metadata'
-            embeddings: List of embedding vectors (1536 dims for ada-002)
+            embeddings: List of embedding vectors (EmbeddingService.get_dimensions() dims)
             
         Returns:
             List of created DocumentChunk objects
@@ -57,23 +91,8 @@ class PgVectorService:
             raise ValueError(f"Mismatch: {len(chunks)} chunks but {len(embeddings)} embeddings")
         
         try:
-            chunk_objects = []
-            for i, (chunk_data, embedding) in enumerate(zip(chunks, embeddings)):
-                # Validate embedding dimensions
-                if len(embedding) != 1536:
-                    logger.warning(
-                        f"Skipping chunk {i}: embedding has {len(embedding)} dimensions, expected 1536"
-                    )
-                    continue
-                
-                chunk = DocumentChunk.objects.create(
-                    document_version=document_version,
-                    chunk_text=chunk_data.get('text', ''),
-                    chunk_index=chunk_data.get('metadata', {}).get('chunk_index', i),
-                    embedding=embedding,
-                    metadata=chunk_data.get('metadata', {})
-                )
-                chunk_objects.append(chunk)
+            with transaction.atomic():
+                chunk_objects = PgVectorService._insert_chunks(document_version, chunks, embeddings)
             
             logger.info(
                 f"Stored {len(chunk_objects)} chunks for document version {document_version.id}"
@@ -85,23 +104,64 @@ class PgVectorService:
             logger.error(f"Error storing chunks: {e}", exc_info=True)
             raise
 
+    @staticmethod
+    def _insert_chunks(
+        document_version: DocumentVersion,
+        chunks: List[Dict],
+        embeddings: List[List[float]]
+    ) -> List[DocumentChunk]:
+        """Bulk insert chunks, skipping embeddings with the wrong dimensions (no namespace bump)."""
+        dimensions = EmbeddingService.get_dimensions()
+        chunk_objects = []
+        for i, (chunk_data, embedding) in enumerate(zip(chunks, embeddings)):
+            # Validate embedding dimensions
+            if len(embedding) != dimensions:
+                logger.warning(
+                    f"Skipping chunk {i}: embedding has {len(embedding)} dimensions, expected {dimensions}"
+                )
+                continue
+            
+            chunk_objects.append(DocumentChunk(
+                document_version=document_version,
+                chunk_text=chunk_data.get('text', ''),
+                chunk_index=chunk_data.get('metadata', {}).get('chunk_index', i),
+                embedding=embedding,
+                metadata=chunk_data.get('metadata', {})
+            ))
+        
+        if not chunk_objects:
+            return []
+        return DocumentChunk.objects.bulk_create(chunk_objects, batch_size=PgVectorService.STORE_BATCH_SIZE)
+
     @staticmethod
     def search_similar(
         query_embedding: List[float],
         limit: int = 10,
         filters: Optional[Dict] = None,
         similarity_threshold: float = 0.7,
-        document_version_id: Optional[str] = None
+        document_version_id: Optional[str] = None,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None
     ) -> List[DocumentChunk]:
         """
         Search for similar chunks using cosine similarity.
         
+        Uses the ANN index on embedding when one exists (see
+        data_ingestion.helpers.vector_index); ef_search/probes trade latency for recall.
+        When VECTOR_SEARCH_BACKEND selects another backend (see
+        ai_decisions.services.vector_backends), it answers the search instead and
+        returns ChunkRecord objects with the same attributes.
+        
         Args:
-            query_embedding: Query vector (1536 dims)
+            query_embedding: Query vector (EmbeddingService.get_dimensions() dims)
             limit: Maximum number of results
             filters: Optional metadata filters (e.g., {'visa_code': 'SKILLED_WORKER'})
             similarity_threshold: Minimum similarity score (0-1, where 1 is identical)
             document_version_id: Optional filter by specific document version
+            ef_search: HNSW candidate list size for this query (defaults to
+                VECTOR_SEARCH_HNSW_EF_SEARCH; pgvector default 40). Should be >= limit.
+            probes: IVFFlat lists to scan for this query (defaults to
+                VECTOR_SEARCH_IVFFLAT_PROBES; pgvector default 1)
             
         Returns:
             List of DocumentChunk objects ordered by similarity (most similar first)
@@ -109,52 +169,434 @@ class PgVectorService:
         if not query_embedding:
             return []
         
-        if len(query_embedding) != 1536:
-            logger.error(f"Query embedding has {len(query_embedding)} dimensions, expected 1536")
+        backend = get_vector_backend()
+        if backend is not None:
+            return backend.search(
+                [query_embedding],
+                limit=limit,
+                filters=[filters],
+                similarity_threshold=similarity_threshold,
+                document_version_id=document_version_id
+            )[0]
+        
+        dimensions = EmbeddingService.get_dimensions()
+        if len(query_embedding) != dimensions:
+            logger.error(f"Query embedding has {len(query_embedding)} dimensions, expected {dimensions}")
             return []
         
         try:
-            # Start with base query
-            queryset = DocumentChunk.objects.filter(
-                embedding__isnull=False
+            queryset = PgVectorService._build_search_queryset(
+                query_embedding=query_embedding,
+                filters=filters,
+                similarity_threshold=similarity_threshold,
+                document_version_id=document_version_id,
+                limit=limit
+            ).select_related('document_version__source_document')
+            
+            # Limit results
+            results = PgVectorService._run_search(
+                lambda: list(queryset[:limit]), ef_search, probes, PgVectorService._binary_shortlist_size(limit)
             )
             
-            # Filter by document version if specified
-            if document_version_id:
-                queryset = queryset.filter(document_version_id=document_version_id)
+            logger.info(
+                f"Found {len(results)} similar chunks "
+                f"(threshold: {similarity_threshold}, limit: {limit})"
+            )
+            return results
             
-            # Apply metadata filters
-            if filters:
-                for key, value in filters.items():
-                    # Use JSON field contains lookup
-                    queryset = queryset.filter(metadata__contains={key: value})
+        except Exception as e:
+            logger.error(f"Error searching similar chunks: {e}", exc_info=True)
+            return []
+
+    @staticmethod
+    def search_similar_many(
+        query_embeddings: List[List[float]],
+        limit: int = 10,
+        filters: Optional[List[Optional[Dict]]] = None,
+        similarity_threshold: float = 0.7,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None
+    ) -> List[List[DocumentChunk]]:
+        """
+        Run several similarity searches in one round trip.
+        
+        The per-query top-k searches are combined with UNION ALL; the matching
+        chunks are then loaded once with document_version__source_document
+        preloaded. Backends without ordered/sliced compound queries (SQLite) fall
+        back to one search_similar call per query.
+        
+        Args:
+            query_embeddings: Query vectors (EmbeddingService.get_dimensions() dims each)
+            limit: Maximum number of results per query
+            filters: Optional metadata filters, one dict (or None) per query
+            similarity_threshold: Minimum similarity score (0-1, where 1 is identical)
+            ef_search: See search_similar
+            probes: See search_similar
             
-            # Vector similarity search using cosine distance
-            # Lower distance = higher similarity
-            # Cosine distance ranges from 0 (identical) to 2 (opposite)
-            queryset = queryset.annotate(
-                distance=CosineDistance('embedding', query_embedding)
-            ).order_by('distance')
+        Returns:
+            One list of DocumentChunk objects (with `distance`) per query, in query
+            order, each ordered by similarity (most similar first)
+        """
+        filters = filters or [None] * len(query_embeddings)
+        if len(filters) != len(query_embeddings):
+            raise ValueError(f"Mismatch: {len(query_embeddings)} queries but {len(filters)} filters")
+        
+        backend = get_vector_backend()
+        if backend is not None:
+            return backend.search(
+                query_embeddings,
+                limit=limit,
+                filters=filters,
+                similarity_threshold=similarity_threshold
+            )
+        
+        results: List[List[DocumentChunk]] = [[] for _ in query_embeddings]
+        dimensions = EmbeddingService.get_dimensions()
+        valid = [i for i, embedding in enumerate(query_embeddings) if embedding and len(embedding) == dimensions]
+        if len(valid) < len(query_embeddings):
+            logger.error(f"{len(query_embeddings) - len(valid)} query embeddings do not have {dimensions} dimensions")
+        if not valid:
+            return results
+        
+        if len(valid) == 1 or not connection.features.supports_slicing_ordering_in_compound:
+            for i in valid:
+                results[i] = PgVectorService.search_similar(
+                    query_embedding=query_embeddings[i],
+                    limit=limit,
+                    filters=filters[i],
+                    similarity_threshold=similarity_threshold,
+                    ef_search=ef_search,
+                    probes=probes
+                )
+            return results
+        
+        try:
+            parts = [
+                PgVectorService._build_search_queryset(
+                    query_embedding=query_embeddings[i],
+                    filters=filters[i],
+                    similarity_threshold=similarity_threshold,
+                    limit=limit
+                ).annotate(
+                    query_index=Value(i, output_field=IntegerField())
+                ).values_list('query_index', 'id', 'distance')[:limit]
+                for i in valid
+            ]
+            combined = parts[0].union(*parts[1:], all=True)
+            rows = PgVectorService._run_search(
+                lambda: list(combined), ef_search, probes, PgVectorService._binary_shortlist_size(limit)
+            )
             
-            # Filter by similarity threshold
-            # Cosine distance: 0 = identical, 2 = opposite
-            # Similarity = 1 - (distance / 2)
-            # So distance <= 0.6 means similarity >= 0.7
-            max_distance = 2 * (1 - similarity_threshold)
-            queryset = queryset.filter(distance__lte=max_distance)
+            chunks_by_id = DocumentChunk.objects.select_related(
+                'document_version__source_document'
+            ).in_bulk({chunk_id for _, chunk_id, _ in rows})
             
-            # Limit results
-            results = list(queryset[:limit])
+            for query_index, chunk_id, distance in sorted(rows, key=lambda row: (row[0], row[2])):
+                chunk = chunks_by_id.get(chunk_id)
+                if chunk is None:
+                    continue
+                # The same chunk can match several queries at different distances
+                chunk = copy.copy(chunk)
+                chunk.distance = distance
+                results[query_index].append(chunk)
             
             logger.info(
-                f"Found {len(results)} similar chunks "
+                f"Found {len(rows)} similar chunks for {len(valid)} queries "
                 f"(threshold: {similarity_threshold}, limit: {limit})"
             )
             return results
             
         except Exception as e:
-            logger.error(f"Error searching similar chunks: {e}", exc_info=True)
+            logger.error(f"Error searching similar chunks for {len(valid)} queries: {e}", exc_info=True)
+            return [[] for _ in query_embeddings]
+
+    @staticmethod
+    def search_hybrid(
+        query_embedding: List[float],
+        query_text: str,
+        limit: int = 10,
+        filters: Optional[Dict] = None,
+        similarity_threshold: float = 0.7,
+        document_version_id: Optional[str] = None,
+        candidate_limit: Optional[int] = None,
+        rrf_k: int = DEFAULT_RRF_K,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None
+    ) -> List[DocumentChunk]:
+        """
+        Search by full-text match and vector similarity, merged with reciprocal-rank fusion.
+        
+        The lexical leg ranks chunks whose `search_vector` matches any term of
+        `query_text` (ts_rank_cd, GIN index), so exact tokens such as SOC codes, salary
+        figures or appendix names are found even when their embeddings are not close.
+        The vector leg is search_similar's query. Each leg returns `candidate_limit`
+        ids; the fused top `limit` chunks are loaded in one query. On backends without
+        PostgreSQL full-text search only the vector leg runs.
+        
+        Args:
+            query_embedding: Query vector (EmbeddingService.get_dimensions() dims)
+            query_text: Query text for the full-text leg
+            limit: Maximum number of results
+            filters: Optional metadata filters (applied to both legs)
+            similarity_threshold: Minimum similarity score for the vector leg (0-1)
+            document_version_id: Optional filter by specific document version
+            candidate_limit: Candidates per leg (default: 4 * limit, at least 20)
+            rrf_k: Reciprocal-rank fusion constant
+            ef_search: See search_similar
+            probes: See search_similar
+            
+        Returns:
+            List of DocumentChunk objects ordered by fused rank, each with `distance`
+            (cosine distance to the query) and `rrf_score`
+        """
+        backend = get_vector_backend()
+        if backend is not None:
+            # Full-text search needs PostgreSQL; other backends answer the vector leg only
+            return backend.search(
+                [query_embedding],
+                limit=limit,
+                filters=[filters],
+                similarity_threshold=similarity_threshold,
+                document_version_id=document_version_id
+            )[0]
+        
+        dimensions = EmbeddingService.get_dimensions()
+        if not query_embedding or len(query_embedding) != dimensions:
+            logger.error(
+                f"Query embedding has {len(query_embedding) if query_embedding else 0} dimensions, "
+                f"expected {dimensions}"
+            )
+            return []
+        
+        if candidate_limit is None:
+            candidate_limit = max(limit * 4, 20)
+        
+        try:
+            vector_queryset = PgVectorService._build_search_queryset(
+                query_embedding=query_embedding,
+                filters=filters,
+                similarity_threshold=similarity_threshold,
+                document_version_id=document_version_id,
+                limit=candidate_limit
+            ).values_list('id', flat=True)[:candidate_limit]
+            
+            lexical_queryset = None
+            if query_text and connection.vendor == 'postgresql':
+                lexical_queryset = PgVectorService._build_lexical_queryset(
+                    query_text=query_text,
+                    filters=filters,
+                    document_version_id=document_version_id
+                ).values_list('id', flat=True)[:candidate_limit]
+            
+            def _execute():
+                vector_ids = list(vector_queryset)
+                lexical_ids = list(lexical_queryset) if lexical_queryset is not None else []
+                return vector_ids, lexical_ids
+            
+            vector_ids, lexical_ids = PgVectorService._run_search(
+                _execute, ef_search, probes, PgVectorService._binary_shortlist_size(candidate_limit)
+            )
+            fused = reciprocal_rank_fusion([vector_ids, lexical_ids], k=rrf_k)[:limit]
+            if not fused:
+                return []
+            
+            chunks_by_id = {
+                chunk.id: chunk
+                for chunk in DocumentChunk.objects.filter(
+                    id__in=[chunk_id for chunk_id, _ in fused]
+                ).annotate(
+                    distance=CosineDistance('embedding', query_embedding)
+                ).select_related('document_version__source_document')
+            }
+            
+            results = []
+            for chunk_id, score in fused:
+                chunk = chunks_by_id.get(chunk_id)
+                if chunk is None:
+                    continue
+                chunk.rrf_score = score
+                results.append(chunk)
+            
+            logger.info(
+                f"Hybrid search found {len(results)} chunks "
+                f"({len(vector_ids)} vector, {len(lexical_ids)} lexical candidates, limit: {limit})"
+            )
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error in hybrid chunk search: {e}", exc_info=True)
+            return []
+
+    @staticmethod
+    def _filtered_queryset(
+        filters: Optional[Dict] = None,
+        document_version_id: Optional[str] = None
+    ):
+        """Embedded chunks matching the document version and metadata filters."""
+        # Start with base query
+        queryset = DocumentChunk.objects.filter(
+            embedding__isnull=False
+        )
+        
+        # Filter by document version if specified
+        if document_version_id:
+            queryset = queryset.filter(document_version_id=document_version_id)
+        
+        # Apply metadata filters
+        if filters:
+            for key, value in filters.items():
+                if key in PgVectorService.INDEXED_METADATA_KEYS and isinstance(value, (str, int, bool)):
+                    # Key lookup matches the expression indexes
+                    queryset = queryset.filter(**{f'metadata__{key}': value})
+                else:
+                    # Use JSON field contains lookup
+                    queryset = queryset.filter(metadata__contains={key: value})
+        return queryset
+
+    @staticmethod
+    def _build_lexical_queryset(
+        query_text: str,
+        filters: Optional[Dict] = None,
+        document_version_id: Optional[str] = None
+    ):
+        """
+        Filtered queryset of chunks matching any term of query_text, best ts_rank_cd first.
+        
+        PostgreSQL only. plainto_tsquery ANDs the terms; they are OR-ed instead so a
+        long case-facts query still matches chunks containing some of its terms.
+        """
+        tsquery = "replace(plainto_tsquery(%s::regconfig, %s)::text, ' & ', ' | ')::tsquery"
+        params = (PgVectorService.TEXT_SEARCH_CONFIG, query_text)
+        return PgVectorService._filtered_queryset(
+            filters=filters,
+            document_version_id=document_version_id
+        ).filter(
+            # Used directly as the WHERE condition so the GIN index applies
+            RawSQL(f"document_chunks.search_vector @@ {tsquery}", params, output_field=BooleanField())
+        ).annotate(
+            lexical_rank=RawSQL(
+                f"ts_rank_cd(document_chunks.search_vector, {tsquery}, 32)", params, output_field=FloatField()
+            )
+        ).order_by('-lexical_rank')
+
+    @staticmethod
+    def _build_search_queryset(
+        query_embedding: List[float],
+        filters: Optional[Dict] = None,
+        similarity_threshold: float = 0.7,
+        document_version_id: Optional[str] = None,
+        limit: int = 10
+    ):
+        """
+        Filtered queryset of chunks within the similarity threshold, ordered by distance.
+        
+        The distance is computed on the representation of VECTOR_SEARCH_PRECISION so
+        the ANN index applies: float32 vectors, float16 halfvecs, or - for 'binary' -
+        a Hamming-distance shortlist of binary_quantize()d vectors (see
+        _binary_shortlist_size for its size) re-ranked by float cosine distance.
+        `limit` is only used to size that shortlist; callers still slice the result.
+        """
+        queryset = PgVectorService._filtered_queryset(
+            filters=filters,
+            document_version_id=document_version_id
+        )
+        
+        precision = get_precision()
+        dimensions = len(query_embedding)
+        if precision == 'binary':
+            # First pass on the bit index, then exact distances for the shortlist only
+            bits = ''.join('1' if value > 0 else '0' for value in query_embedding)
+            shortlist = queryset.annotate(
+                hamming_distance=HammingDistance(
+                    Cast(BinaryQuantize('embedding'), BitField(length=dimensions)),
+                    Cast(Value(bits), BitField(length=dimensions))
+                )
+            ).order_by('hamming_distance').values('id')[:PgVectorService._binary_shortlist_size(limit)]
+            queryset = DocumentChunk.objects.filter(id__in=shortlist)
+            distance = CosineDistance(Cast('embedding', VectorField(dimensions=dimensions)), query_embedding)
+        elif precision == 'halfvec':
+            distance = CosineDistance(
+                Cast('embedding', HalfVectorField(dimensions=dimensions)),
+                HalfVector(query_embedding)
+            )
+        else:
+            distance = CosineDistance(Cast('embedding', VectorField(dimensions=dimensions)), query_embedding)
+        
+        # Vector similarity search using cosine distance
+        # Lower distance = higher similarity
+        # Cosine distance ranges from 0 (identical) to 2 (opposite)
+        queryset = queryset.annotate(
+            distance=distance
+        ).order_by('distance')
+        
+        # Filter by similarity threshold
+        # Cosine distance: 0 = identical, 2 = opposite
+        # Similarity = 1 - (distance / 2)
+        # So distance <= 0.6 means similarity >= 0.7
+        max_distance = 2 * (1 - similarity_threshold)
+        return queryset.filter(distance__lte=max_distance)
+
+    @staticmethod
+    def _binary_shortlist_size(limit: int) -> Optional[int]:
+        """Hamming shortlist size for `limit` results, or None unless searching binary vectors."""
+        if get_precision() != 'binary':
+            return None
+        factor = (
+            getattr(settings, 'VECTOR_SEARCH_BINARY_RERANK_FACTOR', None)
+            or PgVectorService.DEFAULT_BINARY_RERANK_FACTOR
+        )
+        return max(limit, 1) * factor
+
+    @staticmethod
+    def _run_search(
+        execute: Callable[[], Any],
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        min_ef_search: Optional[int] = None
+    ):
+        """Evaluate a search with the per-query ANN settings applied."""
+        search_params = PgVectorService._ann_search_params(ef_search, probes, min_ef_search)
+        if not search_params:
+            return execute()
+        # SET LOCAL only lasts for this transaction
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                for name, value in search_params:
+                    cursor.execute(f"SET LOCAL {name} = {value}")
+            return execute()
+
+    @staticmethod
+    def _ann_search_params(
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        min_ef_search: Optional[int] = None
+    ) -> List[Tuple[str, int]]:
+        """
+        Per-query ANN settings to apply, falling back to settings defaults.
+        
+        `min_ef_search` raises ef_search when an HNSW scan must return more rows
+        than the default candidate list holds (the binary-quantized shortlist).
+        
+        Returns:
+            List of (setting name, value); empty on non-PostgreSQL backends or
+            when nothing is configured
+        """
+        if connection.vendor != 'postgresql':
             return []
+        
+        if ef_search is None:
+            ef_search = getattr(settings, 'VECTOR_SEARCH_HNSW_EF_SEARCH', None)
+        if probes is None:
+            probes = getattr(settings, 'VECTOR_SEARCH_IVFFLAT_PROBES', None)
+        if min_ef_search and (ef_search or PgVectorService.PGVECTOR_DEFAULT_EF_SEARCH) < min_ef_search:
+            ef_search = min_ef_search
+        
+        params = []
+        if ef_search:
+            params.append(('hnsw.ef_search', int(ef_search)))
+        if probes:
+            params.append(('ivfflat.probes', int(probes)))
+        return params
 
     @staticmethod
     def get_chunks_by_document_version(
@@ -205,6 +647,9 @@ class PgVectorService:
         """
         Update chunks for a document version (delete old, create new).
         
+        The delete and the bulk insert run in one transaction, so readers never see
+        the version without chunks, with a single namespace bump at the end.
+        
         Args:
             document_version: DocumentVersion instance
             chunks: List of dicts with 'text' and 'metadata'
@@ -213,9 +658,18 @@ class PgVectorService:
         Returns:
             List of created DocumentChunk objects
         """
-        # Delete existing chunks
-        PgVectorService.delete_chunks_by_document_version(document_version)
+        if len(chunks) != len(embeddings):
+            raise ValueError(f"Mismatch: {len(chunks)} chunks but {len(embeddings)} embeddings")
         
-        # Create new chunks
-        return PgVectorService.store_chunks(document_version, chunks, embeddings)
-
+        with transaction.atomic():
+            # Delete existing chunks
+            deleted, _ = DocumentChunk.objects.filter(document_version=document_version).delete()
+            
+            # Create new chunks
+            chunk_objects = PgVectorService._insert_chunks(document_version, chunks, embeddings)
+        
+        logger.info(
+            f"Replaced {deleted} chunks with {len(chunk_objects)} chunks for document version {document_version.id}"
+        )
+        bump_namespace(namespace())
+        return chunk_objects
@@ -42,7 +42,8 @@ def run_eligibility_check_task(
     case_id: str,
     visa_type_id: Optional[str] = None,
     enable_ai_reasoning: bool = True,
-    evaluation_date: Optional[str] = None
+    evaluation_date: Optional[str] = None,
+    changed_fact_keys: Optional[List[str]] = None
 ) -> Dict[str, Any]:
     """
     Celery task to run eligibility check for a case.
@@ -61,6 +62,9 @@ def run_eligibility_check_task(
         visa_type_id: Optional visa type ID to check (if None, checks all active visa types for jurisdiction)
         enable_ai_reasoning: Whether to run AI reasoning (default: True)
         evaluation_date: Optional ISO format date string to evaluate against (defaults to now)
+        changed_fact_keys: Optional fact keys changed since the last check (incremental
+            mode). Only requirements referencing them are re-evaluated, and visa types
+            none of whose requirements reference them are skipped.
         
     Returns:
         Dict with eligibility check results:
@@ -153,7 +157,8 @@ def run_eligibility_check_task(
                 visa_type_id=visa_type_id,
                 enable_ai_reasoning=enable_ai_reasoning,
                 evaluation_date=parsed_evaluation_date,
-                task_start_time=task_start_time
+                task_start_time=task_start_time,
+                changed_fact_keys=changed_fact_keys
             )
         else:
             # Check all active visa types for the case's jurisdiction
@@ -161,7 +166,8 @@ def run_eligibility_check_task(
                 case=case,
                 enable_ai_reasoning=enable_ai_reasoning,
                 evaluation_date=parsed_evaluation_date,
-                task_start_time=task_start_time
+                task_start_time=task_start_time,
+                changed_fact_keys=changed_fact_keys
             )
         
     except Retry:
@@ -213,12 +219,45 @@ def run_eligibility_check_task(
             }
 
 
+@shared_task(bind=True, base=BaseTaskWithMeta)
+def run_eligibility_recheck_task(self, case_id: str, first_seq: int) -> Dict[str, Any]:
+    """
+    Debounced incremental re-check of a case after fact changes.
+
+    Scheduled by the CaseFact signals through EligibilityRecheckQueue; runs once per
+    batch of writes with the union of their changed fact keys. Only cases that were
+    already evaluated are refreshed, and the re-check runs the rule engine only
+    (AI reasoning is requested explicitly).
+
+    Args:
+        case_id: UUID of the case
+        first_seq: First sequence number of the batch (from EligibilityRecheckQueue.add)
+    """
+    from ai_decisions.helpers.eligibility_recheck import EligibilityRecheckQueue
+    from ai_decisions.models.eligibility_result import EligibilityResult
+
+    changed_fact_keys = EligibilityRecheckQueue.take(case_id, first_seq)
+    if not changed_fact_keys:
+        return {'case_id': case_id, 'skipped': 'no changed facts'}
+    if not EligibilityResult.objects.filter(case_id=case_id, is_deleted=False).exists():
+        return {'case_id': case_id, 'skipped': 'not evaluated yet'}
+
+    run_eligibility_check_task.delay(
+        case_id=case_id,
+        enable_ai_reasoning=False,
+        changed_fact_keys=changed_fact_keys
+    )
+    logger.info(f"Queued incremental eligibility re-check for case {case_id}: {changed_fact_keys}")
+    return {'case_id': case_id, 'changed_fact_keys': changed_fact_keys}
+
+
 def _run_single_visa_type_check(
     case_id: str,
     visa_type_id: str,
     enable_ai_reasoning: bool,
     evaluation_date: Optional[Any],
-    task_start_time: float
+    task_start_time: float,
+    changed_fact_keys: Optional[List[str]] = None
 ) -> Dict[str, Any]:
     """
     Run eligibility check for a single visa type.
@@ -229,6 +268,7 @@ def _run_single_visa_type_check(
         enable_ai_reasoning: Whether to enable AI reasoning
         evaluation_date: Optional evaluation date
         task_start_time: Task start time for metrics
+        changed_fact_keys: Optional changed fact keys (incremental mode)
         
     Returns:
         Dict with eligibility check result
@@ -246,11 +286,15 @@ def _run_single_visa_type_check(
             }
         
         # Run complete eligibility check
+        check_kwargs = {}
+        if changed_fact_keys is not None:
+            check_kwargs['changed_fact_keys'] = changed_fact_keys
         check_result = EligibilityCheckService.run_eligibility_check(
             case_id=case_id,
             visa_type_id=visa_type_id,
             evaluation_date=evaluation_date,
-            enable_ai_reasoning=enable_ai_reasoning
+            enable_ai_reasoning=enable_ai_reasoning,
+            **check_kwargs
         )
         
         # Track metrics
@@ -302,7 +346,8 @@ def _run_multi_visa_type_check(
     case: Any,
     enable_ai_reasoning: bool,
     evaluation_date: Optional[Any],
-    task_start_time: float
+    task_start_time: float,
+    changed_fact_keys: Optional[List[str]] = None
 ) -> Dict[str, Any]:
     """
     Run eligibility checks for all active visa types in the case's jurisdiction.
@@ -312,6 +357,8 @@ def _run_multi_visa_type_check(
         enable_ai_reasoning: Whether to enable AI reasoning
         evaluation_date: Optional evaluation date
         task_start_time: Task start time for metrics
+        changed_fact_keys: Optional changed fact keys (incremental mode); visa types
+            whose requirements do not reference them keep their last result
         
     Returns:
         Dict with aggregated results for all visa types
@@ -359,57 +406,73 @@ def _run_multi_visa_type_check(
         all_requires_review = False
         low_confidence_count = 0
         conflict_count = 0
+        skipped = []
         
+        to_check = []
         for visa_type in visa_type_list:
+            if changed_fact_keys is not None and not EligibilityCheckService.requires_reevaluation(
+                case, str(visa_type.id), changed_fact_keys, evaluation_date
+            ):
+                skipped.append(str(visa_type.id))
+                continue
+            to_check.append(visa_type)
+        
+        # Rule pass runs as one batch; AI reasoning fans out when
+        # ELIGIBILITY_CHECK_MAX_WORKERS > 1 (sequential otherwise)
+        check_results = {}
+        check_error = None
+        if to_check:
             try:
-                check_result = EligibilityCheckService.run_eligibility_check(
+                check_results = EligibilityCheckService.run_multi_visa_eligibility_check(
                     case_id=str(case.id),
-                    visa_type_id=str(visa_type.id),
+                    visa_type_ids=[str(visa_type.id) for visa_type in to_check],
                     evaluation_date=evaluation_date,
-                    enable_ai_reasoning=enable_ai_reasoning
+                    enable_ai_reasoning=enable_ai_reasoning,
+                    changed_fact_keys=changed_fact_keys
                 )
-                
-                if check_result.success:
-                    result_dict = check_result.to_dict()
-                    result_dict['visa_code'] = visa_type.code
-                    result_dict['visa_name'] = visa_type.name
-                    results.append(result_dict)
-                    
-                    # Track aggregate flags
-                    if check_result.requires_human_review:
-                        all_requires_review = True
-                    
-                    if check_result.confidence < EligibilityCheckService.LOW_CONFIDENCE_THRESHOLD:
-                        low_confidence_count += 1
-                    
-                    if check_result.conflict_detected:
-                        conflict_count += 1
-                else:
-                    errors.append({
-                        'visa_type_id': str(visa_type.id),
-                        'visa_code': visa_type.code,
-                        'visa_name': visa_type.name,
-                        'error': check_result.error or 'Unknown error',
-                        'warnings': check_result.warnings
-                    })
-                    logger.warning(
-                        f"Eligibility check failed for case {case.id}, "
-                        f"visa {visa_type.code}: {check_result.error}"
-                    )
-                    
             except Exception as e:
-                logger.error(
-                    f"Error checking visa type {visa_type.id} for case {case.id}: {e}",
-                    exc_info=True
-                )
+                logger.error(f"Error checking visa types for case {case.id}: {e}", exc_info=True)
+                check_error = e
+        
+        for visa_type in to_check:
+            check_result = check_results.get(str(visa_type.id))
+            if check_result is None:
                 errors.append({
                     'visa_type_id': str(visa_type.id),
                     'visa_code': visa_type.code,
                     'visa_name': visa_type.name,
-                    'error': str(e),
-                    'error_type': type(e).__name__
+                    'error': str(check_error) if check_error else 'Eligibility check returned no result',
+                    'error_type': type(check_error).__name__ if check_error else None
                 })
                 continue
+            
+            if check_result.success:
+                result_dict = check_result.to_dict()
+                result_dict['visa_code'] = visa_type.code
+                result_dict['visa_name'] = visa_type.name
+                results.append(result_dict)
+                
+                # Track aggregate flags
+                if check_result.requires_human_review:
+                    all_requires_review = True
+                
+                if check_result.confidence < EligibilityCheckService.LOW_CONFIDENCE_THRESHOLD:
+                    low_confidence_count += 1
+                
+                if check_result.conflict_detected:
+                    conflict_count += 1
+            else:
+                errors.append({
+                    'visa_type_id': str(visa_type.id),
+                    'visa_code': visa_type.code,
+                    'visa_name': visa_type.name,
+                    'error': check_result.error or 'Unknown error',
+                    'warnings': check_result.warnings
+                })
+                logger.warning(
+                    f"Eligibility check failed for case {case.id}, "
+                    f"visa {visa_type.code}: {check_result.error}"
+                )
         
         # Update case status if at least one check succeeded
         if results:
@@ -441,7 +504,8 @@ def _run_multi_visa_type_check(
         
         # Build response
         response = {
-            'success': len(results) > 0,  # Success if at least one check succeeded
+            # Success if at least one check succeeded (or nothing needed re-checking)
+            'success': len(results) > 0 or (bool(skipped) and not errors),
             'case_id': str(case.id),
             'jurisdiction': jurisdiction,
             'results': results,
@@ -449,6 +513,7 @@ def _run_multi_visa_type_check(
                 'total_checked': len(visa_type_list),
                 'successful': len(results),
                 'failed': len(errors),
+                'skipped_unaffected': len(skipped),
                 'requires_human_review': all_requires_review,
                 'low_confidence_count': low_confidence_count,
                 'conflict_count': conflict_count
@@ -0,0 +1,37 @@
+import logging
+from datetime import timedelta
+from celery import shared_task
+from django.conf import settings
+from django.utils import timezone
+from main_system.utils.tasks_base import BaseTaskWithMeta
+from ai_decisions.repositories.embedding_cache_repository import EmbeddingCacheRepository
+
+logger = logging.getLogger('django')
+
+
+@shared_task(bind=True, base=BaseTaskWithMeta)
+def prune_embedding_cache_task(self):
+    """
+    Celery task deleting persistent embedding cache entries that have not been used
+    for EMBEDDING_CACHE_RETENTION_DAYS (every distinct query text adds an entry).
+    This task runs daily via Celery Beat.
+    
+    Returns:
+        Dict with pruning results
+    """
+    retention_days = getattr(settings, 'EMBEDDING_CACHE_RETENTION_DAYS', 90)
+    if not retention_days:
+        return {'success': True, 'deleted': 0, 'message': 'Embedding cache pruning disabled'}
+    
+    try:
+        cutoff = timezone.now() - timedelta(days=retention_days)
+        deleted = EmbeddingCacheRepository.delete_unused_since(cutoff)
+        logger.info(f"Pruned {deleted} embedding cache entries unused for {retention_days} days")
+        return {
+            'success': True,
+            'deleted': deleted,
+            'message': f'Deleted {deleted} embedding cache entries unused since {cutoff.isoformat()}'
+        }
+    except Exception as e:
+        logger.error(f"Error pruning embedding cache: {e}")
+        raise self.retry(exc=e, countdown=300, max_retries=3)
@@ -17,6 +17,7 @@ import pytest
 from django.utils import timezone
 from rest_framework.test import APIClient
 from main_system.utils.cache_utils import cache_clear
+from ai_decisions.helpers.embedding_cache import EmbeddingCache
 from users_access.services import UserService
 from immigration_cases.services import CaseService
 from payments.services import PaymentService
@@ -34,6 +35,7 @@ from ai_decisions.services import (
 def _clear_cache():
     """Avoid cross-test cache coupling due to @cache_result usage."""
     cache_clear()
+    EmbeddingCache.clear()
 
 
 @pytest.fixture
@@ -57,6 +57,62 @@ class TestAIReasoningService:
         assert ctx[0]["source"] == "https://example.com/doc"
         assert 0.0 <= ctx[0]["similarity"] <= 1.0
 
+    def test_retrieve_context_uses_hybrid_search_when_configured(self, monkeypatch, settings):
+        settings.VECTOR_SEARCH_MODE = "hybrid"
+        monkeypatch.setattr(
+            "ai_decisions.services.ai_reasoning_service.EmbeddingService.generate_embedding",
+            MagicMock(return_value=[0.0] * 1536),
+        )
+        hybrid = MagicMock(return_value=[])
+        similar = MagicMock(return_value=[])
+        monkeypatch.setattr("ai_decisions.services.ai_reasoning_service.PgVectorService.search_hybrid", hybrid)
+        monkeypatch.setattr("ai_decisions.services.ai_reasoning_service.PgVectorService.search_similar", similar)
+
+        AIReasoningService.retrieve_context(case_facts={"salary": 38700}, visa_code="US_TEST")
+        assert "salary: 38700" in hybrid.call_args.kwargs["query_text"]
+        similar.assert_not_called()
+
+    def test_retrieve_context_many_embeds_once_and_searches_in_batch(self, monkeypatch):
+        generate = MagicMock(return_value=[[0.0] * 1536, [0.1] * 1536])
+        monkeypatch.setattr(
+            "ai_decisions.services.ai_reasoning_service.EmbeddingService.generate_embeddings",
+            generate,
+        )
+        chunk = SimpleNamespace(
+            id="c1",
+            chunk_text="Chunk text",
+            metadata={},
+            distance=0.4,
+            document_version=SimpleNamespace(
+                source_document=SimpleNamespace(source_url="https://example.com/doc")
+            ),
+        )
+        search_many = MagicMock(return_value=[[chunk], []])
+        monkeypatch.setattr(
+            "ai_decisions.services.ai_reasoning_service.PgVectorService.search_similar_many",
+            search_many,
+        )
+
+        contexts = AIReasoningService.retrieve_context_many([
+            {"case_facts": {"age": 30}, "visa_code": "A", "jurisdiction": "UK"},
+            {"case_facts": {"age": 30}, "visa_code": "B"},
+        ])
+        generate.assert_called_once()
+        assert search_many.call_args.kwargs["filters"] == [
+            {"visa_code": "A", "jurisdiction": "UK"},
+            {"visa_code": "B"},
+        ]
+        assert contexts[0][0]["source"] == "https://example.com/doc"
+        assert contexts[0][0]["similarity"] == pytest.approx(0.8)
+        assert contexts[1] == []
+
+    def test_retrieve_context_many_returns_none_on_failure(self, monkeypatch):
+        monkeypatch.setattr(
+            "ai_decisions.services.ai_reasoning_service.EmbeddingService.generate_embeddings",
+            MagicMock(side_effect=RuntimeError("boom")),
+        )
+        assert AIReasoningService.retrieve_context_many([{"case_facts": {}}, {"case_facts": {}}]) == [None, None]
+
     def test_call_llm_missing_openai_package_tracks_failure(self, monkeypatch):
         track = MagicMock()
         monkeypatch.setattr("ai_decisions.services.ai_reasoning_service.track_ai_reasoning", track)
@@ -193,3 +249,33 @@ class TestAIReasoningService:
         assert out["reasoning_log_id"] == "log1"
         assert out["model"] == "gpt-4"
 
+    def test_run_ai_reasoning_abandoned_during_llm_call_stores_nothing(self, monkeypatch, paid_case):
+        import threading
+
+        case, _payment = paid_case
+        cancel_event = threading.Event()
+
+        def slow_llm(prompt, model):
+            cancel_event.set()  # the caller timed out meanwhile
+            return {"response": "Likely", "model": "gpt-4", "tokens_used": 20, "citations": []}
+
+        monkeypatch.setattr(
+            "payments.helpers.payment_validator.PaymentValidator.validate_case_has_payment",
+            MagicMock(return_value=(True, None)),
+        )
+        monkeypatch.setattr(
+            "ai_decisions.services.ai_reasoning_service.AIReasoningService.construct_prompt",
+            MagicMock(return_value="prompt"),
+        )
+        monkeypatch.setattr("ai_decisions.services.ai_reasoning_service.AIReasoningService.call_llm", slow_llm)
+        create_log = MagicMock()
+        monkeypatch.setattr(
+            "ai_decisions.services.ai_reasoning_service.AIReasoningLogService.create_reasoning_log", create_log
+        )
+
+        out = AIReasoningService.run_ai_reasoning(
+            case_id=str(case.id), case_facts={"age": 30}, context_chunks=[], cancel_event=cancel_event
+        )
+        assert out["success"] is False and out["cancelled"] is True
+        create_log.assert_not_called()
+
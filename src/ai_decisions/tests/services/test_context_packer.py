@@ -0,0 +1,84 @@
+from ai_decisions.helpers.context_packer import estimate_tokens, pack_context
+
+
+def _chunk(chunk_id, text, similarity, version="dv1", index=None):
+    return {
+        "chunk_id": chunk_id,
+        "text": text,
+        "similarity": similarity,
+        "source": "https://example.com/doc",
+        "metadata": {},
+        "document_version_id": version,
+        "chunk_index": index,
+    }
+
+
+PASSAGE = "applicants must show a salary of at least thirty eight thousand pounds per year from a licensed sponsor"
+
+
+class TestContextPacker:
+    def test_estimate_tokens(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd" * 10) == 10
+        assert estimate_tokens("abcde") == 2
+
+    def test_near_duplicates_keep_the_most_relevant(self):
+        packed = pack_context([
+            _chunk("old", PASSAGE + " today", 0.8, version="dv1", index=3),
+            _chunk("new", PASSAGE, 0.9, version="dv2", index=3),
+            _chunk("other", "english language requirement at level B1 of the CEFR scale", 0.7, index=9),
+        ])
+        assert [p["chunk_id"] for p in packed] == ["new", "other"]
+
+    def test_adjacent_chunks_merge_without_overlap(self):
+        first = "The applicant must have a certificate of sponsorship issued by the employer."
+        second = "issued by the employer. The job must be at an eligible skill level."
+        packed = pack_context([
+            _chunk("c2", second, 0.75, index=2),
+            _chunk("c1", first, 0.85, index=1),
+        ])
+        assert len(packed) == 1
+        assert packed[0]["text"] == (
+            "The applicant must have a certificate of sponsorship issued by the employer."
+            " The job must be at an eligible skill level."
+        )
+        assert packed[0]["chunk_ids"] == ["c1", "c2"]
+        assert packed[0]["chunk_id"] == "c1"
+        assert packed[0]["similarity"] == 0.85
+
+    def test_budget_is_filled_by_relevance(self):
+        packed = pack_context([
+            _chunk("big", "x " * 400, 0.95, index=1),
+            _chunk("small", "salary threshold details", 0.8, index=5),
+            _chunk("medium", "maintenance funds " * 10, 0.9, index=8),
+        ], token_budget=60)
+        assert [p["chunk_id"] for p in packed] == ["medium", "small"]
+        assert sum(p["tokens"] for p in packed) <= 60
+
+    def test_chunks_without_position_are_kept_separately(self):
+        packed = pack_context([
+            {"chunk_id": "a", "text": "first rule text here", "similarity": 0.9},
+            {"chunk_id": "b", "text": "second rule about fees", "similarity": 0.8},
+        ])
+        assert [p["chunk_ids"] for p in packed] == [["a"], ["b"]]
+        assert pack_context([]) == []
+
+    def test_adjacent_chunks_over_budget_are_not_merged(self):
+        chunks = [
+            _chunk(f"c{index}", f"section {index} " + "rule text " * 700, similarity, index=index)
+            for index, similarity in ((1, 0.7), (2, 0.9), (3, 0.8))
+        ]
+        assert all(1700 < estimate_tokens(chunk["text"]) < 2000 for chunk in chunks)
+
+        packed = pack_context(chunks, token_budget=2000)
+        assert [p["chunk_ids"] for p in packed] == [["c2"]]
+        assert packed[0]["tokens"] <= 2000
+
+    def test_most_relevant_chunk_is_truncated_to_the_budget(self):
+        packed = pack_context([
+            _chunk("long", "salary threshold " * 100, 0.9, index=1),
+            _chunk("longer", "english language " * 200, 0.5, index=7),
+        ], token_budget=50)
+        assert [p["chunk_id"] for p in packed] == ["long"]
+        assert packed[0]["tokens"] == 50
+        assert packed[0]["truncated"] is True
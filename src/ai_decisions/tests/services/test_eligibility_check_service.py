@@ -205,3 +205,174 @@ class TestEligibilityCheckService:
         assert result.outcome == "possible"
         assert escalate.call_count == 1
 
+    def test_incremental_evaluation_reuses_stored_requirement_results(
+        self, monkeypatch, paid_case, visa_type, rule_version, eligibility_result_service
+    ):
+        from rules_knowledge.services.rule_engine_service import RuleEngineService
+        from rules_knowledge.services.visa_requirement_service import VisaRequirementService
+
+        case, _payment = paid_case
+        VisaRequirementService.create_requirement(
+            str(rule_version.id), "MIN_AGE", "eligibility", "Age", {">=": [{"var": "age"}, 18]}
+        )
+        VisaRequirementService.create_requirement(
+            str(rule_version.id), "MIN_SALARY", "eligibility", "Salary", {">=": [{"var": "salary"}, 30000]}
+        )
+        previous = RuleEngineService.evaluate_all_requirements(rule_version, {"age": 30, "salary": 100})
+        eligibility_result_service.create_eligibility_result(
+            case_id=str(case.id),
+            visa_type_id=str(visa_type.id),
+            rule_version_id=str(rule_version.id),
+            outcome="not_eligible",
+            requirement_results=previous,
+        )
+        monkeypatch.setattr(
+            "ai_decisions.services.eligibility_check_service.RuleEngineService.load_active_rule_version",
+            MagicMock(return_value=rule_version),
+        )
+
+        assert EligibilityCheckService.requires_reevaluation(case, str(visa_type.id), ["salary"]) is True
+        assert EligibilityCheckService.requires_reevaluation(case, str(visa_type.id), ["nationality"]) is False
+
+        reevaluate = MagicMock(wraps=RuleEngineService.evaluate_requirement)
+        monkeypatch.setattr(
+            "rules_knowledge.services.rule_engine_service.RuleEngineService.evaluate_requirement", reevaluate
+        )
+        result = EligibilityCheckService._run_incremental_rule_evaluation(
+            case, str(visa_type.id), {"age": 30, "salary": 50000}, ["salary"]
+        )
+        assert reevaluate.call_count == 1
+        assert result.requirements_passed == 2
+        assert result.outcome == "likely"
+
+    def test_concurrent_ai_reasoning_times_out_per_visa_type(self, monkeypatch):
+        import threading
+
+        release = threading.Event()
+        cancel_events = {}
+
+        def fake_call(case, case_facts, rule_engine_result, visa_type, cancel_event):
+            cancel_events[visa_type] = cancel_event
+            if visa_type == "slow":
+                release.wait(5)
+            return {"success": True, "visa_type": visa_type}
+
+        monkeypatch.setattr(
+            "ai_decisions.services.eligibility_check_service.EligibilityCheckService._call_ai_reasoning",
+            fake_call,
+        )
+        jobs = {
+            name: {"case": None, "case_facts": {}, "rule_engine_result": None, "visa_type": name}
+            for name in ("fast", "slow")
+        }
+        try:
+            outcomes = EligibilityCheckService._run_ai_reasoning_concurrently(
+                jobs=jobs, max_workers=2, timeout_seconds=0.2
+            )
+        finally:
+            release.set()
+        assert outcomes["fast"] == ({"success": True, "visa_type": "fast"}, None)
+        assert outcomes["slow"][0] is None
+        assert isinstance(outcomes["slow"][1], TimeoutError)
+        # The abandoned call is told to stop before storing anything
+        assert cancel_events["slow"].is_set()
+        assert not cancel_events["fast"].is_set()
+
+    def test_multi_visa_rule_pass_loads_case_and_facts_once(self, monkeypatch, paid_case, visa_type, rule_version):
+        case, _payment = paid_case
+        get_case = MagicMock(return_value=case)
+        load_facts = MagicMock(return_value={"age": 30})
+        monkeypatch.setattr("ai_decisions.services.eligibility_check_service.CaseSelector.get_by_id", get_case)
+        monkeypatch.setattr(
+            "ai_decisions.services.eligibility_check_service.RuleEngineService.load_case_facts", load_facts
+        )
+        monkeypatch.setattr(
+            "ai_decisions.services.eligibility_check_service.VisaTypeSelector.get_by_id",
+            MagicMock(return_value=visa_type),
+        )
+        evaluate = MagicMock(return_value=None)
+        monkeypatch.setattr(
+            "ai_decisions.services.eligibility_check_service.RuleEngineService.run_eligibility_evaluation",
+            evaluate,
+        )
+
+        results = EligibilityCheckService.run_multi_visa_eligibility_check(
+            case_id=str(case.id),
+            visa_type_ids=["vt1", "vt2", "vt3"],
+            enable_ai_reasoning=False,
+            max_workers=2,
+        )
+        assert len(results) == 3
+        assert get_case.call_count == 1
+        assert load_facts.call_count == 1
+        assert evaluate.call_count == 3
+        for call in evaluate.call_args_list:
+            assert call.kwargs["case"] is case
+            assert call.kwargs["payment_validated"] is True
+            assert call.kwargs["case_facts"] == {"age": 30}
+            assert call.kwargs["visa_type"] is visa_type
+
+    def test_case_fact_change_queues_incremental_recheck(
+        self, monkeypatch, settings, paid_case, visa_type, rule_version, eligibility_result_service,
+        django_capture_on_commit_callbacks
+    ):
+        from django.core.cache import cache
+        from ai_decisions.tasks import ai_reasoning_tasks
+        from immigration_cases.services.case_fact_service import CaseFactService
+        from rules_knowledge.services.rule_engine_service import RuleEngineService
+        from rules_knowledge.services.visa_requirement_service import VisaRequirementService
+
+        case, _payment = paid_case
+        VisaRequirementService.create_requirement(
+            str(rule_version.id), "MIN_AGE", "eligibility", "Age", {">=": [{"var": "age"}, 18]}
+        )
+        VisaRequirementService.create_requirement(
+            str(rule_version.id), "MIN_SALARY", "eligibility", "Salary", {">=": [{"var": "salary"}, 30000]}
+        )
+        eligibility_result_service.create_eligibility_result(
+            case_id=str(case.id),
+            visa_type_id=str(visa_type.id),
+            rule_version_id=str(rule_version.id),
+            outcome="not_eligible",
+            requirement_results=RuleEngineService.evaluate_all_requirements(
+                rule_version, {"age": 30, "salary": 100}
+            ),
+        )
+        monkeypatch.setattr(
+            "ai_decisions.services.eligibility_check_service.RuleEngineService.load_active_rule_version",
+            MagicMock(return_value=rule_version),
+        )
+
+        # Off by default
+        schedule = MagicMock()
+        monkeypatch.setattr(ai_reasoning_tasks.run_eligibility_recheck_task, "apply_async", schedule)
+        with django_capture_on_commit_callbacks(execute=True):
+            CaseFactService.create_case_fact(case_id=str(case.id), fact_key="age", fact_value=31)
+        schedule.assert_not_called()
+
+        # Writes within the debounce window are batched into one re-check
+        settings.ELIGIBILITY_RECHECK_ON_FACT_CHANGE = True
+        cache.clear()
+        for fact_key, value in (("salary", 50000), ("age", 32)):
+            with django_capture_on_commit_callbacks(execute=True):
+                CaseFactService.create_case_fact(case_id=str(case.id), fact_key=fact_key, fact_value=value)
+        schedule.assert_called_once()
+        assert schedule.call_args.kwargs["countdown"] == settings.ELIGIBILITY_RECHECK_DEBOUNCE_SECONDS
+
+        delay = MagicMock()
+        monkeypatch.setattr(ai_reasoning_tasks.run_eligibility_check_task, "delay", delay)
+        ai_reasoning_tasks.run_eligibility_recheck_task.apply(args=schedule.call_args.kwargs["args"]).get()
+        delay.assert_called_once_with(
+            case_id=str(case.id), enable_ai_reasoning=False, changed_fact_keys=["age", "salary"]
+        )
+
+        incremental = MagicMock(wraps=EligibilityCheckService._run_incremental_rule_evaluation)
+        full = MagicMock(wraps=RuleEngineService.run_eligibility_evaluation)
+        monkeypatch.setattr(EligibilityCheckService, "_run_incremental_rule_evaluation", incremental)
+        monkeypatch.setattr(
+            "ai_decisions.services.eligibility_check_service.RuleEngineService.run_eligibility_evaluation", full
+        )
+        outcome = ai_reasoning_tasks.run_eligibility_check_task.apply(kwargs=delay.call_args.kwargs).get()
+        assert outcome["success"] is True
+        assert incremental.call_args.kwargs["changed_fact_keys"] == ["age", "salary"]
+        full.assert_not_called()
@@ -0,0 +1,30 @@
+import pytest
+from django.core.cache import cache
+
+from ai_decisions.helpers.eligibility_recheck import EligibilityRecheckQueue
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+class TestEligibilityRecheckQueue:
+    def test_writes_join_the_open_batch(self):
+        first = EligibilityRecheckQueue.add("case-1", ["salary"])
+        assert first is not None
+        assert EligibilityRecheckQueue.add("case-1", ["age", "salary"]) is None
+        assert EligibilityRecheckQueue.add("case-2", ["age"]) is not None
+
+        assert EligibilityRecheckQueue.take("case-1", first) == ["age", "salary"]
+        assert EligibilityRecheckQueue.take("case-1", first) == []
+
+    def test_write_after_take_opens_next_batch(self):
+        first = EligibilityRecheckQueue.add("case-1", ["salary"])
+        assert EligibilityRecheckQueue.take("case-1", first) == ["salary"]
+
+        second = EligibilityRecheckQueue.add("case-1", ["age"])
+        assert second == first + 1
+        assert EligibilityRecheckQueue.take("case-1", second) == ["age"]
@@ -90,3 +90,140 @@ class TestEmbeddingService:
         assert len(embeddings) == 2
         assert all(len(vec) == 1536 for vec in embeddings)
 
+    def test_generate_embeddings_only_embeds_cache_misses(self, monkeypatch):
+        from ai_decisions.helpers.embedding_cache import EmbeddingCache
+
+        requested = []
+
+        def fake_request(texts, model, dimensions=None):
+            requested.append(list(texts))
+            return [[float(len(text))] * 1536 for text in texts]
+
+        monkeypatch.setattr(EmbeddingService, "_request_embeddings", staticmethod(fake_request))
+
+        first = EmbeddingService.generate_embeddings(["alpha", "beta", "alpha"])
+        assert requested == [["alpha", "beta"]]
+        assert first[0] == first[2] == [5.0] * 1536
+
+        # In-process LRU hit
+        EmbeddingService.generate_embeddings(["beta"])
+        assert len(requested) == 1
+
+        # Persistent store hit after the LRU is gone; only the new text is embedded
+        EmbeddingCache.clear()
+        out = EmbeddingService.generate_embeddings(["alpha", "gamma"])
+        assert requested[-1] == ["gamma"]
+        assert out[0] == [5.0] * 1536
+
+        # Cache is per model and can be bypassed
+        EmbeddingService.generate_embeddings(["alpha"], model="other-model")
+        EmbeddingService.generate_embeddings(["alpha"], use_cache=False)
+        assert requested[-2:] == [["alpha"], ["alpha"]]
+
+    def test_generate_embeddings_count_mismatch_raises(self, monkeypatch):
+        from ai_decisions.helpers.embedding_cache import EmbeddingCache
+
+        monkeypatch.setattr(
+            EmbeddingService, "_request_embeddings", staticmethod(lambda texts, model, dimensions=None: [[1.0] * 1536])
+        )
+        EmbeddingCache.put_many(EmbeddingService.get_model(), {EmbeddingCache.content_hash("cached"): [2.0] * 1536})
+        with pytest.raises(ValueError):
+            EmbeddingService.generate_embeddings(["new one", "cached", "new two"])
+        assert EmbeddingCache.get_many(EmbeddingService.get_model(), [EmbeddingCache.content_hash("new one")]) == {}
+
+    def test_unused_persistent_entries_are_pruned(self, monkeypatch):
+        from datetime import timedelta
+        from django.utils import timezone
+        from ai_decisions.helpers.embedding_cache import EmbeddingCache
+        from ai_decisions.models.embedding_cache_entry import EmbeddingCacheEntry
+        from ai_decisions.tasks.embedding_cache_tasks import prune_embedding_cache_task
+
+        monkeypatch.setattr(
+            EmbeddingService, "_request_embeddings",
+            staticmethod(lambda texts, model, dimensions=None: [[0.25] * 1536 for _ in texts])
+        )
+        EmbeddingService.generate_embeddings(["used", "unused"])
+        EmbeddingCacheEntry.objects.update(last_used_at=timezone.now() - timedelta(days=120))
+
+        # A store hit refreshes last_used_at
+        EmbeddingCache.clear()
+        EmbeddingService.generate_embeddings(["used"])
+
+        result = prune_embedding_cache_task.apply().get()
+        assert result["deleted"] == 1
+        remaining = EmbeddingCacheEntry.objects.values_list("content_hash", flat=True)
+        assert list(remaining) == [EmbeddingCache.content_hash("used")]
+
+    def test_content_defined_chunks_are_stable_under_local_edits(self):
+        sentences = [f"Sentence {i} about sponsorship, salary thresholds and route {i % 7}." for i in range(600)]
+        before = EmbeddingService.chunk_document(" ".join(sentences), content_defined=True)
+
+        sentences.insert(300, "A newly inserted sentence about the £38,700 general salary threshold.")
+        after = EmbeddingService.chunk_document(" ".join(sentences), content_defined=True)
+
+        assert len(before) > 3
+        assert [c["metadata"]["chunk_index"] for c in after] == list(range(len(after)))
+        assert all(c["metadata"]["length"] <= EmbeddingService.MAX_CHUNK_SIZE for c in after)
+        previous_texts = {c["text"] for c in before}
+        changed = [c for c in after if c["text"] not in previous_texts]
+        assert 1 <= len(changed) <= 2
+
+    def test_embed_chunks_reuses_previous_version_embeddings(self, monkeypatch):
+        from types import SimpleNamespace
+
+        generate = MagicMock(return_value=[[2.0] * 1536])
+        monkeypatch.setattr(EmbeddingService, "generate_embeddings", generate)
+
+        previous = [SimpleNamespace(
+            chunk_text="unchanged", embedding=[1.0] * 1536,
+            metadata={"embedding_model": EmbeddingService.embedding_space()},
+        )]
+        embeddings, reused = EmbeddingService.embed_chunks(
+            [{"text": "unchanged"}, {"text": "edited"}], previous_chunks=previous
+        )
+        generate.assert_called_once_with(["edited"], model=None)
+        assert reused == 1
+        assert embeddings == [[1.0] * 1536, [2.0] * 1536]
+
+    def test_embed_chunks_does_not_reuse_embeddings_of_another_model(self, monkeypatch, settings):
+        from types import SimpleNamespace
+
+        settings.EMBEDDING_MODEL = "text-embedding-3-small"
+        generate = MagicMock(return_value=[[2.0] * 1536])
+        monkeypatch.setattr(EmbeddingService, "generate_embeddings", generate)
+
+        # Same size, different vector space; chunks stored without the model are not trusted either
+        previous = [
+            SimpleNamespace(chunk_text="unchanged", embedding=[1.0] * 1536,
+                            metadata={"embedding_model": "text-embedding-ada-002"}),
+            SimpleNamespace(chunk_text="unchanged", embedding=[1.0] * 1536, metadata={}),
+        ]
+        embeddings, reused = EmbeddingService.embed_chunks([{"text": "unchanged"}], previous_chunks=previous)
+        assert reused == 0
+        assert embeddings == [[2.0] * 1536]
+
+    def test_dimensions_are_configurable_for_reducible_models(self, settings):
+        settings.EMBEDDING_MODEL = "text-embedding-ada-002"
+        settings.EMBEDDING_DIMENSIONS = 512
+        # ada-002 cannot be shortened
+        assert EmbeddingService.get_dimensions() == 1536
+        assert EmbeddingService.get_dimensions("text-embedding-3-large") == 512
+
+        settings.EMBEDDING_DIMENSIONS = None
+        assert EmbeddingService.get_dimensions("text-embedding-3-large") == 3072
+
+    def test_shortened_embeddings_are_requested_and_cached_separately(self, monkeypatch, settings):
+        settings.EMBEDDING_MODEL = "text-embedding-3-small"
+        requests = []
+
+        def fake_request(texts, model, dimensions=None):
+            requests.append((model, dimensions))
+            return [[0.5] * dimensions for _ in texts]
+
+        monkeypatch.setattr(EmbeddingService, "_request_embeddings", staticmethod(fake_request))
+
+        settings.EMBEDDING_DIMENSIONS = 256
+        assert len(EmbeddingService.generate_embedding("text")) == 256
+        settings.EMBEDDING_DIMENSIONS = None
+        assert len(EmbeddingService.generate_embedding("text")) == 1536
+        assert requests == [("text-embedding-3-small", 256), ("text-embedding-3-small", 1536)]
@@ -0,0 +1,19 @@
+import pytest
+
+from ai_decisions.helpers.rank_fusion import reciprocal_rank_fusion
+
+
+class TestReciprocalRankFusion:
+    def test_items_in_both_rankings_rank_first(self):
+        fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "d"]], k=60)
+        ids = [item for item, _ in fused]
+        assert ids[0] == "c"
+        assert set(ids) == {"a", "b", "c", "d"}
+        assert dict(fused)["c"] == pytest.approx(1 / 63 + 1 / 61)
+
+    def test_ties_keep_first_seen_order_and_duplicates_count_once(self):
+        fused = reciprocal_rank_fusion([["a", "a"], ["b"]], k=1)
+        assert fused == [("a", 0.5), ("b", 0.5)]
+
+    def test_empty_rankings(self):
+        assert reciprocal_rank_fusion([[], []]) == []
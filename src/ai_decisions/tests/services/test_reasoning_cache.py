@@ -0,0 +1,137 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from ai_decisions.helpers.reasoning_cache import ReasoningCache
+from ai_decisions.services.ai_reasoning_service import AIReasoningService
+from main_system.utils.cache_utils import bump_namespace
+from rules_knowledge.helpers.active_rule_version_cache import NAMESPACE as RULE_VERSIONS_NAMESPACE
+
+CONTEXT = [{"chunk_id": "c1", "text": "Salary must be at least 38,700.", "similarity": 0.9}]
+RULES = {"outcome": "likely", "rule_version_id": "rv1", "evaluation_date": "2026-01-01T00:00:00"}
+
+
+def _scope(rule_results=RULES, context=CONTEXT):
+    return ReasoningCache.scope_key("gpt-4", "1", rule_results, context)
+
+
+class TestReasoningCache:
+    def test_exact_hit_uses_normalized_facts(self):
+        scope = _scope()
+        ReasoningCache.put(scope, {"nationality": "British ", "salary": 40000.0}, {"response": "Likely"})
+
+        value, result = ReasoningCache.get(scope, {"salary": 40000, "nationality": "british", "notes": ""})
+        assert result == "exact_hit"
+        assert value == {"response": "Likely"}
+        assert ReasoningCache.get(scope, {"salary": 39000, "nationality": "british"}) == (None, "miss")
+
+    def test_scope_changes_with_rules_chunks_and_ignores_evaluation_date(self):
+        scope = _scope()
+        assert _scope(rule_results={**RULES, "evaluation_date": "2026-02-01T00:00:00"}) == scope
+        assert _scope(rule_results={**RULES, "rule_version_id": "rv2"}) != scope
+        assert _scope(context=[{**CONTEXT[0], "text": "Salary must be at least 41,700."}]) != scope
+        assert _scope(context=[{**CONTEXT[0], "chunk_id": "c2"}]) != scope
+
+    def test_scope_ignores_missing_facts_order(self):
+        scope = _scope(rule_results={**RULES, "missing_facts": ["salary", "age", "nationality"]})
+        assert _scope(rule_results={**RULES, "missing_facts": ["nationality", "salary", "age"]}) == scope
+        assert _scope(rule_results={**RULES, "missing_facts": ["salary", "age"]}) != scope
+
+    def test_facts_are_not_rounded(self):
+        scope = _scope()
+        ReasoningCache.put(scope, {"years_of_residence": 4.99}, {"response": "Unlikely"})
+        assert ReasoningCache.get(scope, {"years_of_residence": 5.0}) == (None, "miss")
+        assert ReasoningCache.get(scope, {"years_of_residence": 4.99})[1] == "exact_hit"
+
+    def test_rule_and_cache_invalidation_change_scope(self):
+        scope = _scope()
+        bump_namespace(RULE_VERSIONS_NAMESPACE)
+        rules_bumped = _scope()
+        assert rules_bumped != scope
+        ReasoningCache.invalidate()
+        assert _scope() != rules_bumped
+
+    def test_semantic_lookup_requires_threshold(self, settings):
+        settings.AI_REASONING_CACHE_SEMANTIC_THRESHOLD = 0.95
+        scope = _scope()
+        ReasoningCache.put(scope, {"salary": 40000}, {"response": "Likely"}, fact_embedding=[1.0, 0.0, 0.0])
+
+        value, result = ReasoningCache.get(scope, {"salary": 40001}, fact_embedding=[0.99, 0.05, 0.0])
+        assert (value, result) == ({"response": "Likely"}, "semantic_hit")
+        assert ReasoningCache.get(scope, {"salary": 40001}, fact_embedding=[0.5, 0.5, 0.0]) == (None, "miss")
+
+        settings.AI_REASONING_CACHE_SEMANTIC_THRESHOLD = None
+        assert ReasoningCache.get(scope, {"salary": 40001}, fact_embedding=[0.99, 0.05, 0.0]) == (None, "miss")
+
+    def test_semantic_candidates_are_bounded(self, settings):
+        settings.AI_REASONING_CACHE_SEMANTIC_THRESHOLD = 0.99
+        settings.AI_REASONING_CACHE_SEMANTIC_CANDIDATES = 2
+        scope = _scope()
+        for i, embedding in enumerate([[1.0, 0.0], [0.0, 1.0], [-1.0, 0.0]]):
+            ReasoningCache.put(scope, {"i": i}, {"response": str(i)}, fact_embedding=embedding)
+
+        assert ReasoningCache.get(scope, {"i": 9}, fact_embedding=[1.0, 0.0]) == (None, "miss")
+        assert ReasoningCache.get(scope, {"i": 9}, fact_embedding=[-1.0, 0.0])[0] == {"response": "2"}
+
+
+@pytest.mark.django_db
+class TestAIReasoningServiceCache:
+    def test_second_case_reuses_response_and_still_logs_citations(self, monkeypatch):
+        monkeypatch.setattr(
+            "immigration_cases.selectors.case_selector.CaseSelector.get_by_id",
+            MagicMock(return_value=None),
+        )
+        call_llm = MagicMock(return_value={"response": "Likely", "model": "gpt-4", "tokens_used": 20, "citations": []})
+        monkeypatch.setattr("ai_decisions.services.ai_reasoning_service.AIReasoningService.call_llm", call_llm)
+        create_log = MagicMock(side_effect=[SimpleNamespace(id="log1"), SimpleNamespace(id="log2")])
+        monkeypatch.setattr(
+            "ai_decisions.services.ai_reasoning_service.AIReasoningLogService.create_reasoning_log",
+            create_log,
+        )
+        fake_doc_chunk = SimpleNamespace(document_version=SimpleNamespace(id="dv1"))
+        monkeypatch.setattr(
+            "data_ingestion.models.document_chunk.DocumentChunk.objects",
+            SimpleNamespace(
+                select_related=MagicMock(return_value=SimpleNamespace(get=MagicMock(return_value=fake_doc_chunk)))
+            ),
+        )
+        create_citation = MagicMock(return_value=SimpleNamespace(id="cit"))
+        monkeypatch.setattr(
+            "ai_decisions.services.ai_reasoning_service.AICitationService.create_citation",
+            create_citation,
+        )
+
+        first = AIReasoningService.run_ai_reasoning(
+            case_id="case-1", case_facts={"salary": 40000}, rule_results=RULES, context_chunks=list(CONTEXT)
+        )
+        second = AIReasoningService.run_ai_reasoning(
+            case_id="case-2", case_facts={"salary": 40000.0}, rule_results=RULES, context_chunks=list(CONTEXT)
+        )
+
+        assert call_llm.call_count == 1
+        assert (first["cached"], second["cached"]) == (False, True)
+        assert second["response"] == "Likely"
+        assert second["reasoning_log_id"] == "log2"
+        assert create_log.call_args_list[1].kwargs["cached_from_id"] == "log1"
+        assert create_log.call_args_list[1].kwargs["tokens_used"] == 0
+        assert create_citation.call_count == 2
+
+    def test_cache_disabled_calls_llm_every_time(self, monkeypatch, settings):
+        settings.AI_REASONING_CACHE_ENABLED = False
+        monkeypatch.setattr(
+            "immigration_cases.selectors.case_selector.CaseSelector.get_by_id",
+            MagicMock(return_value=None),
+        )
+        call_llm = MagicMock(return_value={"response": "Likely", "model": "gpt-4", "tokens_used": 20, "citations": []})
+        monkeypatch.setattr("ai_decisions.services.ai_reasoning_service.AIReasoningService.call_llm", call_llm)
+        monkeypatch.setattr(
+            "ai_decisions.services.ai_reasoning_service.AIReasoningLogService.create_reasoning_log",
+            MagicMock(return_value=None),
+        )
+
+        for _ in range(2):
+            AIReasoningService.run_ai_reasoning(
+                case_id="case-1", case_facts={"salary": 40000}, rule_results=RULES, context_chunks=[]
+            )
+        assert call_llm.call_count == 2
@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+
+from ai_decisions.helpers.retrieval_benchmark import run_retrieval_benchmark, sample_queries
+from ai_decisions.services.vector_backends import ChunkRecord, set_vector_backend
+from ai_decisions.services.vector_backends.base import metadata_matches
+from ai_decisions.services.vector_backends.numpy_backend import NumpyVectorBackend
+from ai_decisions.services.vector_db_service import PgVectorService
+
+
+def _backend(n=200, dims=16, seed=1):
+    rng = np.random.default_rng(seed)
+    embeddings = rng.normal(size=(n, dims)).astype(np.float32)
+    records = [
+        ChunkRecord(
+            id=f"c{i}",
+            chunk_text=f"chunk {i}",
+            metadata={"visa_code": "A" if i % 2 else "B", "tags": ["salary"] if i % 3 == 0 else []},
+            document_version_id=f"dv{i % 4}",
+            source_url=f"https://example.com/{i}",
+        )
+        for i in range(n)
+    ]
+    return NumpyVectorBackend(embeddings, records), embeddings
+
+
+@pytest.fixture
+def installed_backend():
+    backend, embeddings = _backend()
+    set_vector_backend(backend)
+    yield backend, embeddings
+    set_vector_backend(None)
+
+
+class TestNumpyVectorBackend:
+    def test_exact_search_matches_numpy_cosine_ranking(self):
+        backend, embeddings = _backend()
+        query = embeddings[7] + 0.01
+
+        found = backend.search([query.tolist()], limit=5, similarity_threshold=0.0)[0]
+
+        normalized = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+        expected = np.argsort(1 - normalized @ (query / np.linalg.norm(query)))[:5]
+        assert [chunk.id for chunk in found] == [f"c{i}" for i in expected]
+        assert found[0].id == "c7"
+        assert found[0].distance == pytest.approx(0.0, abs=1e-3)
+        assert [chunk.distance for chunk in found] == sorted(chunk.distance for chunk in found)
+
+    def test_filters_threshold_and_document_version(self):
+        backend, embeddings = _backend()
+        query = embeddings[3].tolist()
+
+        found = backend.search(
+            [query], limit=50, filters=[{"visa_code": "A", "tags": ["salary"]}], similarity_threshold=0.0
+        )[0]
+        assert found and all(c.metadata["visa_code"] == "A" and "salary" in c.metadata["tags"] for c in found)
+
+        same_version = backend.search([query], limit=50, similarity_threshold=0.0, document_version_id="dv3")[0]
+        assert same_version and all(c.document_version_id == "dv3" for c in same_version)
+
+        assert [c.id for c in backend.search([query], limit=50, similarity_threshold=0.999)[0]] == ["c3"]
+
+    def test_ivf_scanning_all_lists_is_exact(self):
+        backend, embeddings = _backend()
+        query = embeddings[11].tolist()
+        exact = backend.search([query], limit=10, similarity_threshold=0.0)[0]
+
+        backend.build_ivf(n_lists=8, seed=0)
+        assert backend.search([query], limit=10, similarity_threshold=0.0, n_probes=8)[0] == exact
+        approximate = backend.search([query], limit=10, similarity_threshold=0.0, n_probes=1)[0]
+        assert approximate[0].id == "c11"
+
+    def test_save_and_load_memory_mapped(self, tmp_path):
+        backend, embeddings = _backend(n=20)
+        backend.save(str(tmp_path))
+
+        loaded = NumpyVectorBackend.load(str(tmp_path))
+        assert isinstance(loaded.embeddings, np.memmap)
+        assert loaded.records == backend.records
+        query = embeddings[4].tolist()
+        assert loaded.search([query])[0] == backend.search([query])[0]
+
+    def test_wrong_dimensions_return_empty(self):
+        backend, _ = _backend()
+        assert backend.search([[1.0, 2.0]]) == [[]]
+
+    def test_metadata_matches_uses_containment_semantics(self):
+        metadata = {"visa_code": "A", "tags": ["x", "y"], "nested": {"a": 1, "b": 2}}
+        assert metadata_matches(metadata, {"tags": ["y"], "nested": {"a": 1}})
+        assert metadata_matches(metadata, {"tags": "x"})
+        assert not metadata_matches(metadata, {"visa_code": "B"})
+        assert not metadata_matches(metadata, {"missing": 1})
+
+
+class TestVectorBackendDispatch:
+    def test_pgvector_service_searches_installed_backend(self, installed_backend):
+        backend, embeddings = installed_backend
+        query = embeddings[5].tolist()
+
+        found = PgVectorService.search_similar(query_embedding=query, limit=3, similarity_threshold=0.0)
+        assert found[0].id == "c5"
+        assert found[0].document_version.source_document.source_url == "https://example.com/5"
+
+        many = PgVectorService.search_similar_many(
+            query_embeddings=[query, embeddings[6].tolist()], limit=2, similarity_threshold=0.0
+        )
+        assert [results[0].id for results in many] == ["c5", "c6"]
+
+        hybrid = PgVectorService.search_hybrid(
+            query_embedding=query, query_text="chunk 5", limit=3, similarity_threshold=0.0
+        )
+        assert hybrid[0].id == "c5"
+
+
+class TestRetrievalBenchmark:
+    def test_sampled_queries_find_their_own_chunk(self):
+        backend, _ = _backend()
+        backend.build_ivf(n_lists=8, seed=0)
+        queries = sample_queries(backend, 20)
+
+        rows = run_retrieval_benchmark(backend, queries, limits=[5], thresholds=[0.0], probes=[0, 2])
+        exact, approximate = rows
+        assert exact["n_probes"] == 0
+        assert exact["recall_vs_exact"] == pytest.approx(1.0)
+        assert exact["relevant_recall"] == pytest.approx(1.0)
+        assert exact["mrr"] == pytest.approx(1.0)
+        assert 0.0 < approximate["recall_vs_exact"] <= 1.0
+        assert approximate["mean_results"] == 5
@@ -22,6 +22,10 @@ class _FakeQS:
         self._calls.append(("order_by", args))
         return self
 
+    def select_related(self, *args):
+        self._calls.append(("select_related", args))
+        return self
+
     def __getitem__(self, item):
         # slicing returns list(...) in PgVectorService.search_similar
         return [SimpleNamespace(id="c1")]
@@ -42,19 +46,16 @@ class TestPgVectorService:
                 embeddings=[[0.0] * 1536, [0.0] * 1536],
             )
 
+    @pytest.mark.django_db
     def test_store_chunks_skips_invalid_embedding_dimensions(self, monkeypatch):
-        created_chunks = []
+        bulk_create = MagicMock(side_effect=lambda objs, batch_size=None: objs)
 
-        def _fake_create(**kwargs):
-            created = SimpleNamespace(**kwargs)
-            created_chunks.append(created)
-            return created
+        class _FakeChunk(SimpleNamespace):
+            objects = SimpleNamespace(bulk_create=bulk_create)
 
-        monkeypatch.setattr(
-            "ai_decisions.services.vector_db_service.DocumentChunk.objects",
-            SimpleNamespace(create=_fake_create),
-        )
-        monkeypatch.setattr("ai_decisions.services.vector_db_service.bump_namespace", MagicMock())
+        monkeypatch.setattr("ai_decisions.services.vector_db_service.DocumentChunk", _FakeChunk)
+        bump = MagicMock()
+        monkeypatch.setattr("ai_decisions.services.vector_db_service.bump_namespace", bump)
 
         created = PgVectorService.store_chunks(
             document_version=SimpleNamespace(id="dv1"),
@@ -68,7 +69,11 @@ class TestPgVectorService:
             ],
         )
         assert len(created) == 1
-        assert created_chunks[0].chunk_text == "good"
+        assert created[0].chunk_text == "good"
+        # One bulk insert and one namespace bump for the whole batch
+        assert bulk_create.call_count == 1
+        assert bulk_create.call_args.kwargs["batch_size"] == PgVectorService.STORE_BATCH_SIZE
+        assert bump.call_count == 1
 
     def test_search_similar_invalid_embedding_returns_empty(self):
         assert PgVectorService.search_similar(query_embedding=[]) == []
@@ -85,18 +90,71 @@ class TestPgVectorService:
         out = PgVectorService.search_similar(
             query_embedding=[0.0] * 1536,
             limit=3,
-            filters={"visa_code": "US_TEST"},
+            filters={"visa_code": "US_TEST", "effective_date": "2026-01-01"},
             similarity_threshold=0.7,
             document_version_id="dv1",
         )
         assert isinstance(out, list)
         assert len(out) == 1
 
-        # Ensure metadata filter was applied and distance threshold filter was applied.
+        # Ensure metadata filters were applied (indexed keys by key lookup, others by
+        # containment) and distance threshold filter was applied.
         filter_calls = [c for c in qs.calls() if c[0] == "filter"]
+        assert any(call[1].get("metadata__visa_code") == "US_TEST" for call in filter_calls)
         assert any("metadata__contains" in call[1] for call in filter_calls)
         assert any("distance__lte" in call[1] for call in filter_calls)
 
+    def test_search_similar_many_falls_back_to_per_query_search(self, monkeypatch):
+        monkeypatch.setattr(
+            "ai_decisions.services.vector_db_service.connection.features.supports_slicing_ordering_in_compound",
+            False,
+        )
+        search = MagicMock(side_effect=[["a"], ["b"]])
+        monkeypatch.setattr(PgVectorService, "search_similar", search)
+
+        out = PgVectorService.search_similar_many(
+            query_embeddings=[[0.0] * 1536, [], [0.1] * 1536],
+            limit=2,
+            filters=[{"visa_code": "A"}, {}, {"visa_code": "C"}],
+        )
+        # Invalid embeddings get an empty result without a query
+        assert out == [["a"], [], ["b"]]
+        assert [c.kwargs["filters"] for c in search.call_args_list] == [{"visa_code": "A"}, {"visa_code": "C"}]
+
+    def test_search_similar_many_filters_length_mismatch_raises(self):
+        with pytest.raises(ValueError):
+            PgVectorService.search_similar_many(query_embeddings=[[0.0] * 1536], filters=[{}, {}])
+
+    def test_binary_precision_shortlists_by_hamming_then_reranks(self, monkeypatch, settings):
+        settings.VECTOR_SEARCH_PRECISION = "binary"
+        settings.VECTOR_SEARCH_BINARY_RERANK_FACTOR = 5
+        assert PgVectorService._binary_shortlist_size(3) == 15
+
+        queryset = PgVectorService._build_search_queryset(query_embedding=[0.1, -0.2] * 768, limit=3)
+        sql = str(queryset.query)
+        assert "binary_quantize" in sql
+        assert "<~>" in sql
+        assert "LIMIT 15" in sql
+
+        settings.VECTOR_SEARCH_PRECISION = "vector"
+        assert PgVectorService._binary_shortlist_size(3) is None
+
+    def test_ann_search_params_only_on_postgres(self, monkeypatch, settings):
+        settings.VECTOR_SEARCH_HNSW_EF_SEARCH = 80
+        settings.VECTOR_SEARCH_IVFFLAT_PROBES = None
+        monkeypatch.setattr("ai_decisions.services.vector_db_service.connection", SimpleNamespace(vendor="sqlite"))
+        assert PgVectorService._ann_search_params() == []
+
+        monkeypatch.setattr("ai_decisions.services.vector_db_service.connection", SimpleNamespace(vendor="postgresql"))
+        assert PgVectorService._ann_search_params() == [("hnsw.ef_search", 80)]
+        assert PgVectorService._ann_search_params(ef_search=200, probes=10) == [
+            ("hnsw.ef_search", 200),
+            ("ivfflat.probes", 10),
+        ]
+        # The binary shortlist needs a candidate list at least its size
+        assert PgVectorService._ann_search_params(min_ef_search=120) == [("hnsw.ef_search", 120)]
+        assert PgVectorService._ann_search_params(min_ef_search=20) == [("hnsw.ef_search", 80)]
+
     def test_delete_chunks_by_document_version_bumps_namespace(self, monkeypatch):
         qs = _FakeQS()
         monkeypatch.setattr(
@@ -110,11 +168,17 @@ class TestPgVectorService:
         assert deleted == 2
         assert bump.call_count == 1
 
+    @pytest.mark.django_db
     def test_update_chunks_for_document_version_deletes_then_creates(self, monkeypatch):
-        delete_mock = MagicMock(return_value=1)
-        store_mock = MagicMock(return_value=[SimpleNamespace(id="c1")])
-        monkeypatch.setattr("ai_decisions.services.vector_db_service.PgVectorService.delete_chunks_by_document_version", delete_mock)
-        monkeypatch.setattr("ai_decisions.services.vector_db_service.PgVectorService.store_chunks", store_mock)
+        qs = _FakeQS()
+        monkeypatch.setattr(
+            "ai_decisions.services.vector_db_service.DocumentChunk.objects",
+            SimpleNamespace(filter=MagicMock(return_value=qs)),
+        )
+        insert_mock = MagicMock(return_value=[SimpleNamespace(id="c1")])
+        monkeypatch.setattr("ai_decisions.services.vector_db_service.PgVectorService._insert_chunks", insert_mock)
+        bump = MagicMock()
+        monkeypatch.setattr("ai_decisions.services.vector_db_service.bump_namespace", bump)
 
         out = PgVectorService.update_chunks_for_document_version(
             document_version=SimpleNamespace(id="dv1"),
@@ -122,6 +186,5 @@ class TestPgVectorService:
             embeddings=[[0.0] * 1536],
         )
         assert len(out) == 1
-        assert delete_mock.call_count == 1
-        assert store_mock.call_count == 1
-
+        assert insert_mock.call_count == 1
+        assert bump.call_count == 1
@@ -0,0 +1,83 @@
+"""
+Change classification for document diffs.
+
+ChangeClassifier consumes a diff incrementally (line by line or in chunks), keeping
+only a few flags and the running length, so a diff can be classified while it is
+streamed to storage instead of being lowercased and searched as one string.
+Patterns are compiled once at import.
+"""
+import re
+from typing import Iterable, Iterator
+
+REQUIREMENT_KEYWORDS = re.compile(r'salary|threshold|minimum|requirement|must|need')
+FEE_KEYWORDS = re.compile(r'fee|cost|charge|payment')
+TIME_KEYWORDS = re.compile(r'day|week|month|processing|time|duration')
+MONEY_PATTERN = re.compile(r'[£$€]\s*\d+|\d+\s*(pound|dollar|euro)')
+DURATION_PATTERN = re.compile(r'\d+\s*(day|week|month|hour)')
+
+# Diffs longer than this (in characters) are major updates
+MAJOR_UPDATE_MIN_LENGTH = 10000
+
+
+class ChangeClassifier:
+    """
+    Incremental diff classifier.
+
+    Precedence (first match wins): requirement_change (requirement keyword and an
+    amount of money), fee_change (fee keyword and money), processing_time_change
+    (time keyword and a duration), major_update (long diff), minor_text.
+    """
+
+    def __init__(self):
+        self.length = 0
+        self.requirement_keyword = False
+        self.fee_keyword = False
+        self.time_keyword = False
+        self.money = False
+        self.duration = False
+
+    @classmethod
+    def classify(cls, diff_text: str) -> str:
+        """Classify a complete diff."""
+        classifier = cls()
+        classifier.feed(diff_text)
+        return classifier.result()
+
+    def observe(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Pass chunks through unchanged, feeding each one to the classifier."""
+        for chunk in chunks:
+            self.feed(chunk)
+            yield chunk
+
+    def feed(self, chunk: str) -> None:
+        """Add a piece of the diff (patterns are matched within lines)."""
+        self.length += len(chunk)
+        if self._decided():
+            return
+        for line in chunk.lower().splitlines():
+            if not self.requirement_keyword and REQUIREMENT_KEYWORDS.search(line):
+                self.requirement_keyword = True
+            if not self.fee_keyword and FEE_KEYWORDS.search(line):
+                self.fee_keyword = True
+            if not self.time_keyword and TIME_KEYWORDS.search(line):
+                self.time_keyword = True
+            if not self.money and MONEY_PATTERN.search(line):
+                self.money = True
+            if not self.duration and DURATION_PATTERN.search(line):
+                self.duration = True
+
+    def result(self) -> str:
+        """Change type of everything fed so far."""
+        if self.requirement_keyword and self.money:
+            return 'requirement_change'
+        if self.fee_keyword and self.money:
+            return 'fee_change'
+        if self.time_keyword and self.duration:
+            return 'processing_time_change'
+        if self.length > MAJOR_UPDATE_MIN_LENGTH:
+            return 'major_update'
+        return 'minor_text'
+
+    def _decided(self) -> bool:
+        # Nothing more can change the outcome once the highest-precedence type matched
+        return self.requirement_keyword and self.money
@@ -0,0 +1,150 @@
+"""
+Concurrent crawl engine for ingestion systems.
+
+- HostRateLimiter: process-wide token bucket per host. Every request an ingestion
+  system makes to a host (discovery, search paging, content fetches) takes a token,
+  so total traffic to gov.uk stays at INGESTION_CRAWL_REQUESTS_PER_SECOND however
+  many threads are fetching. Callers reserve their slot under a lock and sleep
+  outside it, so waiting threads are released one interval apart instead of in bursts.
+- crawl(): frontier queue with dedup, worked by a bounded thread pool. Handlers
+  return the items they discover; items whose key was already seen are dropped.
+
+The LLM rate limiter (helpers.rate_limiter) is shared through the Django cache
+across workers; a crawl runs inside a single ingestion task, so its limiter is
+process-local and exact.
+"""
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from django.conf import settings
+from main_system.utils.thread_pool import DBThreadPoolExecutor
+
+logger = logging.getLogger('django')
+
+DEFAULT_REQUESTS_PER_SECOND = 2.0
+DEFAULT_BURST = 2
+DEFAULT_MAX_IN_FLIGHT = 4
+
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until a token is available."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = float(rate)
+        self.capacity = float(max(1, burst))
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until it is available.
+
+        Returns:
+            Seconds waited
+        """
+        if self.rate <= 0:
+            return 0.0
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            # Reserve the token; a negative balance is the queue of waiting callers
+            self.tokens -= 1.0
+            wait_seconds = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+        return wait_seconds
+
+
+class HostRateLimiter:
+    """Process-wide token buckets keyed by host."""
+
+    _buckets: Dict[str, TokenBucket] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def host(url: str) -> str:
+        return (urlparse(url).netloc or url).lower()
+
+    @classmethod
+    def acquire(cls, url: str) -> float:
+        """Wait for a request slot for the host of `url`; returns seconds waited."""
+        return cls._bucket(cls.host(url)).acquire()
+
+    @classmethod
+    def _bucket(cls, host: str) -> TokenBucket:
+        with cls._lock:
+            bucket = cls._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(
+                    rate=getattr(settings, 'INGESTION_CRAWL_REQUESTS_PER_SECOND', DEFAULT_REQUESTS_PER_SECOND),
+                    burst=getattr(settings, 'INGESTION_CRAWL_BURST', DEFAULT_BURST),
+                )
+                cls._buckets[host] = bucket
+            return bucket
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop all buckets (picked up again from settings on next use)."""
+        with cls._lock:
+            cls._buckets.clear()
+
+
+def max_in_flight() -> int:
+    """Configured maximum number of concurrent crawl requests."""
+    return max(1, getattr(settings, 'INGESTION_CRAWL_MAX_IN_FLIGHT', DEFAULT_MAX_IN_FLIGHT))
+
+
+def crawl(
+    seeds: Iterable[Any],
+    handler: Callable[[Any], Optional[Iterable[Any]]],
+    key: Callable[[Any], Hashable] = lambda item: item,
+    max_workers: Optional[int] = None,
+    thread_name_prefix: str = 'crawler'
+) -> List[Tuple[Any, Exception]]:
+    """
+    Work a deduplicated frontier with a bounded thread pool.
+
+    Args:
+        seeds: Initial frontier items
+        handler: Processes one item (in a worker thread) and returns newly discovered items
+        key: Dedup key of an item
+        max_workers: Maximum items in flight (default: INGESTION_CRAWL_MAX_IN_FLIGHT)
+        thread_name_prefix: Worker thread name prefix
+
+    Returns:
+        List of (item, exception) for handlers that raised
+    """
+    seen = set()
+    frontier = deque()
+
+    def _enqueue(items: Optional[Iterable[Any]]) -> None:
+        for item in items or ():
+            item_key = key(item)
+            if item_key not in seen:
+                seen.add(item_key)
+                frontier.append(item)
+
+    _enqueue(seeds)
+    errors: List[Tuple[Any, Exception]] = []
+    limit = max_workers or max_in_flight()
+    with DBThreadPoolExecutor(max_workers=limit, thread_name_prefix=thread_name_prefix) as executor:
+        in_flight = {}
+        while frontier or in_flight:
+            while frontier and len(in_flight) < limit:
+                item = frontier.popleft()
+                in_flight[executor.submit(handler, item)] = item
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = in_flight.pop(future)
+                try:
+                    _enqueue(future.result())
+                except Exception as e:
+                    errors.append((item, e))
+    return errors
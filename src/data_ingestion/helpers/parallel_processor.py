@@ -7,8 +7,9 @@ Provides async/parallel processing capabilities for batch operations.
 import logging
 import asyncio
 from typing import List, Dict, Optional, Any, Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import as_completed
 from django.conf import settings
+from main_system.utils.thread_pool import DBThreadPoolExecutor
 from decimal import Decimal
 
 logger = logging.getLogger('django')
@@ -47,7 +48,7 @@ class ParallelProcessor:
         if getattr(settings, "APP_ENV", None) != "test":
             logger.info(f"Processing {len(items)} items in parallel with {max_workers} workers")
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        with DBThreadPoolExecutor(max_workers=max_workers) as executor:
             # Submit all tasks
             future_to_item = {
                 executor.submit(process_func, item): item
@@ -0,0 +1,140 @@
+"""
+Flow control for the queued ingestion pipeline (data_ingestion.tasks.pipeline_tasks).
+
+State lives in the shared Django cache (Redis), so limits hold across all workers:
+
+- Pending counters: incremented when a stage task is enqueued, decremented when it
+  finishes. A stage whose pending count reaches INGESTION_PIPELINE_STAGE_MAX_PENDING
+  is saturated; the stages feeding it wait (retry later) instead of enqueueing more,
+  so a slow LLM parse backlog slows fetching rather than growing without bound.
+- Slots: at most INGESTION_PIPELINE_STAGE_CONCURRENCY tasks of a stage run at once,
+  whatever the worker pool sizes are.
+- Claims: a task keyed by content hash (or URL) is only run by one worker at a time,
+  so redelivered (acks_late) or duplicate messages do not repeat work in parallel.
+
+Counters and slots expire (COUNTER_TTL_SECONDS / slot timeout), so a worker that died
+without cleaning up can only relax the limits temporarily, never block a stage.
+A limit of 0 (or a missing entry) means unlimited.
+"""
+import logging
+from typing import Optional
+
+from django.conf import settings
+
+from main_system.utils.cache_utils import cache_add, cache_delete, cache_get, cache_incr
+
+logger = logging.getLogger('django')
+
+FETCH = 'fetch'
+NORMALIZE = 'normalize'
+DIFF = 'diff'
+EMBED = 'embed'
+PARSE = 'parse'
+STAGES = (FETCH, NORMALIZE, DIFF, EMBED, PARSE)
+
+# Stages a task enqueues into; the task waits while any of them is saturated
+DOWNSTREAM = {
+    FETCH: (NORMALIZE,),
+    NORMALIZE: (DIFF, EMBED, PARSE),
+    DIFF: (),
+    EMBED: (),
+    PARSE: (),
+}
+
+KEY_PREFIX = 'ingestion_pipeline'
+COUNTER_TTL_SECONDS = 6 * 60 * 60
+
+
+class PipelineControl:
+    """Pending counters, concurrency slots and claims per pipeline stage."""
+
+    @staticmethod
+    def max_pending(stage: str) -> int:
+        return (getattr(settings, 'INGESTION_PIPELINE_STAGE_MAX_PENDING', None) or {}).get(stage, 0)
+
+    @staticmethod
+    def concurrency(stage: str) -> int:
+        return (getattr(settings, 'INGESTION_PIPELINE_STAGE_CONCURRENCY', None) or {}).get(stage, 0)
+
+    @staticmethod
+    def retry_delay() -> int:
+        """Seconds a task waits before retrying when held back."""
+        return getattr(settings, 'INGESTION_PIPELINE_RETRY_DELAY_SECONDS', 30)
+
+    @staticmethod
+    def pending(stage: str) -> int:
+        return max(0, int(cache_get(_pending_key(stage), 0) or 0))
+
+    @staticmethod
+    def mark_enqueued(stage: str) -> None:
+        key = _pending_key(stage)
+        cache_add(key, 0, timeout=COUNTER_TTL_SECONDS)
+        try:
+            cache_incr(key)
+        except ValueError:
+            # Expired between add and incr
+            cache_add(key, 1, timeout=COUNTER_TTL_SECONDS)
+
+    @staticmethod
+    def mark_finished(stage: str) -> None:
+        try:
+            if PipelineControl.pending(stage) > 0:
+                cache_incr(_pending_key(stage), -1)
+        except ValueError:
+            pass
+
+    @classmethod
+    def is_saturated(cls, stage: str) -> bool:
+        limit = cls.max_pending(stage)
+        return bool(limit) and cls.pending(stage) >= limit
+
+    @classmethod
+    def downstream_saturated(cls, stage: str) -> Optional[str]:
+        """First saturated stage fed by `stage` (None if it may enqueue)."""
+        return next((downstream for downstream in DOWNSTREAM[stage] if cls.is_saturated(downstream)), None)
+
+    @classmethod
+    def acquire_slot(cls, stage: str, timeout: int) -> Optional[int]:
+        """
+        Take one of the stage's concurrency slots.
+
+        Args:
+            stage: Pipeline stage
+            timeout: Seconds after which the slot frees itself (task time limit)
+
+        Returns:
+            Slot number (-1 when the stage is unlimited), or None if all are taken
+        """
+        limit = cls.concurrency(stage)
+        if not limit:
+            return -1
+        for slot in range(limit):
+            if cache_add(_slot_key(stage, slot), 1, timeout=timeout):
+                return slot
+        return None
+
+    @staticmethod
+    def release_slot(stage: str, slot: Optional[int]) -> None:
+        if slot is not None and slot >= 0:
+            cache_delete(_slot_key(stage, slot))
+
+    @staticmethod
+    def claim(stage: str, key: str, timeout: int) -> bool:
+        """Claim exclusive processing of `key` in a stage (False if another worker holds it)."""
+        return cache_add(_claim_key(stage, key), 1, timeout=timeout)
+
+    @staticmethod
+    def release_claim(stage: str, key: str) -> None:
+        cache_delete(_claim_key(stage, key))
+
+
+def _pending_key(stage: str) -> str:
+    return f"{KEY_PREFIX}:pending:{stage}"
+
+
+def _slot_key(stage: str, slot: int) -> str:
+    return f"{KEY_PREFIX}:slot:{stage}:{slot}"
+
+
+def _claim_key(stage: str, key: str) -> str:
+    return f"{KEY_PREFIX}:claim:{stage}:{key}"
@@ -0,0 +1,232 @@
+"""
+Line diff engine for document versions.
+
+difflib.unified_diff compares lines as strings, degrades quadratically when long
+documents are reordered, and callers usually join its output into one string. This
+engine:
+
+- hashes each line to an integer id once, so comparisons are int comparisons
+- anchors on lines that occur exactly once in both regions (patience diff): the
+  longest increasing run of unique common lines splits the problem into
+  independent regions, recursively; common prefixes/suffixes are trimmed first
+- falls back to difflib.SequenceMatcher (on the ids) only for regions without
+  unique lines, and treats such regions as a plain replacement when they are larger
+  than FALLBACK_MAX_LINES, so the worst case stays bounded
+- yields the unified diff one line at a time (hunks with `context` lines), in
+  the format of difflib.unified_diff, so consumers can stream it
+"""
+import difflib
+from array import array
+from bisect import bisect_left
+from typing import Iterator, List, Sequence, Tuple
+
+# Regions without unique anchor lines larger than this are not searched for matches
+FALLBACK_MAX_LINES = 2000
+
+Opcode = Tuple[str, int, int, int, int]
+
+
+def unified_diff(
+    old_text: str,
+    new_text: str,
+    context: int = 3,
+    fromfile: str = 'old_version',
+    tofile: str = 'new_version'
+) -> Iterator[str]:
+    """
+    Unified diff of two texts, streamed line by line.
+
+    Args:
+        old_text: Previous version text
+        new_text: New version text
+        context: Unchanged lines shown around each change
+        fromfile: Old file label
+        tofile: New file label
+
+    Yields:
+        Diff lines, each ending with a newline (nothing if the texts are equal)
+    """
+    old_lines = old_text.splitlines(keepends=True)
+    new_lines = new_text.splitlines(keepends=True)
+    old_ids, new_ids = _line_ids(old_lines, new_lines)
+
+    started = False
+    for group in _grouped_opcodes(opcodes(old_ids, new_ids), context):
+        if not started:
+            started = True
+            yield f'--- {fromfile}\n'
+            yield f'+++ {tofile}\n'
+        first, last = group[0], group[-1]
+        yield f'@@ -{_format_range(first[1], last[2])} +{_format_range(first[3], last[4])} @@\n'
+        for tag, i1, i2, j1, j2 in group:
+            if tag == 'equal':
+                for line in old_lines[i1:i2]:
+                    yield ' ' + _terminated(line)
+                continue
+            for line in old_lines[i1:i2]:
+                yield '-' + _terminated(line)
+            for line in new_lines[j1:j2]:
+                yield '+' + _terminated(line)
+
+
+def opcodes(old_ids: Sequence[int], new_ids: Sequence[int]) -> Iterator[Opcode]:
+    """
+    Edit operations between two id sequences (as SequenceMatcher.get_opcodes()).
+
+    Yields:
+        (tag, i1, i2, j1, j2) with tag in 'equal', 'replace', 'delete', 'insert'
+    """
+    i = j = 0
+    for block_i, block_j, size in matching_blocks(old_ids, new_ids):
+        if i < block_i and j < block_j:
+            yield ('replace', i, block_i, j, block_j)
+        elif i < block_i:
+            yield ('delete', i, block_i, j, block_j)
+        elif j < block_j:
+            yield ('insert', i, block_i, j, block_j)
+        if size:
+            yield ('equal', block_i, block_i + size, block_j, block_j + size)
+        i, j = block_i + size, block_j + size
+
+
+def matching_blocks(old_ids: Sequence[int], new_ids: Sequence[int]) -> List[Tuple[int, int, int]]:
+    """
+    Matching runs (i, j, size) in increasing order, ending with (len(a), len(b), 0).
+    """
+    matches: List[Tuple[int, int, int]] = []
+    regions = [(0, len(old_ids), 0, len(new_ids))]
+    while regions:
+        alo, ahi, blo, bhi = regions.pop()
+
+        # Common prefix and suffix
+        while alo < ahi and blo < bhi and old_ids[alo] == new_ids[blo]:
+            matches.append((alo, blo, 1))
+            alo += 1
+            blo += 1
+        while alo < ahi and blo < bhi and old_ids[ahi - 1] == new_ids[bhi - 1]:
+            ahi -= 1
+            bhi -= 1
+            matches.append((ahi, bhi, 1))
+        if alo == ahi or blo == bhi:
+            continue
+
+        anchors = _unique_anchors(old_ids, new_ids, alo, ahi, blo, bhi)
+        if anchors:
+            previous_i, previous_j = alo, blo
+            for i, j in anchors:
+                matches.append((i, j, 1))
+                regions.append((previous_i, i, previous_j, j))
+                previous_i, previous_j = i + 1, j + 1
+            regions.append((previous_i, ahi, previous_j, bhi))
+        elif ahi - alo <= FALLBACK_MAX_LINES and bhi - blo <= FALLBACK_MAX_LINES:
+            matcher = difflib.SequenceMatcher(None, old_ids[alo:ahi], new_ids[blo:bhi], autojunk=False)
+            for i, j, size in matcher.get_matching_blocks():
+                if size:
+                    matches.append((alo + i, blo + j, size))
+
+    return _merge_blocks(sorted(matches), len(old_ids), len(new_ids))
+
+
+def _unique_anchors(old_ids, new_ids, alo: int, ahi: int, blo: int, bhi: int) -> List[Tuple[int, int]]:
+    """Longest increasing sequence of lines occurring once in both regions."""
+    old_positions = {}
+    for i in range(alo, ahi):
+        line_id = old_ids[i]
+        old_positions[line_id] = -1 if line_id in old_positions else i
+    new_positions = {}
+    for j in range(blo, bhi):
+        line_id = new_ids[j]
+        if old_positions.get(line_id, -1) >= 0:
+            new_positions[line_id] = -1 if line_id in new_positions else j
+
+    pairs = sorted(
+        (old_positions[line_id], j) for line_id, j in new_positions.items() if j >= 0
+    )
+    if not pairs:
+        return []
+
+    # Patience sorting: longest increasing subsequence of new positions
+    tails: List[int] = []
+    tail_index: List[int] = []
+    previous = [-1] * len(pairs)
+    for index, (_, j) in enumerate(pairs):
+        pile = bisect_left(tails, j)
+        if pile == len(tails):
+            tails.append(j)
+            tail_index.append(index)
+        else:
+            tails[pile] = j
+            tail_index[pile] = index
+        previous[index] = tail_index[pile - 1] if pile else -1
+
+    anchors = []
+    index = tail_index[-1]
+    while index >= 0:
+        anchors.append(pairs[index])
+        index = previous[index]
+    anchors.reverse()
+    return anchors
+
+
+def _merge_blocks(blocks, old_len: int, new_len: int) -> List[Tuple[int, int, int]]:
+    merged: List[Tuple[int, int, int]] = []
+    for i, j, size in blocks:
+        if merged:
+            last_i, last_j, last_size = merged[-1]
+            if last_i + last_size == i and last_j + last_size == j:
+                merged[-1] = (last_i, last_j, last_size + size)
+                continue
+        merged.append((i, j, size))
+    merged.append((old_len, new_len, 0))
+    return merged
+
+
+def _grouped_opcodes(codes: Iterator[Opcode], context: int) -> Iterator[List[Opcode]]:
+    """Hunks of changes with up to `context` equal lines around them (as SequenceMatcher)."""
+    group: List[Opcode] = []
+    pending_equal = None
+    for code in codes:
+        tag, i1, i2, j1, j2 = code
+        if tag == 'equal':
+            pending_equal = code
+            continue
+        if pending_equal is not None:
+            _, ei1, ei2, ej1, ej2 = pending_equal
+            pending_equal = None
+            if group and ei2 - ei1 > 2 * context:
+                # Close the current hunk and open a new one
+                group.append(('equal', ei1, ei1 + context, ej1, ej1 + context))
+                yield group
+                group = []
+            if group:
+                group.append(('equal', ei1, ei2, ej1, ej2))
+            else:
+                group.append(('equal', max(ei1, ei2 - context), ei2, max(ej1, ej2 - context), ej2))
+        group.append(code)
+    if group:
+        if pending_equal is not None:
+            _, ei1, ei2, ej1, ej2 = pending_equal
+            group.append(('equal', ei1, min(ei2, ei1 + context), ej1, min(ej2, ej1 + context)))
+        yield group
+
+
+def _line_ids(old_lines: List[str], new_lines: List[str]) -> Tuple[array, array]:
+    ids = {}
+    old_ids = array('l', (ids.setdefault(line, len(ids)) for line in old_lines))
+    new_ids = array('l', (ids.setdefault(line, len(ids)) for line in new_lines))
+    return old_ids, new_ids
+
+
+def _format_range(start: int, stop: int) -> str:
+    # Same as difflib's unified range format
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return str(beginning)
+    if not length:
+        beginning -= 1
+    return f'{beginning},{length}'
+
+
+def _terminated(line: str) -> str:
+    return line if line.endswith('\n') else line + '\n'
@@ -0,0 +1,234 @@
+"""
+Vector Index Management
+
+Builds and inspects the approximate nearest neighbour (ANN) index on
+`document_chunks.embedding`.
+
+Two pgvector index types are supported:
+- HNSW (default): better recall/latency trade-off, no training step, slower to build.
+  Query-time recall is tuned with `hnsw.ef_search`.
+- IVFFlat: faster to build and smaller, but the lists are trained on the rows present
+  at build time, so rebuild it after large ingestions. Query-time recall is tuned with
+  `ivfflat.probes`.
+
+The embedding column has no fixed dimension (it depends on the embedding model), so
+the index is built on a typed expression, in one of three precisions:
+- vector: float32, `embedding::vector(N)`.
+- halfvec: float16, `embedding::halfvec(N)`; half the index size, near-identical recall.
+- binary: `binary_quantize(embedding)::bit(N)` with Hamming distance; 1 bit per
+  dimension (32x smaller). Used as a first pass whose shortlist is re-ranked on the
+  float vectors (see PgVectorService).
+PgVectorService builds its distance expressions with `index_expression`, so queries
+match the index. VECTOR_SEARCH_PRECISION selects the precision for both.
+
+Only one ANN index is kept on the column at a time. All operations are no-ops on
+non-PostgreSQL backends (SQLite test databases have no pgvector).
+"""
+import logging
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger('django')
+
+TABLE = 'document_chunks'
+COLUMN = 'embedding'
+
+INDEX_NAMES = {
+    'hnsw': 'document_chunks_embedding_hnsw_idx',
+    'ivfflat': 'document_chunks_embedding_ivfflat_idx',
+}
+
+# precision -> (indexed expression, operator class); PgVectorService searches by cosine
+# distance, and by Hamming distance on the binary-quantized first pass
+PRECISIONS = {
+    'vector': ('{column}::vector({dimensions})', 'vector_cosine_ops'),
+    'halfvec': ('{column}::halfvec({dimensions})', 'halfvec_cosine_ops'),
+    'binary': ('binary_quantize({column})::bit({dimensions})', 'bit_hamming_ops'),
+}
+
+# pgvector defaults
+DEFAULT_HNSW_M = 16
+DEFAULT_HNSW_EF_CONSTRUCTION = 64
+
+
+def get_precision(precision: Optional[str] = None) -> str:
+    """Index/search precision: the given one, else VECTOR_SEARCH_PRECISION (default 'vector')."""
+    precision = precision or getattr(settings, 'VECTOR_SEARCH_PRECISION', None) or 'vector'
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unknown vector precision '{precision}', expected one of {sorted(PRECISIONS)}")
+    return precision
+
+
+def get_dimensions(dimensions: Optional[int] = None) -> int:
+    """Embedding dimensions: the given value, else those of the configured embedding model."""
+    if dimensions:
+        return int(dimensions)
+    from ai_decisions.services.embedding_service import EmbeddingService
+    return EmbeddingService.get_dimensions()
+
+
+def index_name(method: str = 'hnsw', precision: str = 'vector') -> str:
+    """Name of the ANN index for a method and precision."""
+    if method not in INDEX_NAMES:
+        raise ValueError(f"Unknown vector index method '{method}', expected one of {sorted(INDEX_NAMES)}")
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unknown vector precision '{precision}', expected one of {sorted(PRECISIONS)}")
+    if precision == 'vector':
+        return INDEX_NAMES[method]
+    return INDEX_NAMES[method].replace('_idx', f'_{precision}_idx')
+
+
+def index_expression(precision: str, dimensions: int, column: str = COLUMN) -> str:
+    """Typed SQL expression indexed (and searched) for a precision."""
+    return PRECISIONS[precision][0].format(column=column, dimensions=int(dimensions))
+
+
+class VectorIndexManager:
+    """Create, drop and inspect the ANN index on document_chunks.embedding."""
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Whether the current database can hold pgvector indexes."""
+        return connection.vendor == 'postgresql'
+
+    @staticmethod
+    def default_ivfflat_lists(row_count: int) -> int:
+        """pgvector guidance: rows / 1000 up to 1M rows, sqrt(rows) above."""
+        if row_count <= 1_000_000:
+            return max(1, row_count // 1000)
+        return int(row_count ** 0.5)
+
+    @staticmethod
+    def build_create_sql(
+        method: str = 'hnsw',
+        m: int = DEFAULT_HNSW_M,
+        ef_construction: int = DEFAULT_HNSW_EF_CONSTRUCTION,
+        lists: Optional[int] = None,
+        concurrently: bool = False,
+        precision: str = 'vector',
+        dimensions: int = 1536
+    ) -> str:
+        """
+        Build the CREATE INDEX statement for an ANN index.
+
+        Args:
+            method: 'hnsw' or 'ivfflat'
+            m: HNSW max connections per layer
+            ef_construction: HNSW candidate list size while building
+            lists: IVFFlat list count (required for ivfflat)
+            concurrently: Build without blocking writes (cannot run inside a transaction)
+            precision: 'vector', 'halfvec' or 'binary'
+            dimensions: Embedding dimensions
+
+        Returns:
+            SQL statement
+        """
+        name = index_name(method, precision)
+
+        if method == 'hnsw':
+            with_clause = f"m = {int(m)}, ef_construction = {int(ef_construction)}"
+        else:
+            if not lists or int(lists) < 1:
+                raise ValueError("ivfflat index requires lists >= 1")
+            with_clause = f"lists = {int(lists)}"
+
+        return (
+            f"CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS {name} "
+            f"ON {TABLE} USING {method} (({index_expression(precision, dimensions)}) {PRECISIONS[precision][1]}) "
+            f"WITH ({with_clause})"
+        )
+
+    @staticmethod
+    def create_index(
+        method: str = 'hnsw',
+        m: int = DEFAULT_HNSW_M,
+        ef_construction: int = DEFAULT_HNSW_EF_CONSTRUCTION,
+        lists: Optional[int] = None,
+        concurrently: bool = False,
+        replace: bool = True,
+        precision: Optional[str] = None,
+        dimensions: Optional[int] = None
+    ) -> bool:
+        """
+        Create the ANN index, dropping any index of another type or precision first.
+
+        Args:
+            method: 'hnsw' or 'ivfflat'
+            m: HNSW max connections per layer
+            ef_construction: HNSW candidate list size while building
+            lists: IVFFlat list count (defaults to a value derived from the row count)
+            concurrently: Build without blocking writes
+            replace: Drop an existing index of the same type first (rebuild)
+            precision: 'vector', 'halfvec' or 'binary' (defaults to VECTOR_SEARCH_PRECISION)
+            dimensions: Embedding dimensions (defaults to the configured embedding model's)
+
+        Returns:
+            True if an index was created, False on unsupported backends
+        """
+        if not VectorIndexManager.is_supported():
+            logger.info("Skipping vector index creation: database is not PostgreSQL")
+            return False
+
+        precision = get_precision(precision)
+        dimensions = get_dimensions(dimensions)
+
+        if method == 'ivfflat' and not lists:
+            with connection.cursor() as cursor:
+                cursor.execute(f"SELECT count(*) FROM {TABLE} WHERE {COLUMN} IS NOT NULL")
+                lists = VectorIndexManager.default_ivfflat_lists(cursor.fetchone()[0])
+
+        sql = VectorIndexManager.build_create_sql(
+            method=method, m=m, ef_construction=ef_construction, lists=lists, concurrently=concurrently,
+            precision=precision, dimensions=dimensions
+        )
+        for other_method in INDEX_NAMES:
+            for other_precision in PRECISIONS:
+                if (other_method, other_precision) != (method, precision) or replace:
+                    VectorIndexManager.drop_index(other_method, concurrently=concurrently, precision=other_precision)
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql)
+        logger.info(f"Created {method} ({precision}) vector index on {TABLE}.{COLUMN}: {sql}")
+        return True
+
+    @staticmethod
+    def drop_index(method: str = 'hnsw', concurrently: bool = False, precision: str = 'vector') -> bool:
+        """
+        Drop the ANN index of the given type and precision if it exists.
+
+        Returns:
+            True if the statement ran, False on unsupported backends
+        """
+        if not VectorIndexManager.is_supported():
+            return False
+        name = index_name(method, precision)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DROP INDEX {'CONCURRENTLY ' if concurrently else ''}IF EXISTS {name}"
+            )
+        return True
+
+    @staticmethod
+    def get_indexes() -> List[Dict[str, Any]]:
+        """
+        List the indexes on document_chunks with their size.
+
+        Returns:
+            List of dicts with 'name', 'definition' and 'size_bytes'
+        """
+        if not VectorIndexManager.is_supported():
+            return []
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexname, indexdef, pg_relation_size(quote_ident(indexname)::regclass) "
+                "FROM pg_indexes WHERE tablename = %s ORDER BY indexname",
+                [TABLE]
+            )
+            return [
+                {'name': name, 'definition': definition, 'size_bytes': size}
+                for name, definition, size in cursor.fetchall()
+            ]
@@ -35,6 +35,24 @@ class BaseIngestionSystem(ABC):
         """
         pass
     
+    def fetch_content_if_modified(self, url: str, validators: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        Fetch content unless it is unchanged since the previous fetch.
+        
+        Systems whose source supports conditional requests override this; the default
+        always fetches.
+        
+        Args:
+            url: URL to fetch from
+            validators: Validators of the previous fetch ('etag', 'last_modified',
+                'public_updated_at'); None for a first fetch
+            
+        Returns:
+            Same as fetch_content, plus 'etag'/'last_modified' when known; unchanged
+            content is reported with 'not_modified': True and no content
+        """
+        return self.fetch_content(url)
+    
     @abstractmethod
     def extract_text(self, raw_content: str, content_type: str) -> str:
         """
@@ -1,8 +1,10 @@
 import json
 import logging
-import time
+from datetime import datetime, timezone
+from email.utils import format_datetime
 from typing import Dict, Optional, List
 from django.conf import settings
+from data_ingestion.helpers.crawler import HostRateLimiter, crawl
 from external_services.request import ExternalHTTPClient
 from .base_ingestion import BaseIngestionSystem
 
@@ -17,6 +19,10 @@ class UKIngestionSystem(BaseIngestionSystem):
     Efficiently fetches and stores all endpoint data including nested child taxons.
     """
 
+    MAX_TAXON_DEPTH = 15
+    SEARCH_PAGE_SIZE = 50
+    SEARCH_MAX_PAGES = 100  # Safety limit per taxon
+
     def __init__(self, data_source):
         super().__init__(data_source)
         # Use settings key or fallback to default
@@ -33,12 +39,16 @@ class UKIngestionSystem(BaseIngestionSystem):
             if getattr(settings, "APP_ENV", None) != "test":
                 logger.warning("UK_GOV_API_BASE_URL not set in settings, using default: https://www.gov.uk")
         
-        # Use external services HTTP client
-        self.client = ExternalHTTPClient(base_url=self.api_base, default_timeout=30)
+        # Use external services HTTP client; every attempt (retries included) shares the host's rate limit
+        self.client = ExternalHTTPClient(
+            base_url=self.api_base, default_timeout=30, rate_limiter=HostRateLimiter.acquire
+        )
         self.headers = {
             'User-Agent': 'ImmigrationIntelligenceBot/1.0',
             'Accept': 'application/json'
         }
+        # Taxon responses fetched during URL discovery, reused by fetch_content_if_modified
+        self._discovered_responses: Dict[str, Dict] = {}
 
     def fetch_content(self, url: str) -> Optional[Dict]:
         """
@@ -50,6 +60,49 @@ class UKIngestionSystem(BaseIngestionSystem):
         Returns:
             Dict with 'content', 'content_type', 'status_code', 'error'
         """
+        return self._get(url, self.headers)
+
+    def fetch_content_if_modified(self, url: str, validators: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        Conditional fetch from gov.uk API.
+        
+        Sends If-None-Match (ETag) and If-Modified-Since (Last-Modified, or the
+        Content API's public_updated_at when the server sent no Last-Modified), so an
+        unchanged page costs a 304 with no body. Taxons already fetched by
+        get_document_urls in this run are returned without another request.
+        
+        Args:
+            url: Full API URL or endpoint path
+            validators: Validators of the previous fetch (see BaseIngestionSystem)
+            
+        Returns:
+            Dict with 'content', 'content_type', 'status_code', 'error', 'etag',
+            'last_modified' (and 'not_modified' on 304)
+        """
+        discovered = self._discovered_responses.pop(url, None)
+        if discovered is not None:
+            return discovered
+        return self._get(url, {**self.headers, **self._conditional_headers(validators)})
+
+    @staticmethod
+    def _conditional_headers(validators: Optional[Dict]) -> Dict[str, str]:
+        validators = validators or {}
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+        elif validators.get('public_updated_at'):
+            try:
+                updated_at = datetime.fromisoformat(validators['public_updated_at'].replace('Z', '+00:00'))
+                if updated_at.tzinfo is None:
+                    updated_at = updated_at.replace(tzinfo=timezone.utc)
+                headers['If-Modified-Since'] = format_datetime(updated_at.astimezone(timezone.utc), usegmt=True)
+            except (TypeError, ValueError):
+                pass
+        return headers
+
+    def _get(self, url: str, headers: Dict[str, str]) -> Optional[Dict]:
         # Extract endpoint from full URL
         endpoint = url.replace(self.api_base, '') if url.startswith('http') else url
         
@@ -57,7 +110,7 @@ class UKIngestionSystem(BaseIngestionSystem):
             # Use external services client (returns detailed response)
             result = self.client.get(
                 endpoint=endpoint,
-                headers=self.headers,
+                headers=headers,
                 timeout=30,
                 return_details=True  # Get detailed response with status_code, error, etc.
             )
@@ -290,57 +343,17 @@ class UKIngestionSystem(BaseIngestionSystem):
         Returns:
             List of content page API URLs
         """
-        content_urls = []
-        page = 1
-        max_pages = 100  # Safety limit
-        
-        while page <= max_pages:
-            try:
-                # Search API endpoint
-                endpoint = f"/api/search.json?filter_taxons={taxon_content_id}&count=50&page={page}"
-                
-                result = self.client.get_with_details(
-                    endpoint=endpoint,
-                    headers=self.headers,
-                    timeout=30
-                )
-                
-                if not result or not result.get('content'):
-                    break
-                
-                data = json.loads(result['content'])
-                results = data.get('results', [])
-                
-                if not results:
-                    break
-                
-                # Extract content page URLs from search results
-                for item in results:
-                    base_path = item.get('base_path')
-                    if base_path:
-                        # Convert to Content API URL
-                        content_url = f"{self.api_base}/api/content{base_path}"
-                        content_urls.append(content_url)
-                
-                # Check if there are more pages
-                total_results = data.get('total', 0)
-                current_count = len(results)
-                
-                if page * 50 >= total_results or current_count < 50:
-                    break
-                
-                page += 1
-                time.sleep(1)  # Rate limiting for search API
-                
-            except json.JSONDecodeError as e:
-                if getattr(settings, "APP_ENV", None) != "test":
-                    logger.warning(f"Invalid JSON from search API for taxon {taxon_content_id}, page {page}: {e}")
-                break
-            except Exception as e:
-                if getattr(settings, "APP_ENV", None) != "test":
-                    logger.error(f"Error fetching search results for taxon {taxon_content_id}, page {page}: {e}")
-                break
+        content_urls: List[str] = []
+        errors = crawl(
+            seeds=[('search', taxon_content_id, 1)],
+            handler=lambda item: self._crawl_search_page(item[1], item[2], content_urls),
+            thread_name_prefix='uk-search'
+        )
+        for (_, _, page), error in errors:
+            if getattr(settings, "APP_ENV", None) != "test":
+                logger.error(f"Error fetching search results for taxon {taxon_content_id}, page {page}: {error}")
         
+        content_urls = list(dict.fromkeys(content_urls))
         if getattr(settings, "APP_ENV", None) != "test":
             logger.info(f"Found {len(content_urls)} content pages for taxon {taxon_content_id}")
         return content_urls
@@ -349,18 +362,15 @@ class UKIngestionSystem(BaseIngestionSystem):
         """
         Discover all URLs using both Content API (for taxons) and Search API (for content pages).
         
-        Process:
-        1. Use Content API to discover taxon hierarchy
-        2. For each taxon, use Search API to find actual content pages
-        3. Fetch all content pages
+        Taxons and search result pages share one crawl frontier worked by a bounded
+        thread pool (INGESTION_CRAWL_MAX_IN_FLIGHT): each taxon enqueues its child
+        taxons and the first search page for its content_id, and a first search page
+        enqueues the remaining pages. Requests are paced by the per-host rate limit
+        rather than fixed sleeps. Taxon responses are kept for fetch_content_if_modified.
         
         Returns:
             List of all URLs to fetch (taxons + content pages)
         """
-        urls = []
-        visited = set()
-        taxon_content_ids = []  # Store taxon IDs for Search API queries
-        
         # Use data_source.base_url or settings key, with fallback
         base_url = self.data_source.base_url
         if not base_url:
@@ -374,108 +384,36 @@ class UKIngestionSystem(BaseIngestionSystem):
                 if getattr(settings, "APP_ENV", None) != "test":
                     logger.warning(f"Using fallback base URL: {base_url}")
         
-        errors = []
-        
-        def fetch_taxons_recursive(url: str, depth: int = 0, max_depth: int = 15):
-            """
-            Recursively fetch taxon structure from Content API.
-            Collects taxon content_ids for later Search API queries.
-            """
-            # Safety checks
-            if depth > max_depth:
-                if getattr(settings, "APP_ENV", None) != "test":
-                    logger.warning(f"Max depth reached for {url}")
-                return
-            
-            if url in visited:
-                return
-            
-            visited.add(url)
-            urls.append(url)  # Add taxon URL to fetch list
-            
-            # Rate limiting: 2 seconds between requests
-            if len(urls) > 1:
-                time.sleep(2)
-            
-            # Fetch the taxon from Content API
-            response = self.fetch_content(url)
-            
-            if not response:
-                errors.append(f"Failed to fetch {url}: No response")
-                return
-            
-            if response.get('error'):
-                errors.append(f"Error fetching {url}: {response.get('error')}")
-                return
-            
-            if not response.get('content'):
-                if getattr(settings, "APP_ENV", None) != "test":
-                    logger.warning(f"No content returned for {url}")
-                return
-            
-            # Parse response and extract child taxon URLs
-            try:
-                data = json.loads(response['content'])
-                
-                # Extract content_id for Search API
-                content_id = data.get('content_id')
-                if content_id:
-                    taxon_content_ids.append(content_id)
-                
-                # Extract child taxon URLs
-                child_urls = self.parse_api_response(data)
-                
-                # Recursively process child taxons
-                for child_url in child_urls:
-                    if child_url not in visited:
-                        fetch_taxons_recursive(child_url, depth + 1, max_depth)
-                        
-            except json.JSONDecodeError as e:
-                if getattr(settings, "APP_ENV", None) != "test":
-                    logger.warning(f"Invalid JSON response from {url}: {e}")
-                errors.append(f"JSON decode error for {url}: {e}")
-            except KeyError as e:
-                if getattr(settings, "APP_ENV", None) != "test":
-                    logger.warning(f"Missing key in response from {url}: {e}")
-                errors.append(f"Key error for {url}: {e}")
-            except Exception as e:
-                if getattr(settings, "APP_ENV", None) != "test":
-                    logger.error(f"Unexpected error processing {url}: {e}")
-                errors.append(f"Unexpected error for {url}: {e}")
-        
-        # Step 1: Discover taxon hierarchy using Content API
-        if getattr(settings, "APP_ENV", None) != "test":
-            logger.info(f"Step 1: Discovering taxon hierarchy from {base_url}")
-        fetch_taxons_recursive(base_url)
+        taxon_urls: List[str] = []
+        content_urls: List[str] = []
+        errors: List[str] = []
         
-        if getattr(settings, "APP_ENV", None) != "test":
-            logger.info(
-                f"Taxon discovery complete: {len(urls)} taxons found, {len(taxon_content_ids)} taxon IDs collected"
-            )
+        def handle(item):
+            if item[0] == 'taxon':
+                return self._crawl_taxon(item[1], item[2], taxon_urls, errors)
+            return self._crawl_search_page(item[1], item[2], content_urls)
         
-        # Step 2: Use Search API to find actual content pages for each taxon
         if getattr(settings, "APP_ENV", None) != "test":
-            logger.info(f"Step 2: Discovering content pages using Search API for {len(taxon_content_ids)} taxons")
-        content_pages_found = 0
+            logger.info(f"Discovering taxon hierarchy and content pages from {base_url}")
+        failures = crawl(
+            seeds=[('taxon', base_url, 0)],
+            handler=handle,
+            # Taxons are deduplicated by URL, search pages by (taxon, page)
+            key=lambda item: item[:2] if item[0] == 'taxon' else item,
+            thread_name_prefix='uk-crawl'
+        )
+        for item, error in failures:
+            errors.append(f"Unexpected error for {item[0]} {item[1]}: {error}")
         
-        for taxon_id in taxon_content_ids:
-            try:
-                content_page_urls = self.get_content_pages_by_taxon(taxon_id)
-                for content_url in content_page_urls:
-                    if content_url not in visited:
-                        visited.add(content_url)
-                        urls.append(content_url)
-                        content_pages_found += 1
-            except Exception as e:
-                if getattr(settings, "APP_ENV", None) != "test":
-                    logger.error(f"Error fetching content pages for taxon {taxon_id}: {e}")
-                errors.append(f"Error fetching content for taxon {taxon_id}: {e}")
+        taxon_set = set(taxon_urls)
+        content_urls = [url for url in dict.fromkeys(content_urls) if url not in taxon_set]
+        urls = taxon_urls + content_urls
         
         # Log final results
         if getattr(settings, "APP_ENV", None) != "test":
             logger.info(
                 f"URL discovery complete: {len(urls)} total URLs found "
-                f"({len(taxon_content_ids)} taxons + {content_pages_found} content pages), "
+                f"({len(taxon_urls)} taxons + {len(content_urls)} content pages), "
                 f"{len(errors)} errors"
             )
         
@@ -484,3 +422,79 @@ class UKIngestionSystem(BaseIngestionSystem):
                 logger.warning(f"Errors during URL discovery: {errors[:5]}...")  # Log first 5 errors
         
         return urls
+
+    def _crawl_taxon(self, url: str, depth: int, taxon_urls: List[str], errors: List[str]) -> List[tuple]:
+        """
+        Fetch a taxon from Content API.
+        
+        Returns:
+            Frontier items: child taxons and the first search page for this taxon
+        """
+        if depth > self.MAX_TAXON_DEPTH:
+            if getattr(settings, "APP_ENV", None) != "test":
+                logger.warning(f"Max depth reached for {url}")
+            return []
+        taxon_urls.append(url)
+        
+        response = self.fetch_content(url)
+        if not response:
+            errors.append(f"Failed to fetch {url}: No response")
+            return []
+        if response.get('error'):
+            errors.append(f"Error fetching {url}: {response.get('error')}")
+            return []
+        if not response.get('content'):
+            if getattr(settings, "APP_ENV", None) != "test":
+                logger.warning(f"No content returned for {url}")
+            return []
+        self._discovered_responses[url] = response
+        
+        try:
+            data = json.loads(response['content'])
+        except json.JSONDecodeError as e:
+            if getattr(settings, "APP_ENV", None) != "test":
+                logger.warning(f"Invalid JSON response from {url}: {e}")
+            errors.append(f"JSON decode error for {url}: {e}")
+            return []
+        
+        items = [('taxon', child_url, depth + 1) for child_url in self.parse_api_response(data)]
+        # Extract content_id for Search API
+        if data.get('content_id'):
+            items.append(('search', data['content_id'], 1))
+        return items
+
+    def _crawl_search_page(self, taxon_content_id: str, page: int, content_urls: List[str]) -> List[tuple]:
+        """
+        Fetch one Search API page of content tagged to a taxon.
+        
+        Returns:
+            Frontier items: on page 1, the remaining pages (up to SEARCH_MAX_PAGES)
+        """
+        endpoint = (
+            f"/api/search.json?filter_taxons={taxon_content_id}&count={self.SEARCH_PAGE_SIZE}"
+            f"&start={(page - 1) * self.SEARCH_PAGE_SIZE}"
+        )
+        result = self._get(endpoint, self.headers)
+        if not result or not result.get('content'):
+            return []
+        
+        try:
+            data = json.loads(result['content'])
+        except json.JSONDecodeError as e:
+            if getattr(settings, "APP_ENV", None) != "test":
+                logger.warning(f"Invalid JSON from search API for taxon {taxon_content_id}, page {page}: {e}")
+            return []
+        
+        for item in data.get('results', []):
+            base_path = item.get('base_path')
+            if base_path:
+                # Convert to Content API URL
+                content_urls.append(f"{self.api_base}/api/content{base_path}")
+        
+        if page != 1:
+            return []
+        total_pages = -(-int(data.get('total', 0) or 0) // self.SEARCH_PAGE_SIZE)
+        return [
+            ('search', taxon_content_id, next_page)
+            for next_page in range(2, min(total_pages, self.SEARCH_MAX_PAGES) + 1)
+        ]
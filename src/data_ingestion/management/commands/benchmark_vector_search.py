@@ -0,0 +1,157 @@
+"""
+Management command to benchmark chunk retrieval offline with the NumPy vector backend.
+
+Usage:
+    python manage.py benchmark_vector_search --path /data/chunks --export
+    python manage.py benchmark_vector_search --path /data/chunks --sample 500 --limits 5,10 --thresholds 0.6,0.7
+    python manage.py benchmark_vector_search --path /data/chunks --ivf-lists 200 --probes 1,4,16,0
+    python manage.py benchmark_vector_search --path /data/chunks --queries labelled_queries.jsonl
+
+--export writes the embedded, non-deleted document_chunks to --path first (read-only
+on the database); later runs only read the export. Labelled query files hold one JSON
+object per line: {"text": ..., "relevant_chunk_ids": [...], "filters": {...}}; the texts
+are embedded with the configured embedding model. Without --queries, stored chunk
+embeddings are sampled as queries. Probes 0 means exact search.
+"""
+
+import json
+import logging
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from ai_decisions.helpers.retrieval_benchmark import BenchmarkQuery, run_retrieval_benchmark, sample_queries
+
+logger = logging.getLogger('django')
+
+
+def _int_list(value):
+    return [int(item) for item in value.split(',') if item.strip()]
+
+
+def _float_list(value):
+    return [float(item) for item in value.split(',') if item.strip()]
+
+
+class Command(BaseCommand):
+    help = 'Benchmark vector retrieval latency and recall against an exported copy of document chunks'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path',
+            type=str,
+            default=getattr(settings, 'VECTOR_SEARCH_NUMPY_PATH', None),
+            help='Export directory (default: VECTOR_SEARCH_NUMPY_PATH)',
+        )
+        parser.add_argument(
+            '--export',
+            action='store_true',
+            help='Export document chunks from the database to --path before benchmarking',
+        )
+        parser.add_argument(
+            '--queries',
+            type=str,
+            help='JSONL file of labelled queries (text, relevant_chunk_ids, filters)',
+        )
+        parser.add_argument(
+            '--sample',
+            type=int,
+            default=200,
+            help='Number of stored chunks to use as queries when --queries is not given (default: 200)',
+        )
+        parser.add_argument('--limits', type=_int_list, default=[5, 10], help='Comma-separated limits (default: 5,10)')
+        parser.add_argument(
+            '--thresholds',
+            type=_float_list,
+            default=[0.7],
+            help='Comma-separated similarity thresholds (default: 0.7)',
+        )
+        parser.add_argument(
+            '--ivf-lists',
+            type=int,
+            help='Build an IVF index with this many lists (default: exact search only)',
+        )
+        parser.add_argument(
+            '--probes',
+            type=_int_list,
+            help='Comma-separated IVF probes to compare (0 = exact; requires --ivf-lists)',
+        )
+        parser.add_argument('--seed', type=int, default=0, help='Random seed for sampling and IVF training')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        if not path:
+            raise CommandError('--path (or VECTOR_SEARCH_NUMPY_PATH) is required')
+
+        try:
+            from ai_decisions.services.vector_backends.numpy_backend import NumpyVectorBackend
+        except ImportError as e:
+            raise CommandError(f'The NumPy vector backend requires numpy: {e}')
+
+        if options['export']:
+            try:
+                count = NumpyVectorBackend.export_document_chunks(path)
+            except ValueError as e:
+                raise CommandError(str(e))
+            self.stdout.write(self.style.SUCCESS(f'Exported {count} chunks to {path}'))
+
+        try:
+            backend = NumpyVectorBackend.load(path)
+        except FileNotFoundError:
+            raise CommandError(f'No chunk export at {path}; run with --export first')
+
+        if options.get('ivf_lists'):
+            backend.build_ivf(n_lists=options['ivf_lists'], seed=options['seed'])
+        probes = options.get('probes') or [0]
+
+        if options.get('queries'):
+            queries = self._load_queries(options['queries'])
+        else:
+            queries = sample_queries(backend, options['sample'], seed=options['seed'])
+        if not queries:
+            raise CommandError('No benchmark queries')
+
+        self.stdout.write(
+            f'{len(queries)} queries over {len(backend)} chunks ({backend.dimensions} dims)'
+        )
+        self.stdout.write(
+            f"{'limit':>5} {'threshold':>9} {'probes':>6} {'p50 ms':>8} {'p95 ms':>8} "
+            f"{'results':>7} {'recall@exact':>12} {'recall@rel':>10} {'mrr':>6}"
+        )
+        for row in run_retrieval_benchmark(
+            backend, queries, limits=options['limits'], thresholds=options['thresholds'], probes=probes
+        ):
+            self.stdout.write(
+                f"{row['limit']:>5} {row['similarity_threshold']:>9.2f} {row['n_probes']:>6} "
+                f"{row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f} {row['mean_results']:>7.2f} "
+                f"{self._fmt(row['recall_vs_exact']):>12} {self._fmt(row['relevant_recall']):>10} "
+                f"{self._fmt(row['mrr']):>6}"
+            )
+
+    @staticmethod
+    def _fmt(value):
+        return '-' if value is None else f'{value:.3f}'
+
+    @staticmethod
+    def _load_queries(path):
+        from ai_decisions.services.embedding_service import EmbeddingService
+
+        entries = []
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    entries.append(json.loads(line))
+        if not entries:
+            return []
+
+        embeddings = EmbeddingService.generate_embeddings([entry['text'] for entry in entries])
+        if len(embeddings) != len(entries):
+            raise CommandError(f'Embedded {len(embeddings)} of {len(entries)} queries')
+        return [
+            BenchmarkQuery(
+                embedding=embedding,
+                relevant_ids={str(chunk_id) for chunk_id in entry.get('relevant_chunk_ids', [])},
+                filters=entry.get('filters'),
+            )
+            for entry, embedding in zip(entries, embeddings)
+        ]
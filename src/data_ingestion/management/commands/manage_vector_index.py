@@ -0,0 +1,122 @@
+"""
+Management command to build or inspect the ANN index on document_chunks.embedding.
+
+Usage:
+    python manage.py manage_vector_index --status
+    python manage.py manage_vector_index --method hnsw --m 16 --ef-construction 64
+    python manage.py manage_vector_index --method ivfflat --lists 500 --concurrently
+    python manage.py manage_vector_index --precision binary --concurrently
+    python manage.py manage_vector_index --drop --method ivfflat
+
+--concurrently builds without blocking chunk writes (recommended on a live database).
+IVFFlat lists are trained on the rows present at build time; rebuild after large ingestions.
+--precision must match VECTOR_SEARCH_PRECISION (used by default), and --dimensions the
+embedding model's dimensions (used by default), or searches will not use the index.
+"""
+
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+
+from data_ingestion.helpers.vector_index import (
+    DEFAULT_HNSW_EF_CONSTRUCTION,
+    DEFAULT_HNSW_M,
+    INDEX_NAMES,
+    PRECISIONS,
+    VectorIndexManager,
+    get_dimensions,
+    get_precision,
+    index_name,
+)
+
+logger = logging.getLogger('django')
+
+
+class Command(BaseCommand):
+    help = 'Build, drop or inspect the ANN (HNSW/IVFFlat) index on document chunk embeddings'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--method',
+            type=str,
+            default='hnsw',
+            choices=sorted(INDEX_NAMES),
+            help='Index type (default: hnsw)',
+        )
+        parser.add_argument(
+            '--m',
+            type=int,
+            default=DEFAULT_HNSW_M,
+            help=f'HNSW max connections per layer (default: {DEFAULT_HNSW_M})',
+        )
+        parser.add_argument(
+            '--ef-construction',
+            type=int,
+            default=DEFAULT_HNSW_EF_CONSTRUCTION,
+            help=f'HNSW build candidate list size (default: {DEFAULT_HNSW_EF_CONSTRUCTION})',
+        )
+        parser.add_argument(
+            '--lists',
+            type=int,
+            help='IVFFlat list count (default: derived from the number of embedded chunks)',
+        )
+        parser.add_argument(
+            '--precision',
+            type=str,
+            choices=sorted(PRECISIONS),
+            help='Indexed representation: vector, halfvec or binary (default: VECTOR_SEARCH_PRECISION)',
+        )
+        parser.add_argument(
+            '--dimensions',
+            type=int,
+            help='Embedding dimensions (default: those of the configured embedding model)',
+        )
+        parser.add_argument(
+            '--concurrently',
+            action='store_true',
+            help='Build/drop without blocking writes',
+        )
+        parser.add_argument(
+            '--drop',
+            action='store_true',
+            help='Drop the index of the given type instead of building it',
+        )
+        parser.add_argument(
+            '--status',
+            action='store_true',
+            help='List the indexes on document_chunks and exit',
+        )
+
+    def handle(self, *args, **options):
+        if not VectorIndexManager.is_supported():
+            raise CommandError('Vector indexes require PostgreSQL with the pgvector extension')
+
+        if options['status']:
+            for index in VectorIndexManager.get_indexes():
+                self.stdout.write(f"{index['name']} ({index['size_bytes']} bytes): {index['definition']}")
+            return
+
+        method = options['method']
+        try:
+            precision = get_precision(options.get('precision'))
+            if options['drop']:
+                VectorIndexManager.drop_index(method, concurrently=options['concurrently'], precision=precision)
+                self.stdout.write(self.style.SUCCESS(f'Dropped {method} ({precision}) vector index'))
+                return
+
+            VectorIndexManager.create_index(
+                method=method,
+                m=options['m'],
+                ef_construction=options['ef_construction'],
+                lists=options.get('lists'),
+                concurrently=options['concurrently'],
+                precision=precision,
+                dimensions=get_dimensions(options.get('dimensions')),
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+        except Exception as e:
+            logger.error(f"Error managing {method} vector index: {e}", exc_info=True)
+            raise CommandError(f'Failed to manage {method} vector index: {e}')
+
+        self.stdout.write(self.style.SUCCESS(f'Built {method} vector index {index_name(method, precision)}'))
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-16 21:30
+
+import django.db.models.fields.json
+from django.db import migrations, models
+
+
+def create_hnsw_index(apps, schema_editor):
+    """
+    Create the HNSW index on document_chunks.embedding (cosine distance).
+
+    SQLite (used in many test environments) has no pgvector; this is a no-op there.
+    Use `manage.py manage_vector_index` to rebuild with other parameters or as IVFFlat.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS document_chunks_embedding_hnsw_idx "
+        "ON document_chunks USING hnsw (embedding vector_cosine_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+
+
+def drop_hnsw_index(apps, schema_editor):
+    """Reverse of create_hnsw_index (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS document_chunks_embedding_hnsw_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("data_ingestion", "0004_data_ingestion_soft_delete_and_optimistic_locking"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="documentchunk",
+            index=models.Index(
+                django.db.models.fields.json.KeyTransform("jurisdiction", "metadata"),
+                django.db.models.fields.json.KeyTransform("visa_code", "metadata"),
+                condition=models.Q(("embedding__isnull", False)),
+                name="doc_chunks_jur_visa_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="documentchunk",
+            index=models.Index(
+                django.db.models.fields.json.KeyTransform("visa_code", "metadata"),
+                condition=models.Q(("embedding__isnull", False)),
+                name="doc_chunks_visa_idx",
+            ),
+        ),
+        migrations.RunPython(create_hnsw_index, reverse_code=drop_hnsw_index),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:10
+
+from django.db import migrations
+
+
+def create_search_vector(apps, schema_editor):
+    """
+    Add the full-text column used by PgVectorService.search_hybrid.
+
+    `search_vector` is a stored generated tsvector over chunk_text, so every insert or
+    update keeps it current without application code. It is indexed with GIN.
+    SQLite (used in many test environments) has no tsvector; this is a no-op there.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "ALTER TABLE document_chunks ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('english', coalesce(chunk_text, ''))) STORED"
+    )
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS document_chunks_search_vector_gin_idx "
+        "ON document_chunks USING gin (search_vector)"
+    )
+
+
+def drop_search_vector(apps, schema_editor):
+    """Reverse of create_search_vector (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS document_chunks_search_vector_gin_idx")
+    schema_editor.execute("ALTER TABLE document_chunks DROP COLUMN IF EXISTS search_vector")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("data_ingestion", "0005_document_chunk_ann_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_vector, reverse_code=drop_search_vector),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:20
+
+import pgvector.django.vector
+from django.db import migrations
+
+# Dimensions of the embeddings stored so far (OpenAI text-embedding-ada-002)
+EXISTING_DIMENSIONS = 1536
+
+
+def drop_column_ann_indexes(apps, schema_editor):
+    """
+    Drop ANN indexes built on the typed column (migration 0005 / manage_vector_index).
+
+    They would block removing the fixed dimension from the column. No-op on SQLite.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS document_chunks_embedding_hnsw_idx")
+    schema_editor.execute("DROP INDEX IF EXISTS document_chunks_embedding_ivfflat_idx")
+
+
+def create_expression_hnsw_index(apps, schema_editor):
+    """
+    Rebuild the HNSW index on the typed expression PgVectorService searches with.
+
+    Use `manage.py manage_vector_index` to rebuild for other dimensions or precisions.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS document_chunks_embedding_hnsw_idx "
+        f"ON document_chunks USING hnsw ((embedding::vector({EXISTING_DIMENSIONS})) vector_cosine_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+
+
+def create_column_hnsw_index(apps, schema_editor):
+    """Reverse of drop_column_ann_indexes: the HNSW index of migration 0005."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS document_chunks_embedding_hnsw_idx "
+        "ON document_chunks USING hnsw (embedding vector_cosine_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("data_ingestion", "0006_document_chunk_search_vector"),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_column_ann_indexes, reverse_code=create_column_hnsw_index),
+        migrations.AlterField(
+            model_name="documentchunk",
+            name="embedding",
+            field=pgvector.django.vector.VectorField(
+                blank=True, help_text="Vector embedding for semantic search", null=True
+            ),
+        ),
+        migrations.RunPython(create_expression_hnsw_index, reverse_code=drop_column_ann_indexes),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("data_ingestion", "0007_document_chunk_embedding_any_dimensions"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sourcedocument",
+            name="etag",
+            field=models.CharField(
+                blank=True,
+                help_text="ETag of the last successful fetch (sent as If-None-Match)",
+                max_length=255,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="sourcedocument",
+            name="last_checked_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="When the URL was last checked for changes (fetched_at is when the content was stored)",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="sourcedocument",
+            name="last_modified",
+            field=models.CharField(
+                blank=True,
+                help_text="Last-Modified header of the last successful fetch (sent as If-Modified-Since)",
+                max_length=100,
+                null=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="sourcedocument",
+            index=models.Index(
+                fields=["data_source", "source_url"],
+                name="source_docu_data_so_8b068b_idx",
+            ),
+        ),
+    ]
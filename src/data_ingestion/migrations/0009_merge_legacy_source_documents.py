@@ -0,0 +1,64 @@
+# Generated by Django 5.2.18 on 2026-10-17 09:12
+
+from django.db import migrations
+from django.db.models import Count
+from django.utils import timezone
+
+
+def merge_legacy_source_documents(apps, schema_editor):
+    # Before 0008 every fetch created a SourceDocument, and versions stayed on the one
+    # that first stored their content. Ingestion now keeps one document per
+    # (data source, URL), so merge each URL's documents into the one owning its latest
+    # version (diffs and embedding reuse look for previous versions there).
+    SourceDocument = apps.get_model("data_ingestion", "SourceDocument")
+    DocumentVersion = apps.get_model("data_ingestion", "DocumentVersion")
+    now = timezone.now()
+
+    duplicated = (
+        SourceDocument.objects.filter(is_deleted=False)
+        .values("data_source_id", "source_url")
+        .annotate(documents=Count("id"))
+        .filter(documents__gt=1)
+    )
+    for group in duplicated.iterator():
+        documents = list(
+            SourceDocument.objects.filter(
+                data_source_id=group["data_source_id"],
+                source_url=group["source_url"],
+                is_deleted=False,
+            ).order_by("-fetched_at")
+        )
+        newest = documents[0]
+        latest_version = (
+            DocumentVersion.objects.filter(source_document__in=documents, is_deleted=False)
+            .order_by("-extracted_at")
+            .first()
+        )
+        keeper_id = latest_version.source_document_id if latest_version else newest.id
+        others = [document.id for document in documents if document.id != keeper_id]
+
+        DocumentVersion.objects.filter(source_document_id__in=others).update(source_document_id=keeper_id)
+        if newest.id != keeper_id:
+            # The kept document holds the URL's most recent fetch
+            SourceDocument.objects.filter(id=keeper_id).update(
+                raw_content=newest.raw_content,
+                content_type=newest.content_type,
+                http_status_code=newest.http_status_code,
+                fetch_error=newest.fetch_error,
+                fetched_at=newest.fetched_at,
+                etag=newest.etag,
+                last_modified=newest.last_modified,
+                last_checked_at=newest.last_checked_at,
+            )
+        SourceDocument.objects.filter(id__in=others).update(is_deleted=True, deleted_at=now)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("data_ingestion", "0008_source_document_conditional_fetch"),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_legacy_source_documents, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,6 @@
 import uuid
 from django.db import models
+from django.db.models.fields.json import KeyTransform
 from pgvector.django import VectorField
 from .document_version import DocumentVersion
 
@@ -30,9 +31,10 @@ class DocumentChunk(models.Model):
         help_text="Index of this chunk within the document (0-based)"
     )
     
-    # Vector embedding (1536 dimensions for OpenAI ada-002)
+    # Vector embedding; dimensions depend on the embedding model (1536 for OpenAI ada-002,
+    # see EmbeddingService.get_dimensions), so the column is untyped and the ANN index is
+    # built on a typed expression (data_ingestion.helpers.vector_index)
     embedding = VectorField(
-        dimensions=1536,  # OpenAI text-embedding-ada-002 dimension
         null=True,
         blank=True,
         help_text="Vector embedding for semantic search"
@@ -60,10 +62,24 @@ class DocumentChunk(models.Model):
         ordering = ['document_version', 'chunk_index']
         indexes = [
             models.Index(fields=['document_version', 'chunk_index']),
+            # Hot metadata filters of PgVectorService.search_similar
+            models.Index(
+                KeyTransform('jurisdiction', 'metadata'),
+                KeyTransform('visa_code', 'metadata'),
+                name='doc_chunks_jur_visa_idx',
+                condition=models.Q(embedding__isnull=False),
+            ),
+            models.Index(
+                KeyTransform('visa_code', 'metadata'),
+                name='doc_chunks_visa_idx',
+                condition=models.Q(embedding__isnull=False),
+            ),
         ]
         verbose_name_plural = 'Document Chunks'
-        # Note: HNSW index for embedding will be created in a separate migration
-        # CREATE INDEX document_chunks_embedding_idx ON document_chunks USING hnsw (embedding vector_cosine_ops);
+        # The ANN (HNSW/IVFFlat) index on embedding is PostgreSQL-only and is managed by
+        # data_ingestion.helpers.vector_index (migration 0005, `manage_vector_index` command).
+        # So is the generated `search_vector` tsvector column (GIN-indexed, migration 0006)
+        # used by PgVectorService.search_hybrid; it is not a model field.
 
     def __str__(self):
         return f"Chunk {self.chunk_index} of {self.document_version.id}"
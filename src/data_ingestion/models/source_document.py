@@ -5,8 +5,9 @@ from .data_source import DataSource
 
 class SourceDocument(models.Model):
     """
-    Raw fetched content from a data source (immutable).
-    Represents a single fetch operation from a source.
+    Raw fetched content of a URL from a data source.
+    One document per (data source, URL): re-fetches reuse it, replacing the raw
+    content only when the extracted text changed (each change is a DocumentVersion).
     """
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False, db_index=True)
     
@@ -51,6 +52,26 @@ class SourceDocument(models.Model):
         blank=True,
         help_text="Error message if fetch failed"
     )
+    
+    etag = models.CharField(
+        max_length=255,
+        null=True,
+        blank=True,
+        help_text="ETag of the last successful fetch (sent as If-None-Match)"
+    )
+    
+    last_modified = models.CharField(
+        max_length=100,
+        null=True,
+        blank=True,
+        help_text="Last-Modified header of the last successful fetch (sent as If-Modified-Since)"
+    )
+    
+    last_checked_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the URL was last checked for changes (fetched_at is when the content was stored)"
+    )
 
     # Optimistic locking
     version = models.IntegerField(default=1, db_index=True, help_text="Version number for optimistic locking")
@@ -65,6 +86,7 @@ class SourceDocument(models.Model):
         indexes = [
             models.Index(fields=['data_source', '-fetched_at']),
             models.Index(fields=['source_url']),
+            models.Index(fields=['data_source', 'source_url']),
         ]
         verbose_name_plural = 'Source Documents'
 
@@ -58,10 +58,12 @@ class DocumentChunkRepository:
         
         Args:
             chunk: DocumentChunk instance
-            embedding: Embedding vector (1536 dimensions)
+            embedding: Embedding vector (EmbeddingService.get_dimensions() dimensions)
         """
-        if len(embedding) != 1536:
-            raise ValueError(f"Embedding must have 1536 dimensions, got {len(embedding)}")
+        from ai_decisions.services.embedding_service import EmbeddingService
+        dimensions = EmbeddingService.get_dimensions()
+        if len(embedding) != dimensions:
+            raise ValueError(f"Embedding must have {dimensions} dimensions, got {len(embedding)}")
 
         with transaction.atomic():
             expected_version = version if version is not None else getattr(chunk, "version", None)
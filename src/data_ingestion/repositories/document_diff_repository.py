@@ -1,3 +1,5 @@
+import io
+from typing import Callable, Iterable, Union
 from django.db import transaction, IntegrityError
 from django.db.models import F
 from django.utils import timezone
@@ -11,8 +13,15 @@ class DocumentDiffRepository:
 
     @staticmethod
     def create_document_diff(old_version: DocumentVersion, new_version: DocumentVersion,
-                            diff_text: str, change_type: str = 'minor_text'):
-        """Create a new document diff."""
+                            diff_text: Union[str, Iterable[str]],
+                            change_type: Union[str, Callable[[], str]] = 'minor_text'):
+        """
+        Create a new document diff.
+
+        diff_text may be an iterable of diff pieces (e.g. a streamed unified diff) and
+        change_type a callable evaluated once they are consumed (e.g. a classifier
+        fed by that stream). Neither is consumed when the diff already exists.
+        """
         with transaction.atomic():
             # Check if diff already exists
             existing = DocumentDiff.objects.filter(
@@ -22,6 +31,14 @@ class DocumentDiffRepository:
             if existing:
                 return existing
 
+            if not isinstance(diff_text, str):
+                buffer = io.StringIO()
+                for piece in diff_text:
+                    buffer.write(piece)
+                diff_text = buffer.getvalue()
+            if callable(change_type):
+                change_type = change_type()
+
             try:
                 diff = DocumentDiff.objects.create(
                     old_version=old_version,
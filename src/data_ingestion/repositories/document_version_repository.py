@@ -38,6 +38,21 @@ class DocumentVersionRepository:
                 # Concurrency-safe: another worker may have created this content_hash concurrently.
                 return DocumentVersion.objects.filter(content_hash=content_hash).first()
 
+    @staticmethod
+    def mark_latest(document_version: DocumentVersion) -> DocumentVersion:
+        """
+        Make an existing version its source document's latest again (content reverted to it).
+
+        Versions are unique by content hash, so a revert re-dates the stored version
+        instead of storing a copy.
+        """
+        with transaction.atomic():
+            DocumentVersion.objects.filter(id=document_version.id).update(
+                extracted_at=timezone.now(),
+                version=F("version") + 1,
+            )
+            return DocumentVersion.objects.get(id=document_version.id)
+
     @staticmethod
     def soft_delete_document_version(document_version: DocumentVersion, version: int = None) -> DocumentVersion:
         """Soft delete a document version with optimistic locking."""
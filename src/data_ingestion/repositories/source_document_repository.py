@@ -12,7 +12,7 @@ class SourceDocumentRepository:
     @staticmethod
     def create_source_document(data_source: DataSource, source_url: str, raw_content: str,
                                content_type: str = 'text/html', http_status_code: int = None,
-                               fetch_error: str = None):
+                               fetch_error: str = None, etag: str = None, last_modified: str = None):
         """Create a new source document."""
         with transaction.atomic():
             source_doc = SourceDocument.objects.create(
@@ -22,6 +22,9 @@ class SourceDocumentRepository:
                 content_type=content_type,
                 http_status_code=http_status_code,
                 fetch_error=fetch_error,
+                etag=etag,
+                last_modified=last_modified,
+                last_checked_at=timezone.now(),
                 version=1,
                 is_deleted=False,
             )
@@ -29,6 +32,59 @@ class SourceDocumentRepository:
             source_doc.save()
             return source_doc
 
+    @staticmethod
+    def store_content(source_document: SourceDocument, raw_content: str, content_type: str = None,
+                      http_status_code: int = None):
+        """
+        Store freshly fetched content of a source document's URL.
+
+        Validators are left alone: they are recorded (record_fetch) once the content
+        has been processed, so a fetch whose processing fails is not skipped as
+        Not Modified next time.
+        """
+        fields = {
+            'raw_content': raw_content,
+            'content_type': content_type or source_document.content_type,
+            'fetched_at': timezone.now(),
+            'fetch_error': None,
+            'version': F('version') + 1,
+        }
+        if http_status_code is not None:
+            fields['http_status_code'] = http_status_code
+        with transaction.atomic():
+            SourceDocument.objects.filter(id=source_document.id).update(**fields)
+            return SourceDocument.objects.get(id=source_document.id)
+
+    @staticmethod
+    def record_fetch(source_document: SourceDocument, http_status_code: int = None, etag: str = None,
+                     last_modified: str = None, raw_content: str = None, content_type: str = None,
+                     not_modified: bool = False):
+        """
+        Record a re-fetch of a source document's URL.
+
+        Always updates last_checked_at. A full response replaces both validators (one it
+        no longer sends is cleared); a 304 (not_modified) only updates those it sends.
+        Replaces the raw content (and fetched_at) only when raw_content is given, i.e.
+        the content changed.
+        """
+        now = timezone.now()
+        fields = {'last_checked_at': now, 'fetch_error': None, 'version': F('version') + 1}
+        if http_status_code is not None:
+            fields['http_status_code'] = http_status_code
+        if etag or not not_modified:
+            fields['etag'] = etag or None
+        if last_modified or not not_modified:
+            fields['last_modified'] = last_modified or None
+        if raw_content is not None:
+            fields.update(
+                raw_content=raw_content,
+                content_type=content_type or source_document.content_type,
+                fetched_at=now,
+            )
+        with transaction.atomic():
+            SourceDocument.objects.filter(id=source_document.id).update(**fields)
+            return SourceDocument.objects.get(id=source_document.id)
+
     @staticmethod
     def soft_delete_source_document(source_document: SourceDocument, version: int = None) -> SourceDocument:
         """Soft delete a source document with optimistic locking."""
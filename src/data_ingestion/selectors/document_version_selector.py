@@ -30,6 +30,16 @@ class DocumentVersionSelector:
             'source_document', 'source_document__data_source'
         ).filter(source_document=source_document, is_deleted=False).order_by('-extracted_at').first()
 
+    @staticmethod
+    def get_previous_with_chunks(document_version):
+        """Get the latest earlier version of the same source document that has embedded chunks."""
+        return DocumentVersion.objects.filter(
+            source_document_id=document_version.source_document_id,
+            extracted_at__lt=document_version.extracted_at,
+            is_deleted=False,
+            chunks__embedding__isnull=False,
+        ).exclude(id=document_version.id).order_by('-extracted_at').distinct().first()
+
     @staticmethod
     def get_by_id(version_id):
         """Get document version by ID."""
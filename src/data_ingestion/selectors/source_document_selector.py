@@ -25,6 +25,15 @@ class SourceDocumentSelector:
             is_deleted=False,
         ).order_by('-fetched_at').first()
 
+    @staticmethod
+    def get_by_data_source_and_url(data_source, source_url: str):
+        """Get the source document holding a URL of a data source."""
+        return SourceDocument.objects.select_related('data_source').filter(
+            data_source=data_source,
+            source_url=source_url,
+            is_deleted=False,
+        ).order_by('-fetched_at').first()
+
     @staticmethod
     def get_latest_by_data_source(data_source):
         """Get latest source document for a data source."""
@@ -40,6 +40,7 @@ class BulkDocumentChunkOperationSerializer(serializers.Serializer):
     ])
     model = serializers.CharField(
         required=False,
-        default='text-embedding-ada-002',
-        help_text="Embedding model to use for re_embed operation (default: text-embedding-ada-002)"
+        allow_null=True,
+        default=None,
+        help_text="Embedding model to use for re_embed operation (default: EMBEDDING_MODEL setting)"
     )
\ No newline at end of file
@@ -91,13 +91,13 @@ class DocumentChunkService:
     
     @staticmethod
     @invalidate_cache(namespace, predicate=bool)
-    def regenerate_embedding(chunk_id: str, model: str = "text-embedding-ada-002") -> bool:
+    def regenerate_embedding(chunk_id: str, model: Optional[str] = None) -> bool:
         """
         Regenerate embedding for a document chunk.
         
         Args:
             chunk_id: Document chunk ID
-            model: Embedding model to use (default: text-embedding-ada-002)
+            model: Embedding model to use (default: EMBEDDING_MODEL)
             
         Returns:
             True if successful, False otherwise
@@ -111,16 +111,19 @@ class DocumentChunkService:
             # Import embedding service
             from ai_decisions.services.embedding_service import EmbeddingService
             
-            # Generate new embedding
-            embedding = EmbeddingService.generate_embedding(chunk.chunk_text, model=model)
-            if not embedding or len(embedding) != 1536:
+            # Generate new embedding (bypass the embedding cache so a bad vector is replaced)
+            embedding = EmbeddingService.generate_embedding(chunk.chunk_text, model=model, use_cache=False)
+            if not EmbeddingService.validate_embedding(embedding, model=model):
                 logger.error(f"Failed to generate valid embedding for chunk {chunk_id}")
                 return False
             
             # Update chunk with new embedding
             DocumentChunkRepository.update_embedding(chunk, embedding, version=getattr(chunk, "version", None))
             
-            logger.info(f"Successfully regenerated embedding for chunk {chunk_id} using model {model}")
+            logger.info(
+                f"Successfully regenerated embedding for chunk {chunk_id} "
+                f"using model {EmbeddingService.get_model(model)}"
+            )
             return True
             
         except Exception as e:
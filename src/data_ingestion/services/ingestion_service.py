@@ -1,6 +1,9 @@
-import difflib
 import logging
-from typing import Dict
+from concurrent.futures import as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
+from django.conf import settings
+from data_ingestion.helpers.change_classifier import ChangeClassifier
+from data_ingestion.helpers.text_diff import unified_diff
 from data_ingestion.models.data_source import DataSource
 from data_ingestion.ingestion.factory import IngestionSystemFactory
 from data_ingestion.repositories.data_source_repository import DataSourceRepository
@@ -8,7 +11,9 @@ from data_ingestion.repositories.source_document_repository import SourceDocumen
 from data_ingestion.repositories.document_version_repository import DocumentVersionRepository
 from data_ingestion.repositories.document_diff_repository import DocumentDiffRepository
 from data_ingestion.selectors.data_source_selector import DataSourceSelector
+from data_ingestion.selectors.source_document_selector import SourceDocumentSelector
 from data_ingestion.selectors.document_version_selector import DocumentVersionSelector
+from main_system.utils.thread_pool import DBThreadPoolExecutor
 
 logger = logging.getLogger('django')
 
@@ -49,10 +54,24 @@ class IngestionService:
             # Get document URLs to fetch
             urls = ingestion_system.get_document_urls()
             
+            if getattr(settings, 'INGESTION_PIPELINE_ENABLED', False):
+                # Hand the URLs to the queued pipeline (fetch → normalize → diff/embed/parse)
+                from data_ingestion.tasks.pipeline_tasks import enqueue_urls
+                urls_queued = enqueue_urls(str(data_source_id), urls)
+                DataSourceRepository.update_last_fetched(data_source)
+                return {
+                    'success': True,
+                    'data_source_id': str(data_source_id),
+                    'pipeline': True,
+                    'urls_queued': urls_queued
+                }
+            
             results = {
                 'success': True,
                 'data_source_id': str(data_source_id),
                 'urls_processed': 0,
+                'not_modified': 0,
+                'unchanged': 0,
                 'new_versions': 0,
                 'diffs_created': 0,
                 'rules_parsed': 0,
@@ -60,24 +79,26 @@ class IngestionService:
                 'errors': []
             }
             
-            # Process each URL
-            for url in urls:
-                try:
-                    result = IngestionService._process_url(
-                        data_source, ingestion_system, url
-                    )
-                    results['urls_processed'] += 1
-                    if result.get('new_version'):
-                        results['new_versions'] += 1
-                    if result.get('diff_created'):
-                        results['diffs_created'] += 1
-                    if result.get('rules_parsed'):
-                        results['rules_parsed'] += result.get('rules_parsed', 0)
-                    if result.get('validation_tasks_created'):
-                        results['validation_tasks_created'] += result.get('validation_tasks_created', 0)
-                except Exception as e:
-                    logger.error(f"Error processing URL {url}: {e}")
-                    results['errors'].append({'url': url, 'error': str(e)})
+            # Process each URL (concurrently when INGESTION_PROCESS_MAX_WORKERS > 1;
+            # fetches are paced by the per-host crawl rate limit either way)
+            for url, result, error in IngestionService._process_urls(data_source, ingestion_system, urls):
+                if error is not None:
+                    logger.error(f"Error processing URL {url}: {error}")
+                    results['errors'].append({'url': url, 'error': str(error)})
+                    continue
+                results['urls_processed'] += 1
+                if result.get('not_modified'):
+                    results['not_modified'] += 1
+                if result.get('unchanged'):
+                    results['unchanged'] += 1
+                if result.get('new_version'):
+                    results['new_versions'] += 1
+                if result.get('diff_created'):
+                    results['diffs_created'] += 1
+                if result.get('rules_parsed'):
+                    results['rules_parsed'] += result.get('rules_parsed', 0)
+                if result.get('validation_tasks_created'):
+                    results['validation_tasks_created'] += result.get('validation_tasks_created', 0)
             
             # Update last_fetched_at
             DataSourceRepository.update_last_fetched(data_source)
@@ -88,11 +109,55 @@ class IngestionService:
             logger.error(f"Error ingesting data source {data_source_id}: {e}")
             return {'success': False, 'message': str(e)}
 
+    @staticmethod
+    def _process_urls(data_source: DataSource, ingestion_system, urls: List[str]) -> Iterator[Tuple[str, Optional[Dict], Optional[Exception]]]:
+        """
+        Run _process_url for each URL, on a thread pool when configured.
+        
+        Args:
+            data_source: DataSource instance
+            ingestion_system: Ingestion system instance
+            urls: URLs to process
+            
+        Yields:
+            (url, result, None) on success or (url, None, exception) on failure,
+            in completion order
+        """
+        max_workers = getattr(settings, 'INGESTION_PROCESS_MAX_WORKERS', 1)
+        if max_workers <= 1 or len(urls) <= 1:
+            for url in urls:
+                try:
+                    yield url, IngestionService._process_url(data_source, ingestion_system, url), None
+                except Exception as e:
+                    yield url, None, e
+            return
+        
+        with DBThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='ingestion') as executor:
+            future_to_url = {
+                executor.submit(IngestionService._process_url, data_source, ingestion_system, url): url
+                for url in urls
+            }
+            for future in as_completed(future_to_url):
+                url = future_to_url[future]
+                try:
+                    yield url, future.result(), None
+                except Exception as e:
+                    yield url, None, e
+
     @staticmethod
     def _process_url(data_source: DataSource, ingestion_system, url: str) -> Dict:
         """
         Process a single URL: fetch, extract, hash, compare, create version/diff.
         
+        Each URL has one SourceDocument and its DocumentVersion history. The fetch is
+        conditional on the validators of the previous fetch (ETag, Last-Modified,
+        public_updated_at), so an unchanged page is a 304 and nothing is stored. When
+        the page is fetched but its extracted text hashes to an existing version, only
+        the fetched content and validators are recorded.
+        
+        The steps are the stages of the queued pipeline (see
+        data_ingestion.tasks.pipeline_tasks), run inline here.
+        
         Args:
             data_source: DataSource instance
             ingestion_system: Ingestion system instance
@@ -101,94 +166,229 @@ class IngestionService:
         Returns:
             Dict with processing results
         """
-        result = {
+        result, fetch_result = IngestionService.fetch_stage(data_source, ingestion_system, url)
+        if fetch_result is None:
+            return result
+        
+        result, new_version, previous_version = IngestionService.normalize_stage(
+            data_source, ingestion_system, url, fetch_result
+        )
+        if new_version is None:
+            return result
+        
+        if previous_version:
+            result['diff_created'] = IngestionService.diff_stage(previous_version, new_version)
+        
+        try:
+            result.update(IngestionService.parse_stage(new_version))
+        except Exception as e:
+            logger.error(f"Error triggering rule parsing for {url}: {e}")
+            result['parsing_error'] = str(e)
+        
+        return result
+
+    @staticmethod
+    def _empty_result(url: str) -> Dict:
+        return {
             'url': url,
             'new_version': False,
-            'diff_created': False
+            'diff_created': False,
+            'not_modified': False,
+            'unchanged': False
         }
+
+    @staticmethod
+    def fetch_stage(data_source: DataSource, ingestion_system, url: str) -> Tuple[Dict, Optional[Dict]]:
+        """
+        Fetch stage: conditional fetch of a URL.
         
-        # 1. Fetch content
-        fetch_result = ingestion_system.fetch_content(url)
-        if not fetch_result or fetch_result.get('error'):
-            result['error'] = fetch_result.get('error', 'Unknown fetch error')
-            return result
+        Args:
+            data_source: DataSource instance
+            ingestion_system: Ingestion system instance
+            url: URL to fetch
+            
+        Returns:
+            (result, fetch_result); fetch_result is None when there is nothing to
+            normalize (error, empty body, or 304 Not Modified, which is recorded here).
+            The fetched body is stored on the URL's source document, so fetch_result
+            only carries its id and the response metadata (status code, content
+            type, validators), keeping queued pipeline messages small
+        """
+        result = IngestionService._empty_result(url)
         
-        # 2. Create source document
-        source_doc = SourceDocumentRepository.create_source_document(
-            data_source=data_source,
-            source_url=url,
-            raw_content=fetch_result['content'],
-            content_type=fetch_result['content_type'],
-            http_status_code=fetch_result['status_code']
+        source_doc = SourceDocumentSelector.get_by_data_source_and_url(data_source, url)
+        latest_version = (
+            DocumentVersionSelector.get_latest_by_source_document(source_doc) if source_doc else None
         )
         
-        # 3. Extract text for hashing
-        extracted_text = ingestion_system.extract_text(
-            fetch_result['content'],
-            fetch_result['content_type']
+        fetch_result = ingestion_system.fetch_content_if_modified(
+            url, validators=IngestionService._fetch_validators(source_doc, latest_version)
         )
+        if not fetch_result or fetch_result.get('error'):
+            result['error'] = (fetch_result or {}).get('error', 'Unknown fetch error')
+            return result, None
+        
+        if fetch_result.get('not_modified') and source_doc:
+            SourceDocumentRepository.record_fetch(
+                source_doc,
+                etag=fetch_result.get('etag'),
+                last_modified=fetch_result.get('last_modified'),
+                not_modified=True
+            )
+            logger.info(f"Not modified: {url}")
+            result['not_modified'] = True
+            return result, None
+        if not fetch_result.get('content'):
+            result['error'] = 'Empty response'
+            return result, None
         
-        # 4. Extract metadata (if method exists)
+        if source_doc:
+            source_doc = SourceDocumentRepository.store_content(
+                source_doc,
+                raw_content=fetch_result['content'],
+                content_type=fetch_result['content_type'],
+                http_status_code=fetch_result.get('status_code')
+            )
+        else:
+            source_doc = SourceDocumentRepository.create_source_document(
+                data_source=data_source,
+                source_url=url,
+                raw_content=fetch_result['content'],
+                content_type=fetch_result['content_type'],
+                http_status_code=fetch_result.get('status_code')
+            )
+        
+        return result, {
+            'source_document_id': str(source_doc.id),
+            'status_code': fetch_result.get('status_code'),
+            'etag': fetch_result.get('etag'),
+            'last_modified': fetch_result.get('last_modified'),
+        }
+
+    @staticmethod
+    def normalize_stage(data_source: DataSource, ingestion_system, url: str, fetch_result: Dict):
+        """
+        Normalize stage: extract text and metadata from the fetched content, hash, and
+        store a new version.
+        
+        Idempotent by content hash: content equal to the URL's latest version creates
+        nothing. Versions are unique by hash across all URLs, so content reverted to an
+        earlier version of the URL (A -> B -> A) makes that version the latest again
+        instead of storing a copy, and content already stored by another URL creates
+        nothing. The fetch's validators are recorded last, once the content is processed.
+        
+        Args:
+            data_source: DataSource instance
+            ingestion_system: Ingestion system instance
+            url: Fetched URL
+            fetch_result: Result of fetch_stage (source document id and response metadata)
+            
+        Returns:
+            (result, new_version, previous_version); new_version is None when the
+            content is unchanged. previous_version is the URL's latest version before
+            this one (None for a new URL)
+        """
+        result = IngestionService._empty_result(url)
+        
+        source_doc = SourceDocumentSelector.get_by_id(fetch_result['source_document_id'])
+        if not source_doc:
+            result['error'] = 'Source document not found'
+            return result, None, None
+        latest_version = DocumentVersionSelector.get_latest_by_source_document(source_doc)
+        
+        # Extract text for hashing
+        extracted_text = ingestion_system.extract_text(source_doc.raw_content, source_doc.content_type)
+        
+        # Extract metadata (if method exists)
         metadata = {}
         if hasattr(ingestion_system, 'extract_metadata'):
-            metadata = ingestion_system.extract_metadata(fetch_result['content'])
+            metadata = ingestion_system.extract_metadata(source_doc.raw_content)
         
-        # 5. Compute hash
         from main_system.utils.file_hashing import ContentHash
         content_hash = ContentHash.compute_sha256(extracted_text)
         
-        # 6. Check if version already exists for this source document
-        # We check by source_document to ensure each URL maintains its own version history
-        existing_versions = DocumentVersionSelector.get_by_source_document(source_doc)
-        for existing_version in existing_versions:
-            if existing_version.content_hash == content_hash:
-                logger.info(f"Content unchanged for {url}, hash: {content_hash[:8]}...")
-                return result
+        new_version = None
+        existing_version = None
+        if latest_version and latest_version.content_hash == content_hash:
+            logger.info(f"Content unchanged for {url}, hash: {content_hash[:8]}...")
+            result['unchanged'] = True
+        else:
+            # Content-addressed dedup (hashes are unique across URLs)
+            existing_version = DocumentVersionSelector.get_by_hash(content_hash)
+            if existing_version and existing_version.source_document_id != source_doc.id:
+                logger.info(f"Content of {url} already stored for another URL, hash: {content_hash[:8]}...")
+                result['unchanged'] = True
+            elif existing_version:
+                # Reverted to an earlier version of this URL
+                new_version = DocumentVersionRepository.mark_latest(existing_version)
+                logger.info(f"Content of {url} reverted to version {content_hash[:8]}...")
+                result['reverted'] = True
+            else:
+                # Create new document version with metadata
+                new_version = DocumentVersionRepository.create_document_version(
+                    source_document=source_doc,
+                    raw_text=extracted_text,
+                    metadata=metadata
+                )
+                result['new_version'] = True
         
-        # 7. Create new document version with metadata
-        new_version = DocumentVersionRepository.create_document_version(
-            source_document=source_doc,
-            raw_text=extracted_text,
-            metadata=metadata
+        SourceDocumentRepository.record_fetch(
+            source_doc,
+            http_status_code=fetch_result.get('status_code'),
+            etag=fetch_result.get('etag'),
+            last_modified=fetch_result.get('last_modified')
         )
-        result['new_version'] = True
+        if new_version is None:
+            return result, None, None
         
-        # 8. Get previous version for diff
-        previous_version = DocumentVersionSelector.get_latest_by_source_document(source_doc)
-        change_detected = False
-        change_type = None
+        previous_version = latest_version if latest_version and latest_version.id != new_version.id else None
+        return result, new_version, previous_version
+
+    @staticmethod
+    def diff_stage(old_version, new_version) -> bool:
+        """
+        Diff stage: store the classified diff between two versions.
         
-        if previous_version and previous_version.id != new_version.id:
-            # 9. Create diff
-            diff_text = IngestionService._compute_diff(
-                previous_version.raw_text,
-                new_version.raw_text
-            )
-            
-            change_type = IngestionService._classify_change(diff_text)
-            
-            DocumentDiffRepository.create_document_diff(
-                old_version=previous_version,
-                new_version=new_version,
-                diff_text=diff_text,
-                change_type=change_type
-            )
-            result['diff_created'] = True
-            change_detected = True
+        Idempotent: an existing diff for the pair is returned without recomputing.
+        The diff is streamed into storage and classified in the same pass.
         
-        # 10. Trigger AI Rule Parsing (as per implementation.md flow)
-        # Parse rules for new document versions (especially when change is detected)
-        if new_version:
-            try:
-                from data_ingestion.services.rule_parsing_service import RuleParsingService
-                parse_result = RuleParsingService.parse_document_version(new_version)
-                result['rules_parsed'] = parse_result.get('rules_created', 0)
-                result['validation_tasks_created'] = parse_result.get('validation_tasks_created', 0)
-            except Exception as e:
-                logger.error(f"Error triggering rule parsing for {url}: {e}")
-                result['parsing_error'] = str(e)
+        Returns:
+            True if a diff exists for the pair
+        """
+        classifier = ChangeClassifier()
+        diff = DocumentDiffRepository.create_document_diff(
+            old_version=old_version,
+            new_version=new_version,
+            diff_text=classifier.observe(unified_diff(old_version.raw_text, new_version.raw_text)),
+            change_type=classifier.result
+        )
+        return diff is not None
+
+    @staticmethod
+    def parse_stage(document_version) -> Dict:
+        """
+        Parse stage: AI rule parsing of a document version.
         
-        return result
+        Returns:
+            Dict with 'rules_parsed' and 'validation_tasks_created'
+        """
+        from data_ingestion.services.rule_parsing_service import RuleParsingService
+        parse_result = RuleParsingService.parse_document_version(document_version)
+        return {
+            'rules_parsed': parse_result.get('rules_created', 0),
+            'validation_tasks_created': parse_result.get('validation_tasks_created', 0),
+        }
+
+    @staticmethod
+    def _fetch_validators(source_doc, latest_version) -> Optional[Dict]:
+        """Conditional-request validators from a URL's previous fetch (None for a new URL)."""
+        if not source_doc:
+            return None
+        return {
+            'etag': source_doc.etag,
+            'last_modified': source_doc.last_modified,
+            'public_updated_at': (latest_version.metadata or {}).get('public_updated_at') if latest_version else None,
+        }
 
     @staticmethod
     def _compute_diff(old_text: str, new_text: str) -> str:
@@ -202,18 +402,7 @@ class IngestionService:
         Returns:
             Unified diff string
         """
-        old_lines = old_text.splitlines(keepends=True)
-        new_lines = new_text.splitlines(keepends=True)
-        
-        diff = difflib.unified_diff(
-            old_lines,
-            new_lines,
-            fromfile='old_version',
-            tofile='new_version',
-            lineterm=''
-        )
-        
-        return ''.join(diff)
+        return ''.join(unified_diff(old_text, new_text))
 
     @staticmethod
     def _classify_change(diff_text: str) -> str:
@@ -226,34 +415,4 @@ class IngestionService:
         Returns:
             Change type classification
         """
-        diff_lower = diff_text.lower()
-        
-        # Check for requirement changes (salary, threshold, etc.)
-        requirement_keywords = ['salary', 'threshold', 'minimum', 'requirement', 'must', 'need']
-        if any(keyword in diff_lower for keyword in requirement_keywords):
-            # Check for numeric patterns
-            import re
-            if re.search(r'[£$€]\s*\d+|\d+\s*(pound|dollar|euro)', diff_lower):
-                return 'requirement_change'
-        
-        # Check for fee changes
-        fee_keywords = ['fee', 'cost', 'charge', 'payment']
-        if any(keyword in diff_lower for keyword in fee_keywords):
-            import re
-            if re.search(r'[£$€]\s*\d+|\d+\s*(pound|dollar|euro)', diff_lower):
-                return 'fee_change'
-        
-        # Check for processing time changes
-        time_keywords = ['day', 'week', 'month', 'processing', 'time', 'duration']
-        if any(keyword in diff_lower for keyword in time_keywords):
-            import re
-            if re.search(r'\d+\s*(day|week|month|hour)', diff_lower):
-                return 'processing_time_change'
-        
-        # Check for major updates (large diff)
-        if len(diff_text) > 10000:
-            return 'major_update'
-        
-        # Default to minor text change
-        return 'minor_text'
-
+        return ChangeClassifier.classify(diff_text)
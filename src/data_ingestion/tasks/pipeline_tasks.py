@@ -0,0 +1,264 @@
+"""
+Queued ingestion pipeline.
+
+Each URL flows through independent Celery stages, each on its own queue so worker
+pools scale separately (many cheap fetch workers, few LLM parse workers):
+
+    fetch (ingestion_fetch) -> normalize (ingestion_normalize) -> diff (ingestion_diff)
+                                                                -> embed (ingestion_embed)
+                                                                -> parse (ingestion_parse)
+
+Stages run the same IngestionService methods as the inline path (_process_url).
+The fetch stage stores fetched bodies on the URL's SourceDocument; messages only
+carry ids, hashes and response metadata, so large pages do not travel through the
+broker (or get re-serialized on every retry and hold-back).
+Messages are acknowledged after the task finishes (acks_late), so a worker that dies
+mid-task leaves its message on the queue. Stages are idempotent: normalize is keyed
+by content hash (versions are unique by hash), diff by the version pair, embed by
+existing chunks, parse by existing parsed rules; a per-key claim keeps duplicates
+from running in parallel (a message finding its key claimed is retried later, never
+dropped). Flow control (per-stage concurrency slots and pending
+limits that hold back the stages feeding a backlog) is in helpers.pipeline_control.
+
+Enabled by INGESTION_PIPELINE_ENABLED; IngestionService.ingest_data_source then
+enqueues fetch tasks instead of processing URLs inline.
+"""
+import hashlib
+import logging
+from typing import Callable, Dict, Iterable, Optional
+
+from celery import shared_task
+from django.conf import settings
+
+from data_ingestion.helpers.pipeline_control import (
+    DIFF,
+    EMBED,
+    FETCH,
+    NORMALIZE,
+    PARSE,
+    PipelineControl,
+)
+from main_system.utils.tasks_base import BaseTaskWithMeta
+
+logger = logging.getLogger('django')
+
+FETCH_QUEUE = 'ingestion_fetch'
+NORMALIZE_QUEUE = 'ingestion_normalize'
+DIFF_QUEUE = 'ingestion_diff'
+EMBED_QUEUE = 'ingestion_embed'
+PARSE_QUEUE = 'ingestion_parse'
+
+MAX_RETRIES = 3
+RETRY_COUNTDOWN_SECONDS = 60
+# Slots and claims expire after the task time limit (a killed worker frees them)
+STAGE_LOCK_TIMEOUT_SECONDS = getattr(settings, 'CELERY_TASK_TIME_LIMIT', 300) or 300
+
+STAGE_TASK_OPTIONS = {
+    'bind': True,
+    'base': BaseTaskWithMeta,
+    'acks_late': True,
+    'reject_on_worker_lost': True,
+}
+
+
+def enqueue_urls(data_source_id: str, urls: Iterable[str]) -> int:
+    """
+    Start the pipeline for URLs of a data source.
+
+    Returns:
+        Number of URLs queued
+    """
+    count = 0
+    for url in urls:
+        _enqueue(fetch_url_task, FETCH, data_source_id, url)
+        count += 1
+    return count
+
+
+@shared_task(queue=FETCH_QUEUE, **STAGE_TASK_OPTIONS)
+def fetch_url_task(self, data_source_id: str, url: str):
+    """
+    Fetch stage: conditional fetch of one URL; changed content goes to normalize.
+
+    Args:
+        data_source_id: UUID of the data source
+        url: URL to fetch
+    """
+    def work():
+        data_source, ingestion_system = _load_ingestion_system(data_source_id)
+        if ingestion_system is None:
+            return {'url': url, 'skipped': 'data source unavailable'}
+
+        from data_ingestion.services.ingestion_service import IngestionService
+        result, fetch_result = IngestionService.fetch_stage(data_source, ingestion_system, url)
+        if fetch_result is not None:
+            _enqueue(normalize_content_task, NORMALIZE, data_source_id, url, fetch_result)
+        return result
+
+    return _run_stage(self, FETCH, f"{data_source_id}:{_digest(url)}", work)
+
+
+@shared_task(queue=NORMALIZE_QUEUE, **STAGE_TASK_OPTIONS)
+def normalize_content_task(self, data_source_id: str, url: str, fetch_result: Dict):
+    """
+    Normalize stage: extract, hash and store a new version; fan out diff, embed and parse.
+
+    Args:
+        data_source_id: UUID of the data source
+        url: Fetched URL
+        fetch_result: Fetch result dict (source_document_id, status_code, validators)
+    """
+    def work():
+        data_source, ingestion_system = _load_ingestion_system(data_source_id)
+        if ingestion_system is None:
+            return {'url': url, 'skipped': 'data source unavailable'}
+
+        from data_ingestion.services.ingestion_service import IngestionService
+        result, new_version, previous_version = IngestionService.normalize_stage(
+            data_source, ingestion_system, url, fetch_result
+        )
+        if new_version is None:
+            return result
+
+        new_version_id = str(new_version.id)
+        if previous_version:
+            _enqueue(diff_versions_task, DIFF, str(previous_version.id), new_version_id)
+        if getattr(settings, 'INGESTION_PIPELINE_EMBED_ENABLED', False):
+            _enqueue(embed_document_version_task, EMBED, new_version_id, new_version.content_hash)
+        _enqueue(parse_document_version_task, PARSE, new_version_id, new_version.content_hash)
+        return {**result, 'document_version_id': new_version_id}
+
+    # One normalize per URL at a time (they update the same source document)
+    return _run_stage(self, NORMALIZE, f"{data_source_id}:{_digest(url)}", work)
+
+
+@shared_task(queue=DIFF_QUEUE, **STAGE_TASK_OPTIONS)
+def diff_versions_task(self, old_version_id: str, new_version_id: str):
+    """
+    Diff stage: store the classified diff between a URL's previous and new version.
+
+    Args:
+        old_version_id: UUID of the previous DocumentVersion
+        new_version_id: UUID of the new DocumentVersion
+    """
+    def work():
+        from data_ingestion.selectors.document_version_selector import DocumentVersionSelector
+        from data_ingestion.services.ingestion_service import IngestionService
+
+        old_version = DocumentVersionSelector.get_by_id(old_version_id)
+        new_version = DocumentVersionSelector.get_by_id(new_version_id)
+        return {
+            'old_version_id': old_version_id,
+            'new_version_id': new_version_id,
+            'diff_created': IngestionService.diff_stage(old_version, new_version),
+        }
+
+    return _run_stage(self, DIFF, f"{old_version_id}:{new_version_id}", work)
+
+
+@shared_task(queue=EMBED_QUEUE, **STAGE_TASK_OPTIONS)
+def embed_document_version_task(self, document_version_id: str, content_hash: str):
+    """
+    Embed stage: chunk and embed a document version (skipped if it already has chunks).
+
+    Args:
+        document_version_id: UUID of the DocumentVersion
+        content_hash: Its content hash (idempotency key)
+    """
+    def work():
+        from data_ingestion.selectors.document_version_selector import DocumentVersionSelector
+        from rules_knowledge.services.rule_publishing_service import RulePublishingService
+
+        document_version = DocumentVersionSelector.get_by_id(document_version_id)
+        chunks_stored = RulePublishingService.index_document_version(
+            document_version,
+            jurisdiction=document_version.source_document.data_source.jurisdiction
+        )
+        return {'document_version_id': document_version_id, 'chunks_stored': chunks_stored}
+
+    return _run_stage(self, EMBED, content_hash, work)
+
+
+@shared_task(queue=PARSE_QUEUE, **STAGE_TASK_OPTIONS)
+def parse_document_version_task(self, document_version_id: str, content_hash: str):
+    """
+    Parse stage: AI rule parsing of a document version (skipped if it already has rules).
+
+    Args:
+        document_version_id: UUID of the DocumentVersion
+        content_hash: Its content hash (idempotency key)
+    """
+    def work():
+        from data_ingestion.selectors.document_version_selector import DocumentVersionSelector
+        from data_ingestion.selectors.parsed_rule_selector import ParsedRuleSelector
+        from data_ingestion.services.ingestion_service import IngestionService
+
+        document_version = DocumentVersionSelector.get_by_id(document_version_id)
+        if ParsedRuleSelector.get_by_document_version(document_version).exists():
+            return {'document_version_id': document_version_id, 'skipped': 'already parsed'}
+        return {'document_version_id': document_version_id, **IngestionService.parse_stage(document_version)}
+
+    return _run_stage(self, PARSE, content_hash, work)
+
+
+def _run_stage(task, stage: str, key: str, work: Callable[[], Dict]) -> Optional[Dict]:
+    """
+    Run a stage task under the pipeline's flow control.
+
+    Held back (re-enqueued after INGESTION_PIPELINE_RETRY_DELAY_SECONDS, without using
+    up retries) while a downstream stage is saturated, all of this stage's slots are
+    taken, or another worker holds the claim for `key`. A claim left by a worker that
+    died expires after STAGE_LOCK_TIMEOUT_SECONDS, so the redelivered message runs
+    then instead of being dropped; a true duplicate finds the work done (stages are
+    idempotent). Failures are retried MAX_RETRIES times.
+    """
+    saturated = PipelineControl.downstream_saturated(stage)
+    slot = PipelineControl.acquire_slot(stage, timeout=STAGE_LOCK_TIMEOUT_SECONDS) if not saturated else None
+    if saturated or slot is None:
+        logger.info(f"Ingestion pipeline {stage} held back ({saturated or stage} at capacity): {key}")
+        return _hold_back(task, saturated or stage)
+
+    try:
+        if not PipelineControl.claim(stage, key, timeout=STAGE_LOCK_TIMEOUT_SECONDS):
+            logger.info(f"Ingestion pipeline {stage} held back (claimed by another worker): {key}")
+            return _hold_back(task, 'in progress')
+        try:
+            result = work()
+        finally:
+            PipelineControl.release_claim(stage, key)
+    except Exception as e:
+        logger.error(f"Ingestion pipeline {stage} failed for {key}: {e}", exc_info=True)
+        if task.request.retries >= MAX_RETRIES:
+            PipelineControl.mark_finished(stage)
+            raise
+        raise task.retry(exc=e, countdown=RETRY_COUNTDOWN_SECONDS, max_retries=MAX_RETRIES)
+    finally:
+        PipelineControl.release_slot(stage, slot)
+
+    PipelineControl.mark_finished(stage)
+    return result
+
+
+def _hold_back(task, reason: str) -> Dict:
+    # Still pending: the message is replaced by a delayed copy
+    task.apply_async(args=task.request.args, kwargs=task.request.kwargs, countdown=PipelineControl.retry_delay())
+    return {'held_back': reason}
+
+
+def _enqueue(task, stage: str, *args) -> None:
+    PipelineControl.mark_enqueued(stage)
+    task.apply_async(args=args)
+
+
+def _load_ingestion_system(data_source_id: str):
+    from data_ingestion.ingestion.factory import IngestionSystemFactory
+    from data_ingestion.selectors.data_source_selector import DataSourceSelector
+
+    data_source = DataSourceSelector.get_by_id(data_source_id)
+    if not data_source or not data_source.is_active:
+        return data_source, None
+    return data_source, IngestionSystemFactory.create(data_source)
+
+
+def _digest(value: str) -> str:
+    return hashlib.sha256(value.encode('utf-8')).hexdigest()[:32]
@@ -0,0 +1,80 @@
+import threading
+import time
+from unittest.mock import patch
+
+from data_ingestion.helpers.crawler import HostRateLimiter, TokenBucket, crawl
+
+
+class TestTokenBucket:
+    @patch("data_ingestion.helpers.crawler.time.sleep")
+    def test_burst_then_paced(self, mock_sleep):
+        bucket = TokenBucket(rate=2.0, burst=2)
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == 0.0
+        # Third and fourth callers queue behind each other, half a second apart
+        third = bucket.acquire()
+        fourth = bucket.acquire()
+        assert 0.4 < third <= 0.5
+        assert 0.9 < fourth <= 1.0
+        assert mock_sleep.call_count == 2
+
+    def test_zero_rate_disables_limit(self):
+        bucket = TokenBucket(rate=0, burst=1)
+        assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+
+class TestHostRateLimiter:
+    def test_buckets_are_per_host_and_read_settings(self, settings):
+        settings.INGESTION_CRAWL_REQUESTS_PER_SECOND = 5.0
+        settings.INGESTION_CRAWL_BURST = 3
+        HostRateLimiter.reset()
+        try:
+            HostRateLimiter.acquire("https://www.gov.uk/api/content/a")
+            HostRateLimiter.acquire("https://WWW.gov.uk/api/search.json")
+            HostRateLimiter.acquire("https://example.com/x")
+            assert set(HostRateLimiter._buckets) == {"www.gov.uk", "example.com"}
+            bucket = HostRateLimiter._buckets["www.gov.uk"]
+            assert (bucket.rate, bucket.capacity) == (5.0, 3.0)
+        finally:
+            HostRateLimiter.reset()
+
+
+class TestCrawl:
+    def test_follows_discovered_items_once(self):
+        graph = {"a": ["b", "c"], "b": ["c", "d"], "c": ["a"], "d": []}
+        visited = []
+
+        def handler(item):
+            visited.append(item)
+            return graph[item]
+
+        assert crawl(["a"], handler, max_workers=2) == []
+        assert sorted(visited) == ["a", "b", "c", "d"]
+
+    def test_custom_key_and_errors_do_not_stop_crawl(self):
+        def handler(item):
+            name, _ = item
+            if name == "bad":
+                raise ValueError("boom")
+            return [("bad", 1), ("ok", 2), ("ok", 3)] if name == "root" else []
+
+        errors = crawl([("root", 0)], handler, key=lambda item: item[0], max_workers=2)
+        assert len(errors) == 1
+        assert errors[0][0] == ("bad", 1)
+        assert str(errors[0][1]) == "boom"
+
+    def test_in_flight_is_bounded(self):
+        lock = threading.Lock()
+        state = {"current": 0, "peak": 0}
+
+        def handler(item):
+            with lock:
+                state["current"] += 1
+                state["peak"] = max(state["peak"], state["current"])
+            time.sleep(0.01)
+            with lock:
+                state["current"] -= 1
+            return [item * 10 + i for i in range(3)] if item < 10 else []
+
+        crawl([1], handler, max_workers=3)
+        assert 1 < state["peak"] <= 3
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from data_ingestion.helpers.parallel_processor import ParallelProcessor, StreamingProcessor
 
 
@@ -23,6 +25,16 @@ class TestParallelProcessor:
         results = ParallelProcessor.process_in_parallel(items, f, max_workers=2, continue_on_error=False)
         assert any(r["success"] is False for r in results)
 
+    @patch("main_system.utils.thread_pool.connections")
+    def test_each_job_closes_its_db_connections(self, mock_connections):
+        def f(x):
+            if x == 2:
+                raise ValueError("bad")
+            return x
+
+        ParallelProcessor.process_in_parallel([1, 2, 3], f, max_workers=2)
+        assert mock_connections.close_all.call_count == 3
+
 
 class TestStreamingProcessor:
     def test_process_in_chunks_basic(self):
@@ -0,0 +1,96 @@
+import difflib
+import random
+import re
+
+from data_ingestion.helpers.change_classifier import ChangeClassifier
+from data_ingestion.helpers.text_diff import FALLBACK_MAX_LINES, matching_blocks, unified_diff
+
+HUNK_HEADER = re.compile(r"@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+def _apply(old_text, diff_lines):
+    """Apply a unified diff to old_text (asserting context lines match)."""
+    old_lines = old_text.splitlines(keepends=True)
+    result, position = [], 0
+    for line in diff_lines[2:]:
+        header = HUNK_HEADER.match(line)
+        if header:
+            start = int(header.group(1)) - (0 if header.group(2) == "0" else 1)
+            result.extend(old_lines[position:start])
+            position = start
+        elif line[0] in " -":
+            assert old_lines[position].rstrip("\n") == line[1:].rstrip("\n")
+            position += 1
+            if line[0] == " ":
+                result.append(line[1:])
+        else:
+            result.append(line[1:])
+    result.extend(old_lines[position:])
+    return "".join(result)
+
+
+def _lines(n, seed):
+    rng = random.Random(seed)
+    return [f"line {rng.randint(0, n // 3)}\n" for _ in range(n)]
+
+
+class TestUnifiedDiff:
+    def test_matches_difflib_for_simple_edit(self):
+        old = "a\nb\nc\nd\ne\nf\ng\nh\ni\nj\n"
+        new = "a\nb\nC\nd\ne\nf\ng\nh\ni\nj\nk\n"
+        expected = difflib.unified_diff(
+            old.splitlines(keepends=True), new.splitlines(keepends=True), "old_version", "new_version"
+        )
+        assert list(unified_diff(old, new)) == list(expected)
+
+    def test_identical_texts_yield_nothing(self):
+        assert list(unified_diff("a\nb\n", "a\nb\n")) == []
+
+    def test_random_edits_round_trip(self):
+        rng = random.Random(7)
+        for seed in range(40):
+            old_lines = _lines(rng.randint(0, 80), seed)
+            new_lines = list(old_lines)
+            for _ in range(rng.randint(1, 10)):
+                op = rng.choice(["insert", "delete", "replace", "move"])
+                position = rng.randint(0, max(0, len(new_lines) - 1))
+                if op == "insert" or not new_lines:
+                    new_lines.insert(position, f"new {rng.random()}\n")
+                elif op == "delete":
+                    del new_lines[position]
+                elif op == "replace":
+                    new_lines[position] = f"changed {rng.random()}\n"
+                else:
+                    new_lines.insert(rng.randint(0, len(new_lines)), new_lines.pop(position))
+            old, new = "".join(old_lines), "".join(new_lines)
+            assert _apply(old, list(unified_diff(old, new))) == new
+
+    def test_reordered_sections_anchor_on_unique_lines(self):
+        sections = [[f"## Section {s}\n"] + [f"Paragraph {s}.{p}\n" for p in range(50)] for s in range(20)]
+        old = "".join(line for section in sections for line in section)
+        new = "".join(line for section in reversed(sections) for line in section)
+        diff = list(unified_diff(old, new))
+        assert _apply(old, diff) == new
+        # One section stays in place; everything else is moved
+        assert sum(size for _, _, size in matching_blocks(
+            [hash(line) for line in old.splitlines()], [hash(line) for line in new.splitlines()]
+        )) == 51
+
+    def test_large_region_without_unique_lines_is_replaced(self):
+        old = "x\n" * (FALLBACK_MAX_LINES + 1) + "y\n" * 3
+        new = "y\n" * 3 + "x\n" * (FALLBACK_MAX_LINES + 1)
+        assert _apply(old, list(unified_diff(old, new))) == new
+
+
+class TestChangeClassifier:
+    def test_streamed_classification_matches_whole_text(self):
+        diff = "--- old_version\n+++ new_version\n@@ -1 +1 @@\n-Fee is £100\n+Fee is £200\n"
+        classifier = ChangeClassifier()
+        assert "".join(classifier.observe(diff.splitlines(keepends=True))) == diff
+        assert classifier.result() == ChangeClassifier.classify(diff) == "fee_change"
+
+    def test_precedence_and_length(self):
+        assert ChangeClassifier.classify("+Minimum salary is £30000\n+Fee is £10") == "requirement_change"
+        assert ChangeClassifier.classify("+Decision within 3 weeks") == "processing_time_change"
+        assert ChangeClassifier.classify("+" + "x" * 10001) == "major_update"
+        assert ChangeClassifier.classify("+wording") == "minor_text"
@@ -0,0 +1,46 @@
+import pytest
+
+from data_ingestion.helpers.vector_index import VectorIndexManager
+
+
+class TestVectorIndexManager:
+    def test_build_hnsw_sql(self):
+        sql = VectorIndexManager.build_create_sql(method="hnsw", m=24, ef_construction=128, concurrently=True)
+        assert sql == (
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS document_chunks_embedding_hnsw_idx "
+            "ON document_chunks USING hnsw ((embedding::vector(1536)) vector_cosine_ops) "
+            "WITH (m = 24, ef_construction = 128)"
+        )
+
+    def test_build_sql_for_compact_precisions(self):
+        sql = VectorIndexManager.build_create_sql(method="hnsw", precision="halfvec", dimensions=512)
+        assert "document_chunks_embedding_hnsw_halfvec_idx" in sql
+        assert "((embedding::halfvec(512)) halfvec_cosine_ops)" in sql
+
+        sql = VectorIndexManager.build_create_sql(method="ivfflat", lists=10, precision="binary", dimensions=1536)
+        assert "document_chunks_embedding_ivfflat_binary_idx" in sql
+        assert "((binary_quantize(embedding)::bit(1536)) bit_hamming_ops)" in sql
+
+        with pytest.raises(ValueError):
+            VectorIndexManager.build_create_sql(precision="int8")
+
+    def test_build_ivfflat_sql_requires_lists(self):
+        with pytest.raises(ValueError):
+            VectorIndexManager.build_create_sql(method="ivfflat")
+        sql = VectorIndexManager.build_create_sql(method="ivfflat", lists=100)
+        assert "USING ivfflat" in sql
+        assert "WITH (lists = 100)" in sql
+
+    def test_build_unknown_method_raises(self):
+        with pytest.raises(ValueError):
+            VectorIndexManager.build_create_sql(method="flat")
+
+    def test_default_ivfflat_lists(self):
+        assert VectorIndexManager.default_ivfflat_lists(0) == 1
+        assert VectorIndexManager.default_ivfflat_lists(500_000) == 500
+        assert VectorIndexManager.default_ivfflat_lists(4_000_000) == 2000
+
+    def test_noop_on_sqlite(self):
+        assert VectorIndexManager.is_supported() is False
+        assert VectorIndexManager.create_index() is False
+        assert VectorIndexManager.get_indexes() == []
@@ -0,0 +1,93 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from external_services.request.http_client import ExternalHTTPClient
+from main_system.utils.request.client import Client
+from main_system.utils.request.session_pool import SessionPool
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    statuses = []  # queued status codes for /flaky
+
+    def do_GET(self):
+        status = self.statuses.pop(0) if self.path == "/flaky" and self.statuses else 200
+        if self.path == "/missing":
+            status = 404
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", '"v1"')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    SessionPool.reset()
+    _Handler.statuses = []
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    SessionPool.reset()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestPooledHTTPClients:
+    def test_clients_for_same_host_share_one_keep_alive_connection(self, server):
+        client = ExternalHTTPClient(base_url=f"{server}/api")
+        other = Client(base_url=server)
+        assert client.client.session is other.session
+
+        for i in range(3):
+            assert client.get(f"/a{i}") == {"path": f"/api/a{i}"}
+        assert other.get_with_details("/b")["etag"] == '"v1"'
+
+        stats = SessionPool.stats()[server]
+        assert stats == {"requests": 4, "connections_opened": 1, "connections_reused": 3}
+
+    def test_transient_errors_are_retried_and_client_errors_are_not(self, server):
+        client = ExternalHTTPClient(base_url=server, max_retries=3, retry_backoff=False)
+
+        _Handler.statuses = [503, 502]
+        assert client.get("/flaky") == {"path": "/flaky"}
+
+        _Handler.statuses = [503, 503, 503]
+        details = client.get("/flaky", return_details=True)
+        assert details["status_code"] == 503
+        assert details["content"] is None
+
+        assert client.get("/missing") is None
+        assert SessionPool.stats()[server]["requests"] == 3 + 3 + 1
+
+    def test_every_attempt_waits_for_the_rate_limiter(self, server):
+        calls = []
+        client = ExternalHTTPClient(base_url=server, max_retries=3, retry_backoff=False, rate_limiter=calls.append)
+
+        _Handler.statuses = [503, 429]
+        assert client.get("/flaky") == {"path": "/flaky"}
+        assert calls == [f"{server}/flaky"] * 3
+
+    def test_post_is_retried_only_when_opted_in(self, server):
+        client = ExternalHTTPClient(base_url=server, max_retries=3, retry_backoff=False)
+        _Handler.statuses = [503, 503]
+        assert client.post("/flaky", {"a": 1}) is None
+        assert SessionPool.stats()[server]["requests"] == 1
+
+        client = ExternalHTTPClient(base_url=server, max_retries=3, retry_backoff=False, retry_non_idempotent=True)
+        _Handler.statuses = [503, 503]
+        assert client.post("/flaky", {"a": 1}) == {"path": "/flaky"}
+        assert SessionPool.stats()[server]["requests"] == 1 + 3
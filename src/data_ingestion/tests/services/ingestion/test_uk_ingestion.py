@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from data_ingestion.helpers.crawler import HostRateLimiter
 from data_ingestion.ingestion.uk_ingestion import UKIngestionSystem
 
 
@@ -56,3 +57,101 @@ class TestUKIngestionSystem:
         urls = system.parse_api_response(response)
         assert urls == ["u1"]
 
+
+    def test_conditional_headers_prefer_http_validators(self):
+        headers = UKIngestionSystem._conditional_headers(
+            {"etag": '"abc"', "last_modified": "Wed, 01 Jan 2026 00:00:00 GMT", "public_updated_at": "2025-01-01T00:00:00Z"}
+        )
+        assert headers == {"If-None-Match": '"abc"', "If-Modified-Since": "Wed, 01 Jan 2026 00:00:00 GMT"}
+
+        headers = UKIngestionSystem._conditional_headers({"public_updated_at": "2026-03-04T10:15:00.000+00:00"})
+        assert headers == {"If-Modified-Since": "Wed, 04 Mar 2026 10:15:00 GMT"}
+        assert UKIngestionSystem._conditional_headers(None) == {}
+
+    def test_fetch_if_modified_reuses_discovered_taxon_response(self):
+        ds = MagicMock(jurisdiction="UK", base_url="https://www.gov.uk/api/content/entering-staying-uk")
+        system = UKIngestionSystem(ds)
+        system.client = MagicMock()
+        system.client.get.return_value = {"content": None, "status_code": 304, "error": None, "not_modified": True}
+        system._discovered_responses["https://www.gov.uk/api/content/a"] = {"content": "{}", "status_code": 200}
+
+        assert system.fetch_content_if_modified("https://www.gov.uk/api/content/a")["content"] == "{}"
+        system.client.get.assert_not_called()
+
+        result = system.fetch_content_if_modified("https://www.gov.uk/api/content/a", {"etag": '"x"'})
+        assert result["not_modified"] is True
+        assert system.client.get.call_args.kwargs["headers"]["If-None-Match"] == '"x"'
+
+
+class TestUKIngestionDiscovery:
+    API = "https://www.gov.uk"
+    ROOT = "https://www.gov.uk/api/content/entering-staying-uk"
+
+    @pytest.fixture(autouse=True)
+    def _fast_rate_limit(self, settings):
+        settings.UK_GOV_API_BASE_URL = self.ROOT
+        settings.INGESTION_CRAWL_REQUESTS_PER_SECOND = 0
+        HostRateLimiter.reset()
+        yield
+        HostRateLimiter.reset()
+
+    def _system(self, responses):
+        system = UKIngestionSystem(MagicMock(jurisdiction="UK", base_url=self.ROOT))
+        system.client = MagicMock()
+
+        def get(endpoint, **kwargs):
+            body = responses.get(endpoint)
+            return {"content": json.dumps(body) if body is not None else None, "status_code": 200, "error": None}
+
+        system.client.get.side_effect = get
+        return system
+
+    @staticmethod
+    def _taxon(content_id, children=()):
+        return {
+            "content_id": content_id,
+            "links": {"child_taxons": [{"api_url": url, "withdrawn": False} for url in children]},
+        }
+
+    @staticmethod
+    def _search(content_id, page, total, paths):
+        endpoint = f"/api/search.json?filter_taxons={content_id}&count=50&start={(page - 1) * 50}"
+        return endpoint, {"total": total, "results": [{"base_path": path} for path in paths]}
+
+    def test_get_document_urls_crawls_taxons_and_search_pages(self):
+        child = f"{self.API}/api/content/visas"
+        responses = {
+            "/api/content/entering-staying-uk": self._taxon("root", [child, child]),
+            "/api/content/visas": self._taxon("visas", [self.ROOT]),
+        }
+        for endpoint, body in (
+            self._search("root", 1, 60, ["/a", "/b"]),
+            self._search("root", 2, 60, ["/c"]),
+            self._search("visas", 1, 2, ["/b", "/visas"]),
+        ):
+            responses[endpoint] = body
+        system = self._system(responses)
+
+        urls = system.get_document_urls()
+
+        assert urls[:2] == [self.ROOT, child]
+        assert sorted(urls[2:]) == sorted(
+            f"{self.API}/api/content{path}" for path in ["/a", "/b", "/c"]
+        )
+        # Each taxon and search page is requested once; taxon bodies are kept for the fetch phase
+        endpoints = [call.kwargs["endpoint"] for call in system.client.get.call_args_list]
+        assert len(endpoints) == len(set(endpoints)) == 5
+        assert set(system._discovered_responses) == {self.ROOT, child}
+
+    def test_get_content_pages_by_taxon_pages_through_results(self):
+        responses = dict([
+            self._search("t1", 1, 120, ["/a"]),
+            self._search("t1", 2, 120, ["/b"]),
+            self._search("t1", 3, 120, ["/a"]),
+        ])
+        system = self._system(responses)
+
+        urls = system.get_content_pages_by_taxon("t1")
+
+        assert sorted(urls) == [f"{self.API}/api/content/a", f"{self.API}/api/content/b"]
+        assert system.client.get.call_count == 3
@@ -0,0 +1,22 @@
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from ai_decisions.services.vector_backends.numpy_backend import NumpyVectorBackend
+
+
+@pytest.mark.django_db
+class TestBenchmarkVectorSearchCommand:
+    def test_exports_chunks_and_reports_benchmark(self, document_chunks, tmp_path, capsys):
+        call_command("benchmark_vector_search", "--path", str(tmp_path), "--export", "--sample", "2", "--limits", "1")
+        out = capsys.readouterr().out
+        assert f"Exported {len(document_chunks)} chunks" in out
+        assert "2 queries over 2 chunks (1536 dims)" in out
+
+        exported = NumpyVectorBackend.load(str(tmp_path))
+        assert {record.id for record in exported.records} == {str(chunk.id) for chunk in document_chunks}
+        assert exported.records[0].source_url
+
+    def test_missing_export_raises(self, tmp_path):
+        with pytest.raises(CommandError):
+            call_command("benchmark_vector_search", "--path", str(tmp_path / "missing"))
@@ -0,0 +1,164 @@
+import pytest
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+
+from data_ingestion.helpers.pipeline_control import NORMALIZE, PARSE, PipelineControl
+from data_ingestion.services.ingestion_service import IngestionService
+from data_ingestion.tasks.pipeline_tasks import normalize_content_task
+
+URL = "https://www.gov.uk/api/content/skilled-worker"
+
+
+class _FakeIngestionSystem:
+    def __init__(self, pages):
+        self.pages = list(pages)
+
+    def get_document_urls(self):
+        return [URL]
+
+    def fetch_content_if_modified(self, url, validators=None):
+        return {"content": self.pages.pop(0), "content_type": "text/plain", "status_code": 200,
+                "error": None, "etag": None, "last_modified": None}
+
+    def extract_text(self, raw_content, content_type):
+        return raw_content
+
+
+@pytest.fixture(autouse=True)
+def _clear_pipeline_state():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+class TestPipelineControl:
+    def test_pending_limit_saturates_upstream(self, settings):
+        settings.INGESTION_PIPELINE_STAGE_MAX_PENDING = {PARSE: 2}
+        PipelineControl.mark_enqueued(PARSE)
+        assert PipelineControl.downstream_saturated(NORMALIZE) is None
+        PipelineControl.mark_enqueued(PARSE)
+        assert PipelineControl.downstream_saturated(NORMALIZE) == PARSE
+        PipelineControl.mark_finished(PARSE)
+        assert PipelineControl.pending(PARSE) == 1
+        assert PipelineControl.downstream_saturated(NORMALIZE) is None
+
+    def test_concurrency_slots(self, settings):
+        settings.INGESTION_PIPELINE_STAGE_CONCURRENCY = {PARSE: 2}
+        first = PipelineControl.acquire_slot(PARSE, timeout=60)
+        second = PipelineControl.acquire_slot(PARSE, timeout=60)
+        assert {first, second} == {0, 1}
+        assert PipelineControl.acquire_slot(PARSE, timeout=60) is None
+        PipelineControl.release_slot(PARSE, first)
+        assert PipelineControl.acquire_slot(PARSE, timeout=60) == first
+        assert PipelineControl.acquire_slot(NORMALIZE, timeout=60) == -1  # unlimited
+
+
+@pytest.mark.django_db
+class TestIngestionPipeline:
+    @pytest.fixture(autouse=True)
+    def _pipeline(self, settings):
+        settings.INGESTION_PIPELINE_ENABLED = True
+        with patch(
+            "data_ingestion.services.rule_parsing_service.RuleParsingService.parse_document_version",
+            return_value={"rules_created": 1, "validation_tasks_created": 1},
+        ) as parse:
+            self.parse = parse
+            yield
+
+    def _ingest(self, data_source, system):
+        with patch("data_ingestion.ingestion.factory.IngestionSystemFactory.create", return_value=system), \
+                patch("data_ingestion.services.ingestion_service.IngestionSystemFactory.create", return_value=system):
+            return IngestionService.ingest_data_source(str(data_source.id))
+
+    def test_stages_store_version_diff_and_parse_each_content_once(self, uk_data_source):
+        from data_ingestion.models.document_diff import DocumentDiff
+        from data_ingestion.models.document_version import DocumentVersion
+
+        system = _FakeIngestionSystem(["Salary: 38700\n", "Salary: 38700\n", "Salary: 41700\n"])
+        for _ in range(3):
+            result = self._ingest(uk_data_source, system)
+            assert result == {
+                "success": True, "data_source_id": str(uk_data_source.id), "pipeline": True, "urls_queued": 1
+            }
+
+        versions = DocumentVersion.objects.filter(source_document__source_url=URL)
+        assert versions.count() == 2
+        assert DocumentDiff.objects.filter(new_version__source_document__source_url=URL).count() == 1
+        # Unchanged content is not parsed again
+        assert self.parse.call_count == 2
+        assert all(PipelineControl.pending(stage) == 0 for stage in ("fetch", "normalize", "diff", "parse"))
+
+    def test_saturated_downstream_holds_task_back_without_work(self, uk_data_source, settings):
+        settings.INGESTION_PIPELINE_STAGE_MAX_PENDING = {PARSE: 1}
+        PipelineControl.mark_enqueued(PARSE)
+
+        fetch_result = {"source_document_id": "unused", "status_code": 200, "etag": None, "last_modified": None}
+        with patch.object(normalize_content_task, "apply_async") as apply_async, \
+                patch("data_ingestion.tasks.pipeline_tasks._load_ingestion_system") as load:
+            result = normalize_content_task.run(str(uk_data_source.id), URL, fetch_result)
+
+        assert result == {"held_back": PARSE}
+        load.assert_not_called()
+        assert apply_async.call_args.kwargs["countdown"] == settings.INGESTION_PIPELINE_RETRY_DELAY_SECONDS
+
+    def test_parse_stage_skips_version_with_parsed_rules(self, uk_data_source):
+        from data_ingestion.tasks.pipeline_tasks import parse_document_version_task
+
+        system = _FakeIngestionSystem(["Salary: 38700\n"])
+        self._ingest(uk_data_source, system)
+        version = uk_data_source.source_documents.get().document_versions.get()
+
+        with patch("data_ingestion.selectors.parsed_rule_selector.ParsedRuleSelector.get_by_document_version",
+                   return_value=MagicMock(exists=MagicMock(return_value=True))):
+            result = parse_document_version_task.run(str(version.id), version.content_hash)
+        assert result["skipped"] == "already parsed"
+        assert self.parse.call_count == 1
+
+    def test_claimed_key_is_retried_later_not_dropped(self, uk_data_source, settings):
+        from data_ingestion.tasks.pipeline_tasks import STAGE_LOCK_TIMEOUT_SECONDS, _digest
+
+        # Claim left behind by a worker that died mid-task
+        key = f"{uk_data_source.id}:{_digest(URL)}"
+        assert PipelineControl.claim(NORMALIZE, key, timeout=STAGE_LOCK_TIMEOUT_SECONDS)
+        PipelineControl.mark_enqueued(NORMALIZE)
+
+        fetch_result = {"source_document_id": "unused", "status_code": 200, "etag": None, "last_modified": None}
+        with patch.object(normalize_content_task, "apply_async") as apply_async, \
+                patch("data_ingestion.tasks.pipeline_tasks._load_ingestion_system") as load:
+            result = normalize_content_task.run(str(uk_data_source.id), URL, fetch_result)
+
+        assert result == {"held_back": "in progress"}
+        load.assert_not_called()
+        assert apply_async.call_args.kwargs["countdown"] == settings.INGESTION_PIPELINE_RETRY_DELAY_SECONDS
+        assert PipelineControl.pending(NORMALIZE) == 1
+
+    def test_embed_stage_indexes_through_public_service(self, uk_data_source):
+        from data_ingestion.tasks.pipeline_tasks import embed_document_version_task
+
+        system = _FakeIngestionSystem(["Salary: 38700\n"])
+        self._ingest(uk_data_source, system)
+        version = uk_data_source.source_documents.get().document_versions.get()
+
+        with patch(
+            "rules_knowledge.services.rule_publishing_service.RulePublishingService.index_document_version",
+            return_value=3,
+        ) as index:
+            result = embed_document_version_task.run(str(version.id), version.content_hash)
+        assert result == {"document_version_id": str(version.id), "chunks_stored": 3}
+        assert index.call_args.kwargs["jurisdiction"] == uk_data_source.jurisdiction
+
+    def test_fetched_body_is_stored_not_queued(self, uk_data_source):
+        from data_ingestion.tasks.pipeline_tasks import fetch_url_task
+
+        system = _FakeIngestionSystem(["Salary: 38700\n"])
+        with patch("data_ingestion.tasks.pipeline_tasks._load_ingestion_system",
+                   return_value=(uk_data_source, system)), \
+                patch.object(normalize_content_task, "apply_async") as apply_async:
+            fetch_url_task.run(str(uk_data_source.id), URL)
+
+        fetch_result = apply_async.call_args.kwargs["args"][2]
+        assert "content" not in fetch_result
+        source_doc = uk_data_source.source_documents.get()
+        assert fetch_result["source_document_id"] == str(source_doc.id)
+        assert source_doc.raw_content == "Salary: 38700\n"
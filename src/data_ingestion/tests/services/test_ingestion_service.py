@@ -89,3 +89,191 @@ class TestIngestionServiceOrchestration:
         assert res["validation_tasks_created"] == 2
         mock_repo.update_last_fetched.assert_called_once()
 
+    @patch("data_ingestion.services.ingestion_service.DataSourceRepository")
+    @patch("data_ingestion.services.ingestion_service.IngestionService._process_url")
+    @patch("data_ingestion.services.ingestion_service.IngestionSystemFactory")
+    @patch("data_ingestion.services.ingestion_service.DataSourceSelector")
+    def test_ingest_data_source_concurrent_workers_aggregate_and_collect_errors(
+        self, mock_selector, mock_factory, mock_process_url, mock_repo, settings
+    ):
+        settings.INGESTION_PROCESS_MAX_WORKERS = 3
+        mock_selector.get_by_id.return_value = MagicMock(is_active=True, jurisdiction="UK")
+        ingestion_system = MagicMock()
+        ingestion_system.get_document_urls.return_value = ["u1", "u2", "u3", "u4"]
+        mock_factory.create.return_value = ingestion_system
+
+        def process(data_source, system, url):
+            if url == "u3":
+                raise RuntimeError("boom")
+            return {"new_version": url != "u4", "not_modified": url == "u4", "rules_parsed": 1}
+
+        mock_process_url.side_effect = process
+
+        res = IngestionService.ingest_data_source("id")
+        assert res["urls_processed"] == 3
+        assert res["new_versions"] == 2
+        assert res["not_modified"] == 1
+        assert res["rules_parsed"] == 3
+        assert res["errors"] == [{"url": "u3", "error": "boom"}]
+
+
+class _FakeIngestionSystem:
+    """Ingestion system serving queued fetch results and recording validators."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.validators = []
+
+    def fetch_content_if_modified(self, url, validators=None):
+        self.validators.append(validators)
+        return self.responses.pop(0)
+
+    def extract_text(self, raw_content, content_type):
+        return raw_content
+
+    def extract_metadata(self, raw_content):
+        return {"public_updated_at": "2026-01-01T00:00:00Z"}
+
+
+def _ok(content, etag='"v1"'):
+    return {"content": content, "content_type": "text/plain", "status_code": 200, "error": None,
+            "etag": etag, "last_modified": None}
+
+
+@pytest.mark.django_db
+class TestIngestionServiceProcessUrl:
+    URL = "https://www.gov.uk/api/content/skilled-worker"
+
+    @pytest.fixture(autouse=True)
+    def _no_rule_parsing(self):
+        with patch(
+            "data_ingestion.services.rule_parsing_service.RuleParsingService.parse_document_version",
+            return_value={"rules_created": 0, "validation_tasks_created": 0},
+        ) as parse:
+            yield parse
+
+    def test_unchanged_content_reuses_source_document_and_version(self, uk_data_source, _no_rule_parsing):
+        from data_ingestion.models.document_version import DocumentVersion
+        from data_ingestion.models.source_document import SourceDocument
+
+        system = _FakeIngestionSystem([_ok("Salary: 38700"), _ok("Salary: 38700", etag='"v2"')])
+        first = IngestionService._process_url(uk_data_source, system, self.URL)
+        second = IngestionService._process_url(uk_data_source, system, self.URL)
+
+        assert first["new_version"] is True
+        assert second["new_version"] is False and second["unchanged"] is True
+        assert SourceDocument.objects.filter(source_url=self.URL).count() == 1
+        assert DocumentVersion.objects.filter(source_document__source_url=self.URL).count() == 1
+        assert system.validators[0] is None
+        assert system.validators[1] == {
+            "etag": '"v1"', "last_modified": None, "public_updated_at": "2026-01-01T00:00:00Z"
+        }
+        assert SourceDocument.objects.get(source_url=self.URL).etag == '"v2"'
+        assert _no_rule_parsing.call_count == 1
+
+    def test_not_modified_stores_nothing(self, uk_data_source):
+        from data_ingestion.models.source_document import SourceDocument
+
+        not_modified = {"content": None, "content_type": None, "status_code": 304, "error": None,
+                        "not_modified": True, "etag": '"v1"', "last_modified": None}
+        system = _FakeIngestionSystem([_ok("Salary: 38700"), not_modified])
+        IngestionService._process_url(uk_data_source, system, self.URL)
+        before = SourceDocument.objects.get(source_url=self.URL)
+
+        result = IngestionService._process_url(uk_data_source, system, self.URL)
+        after = SourceDocument.objects.get(source_url=self.URL)
+        assert result["not_modified"] is True and result["new_version"] is False
+        assert after.fetched_at == before.fetched_at
+        assert after.last_checked_at > before.last_checked_at
+
+    def test_changed_content_adds_version_and_diff_to_same_document(self, uk_data_source):
+        from data_ingestion.models.document_diff import DocumentDiff
+        from data_ingestion.models.source_document import SourceDocument
+
+        system = _FakeIngestionSystem([_ok("Salary: 38700\n"), _ok("Salary: 41700\n", etag='"v2"')])
+        IngestionService._process_url(uk_data_source, system, self.URL)
+        result = IngestionService._process_url(uk_data_source, system, self.URL)
+
+        assert result["new_version"] is True and result["diff_created"] is True
+        source_doc = SourceDocument.objects.get(source_url=self.URL)
+        assert source_doc.raw_content == "Salary: 41700\n"
+        assert source_doc.document_versions.count() == 2
+        assert DocumentDiff.objects.filter(new_version__source_document=source_doc).count() == 1
+
+    def test_reverted_content_becomes_latest_version_again(self, uk_data_source):
+        from data_ingestion.models.document_diff import DocumentDiff
+        from data_ingestion.models.source_document import SourceDocument
+        from data_ingestion.selectors.document_version_selector import DocumentVersionSelector
+
+        system = _FakeIngestionSystem([_ok("Salary: 38700\n"), _ok("Salary: 41700\n"), _ok("Salary: 38700\n")])
+        for _ in range(3):
+            result = IngestionService._process_url(uk_data_source, system, self.URL)
+
+        assert result["reverted"] is True and result["unchanged"] is False
+        assert result["diff_created"] is True
+        source_doc = SourceDocument.objects.get(source_url=self.URL)
+        assert source_doc.document_versions.count() == 2
+        assert DocumentVersionSelector.get_latest_by_source_document(source_doc).raw_text == "Salary: 38700\n"
+        assert source_doc.raw_content == "Salary: 38700\n"
+        assert DocumentDiff.objects.filter(new_version__source_document=source_doc).count() == 2
+
+        # Fetching the reverted content again is unchanged
+        system.responses.append(_ok("Salary: 38700\n"))
+        assert IngestionService._process_url(uk_data_source, system, self.URL)["unchanged"] is True
+
+    def test_full_response_without_etag_clears_stored_etag(self, uk_data_source):
+        from data_ingestion.models.source_document import SourceDocument
+
+        system = _FakeIngestionSystem([_ok("Salary: 38700\n"), _ok("Salary: 41700\n", etag=None)])
+        IngestionService._process_url(uk_data_source, system, self.URL)
+        assert SourceDocument.objects.get(source_url=self.URL).etag == '"v1"'
+
+        IngestionService._process_url(uk_data_source, system, self.URL)
+        assert SourceDocument.objects.get(source_url=self.URL).etag is None
+
+    def test_legacy_per_fetch_documents_are_merged_into_latest_version_owner(self, uk_data_source):
+        from importlib import import_module
+
+        from django.apps import apps
+        from data_ingestion.models.document_diff import DocumentDiff
+        from data_ingestion.models.source_document import SourceDocument
+        from data_ingestion.repositories.document_version_repository import DocumentVersionRepository
+        from data_ingestion.repositories.source_document_repository import SourceDocumentRepository
+
+        migration = import_module("data_ingestion.migrations.0009_merge_legacy_source_documents")
+
+        # One document per fetch, versions on the document that first stored their content
+        documents = [
+            SourceDocumentRepository.create_source_document(uk_data_source, self.URL, content, "text/plain", 200)
+            for content in ("Salary: 38700\n", "Salary: 38700\n", "Salary: 41700\n", "Salary: 41700\n")
+        ]
+        DocumentVersionRepository.create_document_version(documents[0], "Salary: 38700\n")
+        latest = DocumentVersionRepository.create_document_version(documents[2], "Salary: 41700\n")
+
+        migration.merge_legacy_source_documents(apps, None)
+
+        kept = SourceDocument.objects.get(source_url=self.URL, is_deleted=False)
+        assert kept.id == documents[2].id
+        assert kept.document_versions.count() == 2
+        assert kept.fetched_at == documents[3].fetched_at
+
+        system = _FakeIngestionSystem([_ok("Salary: 45000\n")])
+        result = IngestionService._process_url(uk_data_source, system, self.URL)
+        assert result["new_version"] is True and result["diff_created"] is True
+        assert DocumentDiff.objects.get(new_version__source_document=kept).old_version_id == latest.id
+
+    def test_validators_are_recorded_only_after_content_is_processed(self, uk_data_source):
+        from data_ingestion.models.source_document import SourceDocument
+
+        system = _FakeIngestionSystem([_ok("Salary: 38700\n"), _ok("Salary: 38700\n")])
+        system.extract_text = MagicMock(side_effect=RuntimeError("extraction failed"))
+        with pytest.raises(RuntimeError):
+            IngestionService._process_url(uk_data_source, system, self.URL)
+        # Stored, but without the ETag: the next fetch is not answered with 304
+        source_doc = SourceDocument.objects.get(source_url=self.URL)
+        assert source_doc.raw_content == "Salary: 38700\n" and source_doc.etag is None
+
+        system.extract_text = lambda raw_content, content_type: raw_content
+        assert IngestionService._process_url(uk_data_source, system, self.URL)["new_version"] is True
+        assert system.validators[1]["etag"] is None
+        assert SourceDocument.objects.get(source_url=self.URL).etag == '"v1"'
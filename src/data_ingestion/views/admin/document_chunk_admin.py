@@ -258,7 +258,7 @@ class BulkDocumentChunkOperationAPI(BaseBulkOperationAPI):
             return DocumentChunkService.delete_document_chunk(str(entity.id))
         elif operation == 're_embed':
             # Get model from validated_data if provided, otherwise use default
-            model = validated_data.get('model', 'text-embedding-ada-002')
+            model = validated_data.get('model')
             return DocumentChunkService.regenerate_embedding(str(entity.id), model=model)
         else:
             raise ValueError(f"Invalid operation: {operation}. Supported operations: delete, re_embed")
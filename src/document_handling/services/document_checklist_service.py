@@ -130,7 +130,10 @@ class DocumentChecklistService:
                     try:
                         conditional_result = RuleEngineService.evaluate_expression(
                             requirement.conditional_logic,
-                            case_facts
+                            case_facts,
+                            required_variables=RuleEngineService.get_indexed_variables(
+                                requirement, requirement.conditional_logic
+                            )
                         )
                         
                         # evaluate_expression always returns a dict with 'passed', 'result', 'error', 'missing_facts'
@@ -122,7 +122,10 @@ class DocumentRequirementMatchingService:
                     # Evaluate conditional logic against case facts
                     conditional_result = RuleEngineService.evaluate_expression(
                         matching_requirement.conditional_logic,
-                        case_facts
+                        case_facts,
+                        required_variables=RuleEngineService.get_indexed_variables(
+                            matching_requirement, matching_requirement.conditional_logic
+                        )
                     )
                     
                     # evaluate_expression always returns a dict with 'passed', 'result', 'error', 'missing_facts'
@@ -2,26 +2,62 @@
 HTTP client for external HTTP requests.
 
 Provides a centralized, production-ready HTTP client with:
-- Retry logic
-- Rate limiting
+- Pooled keep-alive connections shared per host (see main_system.utils.request.session_pool)
+- Retry logic (idempotent methods; POST only when opted in)
+- Rate limiting (optional per-attempt limiter)
 - Error handling
 - Request/response logging
 - Timeout configuration
 """
 
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 from main_system.utils.request.client import Client
 from tenacity import (
     retry,
-    stop_after_attempt,
     wait_exponential,
-    retry_if_exception_type
+    retry_if_exception
 )
 import requests
 
 logger = logging.getLogger('django')
 
+# Status codes worth retrying; other 4xx responses fail the same way again
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+_exponential_backoff = wait_exponential(multiplier=1, min=2, max=30)
+
+
+def _is_transient(exception: BaseException) -> bool:
+    """Connection errors, timeouts and 429/5xx responses."""
+    if isinstance(exception, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+        return True
+    if isinstance(exception, requests.exceptions.HTTPError):
+        response = exception.response
+        return response is not None and response.status_code in RETRYABLE_STATUS_CODES
+    return False
+
+
+def _stop_after_max_retries(retry_state) -> bool:
+    client = retry_state.args[0]
+    return retry_state.attempt_number >= max(1, client.max_retries)
+
+
+def _wait_backoff(retry_state) -> float:
+    client = retry_state.args[0]
+    return _exponential_backoff(retry_state) if client.retry_backoff else 0
+
+
+# Retry policy of ExternalHTTPClient methods, configured per instance
+# (max_retries attempts, exponential backoff when retry_backoff). Each attempt
+# calls the client's rate limiter, so retries are throttled like first requests.
+retry_transient = retry(
+    stop=_stop_after_max_retries,
+    wait=_wait_backoff,
+    retry=retry_if_exception(_is_transient),
+    reraise=True
+)
+
 
 class ExternalHTTPClient:
     """
@@ -40,7 +76,9 @@ class ExternalHTTPClient:
         base_url: str,
         default_timeout: int = 30,
         max_retries: int = 3,
-        retry_backoff: bool = True
+        retry_backoff: bool = True,
+        rate_limiter: Optional[Callable[[str], Any]] = None,
+        retry_non_idempotent: bool = False
     ):
         """
         Initialize external HTTP client.
@@ -50,12 +88,24 @@ class ExternalHTTPClient:
             default_timeout: Default timeout in seconds
             max_retries: Maximum number of retry attempts
             retry_backoff: Whether to use exponential backoff
+            rate_limiter: Optional callable taking the request URL, called before every
+                attempt (e.g. HostRateLimiter.acquire)
+            retry_non_idempotent: Also retry POST requests (only safe if the API
+                deduplicates them, e.g. with idempotency keys)
         """
         self.base_url = base_url.rstrip('/')
         self.default_timeout = default_timeout
         self.max_retries = max_retries
         self.retry_backoff = retry_backoff
-        self.client = Client(base_url=base_url)
+        self.rate_limiter = rate_limiter
+        self.retry_non_idempotent = retry_non_idempotent
+        # Shares the pooled session of every client for the same host
+        self.client = Client(base_url=self.base_url)
+    
+    def _throttle(self, endpoint: str) -> None:
+        """Wait for the rate limiter before an attempt."""
+        if self.rate_limiter is not None:
+            self.rate_limiter(f"{self.base_url}{endpoint}")
     
     def get(
         self,
@@ -83,18 +133,14 @@ class ExternalHTTPClient:
         
         if return_details:
             return self._get_with_details(endpoint, headers, params, timeout)
-        else:
+        
+        try:
             return self._get_with_retry(endpoint, headers, params, timeout)
+        except Exception as e:
+            logger.error(f"GET request failed for {endpoint}: {e}")
+            return None
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
-        retry=retry_if_exception_type((
-            requests.exceptions.ConnectionError,
-            requests.exceptions.Timeout,
-            requests.exceptions.HTTPError
-        ))
-    )
+    @retry_transient
     def _get_with_retry(
         self,
         endpoint: str,
@@ -103,12 +149,9 @@ class ExternalHTTPClient:
         timeout: Optional[int] = None
     ) -> Optional[Dict[str, Any]]:
         """Make GET request with retry logic."""
-        try:
-            logger.debug(f"GET {self.base_url}{endpoint}")
-            return self.client.get(endpoint, headers, params)
-        except Exception as e:
-            logger.error(f"GET request failed for {endpoint}: {e}")
-            raise
+        self._throttle(endpoint)
+        logger.debug(f"GET {self.base_url}{endpoint}")
+        return self.client.request('GET', endpoint, timeout=timeout, headers=headers, params=params).json()
     
     def _get_with_details(
         self,
@@ -117,18 +160,26 @@ class ExternalHTTPClient:
         params: Optional[Dict[str, Any]] = None,
         timeout: Optional[int] = None
     ) -> Dict[str, Any]:
-        """Make GET request and return detailed response."""
+        """Make GET request (retrying transient failures) and return detailed response."""
         try:
-            logger.debug(f"GET {self.base_url}{endpoint}")
-            return self.client.get_with_details(endpoint, headers, params, timeout)
+            response = self._get_response_with_retry(endpoint, headers, params, timeout)
+            return Client.response_details(response, endpoint)
         except Exception as e:
             logger.error(f"GET request failed for {endpoint}: {e}")
-            return {
-                'content': None,
-                'content_type': None,
-                'status_code': None,
-                'error': str(e)
-            }
+            return Client.error_details(e)
+    
+    @retry_transient
+    def _get_response_with_retry(
+        self,
+        endpoint: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None
+    ) -> requests.Response:
+        """Make GET request with retry logic and return the raw response (304 included)."""
+        self._throttle(endpoint)
+        logger.debug(f"GET {self.base_url}{endpoint}")
+        return self.client.request('GET', endpoint, timeout=timeout, headers=headers, params=params)
     
     def post(
         self,
@@ -153,33 +204,26 @@ class ExternalHTTPClient:
         
         try:
             logger.debug(f"POST {self.base_url}{endpoint}")
-            return self._post_with_retry(endpoint, data, headers, timeout)
+            # POST is not idempotent: a timed-out request may have been applied
+            send = self._post_with_retry if self.retry_non_idempotent else self._post_once
+            return send(endpoint, data, headers, timeout)
         except Exception as e:
             logger.error(f"POST request failed for {endpoint}: {e}")
             return None
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
-        retry=retry_if_exception_type((
-            requests.exceptions.ConnectionError,
-            requests.exceptions.Timeout,
-            requests.exceptions.HTTPError
-        ))
-    )
-    def _post_with_retry(
+    def _post_once(
         self,
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[int] = None
     ) -> Optional[Dict[str, Any]]:
-        """Make POST request with retry logic."""
-        try:
-            return self.client.post(endpoint, data or {}, headers)
-        except Exception as e:
-            logger.error(f"POST request failed for {endpoint}: {e}")
-            raise
+        """Make a single POST request."""
+        self._throttle(endpoint)
+        return self.client.request('POST', endpoint, timeout=timeout, json=data or {}, headers=headers).json()
+    
+    # POST with retry logic, used when the client opts in (retry_non_idempotent)
+    _post_with_retry = retry_transient(_post_once)
     
     def put(
         self,
@@ -209,15 +253,7 @@ class ExternalHTTPClient:
             logger.error(f"PUT request failed for {endpoint}: {e}")
             return None
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
-        retry=retry_if_exception_type((
-            requests.exceptions.ConnectionError,
-            requests.exceptions.Timeout,
-            requests.exceptions.HTTPError
-        ))
-    )
+    @retry_transient
     def _put_with_retry(
         self,
         endpoint: str,
@@ -226,11 +262,8 @@ class ExternalHTTPClient:
         timeout: Optional[int] = None
     ) -> Optional[Dict[str, Any]]:
         """Make PUT request with retry logic."""
-        try:
-            return self.client.put(endpoint, data or {}, headers)
-        except Exception as e:
-            logger.error(f"PUT request failed for {endpoint}: {e}")
-            raise
+        self._throttle(endpoint)
+        return self.client.request('PUT', endpoint, timeout=timeout, json=data or {}, headers=headers).json()
     
     def delete(
         self,
@@ -258,15 +291,7 @@ class ExternalHTTPClient:
             logger.error(f"DELETE request failed for {endpoint}: {e}")
             return None
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
-        retry=retry_if_exception_type((
-            requests.exceptions.ConnectionError,
-            requests.exceptions.Timeout,
-            requests.exceptions.HTTPError
-        ))
-    )
+    @retry_transient
     def _delete_with_retry(
         self,
         endpoint: str,
@@ -274,8 +299,5 @@ class ExternalHTTPClient:
         timeout: Optional[int] = None
     ) -> Optional[Dict[str, Any]]:
         """Make DELETE request with retry logic."""
-        try:
-            return self.client.delete(endpoint, headers)
-        except Exception as e:
-            logger.error(f"DELETE request failed for {endpoint}: {e}")
-            raise
+        self._throttle(endpoint)
+        return self.client.request('DELETE', endpoint, timeout=timeout, headers=headers).json()
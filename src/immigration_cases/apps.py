@@ -6,4 +6,4 @@ class ImmigrationCasesConfig(AppConfig):
     name = "immigration_cases"
 
     def ready(self):
-        from .signals import case_signals
+        from .signals import case_signals, case_fact_signals
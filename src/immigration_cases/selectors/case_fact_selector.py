@@ -1,10 +1,22 @@
+from typing import Any, Dict
+from django.db import connection
 from immigration_cases.models.case_fact import CaseFact
 from immigration_cases.models.case import Case
+from main_system.utils.cache_utils import cache_get, cache_set, get_namespace_version, make_cache_key
 
 
 class CaseFactSelector:
     """Selector for CaseFact read operations."""
 
+    # Latest-facts snapshots are keyed by the per-case namespace version, which
+    # CaseFact post_save/post_delete signals bump; the TTL only bounds memory.
+    LATEST_FACTS_CACHE_TIMEOUT = 3600
+
+    @staticmethod
+    def case_facts_cache_namespace(case_id) -> str:
+        """Cache namespace for a case's facts (bumped on every fact write)."""
+        return f"case_facts:{case_id}"
+
     @staticmethod
     def get_all(use_cache: bool = False):
         """Get all case facts."""
@@ -35,6 +47,45 @@ class CaseFactSelector:
             fact_key=fact_key
         ).order_by('-created_at').first()
 
+    @staticmethod
+    def get_latest_facts(case_id, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Get the current value of every fact key for a case as a dict.
+        
+        One query: DISTINCT ON (fact_key) where the backend supports it, otherwise a
+        single ordered values query deduplicated in Python (latest wins). Results are
+        cached per case until the next fact write.
+        """
+        cache_key = None
+        if use_cache:
+            ns = CaseFactSelector.case_facts_cache_namespace(case_id)
+            cache_key = make_cache_key(
+                namespace=ns,
+                namespace_version=get_namespace_version(ns),
+                func_qualname='CaseFactSelector.get_latest_facts',
+                user_scope='global',
+                user_id='global',
+                key_material={'case_id': str(case_id)},
+            )
+            cached = cache_get(cache_key)
+            if cached is not None:
+                return dict(cached)
+        
+        queryset = CaseFact.objects.filter(case_id=case_id)
+        if connection.features.can_distinct_on_fields:
+            rows = queryset.order_by('fact_key', '-created_at').distinct('fact_key').values_list(
+                'fact_key', 'fact_value'
+            )
+            facts = dict(rows)
+        else:
+            facts = {}
+            for fact_key, fact_value in queryset.order_by('-created_at').values_list('fact_key', 'fact_value'):
+                facts.setdefault(fact_key, fact_value)
+        
+        if cache_key is not None:
+            cache_set(cache_key, facts, timeout=CaseFactSelector.LATEST_FACTS_CACHE_TIMEOUT)
+        return dict(facts)
+
     @staticmethod
     def get_by_source(source: str):
         """Get facts by source."""
@@ -1,7 +1,14 @@
 from .case_signals import handle_case_status_change, store_previous_status
+from .case_fact_signals import (
+    invalidate_case_facts_cache,
+    invalidate_case_facts_cache_on_delete,
+    store_previous_fact_key,
+)
 
 __all__ = [
     'handle_case_status_change',
     'store_previous_status',
+    'invalidate_case_facts_cache',
+    'invalidate_case_facts_cache_on_delete',
+    'store_previous_fact_key',
 ]
-
@@ -0,0 +1,94 @@
+"""
+Signals for CaseFact model.
+"""
+import logging
+import threading
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_save
+from django.dispatch import receiver
+from immigration_cases.models.case_fact import CaseFact
+from immigration_cases.selectors.case_fact_selector import CaseFactSelector
+from main_system.utils.cache_utils import bump_namespace
+
+logger = logging.getLogger('django')
+
+# Fact keys changed per case, waiting for the transaction to commit (per thread)
+_pending_rechecks = threading.local()
+
+
+def _invalidate_case_facts(case_id) -> None:
+    """
+    Bump the case's facts namespace now and again on commit.
+
+    A reader running between the write and the commit (fact writes are atomic) would
+    otherwise cache the pre-commit facts under the new namespace version.
+    """
+    namespace = CaseFactSelector.case_facts_cache_namespace(case_id)
+    bump_namespace(namespace)
+    transaction.on_commit(lambda: bump_namespace(namespace))
+
+
+def _schedule_eligibility_recheck(case_id, fact_keys) -> None:
+    """
+    Queue an incremental eligibility re-check of the case once the write commits.
+
+    Opt-in (ELIGIBILITY_RECHECK_ON_FACT_CHANGE). Keys changed by several writes in one
+    transaction are collected together; EligibilityRecheckQueue then debounces the
+    writes of the following seconds into one re-check. Keys of a rolled-back write are
+    sent with the next write of the case (re-evaluating a requirement that did not
+    change is harmless).
+    """
+    if not getattr(settings, 'ELIGIBILITY_RECHECK_ON_FACT_CHANGE', False):
+        return
+    pending = getattr(_pending_rechecks, 'keys', None)
+    if pending is None:
+        pending = _pending_rechecks.keys = {}
+    pending.setdefault(str(case_id), set()).update(key for key in fact_keys if key)
+    transaction.on_commit(lambda: _enqueue_eligibility_recheck(str(case_id)))
+
+
+def _enqueue_eligibility_recheck(case_id: str) -> None:
+    changed_fact_keys = getattr(_pending_rechecks, 'keys', {}).pop(case_id, None)
+    if not changed_fact_keys:
+        return  # Already sent by an earlier callback of the same transaction
+    try:
+        from ai_decisions.helpers.eligibility_recheck import EligibilityRecheckQueue
+        from ai_decisions.tasks.ai_reasoning_tasks import run_eligibility_recheck_task
+
+        first_seq = EligibilityRecheckQueue.add(case_id, changed_fact_keys)
+        if first_seq is not None:
+            run_eligibility_recheck_task.apply_async(
+                args=(case_id, first_seq), countdown=EligibilityRecheckQueue.debounce_seconds()
+            )
+    except Exception as e:
+        logger.error(f"Failed to queue eligibility re-check for case {case_id}: {e}", exc_info=True)
+
+
+@receiver(pre_save, sender=CaseFact)
+def store_previous_fact_key(sender, instance, **kwargs):
+    """
+    Store the fact key before an update (a renamed fact changes both keys).
+    """
+    if instance._state.adding:
+        instance._previous_fact_key = None
+    else:
+        instance._previous_fact_key = (
+            CaseFact.objects.filter(pk=instance.pk).values_list('fact_key', flat=True).first()
+        )
+
+
+@receiver(post_save, sender=CaseFact)
+def invalidate_case_facts_cache(sender, instance, **kwargs):
+    """Invalidate the case's latest-facts snapshot when a fact is saved."""
+    _invalidate_case_facts(instance.case_id)
+    _schedule_eligibility_recheck(
+        instance.case_id, [instance.fact_key, getattr(instance, '_previous_fact_key', None)]
+    )
+
+
+@receiver(post_delete, sender=CaseFact)
+def invalidate_case_facts_cache_on_delete(sender, instance, **kwargs):
+    """Invalidate the case's latest-facts snapshot when a fact is deleted."""
+    _invalidate_case_facts(instance.case_id)
+    _schedule_eligibility_recheck(instance.case_id, [instance.fact_key])
@@ -133,3 +133,31 @@ class TestCaseFactService:
 
         assert case_fact_service.delete_case_fact(str(fact.id)) is False
 
+    def test_latest_facts_snapshot_refreshes_on_fact_writes(self, case_fact_service, paid_case_with_fact):
+        from immigration_cases.selectors.case_fact_selector import CaseFactSelector
+
+        case, fact = paid_case_with_fact
+        assert CaseFactSelector.get_latest_facts(case.id) == {"age": 30}
+
+        case_fact_service.create_case_fact(case_id=str(case.id), fact_key="age", fact_value=31, source="user")
+        case_fact_service.create_case_fact(case_id=str(case.id), fact_key="salary", fact_value=42000, source="user")
+        assert CaseFactSelector.get_latest_facts(case.id) == {"age": 31, "salary": 42000}
+
+        case_fact_service.update_case_fact(str(fact.id), fact_key="nationality", fact_value="NG")
+        assert CaseFactSelector.get_latest_facts(case.id) == {
+            "age": 31, "salary": 42000, "nationality": "NG"
+        }
+
+    def test_fact_write_bumps_snapshot_namespace_again_on_commit(
+        self, case_fact_service, paid_case_with_fact, django_capture_on_commit_callbacks
+    ):
+        from immigration_cases.selectors.case_fact_selector import CaseFactSelector
+        from main_system.utils.cache_utils import get_namespace_version
+
+        case, _fact = paid_case_with_fact
+        namespace = CaseFactSelector.case_facts_cache_namespace(case.id)
+        with django_capture_on_commit_callbacks(execute=True):
+            case_fact_service.create_case_fact(case_id=str(case.id), fact_key="age", fact_value=31, source="user")
+            # A reader before the commit would cache under this version
+            version_before_commit = get_namespace_version(namespace)
+        assert get_namespace_version(namespace) != version_before_commit
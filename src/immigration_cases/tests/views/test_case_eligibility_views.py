@@ -105,6 +105,7 @@ class TestCaseEligibilityEndpoints:
         check_result.requires_human_review = False
         check_result.reasoning_summary = "ok"
         check_result.warnings = []
+        check_result.ai_reasoning_timed_out = False
 
         monkeypatch.setattr(
             eligibility_check_service_module.EligibilityCheckService,
@@ -152,6 +153,7 @@ class TestCaseEligibilityEndpoints:
         check_result.requires_human_review = False
         check_result.reasoning_summary = "ok"
         check_result.warnings = []
+        check_result.ai_reasoning_timed_out = False
 
         monkeypatch.setattr(
             eligibility_check_service_module.EligibilityCheckService,
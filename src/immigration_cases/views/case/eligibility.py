@@ -135,26 +135,45 @@ class CaseEligibilityCheckAPI(AuthAPI):
         results = []
         all_requires_review = False
         low_confidence_flags = []
+        ai_timeouts = []  # Visa codes whose AI reasoning timed out (rule engine outcome used)
         errors = []  # Track errors for individual visa types
         
+        # Validate visa types exist
+        visa_types = {}
         for visa_type_id in visa_type_ids:
+            visa_type = VisaTypeSelector.get_by_id(visa_type_id)
+            if not visa_type:
+                errors.append({
+                    'visa_type_id': visa_type_id,
+                    'error': 'Visa type not found'
+                })
+                logger.warning(f"Visa type {visa_type_id} not found for eligibility check")
+                continue
+            visa_types[visa_type_id] = visa_type
+        
+        # Rule pass runs as one batch; AI reasoning fans out over a bounded pool
+        # (ELIGIBILITY_CHECK_MAX_WORKERS) with a per-visa-type timeout
+        check_results = {}
+        if visa_types:
             try:
-                # Validate visa type exists
-                visa_type = VisaTypeSelector.get_by_id(visa_type_id)
-                if not visa_type:
-                    errors.append({
-                        'visa_type_id': visa_type_id,
-                        'error': 'Visa type not found'
-                    })
-                    logger.warning(f"Visa type {visa_type_id} not found for eligibility check")
-                    continue
-                
-                # Run eligibility check
-                check_result = EligibilityCheckService.run_eligibility_check(
+                check_results = EligibilityCheckService.run_multi_visa_eligibility_check(
                     case_id=str(case.id),
-                    visa_type_id=visa_type_id,
+                    visa_type_ids=list(visa_types.keys()),
                     enable_ai_reasoning=enable_ai_reasoning
                 )
+            except Exception as e:
+                logger.error(f"Error running eligibility checks for case {case.id}: {e}", exc_info=True)
+                for visa_type_id, visa_type in visa_types.items():
+                    errors.append({
+                        'visa_type_id': visa_type_id,
+                        'visa_code': visa_type.code,
+                        'error': f"Internal error: {str(e)}"
+                    })
+                visa_types = {}
+        
+        for visa_type_id, visa_type in visa_types.items():
+            try:
+                check_result = check_results.get(visa_type_id)
                 
                 if not check_result:
                     errors.append({
@@ -207,10 +226,14 @@ class CaseEligibilityCheckAPI(AuthAPI):
                     'citations': self._get_citations_for_result(check_result.eligibility_result_id) if check_result.eligibility_result_id else [],
                     'reasoning_summary': check_result.reasoning_summary,
                     'warnings': check_result.warnings if hasattr(check_result, 'warnings') else [],
+                    'ai_reasoning_timed_out': check_result.ai_reasoning_timed_out,
                 }
                 
                 results.append(result_data)
                 
+                if check_result.ai_reasoning_timed_out:
+                    ai_timeouts.append(visa_type.code)
+                
                 # Track review requirements
                 if check_result.requires_human_review:
                     all_requires_review = True
@@ -259,7 +282,8 @@ class CaseEligibilityCheckAPI(AuthAPI):
                 'successful': len(results),
                 'failed': len(errors),
                 'requires_review': all_requires_review,
-                'low_confidence_count': len(low_confidence_flags)
+                'low_confidence_count': len(low_confidence_flags),
+                'ai_reasoning_timeouts': len(ai_timeouts)
             },
             'generated_at': timezone.now().isoformat()
         }
@@ -271,6 +295,12 @@ class CaseEligibilityCheckAPI(AuthAPI):
         elif errors:
             message = f"Eligibility check completed. {len(results)} succeeded, {len(errors)} failed."
             status_code = status.HTTP_207_MULTI_STATUS
+        elif ai_timeouts:
+            message = (
+                f"Eligibility check completed. AI reasoning timed out for {len(ai_timeouts)} "
+                f"visa type(s); rule engine outcome used."
+            )
+            status_code = status.HTTP_207_MULTI_STATUS
         else:
             message = "Eligibility check completed successfully."
             status_code = status.HTTP_200_OK
@@ -97,9 +97,119 @@ SESSION_COOKIE_NAME = "sessionid"
 FINGERPRINT_COOKIE_NAME = "fingerprint"
 MFA_VERIFIED_COOKIE_NAME = "mfa_verified"
 
+# Outbound HTTP: one pooled keep-alive session per host shared by all clients
+# (main_system.utils.request.session_pool). POOL_MAXSIZE connections are kept per
+# host; POOL_BLOCK waits for a free one instead of opening extras. HTTP2 needs httpx[http2].
+HTTP_CLIENT_POOL_CONNECTIONS = env.int('HTTP_CLIENT_POOL_CONNECTIONS', default=10)
+HTTP_CLIENT_POOL_MAXSIZE = env.int('HTTP_CLIENT_POOL_MAXSIZE', default=10)
+HTTP_CLIENT_POOL_BLOCK = env.bool('HTTP_CLIENT_POOL_BLOCK', default=False)
+HTTP_CLIENT_HTTP2 = env.bool('HTTP_CLIENT_HTTP2', default=False)
+
 # UK INGESTION API
 UK_GOV_API_BASE_URL = env('UK_GOV_API_BASE_URL')
 
+# Ingestion crawl: requests per second (token bucket, shared by all threads in a
+# process) and burst per host, concurrent discovery requests, and URLs processed
+# concurrently per ingestion run (1 = sequential).
+INGESTION_CRAWL_REQUESTS_PER_SECOND = env.float('INGESTION_CRAWL_REQUESTS_PER_SECOND', default=2.0)
+INGESTION_CRAWL_BURST = env.int('INGESTION_CRAWL_BURST', default=2)
+INGESTION_CRAWL_MAX_IN_FLIGHT = env.int('INGESTION_CRAWL_MAX_IN_FLIGHT', default=4)
+INGESTION_PROCESS_MAX_WORKERS = env.int('INGESTION_PROCESS_MAX_WORKERS', default=1)
+
+# Queued ingestion pipeline (data_ingestion.tasks.pipeline_tasks): when enabled, each
+# URL flows through Celery stages on their own queues (ingestion_fetch,
+# ingestion_normalize, ingestion_diff, ingestion_embed, ingestion_parse), so
+# e.g. `celery -A main_system worker -Q ingestion_parse --concurrency=2` scales LLM
+# parsing separately from `-Q ingestion_fetch,ingestion_normalize,ingestion_diff`.
+# STAGE_CONCURRENCY caps running tasks per stage across all workers; STAGE_MAX_PENDING
+# holds back the stages feeding a backlogged stage (0 = unlimited). The embed stage
+# is off by default: rule publishing embeds with visa_code metadata and skips
+# versions that already have chunks.
+INGESTION_PIPELINE_ENABLED = env.bool('INGESTION_PIPELINE_ENABLED', default=False)
+INGESTION_PIPELINE_EMBED_ENABLED = env.bool('INGESTION_PIPELINE_EMBED_ENABLED', default=False)
+INGESTION_PIPELINE_STAGE_CONCURRENCY = {
+    'fetch': env.int('INGESTION_PIPELINE_FETCH_CONCURRENCY', default=8),
+    'normalize': env.int('INGESTION_PIPELINE_NORMALIZE_CONCURRENCY', default=0),
+    'diff': env.int('INGESTION_PIPELINE_DIFF_CONCURRENCY', default=0),
+    'embed': env.int('INGESTION_PIPELINE_EMBED_CONCURRENCY', default=4),
+    'parse': env.int('INGESTION_PIPELINE_PARSE_CONCURRENCY', default=2),
+}
+INGESTION_PIPELINE_STAGE_MAX_PENDING = {
+    'normalize': env.int('INGESTION_PIPELINE_NORMALIZE_MAX_PENDING', default=500),
+    'diff': env.int('INGESTION_PIPELINE_DIFF_MAX_PENDING', default=500),
+    'embed': env.int('INGESTION_PIPELINE_EMBED_MAX_PENDING', default=200),
+    'parse': env.int('INGESTION_PIPELINE_PARSE_MAX_PENDING', default=100),
+}
+INGESTION_PIPELINE_RETRY_DELAY_SECONDS = env.int('INGESTION_PIPELINE_RETRY_DELAY_SECONDS', default=30)
+
+# Rule Engine
+# Three-valued evaluation: decide requirements from the facts present when the
+# missing ones cannot change the result (e.g. a satisfied `or` branch).
+RULE_ENGINE_THREE_VALUED = env.bool('RULE_ENGINE_THREE_VALUED', default=False)
+
+# Multi-visa eligibility checks: AI reasoning calls run concurrently when > 1
+# (the rule pass always runs as one batch); per-visa-type AI timeout in seconds.
+ELIGIBILITY_CHECK_MAX_WORKERS = env.int('ELIGIBILITY_CHECK_MAX_WORKERS', default=1)
+ELIGIBILITY_CHECK_AI_TIMEOUT_SECONDS = env.int('ELIGIBILITY_CHECK_AI_TIMEOUT_SECONDS', default=60)
+# Opt-in: re-check evaluated cases (rule engine only) when their facts change,
+# re-evaluating only the requirements that reference the changed fact keys. Writes to
+# a case within the debounce window are batched into one re-check.
+ELIGIBILITY_RECHECK_ON_FACT_CHANGE = env.bool('ELIGIBILITY_RECHECK_ON_FACT_CHANGE', default=False)
+ELIGIBILITY_RECHECK_DEBOUNCE_SECONDS = env.int('ELIGIBILITY_RECHECK_DEBOUNCE_SECONDS', default=30)
+
+# pgvector ANN recall knobs for PgVectorService.search_similar (unset = pgvector defaults:
+# hnsw.ef_search 40, ivfflat.probes 1). Per-query overrides are passed to search_similar.
+VECTOR_SEARCH_HNSW_EF_SEARCH = env.int('VECTOR_SEARCH_HNSW_EF_SEARCH', default=None)
+VECTOR_SEARCH_IVFFLAT_PROBES = env.int('VECTOR_SEARCH_IVFFLAT_PROBES', default=None)
+
+# Stored/searched representation of chunk embeddings: 'vector' (float32), 'halfvec'
+# (float16 index, half the size) or 'binary' (bit index, 32x smaller; Hamming shortlist of
+# limit * VECTOR_SEARCH_BINARY_RERANK_FACTOR rows re-ranked on the float vectors).
+# Rebuild the index with `manage.py manage_vector_index --precision ...` when changing it.
+VECTOR_SEARCH_PRECISION = env('VECTOR_SEARCH_PRECISION', default='vector')
+VECTOR_SEARCH_BINARY_RERANK_FACTOR = env.int('VECTOR_SEARCH_BINARY_RERANK_FACTOR', default=4)
+
+# Similarity search backend behind PgVectorService: 'pgvector' (PostgreSQL) or 'numpy'
+# (in-process search over the chunk export at VECTOR_SEARCH_NUMPY_PATH, for offline
+# evaluation; see `manage.py benchmark_vector_search`).
+VECTOR_SEARCH_BACKEND = env('VECTOR_SEARCH_BACKEND', default='pgvector')
+VECTOR_SEARCH_NUMPY_PATH = env('VECTOR_SEARCH_NUMPY_PATH', default=None)
+
+# RAG retrieval mode for AI reasoning: 'vector' (cosine distance only) or 'hybrid'
+# (PostgreSQL full-text + vector, merged with reciprocal-rank fusion).
+VECTOR_SEARCH_MODE = env('VECTOR_SEARCH_MODE', default='vector')
+
+# Token budget for retrieved context in AI reasoning prompts. Near-duplicate chunks are
+# dropped and adjacent chunks merged before passages are added by relevance (0 = no limit).
+AI_REASONING_CONTEXT_TOKEN_BUDGET = env.int('AI_REASONING_CONTEXT_TOKEN_BUDGET', default=2000)
+
+# Reuse of LLM responses for AI reasoning with identical inputs (model, prompt template,
+# rule version and results, context chunks, normalized case facts), in the Django cache.
+# AI_REASONING_CACHE_SEMANTIC_THRESHOLD (e.g. 0.98) also reuses responses for facts whose
+# query embedding is at least that cosine-similar (unset = exact matches only).
+AI_REASONING_CACHE_ENABLED = env.bool('AI_REASONING_CACHE_ENABLED', default=True)
+AI_REASONING_CACHE_TTL_SECONDS = env.int('AI_REASONING_CACHE_TTL_SECONDS', default=86400)
+AI_REASONING_CACHE_SEMANTIC_THRESHOLD = env.float('AI_REASONING_CACHE_SEMANTIC_THRESHOLD', default=None)
+AI_REASONING_CACHE_SEMANTIC_CANDIDATES = env.int('AI_REASONING_CACHE_SEMANTIC_CANDIDATES', default=20)
+
+# Embedding model for document chunks and queries. EMBEDDING_DIMENSIONS shortens the
+# embeddings of text-embedding-3 models (unset = native size). Changing either requires
+# re-embedding all chunks and rebuilding the vector index (`manage_vector_index`).
+EMBEDDING_MODEL = env('EMBEDDING_MODEL', default='text-embedding-ada-002')
+EMBEDDING_DIMENSIONS = env.int('EMBEDDING_DIMENSIONS', default=None)
+
+# Embedding cache keyed by (sha256(text), model): in-process LRU in front of the
+# embedding_cache_entries table; only misses call the embedding API.
+EMBEDDING_CACHE_ENABLED = env.bool('EMBEDDING_CACHE_ENABLED', default=True)
+EMBEDDING_CACHE_MAX_ENTRIES = env.int('EMBEDDING_CACHE_MAX_ENTRIES', default=5000)
+# Persistent entries unused for this many days are deleted daily (0 = keep forever)
+EMBEDDING_CACHE_RETENTION_DAYS = env.int('EMBEDDING_CACHE_RETENTION_DAYS', default=90)
+
+# Document chunking for RAG: 'fixed' (character windows with overlap) or 'content_defined'
+# (boundaries stable under local edits, so unchanged chunks keep their embeddings across
+# document versions). Switching modes re-chunks and re-embeds documents as they change.
+DOCUMENT_CHUNKING_MODE = env('DOCUMENT_CHUNKING_MODE', default='fixed')
+
 # AI/LLM Services
 OPENAI_API_KEY = env('OPENAI_API_KEY', default=None)
 AI_CALLS_LLM_MODEL = env('AI_CALLS_LLM_MODEL', default='gpt-5.2')
@@ -245,6 +355,10 @@ CELERY_CACHE_BACKEND = 'django-cache'
 DJANGO_CELERY_RESULTS_TASK_ID_MAX_LENGTH = 255
 CELERY_TASK_TRACK_STARTED = True
 CELERY_TASK_TIME_LIMIT = 300  # 5 minutes
+CELERY_IMPORTS = (  # Register task modules not imported by their app's tasks package
+    'data_ingestion.tasks.pipeline_tasks',
+    'ai_decisions.tasks.embedding_cache_tasks',
+)
 CELERY_BEAT_MAX_LOOP_INTERVAL = 60  # 1 minute
 
 # Redbeat (Redis-based Celery Beat scheduler) Configuration
@@ -26,6 +26,13 @@ CELERY_BEAT_SCHEDULE = {
         'options': {'expires': 7200}  # Task expires after 2 hours
     },
     
+    # Daily pruning of persistent embedding cache entries that are no longer used
+    'prune-embedding-cache': {
+        'task': 'ai_decisions.tasks.embedding_cache_tasks.prune_embedding_cache_task',
+        'schedule': crontab(hour=4, minute=0),  # Run daily at 4 AM UTC
+        'options': {'expires': 3600}
+    },
+    
     # Daily check for SLA deadlines (review assignments approaching deadline)
     'check-review-sla-deadlines': {
         'task': 'human_reviews.tasks.review_tasks.check_review_sla_deadlines_task',
@@ -9,11 +9,22 @@ Why this exists:
 
 Public API mirrors the upstream library:
     - jsonLogic(logic, data)
+
+Additionally:
+    - compile_logic(logic) -> callable(data)
+      Pre-compiles an expression into nested closures (var paths pre-split, operators
+      resolved once) so the same rule can be evaluated many times without re-walking
+      the raw dict tree. Results are identical to `jsonLogic`.
+    - evaluate_partial(logic, data, missing_keys=None) -> PartialResult
+      Three-valued evaluation over incomplete data: absent vars are "unknown" rather
+      than None, `and`/`or`/`if`/`!` short-circuit over unknowns, and the result is
+      either determined or undetermined together with the facts that would decide it.
 """
 
 from __future__ import annotations
 
-from typing import Any, List, Optional
+import operator
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
 
 def _truthy(value: Any) -> bool:
@@ -78,6 +89,25 @@ def _get_var(data: Any, path: Any, default: Any = None) -> Any:
     return cur
 
 
+def _apply_method(target: Any, method_name: Any, method_args: List[Any]) -> Any:
+    if isinstance(target, str) and isinstance(method_name, str):
+        if method_name == "lower":
+            return target.lower()
+        if method_name == "upper":
+            return target.upper()
+        if method_name == "strip":
+            return target.strip()
+        if method_name == "startswith":
+            return target.startswith(str(method_args[0])) if method_args else False
+        if method_name == "endswith":
+            return target.endswith(str(method_args[0])) if method_args else False
+        if method_name == "replace":
+            if len(method_args) >= 2:
+                return target.replace(str(method_args[0]), str(method_args[1]))
+            return target
+    raise ValueError(f"Unsupported method operation: {method_name}")
+
+
 def jsonLogic(logic: Any, data: Any = None) -> Any:
     if data is None:
         data = {}
@@ -195,10 +225,13 @@ def jsonLogic(logic: Any, data: Any = None) -> Any:
 
     if op == "+":
         total = 0.0
+        has_float = False
         for a in args:
-            n = _to_number(jsonLogic(a, data))
+            v = jsonLogic(a, data)
+            has_float = has_float or isinstance(v, float)
+            n = _to_number(v)
             total += 0.0 if n is None else n
-        return total if any(isinstance(jsonLogic(a, data), float) for a in args) else int(total)
+        return total if has_float else int(total)
 
     if op == "-":
         if len(args) == 1:
@@ -327,25 +360,673 @@ def jsonLogic(logic: Any, data: Any = None) -> Any:
         target = jsonLogic(values[0], data)
         method_name = jsonLogic(values[1], data)
         method_args = [jsonLogic(v, data) for v in values[2:]]
-        if isinstance(target, str) and isinstance(method_name, str):
-            if method_name == "lower":
-                return target.lower()
-            if method_name == "upper":
-                return target.upper()
-            if method_name == "strip":
-                return target.strip()
-            if method_name == "startswith":
-                return target.startswith(str(method_args[0])) if method_args else False
-            if method_name == "endswith":
-                return target.endswith(str(method_args[0])) if method_args else False
-            if method_name == "replace":
-                if len(method_args) >= 2:
-                    return target.replace(str(method_args[0]), str(method_args[1]))
-                return target
-        raise ValueError(f"Unsupported method operation: {method_name}")
+        return _apply_method(target, method_name, method_args)
 
     raise ValueError(f"Unsupported JSON Logic operator: {op}")
 
 
-__all__ = ["jsonLogic"]
+# ---------------------------------------------------------------------------
+# Compiled evaluation
+# ---------------------------------------------------------------------------
+#
+# Each compiler receives the raw operator `values` and returns a closure taking
+# `data`. Errors that `jsonLogic` would raise while evaluating are deferred to call
+# time (via `_raiser`) so an invalid sub-expression in an untaken branch behaves
+# exactly like the interpreter.
+
+Compiled = Callable[[Any], Any]
+
+_MISSING = object()
+
+
+def _raiser(exc: Exception) -> Compiled:
+    def fn(data: Any) -> Any:
+        raise exc
+    return fn
+
+
+def _const(value: Any) -> Compiled:
+    return lambda data: value
+
+
+def _compile_path(path: Any) -> Tuple[Optional[Tuple[str, ...]], Any, bool]:
+    """
+    Pre-resolve a `var` path. Returns (parts, default, is_self_reference).
+    `parts` is None when the path can never resolve (non-string path).
+    """
+    default = None
+    if path is None:
+        return None, default, False
+    if isinstance(path, list):
+        if len(path) == 0:
+            return None, default, False
+        default = path[1] if len(path) > 1 else default
+        path = path[0]
+    if path == "":
+        return (), default, True
+    if not isinstance(path, str):
+        return None, default, False
+    return tuple(path.split(".")), default, False
+
+
+def _walk(data: Any, parts: Tuple[str, ...], default: Any) -> Any:
+    cur = data
+    for part in parts:
+        if cur is None:
+            return default
+        if isinstance(cur, dict):
+            if part in cur:
+                cur = cur[part]
+            else:
+                return default
+        elif isinstance(cur, list):
+            try:
+                idx = int(part)
+            except ValueError:
+                return default
+            if 0 <= idx < len(cur):
+                cur = cur[idx]
+            else:
+                return default
+        else:
+            return default
+    return cur
+
+
+def _compile_var(values: Any) -> Compiled:
+    parts, default, is_self = _compile_path(values)
+    if is_self:
+        return lambda data: data
+    if parts is None:
+        return _const(default)
+    if len(parts) == 1:
+        key = parts[0]
+
+        def fn(data: Any) -> Any:
+            if isinstance(data, dict):
+                return data[key] if key in data else default
+            return _walk(data, parts, default)
+        return fn
+    return lambda data: _walk(data, parts, default)
+
+
+def _compile_missing(values: Any) -> Compiled:
+    keys = values if isinstance(values, list) else [values]
+    resolved: List[Tuple[str, Any]] = []
+    for k in keys:
+        if isinstance(k, str):
+            parts, default, is_self = _compile_path(k)
+            resolved.append((k, (parts, default, is_self)))
+        else:
+            resolved.append((str(k), None))
+
+    def fn(data: Any) -> Any:
+        missing = []
+        for name, path in resolved:
+            if path is None:
+                missing.append(name)
+                continue
+            parts, default, is_self = path
+            v = data if is_self else (default if parts is None else _walk(data, parts, default))
+            if v is None:
+                missing.append(name)
+        return missing
+    return fn
+
+
+def _compile_missing_some(values: Any) -> Compiled:
+    if not isinstance(values, list) or len(values) != 2:
+        return _raiser(ValueError("missing_some expects [min_required, keys]"))
+    min_required_fn = _compile(values[0])
+    keys_fn = _compile(values[1])
+
+    def fn(data: Any) -> Any:
+        min_required = int(min_required_fn(data))
+        keys = keys_fn(data)
+        if not isinstance(keys, list):
+            raise ValueError("missing_some keys must be list")
+        present = 0
+        missing = []
+        for k in keys:
+            if not isinstance(k, str):
+                missing.append(str(k))
+                continue
+            v = _get_var(data, k, default=_MISSING)
+            if v is _MISSING or v is None:
+                missing.append(k)
+            else:
+                present += 1
+        if present >= min_required:
+            return []
+        return missing
+    return fn
+
+
+def _args(values: Any) -> List[Compiled]:
+    return [_compile(a) for a in (values if isinstance(values, list) else [values])]
+
+
+def _arg(compiled: List[Compiled], index: int) -> Compiled:
+    if index < len(compiled):
+        return compiled[index]
+    return _raiser(IndexError("list index out of range"))
+
+
+def _compile_not(values: Any) -> Compiled:
+    a = _arg(_args(values), 0)
+    return lambda data: not _truthy(a(data))
+
+
+def _compile_double_not(values: Any) -> Compiled:
+    a = _arg(_args(values), 0)
+    return lambda data: _truthy(a(data))
+
+
+def _compile_and(values: Any) -> Compiled:
+    args = _args(values)
+
+    def fn(data: Any) -> Any:
+        last = None
+        for a in args:
+            last = a(data)
+            if not _truthy(last):
+                return last
+        return last
+    return fn
+
+
+def _compile_or(values: Any) -> Compiled:
+    args = _args(values)
+
+    def fn(data: Any) -> Any:
+        last = None
+        for a in args:
+            last = a(data)
+            if _truthy(last):
+                return last
+        return last
+    return fn
+
+
+def _compile_eq(values: Any) -> Compiled:
+    args = _args(values)
+    left, right = _arg(args, 0), _arg(args, 1)
+    return lambda data: left(data) == right(data)
+
+
+def _compile_ne(values: Any) -> Compiled:
+    args = _args(values)
+    left, right = _arg(args, 0), _arg(args, 1)
+    return lambda data: left(data) != right(data)
+
+
+def _make_comparison(cmp: Callable[[Any, Any], bool]) -> Callable[[Any], Compiled]:
+    def compiler(values: Any) -> Compiled:
+        args = _args(values)
+        left_fn, right_fn = _arg(args, 0), _arg(args, 1)
+
+        def fn(data: Any) -> Any:
+            left = left_fn(data)
+            right = right_fn(data)
+            if left is None or right is None:
+                return False
+            lnum = _to_number(left)
+            rnum = _to_number(right)
+            if lnum is not None and rnum is not None:
+                return cmp(lnum, rnum)
+            try:
+                return cmp(left, right)
+            except TypeError:
+                return False
+        return fn
+    return compiler
+
+
+def _compile_add(values: Any) -> Compiled:
+    args = _args(values)
+
+    def fn(data: Any) -> Any:
+        total = 0.0
+        has_float = False
+        for a in args:
+            v = a(data)
+            if isinstance(v, float):
+                has_float = True
+            n = _to_number(v)
+            total += 0.0 if n is None else n
+        return total if has_float else int(total)
+    return fn
+
+
+def _compile_sub(values: Any) -> Compiled:
+    args = _args(values)
+    if len(args) == 1:
+        only = args[0]
+        return lambda data: -(_to_number(only(data)) or 0.0)
+    left_fn, right_fn = _arg(args, 0), _arg(args, 1)
+    return lambda data: (_to_number(left_fn(data)) or 0.0) - (_to_number(right_fn(data)) or 0.0)
+
+
+def _compile_mul(values: Any) -> Compiled:
+    args = _args(values)
+
+    def fn(data: Any) -> Any:
+        prod = 1.0
+        for a in args:
+            prod *= _to_number(a(data)) or 0.0
+        return prod
+    return fn
+
+
+def _compile_div(values: Any) -> Compiled:
+    args = _args(values)
+    left_fn, right_fn = _arg(args, 0), _arg(args, 1)
+
+    def fn(data: Any) -> Any:
+        left = _to_number(left_fn(data)) or 0.0
+        right = _to_number(right_fn(data)) or 0.0
+        if right == 0:
+            raise ZeroDivisionError("division by zero")
+        return left / right
+    return fn
+
+
+def _compile_mod(values: Any) -> Compiled:
+    args = _args(values)
+    left_fn, right_fn = _arg(args, 0), _arg(args, 1)
+
+    def fn(data: Any) -> Any:
+        left = int(_to_number(left_fn(data)) or 0)
+        right = int(_to_number(right_fn(data)) or 0)
+        if right == 0:
+            raise ZeroDivisionError("modulo by zero")
+        return left % right
+    return fn
+
+
+def _make_min_max(reducer: Callable[..., Any]) -> Callable[[Any], Compiled]:
+    def compiler(values: Any) -> Compiled:
+        args = _args(values)
+
+        def fn(data: Any) -> Any:
+            nums = [x for x in (_to_number(a(data)) for a in args) if x is not None]
+            return reducer(nums) if nums else None
+        return fn
+    return compiler
+
+
+def _compile_abs(values: Any) -> Compiled:
+    a = _arg(_args(values), 0)
+    return lambda data: abs(_to_number(a(data)) or 0.0)
+
+
+def _compile_cat(values: Any) -> Compiled:
+    args = _args(values)
+    return lambda data: "".join("" if v is None else str(v) for v in (a(data) for a in args))
+
+
+def _compile_substr(values: Any) -> Compiled:
+    args = _args(values)
+    s_fn, start_fn = _arg(args, 0), _arg(args, 1)
+    length_fn = args[2] if len(args) > 2 else None
+
+    def fn(data: Any) -> Any:
+        s = s_fn(data)
+        s = "" if s is None else str(s)
+        start = int(_to_number(start_fn(data)) or 0)
+        length = int(_to_number(length_fn(data)) or 0) if length_fn is not None else None
+        if length is None:
+            return s[start:]
+        if length >= 0:
+            return s[start : start + length]
+        return s[start:length]
+    return fn
+
+
+def _compile_in(values: Any) -> Compiled:
+    args = _args(values)
+    needle_fn, haystack_fn = _arg(args, 0), _arg(args, 1)
+
+    def fn(data: Any) -> Any:
+        needle = needle_fn(data)
+        haystack = haystack_fn(data)
+        if isinstance(haystack, str):
+            return str(needle) in haystack
+        if isinstance(haystack, list):
+            return needle in haystack
+        return False
+    return fn
+
+
+def _compile_merge(values: Any) -> Compiled:
+    args = _args(values)
+
+    def fn(data: Any) -> Any:
+        merged: List[Any] = []
+        for a in args:
+            v = a(data)
+            if isinstance(v, list):
+                merged.extend(v)
+            else:
+                merged.append(v)
+        return merged
+    return fn
+
+
+def _compile_if(values: Any) -> Compiled:
+    args = _args(values)
+    pairs = [(args[i], args[i + 1]) for i in range(0, len(args) - 1, 2)]
+    otherwise = args[-1] if len(args) % 2 == 1 else None
+
+    def fn(data: Any) -> Any:
+        for cond, then in pairs:
+            if _truthy(cond(data)):
+                return then(data)
+        if otherwise is not None:
+            return otherwise(data)
+        return None
+    return fn
+
+
+def _make_array_op(op: str) -> Callable[[Any], Compiled]:
+    def compiler(values: Any) -> Compiled:
+        if not isinstance(values, list) or len(values) != 2:
+            return _raiser(ValueError(f"{op} expects [array, rule]"))
+        arr_fn = _compile(values[0])
+        rule_fn = compile_logic(values[1])
+
+        def fn(data: Any) -> Any:
+            arr = arr_fn(data)
+            if not isinstance(arr, list):
+                return [] if op in ("map", "filter") else False
+            if op == "map":
+                return [rule_fn(item) for item in arr]
+            if op == "filter":
+                return [item for item in arr if _truthy(rule_fn(item))]
+            if op == "all":
+                return all(_truthy(rule_fn(item)) for item in arr)
+            if op == "none":
+                return all(not _truthy(rule_fn(item)) for item in arr)
+            return any(_truthy(rule_fn(item)) for item in arr)
+        return fn
+    return compiler
+
+
+def _compile_reduce(values: Any) -> Compiled:
+    if not isinstance(values, list) or len(values) < 2:
+        return _raiser(ValueError("reduce expects [array, rule, initial?]"))
+    arr_fn = _compile(values[0])
+    rule_fn = compile_logic(values[1])
+    initial_fn = _compile(values[2]) if len(values) > 2 else None
+
+    def fn(data: Any) -> Any:
+        arr = arr_fn(data)
+        initial = initial_fn(data) if initial_fn is not None else None
+        if not isinstance(arr, list):
+            return initial
+        acc = initial
+        for item in arr:
+            acc = rule_fn({"current": item, "accumulator": acc})
+        return acc
+    return fn
+
+
+def _compile_log(values: Any) -> Compiled:
+    args = _args(values)
+    if not args:
+        return _const(None)
+    return args[0]
+
+
+def _compile_method(values: Any) -> Compiled:
+    if not isinstance(values, list) or len(values) < 2:
+        return _raiser(ValueError("method expects [object, method_name, ...args]"))
+    target_fn = _compile(values[0])
+    name_fn = _compile(values[1])
+    arg_fns = [_compile(v) for v in values[2:]]
+
+    return lambda data: _apply_method(target_fn(data), name_fn(data), [a(data) for a in arg_fns])
+
+
+_COMPILERS: Dict[str, Callable[[Any], Compiled]] = {
+    "var": _compile_var,
+    "missing": _compile_missing,
+    "missing_some": _compile_missing_some,
+    "!": _compile_not,
+    "!!": _compile_double_not,
+    "and": _compile_and,
+    "or": _compile_or,
+    "==": _compile_eq,
+    "===": _compile_eq,
+    "!=": _compile_ne,
+    "!==": _compile_ne,
+    ">": _make_comparison(operator.gt),
+    ">=": _make_comparison(operator.ge),
+    "<": _make_comparison(operator.lt),
+    "<=": _make_comparison(operator.le),
+    "+": _compile_add,
+    "-": _compile_sub,
+    "*": _compile_mul,
+    "/": _compile_div,
+    "%": _compile_mod,
+    "min": _make_min_max(min),
+    "max": _make_min_max(max),
+    "abs": _compile_abs,
+    "cat": _compile_cat,
+    "substr": _compile_substr,
+    "in": _compile_in,
+    "merge": _compile_merge,
+    "if": _compile_if,
+    "map": _make_array_op("map"),
+    "filter": _make_array_op("filter"),
+    "all": _make_array_op("all"),
+    "none": _make_array_op("none"),
+    "some": _make_array_op("some"),
+    "reduce": _compile_reduce,
+    "log": _compile_log,
+    "method": _compile_method,
+}
+
+
+def _compile(logic: Any) -> Compiled:
+    if logic is None or isinstance(logic, (str, int, float, bool)):
+        return _const(logic)
+
+    if isinstance(logic, list):
+        items = [_compile(item) for item in logic]
+        return lambda data: [item(data) for item in items]
+
+    if not isinstance(logic, dict):
+        return _const(logic)
+
+    if len(logic) != 1:
+        return _raiser(ValueError("JSON Logic expression must be a single-key dict"))
+
+    op, values = next(iter(logic.items()))
+    compiler = _COMPILERS.get(op)
+    if compiler is None:
+        return _raiser(ValueError(f"Unsupported JSON Logic operator: {op}"))
+    return compiler(values)
+
+
+def compile_logic(logic: Any) -> Compiled:
+    """
+    Compile a JSON Logic expression into a reusable callable.
+
+    The returned function takes the data context (defaults to `{}` when None) and
+    returns exactly what `jsonLogic(logic, data)` would.
+    """
+    fn = _compile(logic)
+
+    def evaluate(data: Any = None) -> Any:
+        return fn({} if data is None else data)
+    return evaluate
+
+
+# ---------------------------------------------------------------------------
+# Three-valued (partial) evaluation
+# ---------------------------------------------------------------------------
+#
+# A string `var` whose key is absent is *unknown* (instead of resolving to None).
+# Control operators combine unknowns with Kleene logic and short-circuit:
+#   and: a falsy determined operand decides the result even if others are unknown
+#   or:  a truthy determined operand decides the result even if others are unknown
+#   if:  a determined condition picks its branch; an unknown one is undetermined
+#   !/!!: propagate unknowns
+# Any other operator is determined only when none of the vars it reads is unknown,
+# in which case it is evaluated by `jsonLogic` (so determined results match it).
+# When an unknown operand was skipped by a short-circuit, the determined value has
+# the right truthiness, which is what rule evaluation uses. `jsonLogic` evaluates a
+# skipped operand before reaching the short-circuit, so if it raises there (e.g. wrong
+# arity, or a method call on a missing value) the result is left undetermined.
+
+class PartialResult(NamedTuple):
+    """Result of `evaluate_partial`."""
+    determined: bool
+    value: Any  # None when not determined
+    missing: Tuple[str, ...]  # facts that would decide an undetermined result
+
+
+_ARRAY_RULE_OPS = ("map", "filter", "all", "none", "some")
+
+
+def _context_vars(logic: Any, out: List[str]) -> None:
+    """Collect string `var` paths read from the top-level data context."""
+    if isinstance(logic, list):
+        for item in logic:
+            _context_vars(item, out)
+        return
+    if not isinstance(logic, dict) or len(logic) != 1:
+        return
+    op, values = next(iter(logic.items()))
+    if op == "var":
+        if isinstance(values, str):
+            if values and values not in out:
+                out.append(values)
+        elif not isinstance(values, list):
+            _context_vars(values, out)
+        return
+    if op in _ARRAY_RULE_OPS and isinstance(values, list) and values:
+        # The rule is evaluated against each array item, not the data context
+        _context_vars(values[0], out)
+        return
+    if op == "reduce" and isinstance(values, list) and values:
+        _context_vars(values[0], out)
+        if len(values) > 2:
+            _context_vars(values[2], out)
+        return
+    _context_vars(values, out)
+
+
+def _merge_missing(*groups: Tuple[str, ...]) -> Tuple[str, ...]:
+    merged: List[str] = []
+    for group in groups:
+        for key in group:
+            if key not in merged:
+                merged.append(key)
+    return tuple(merged)
+
+
+def _collect(logic: Any) -> List[str]:
+    out: List[str] = []
+    _context_vars(logic, out)
+    return out
+
+
+def _raises(logic: Any, data: Any) -> bool:
+    """True when `jsonLogic` raises evaluating `logic` (unknown vars read as None)."""
+    try:
+        jsonLogic(logic, data)
+    except Exception:
+        return True
+    return False
+
+
+def _partial(logic: Any, data: Any, is_unknown: Callable[[str], bool]) -> PartialResult:
+    if not isinstance(logic, dict) or len(logic) != 1:
+        unknown = [key for key in _collect(logic) if is_unknown(key)]
+        if unknown:
+            return PartialResult(False, None, tuple(unknown))
+        return PartialResult(True, jsonLogic(logic, data), ())
+
+    op, values = next(iter(logic.items()))
+    args = values if isinstance(values, list) else [values]
+
+    if op in ("and", "or"):
+        deciding = (lambda v: not _truthy(v)) if op == "and" else _truthy
+        last = None
+        missing: Tuple[str, ...] = ()
+        skipped: List[Any] = []
+        for a in args:
+            result = _partial(a, data, is_unknown)
+            if not result.determined:
+                missing = _merge_missing(missing, result.missing)
+                skipped.append(a)
+                continue
+            last = result.value
+            if deciding(last):
+                if any(_raises(s, data) for s in skipped):
+                    # jsonLogic raises on the skipped operand before getting here
+                    return PartialResult(False, None, missing)
+                return PartialResult(True, last, ())
+        if missing:
+            return PartialResult(False, None, missing)
+        return PartialResult(True, last, ())
+
+    if op in ("!", "!!"):
+        if not args:
+            # Malformed: raise exactly like jsonLogic
+            return PartialResult(True, jsonLogic(logic, data), ())
+        result = _partial(args[0], data, is_unknown)
+        if not result.determined:
+            return result
+        truthy = _truthy(result.value)
+        return PartialResult(True, not truthy if op == "!" else truthy, ())
+
+    if op == "if":
+        i = 0
+        while i + 1 < len(args):
+            cond = _partial(args[i], data, is_unknown)
+            if not cond.determined:
+                # Either remaining branch may be taken: report everything that could decide it
+                rest = [_partial(a, data, is_unknown) for a in args[i + 1:]]
+                return PartialResult(False, None, _merge_missing(cond.missing, *(r.missing for r in rest)))
+            if _truthy(cond.value):
+                return _partial(args[i + 1], data, is_unknown)
+            i += 2
+        if i < len(args):
+            return _partial(args[i], data, is_unknown)
+        return PartialResult(True, None, ())
+
+    unknown = [key for key in _collect(logic) if is_unknown(key)]
+    if unknown:
+        return PartialResult(False, None, tuple(unknown))
+    return PartialResult(True, jsonLogic(logic, data), ())
+
+
+def evaluate_partial(logic: Any, data: Any = None, missing_keys: Optional[Any] = None) -> PartialResult:
+    """
+    Evaluate with three-valued logic over possibly incomplete data.
+
+    Args:
+        logic: JSON Logic expression
+        data: Data context (defaults to `{}`)
+        missing_keys: Optional collection of var paths to treat as unknown. When
+            omitted, a string var path is unknown if it does not resolve in `data`.
+
+    Returns:
+        PartialResult(determined, value, missing). With no unknown vars the value is
+        exactly `jsonLogic(logic, data)`.
+    """
+    if data is None:
+        data = {}
+    if missing_keys is not None:
+        missing_set = frozenset(missing_keys)
+        is_unknown = missing_set.__contains__
+    else:
+        def is_unknown(key: str) -> bool:
+            return _get_var(data, key, _MISSING) is _MISSING
+    return _partial(logic, data, is_unknown)
+
 
+__all__ = ["jsonLogic", "compile_logic", "evaluate_partial", "PartialResult"]
@@ -1,130 +1,159 @@
 from typing import Optional, Dict
+import json
 import requests
 import logging
 
+from main_system.utils.request.session_pool import SessionPool
+
 logger = logging.getLogger("django")
 
+DEFAULT_TIMEOUT = 30
+
+
 class Client:
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, session: Optional[requests.Session] = None):
+        """
+        Args:
+            base_url: Base URL for all requests
+            session: Session to send requests with (default: the shared pooled
+                keep-alive session for the base URL's host, see SessionPool)
+        """
         self.base_url = base_url
+        self.session = session or SessionPool.get(base_url)
+
+    def request(self, method: str, endpoint: str, timeout: Optional[int] = DEFAULT_TIMEOUT,
+                **kwargs) -> requests.Response:
+        """
+        Send a request on the pooled session.
+        Raises requests exceptions (HTTPError for 4xx/5xx) so callers can retry them.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            timeout: Request timeout in seconds
+            **kwargs: Passed to requests (headers, params, json, data)
+
+        Returns:
+            Response (status < 400)
+        """
+        response = self.session.request(
+            method,
+            f"{self.base_url}{endpoint}",
+            timeout=timeout,
+            **kwargs
+        )
+        response.raise_for_status()
+        return response
 
-    def get(self, endpoint: str, headers: Optional[dict] = None, params: Optional[str] = None):
+    def get(self, endpoint: str, headers: Optional[dict] = None, params: Optional[str] = None,
+            timeout: Optional[int] = DEFAULT_TIMEOUT):
         """
         Make a GET request and return JSON response.
         Returns None on error (for backward compatibility).
         """
         try:
-            response = requests.get(
-                f"{self.base_url}{endpoint}",
-                headers=headers,
-                params=params
-            )
-            response.raise_for_status()
-            return response.json()
+            return self.request('GET', endpoint, timeout=timeout, headers=headers, params=params).json()
         except requests.exceptions.RequestException as e:
             logger.error(f"Error while making GET request to {endpoint}: {e}")
             return None
 
-    def get_with_details(self, endpoint: str, headers: Optional[dict] = None, 
+    def get_with_details(self, endpoint: str, headers: Optional[dict] = None,
                         params: Optional[str] = None, timeout: Optional[int] = 30) -> Dict:
         """
         Make a GET request and return detailed response information.
         Useful for ingestion systems that need status codes and error details.
-        
+
         Args:
             endpoint: API endpoint path
             headers: Optional request headers
             params: Optional query parameters
             timeout: Request timeout in seconds (default: 30)
-            
+
         Returns:
-            Dict with keys: 'content', 'content_type', 'status_code', 'error'
+            Dict with keys: 'content', 'content_type', 'status_code', 'error', plus the
+            response validators 'etag' and 'last_modified' (None when absent)
             - On success: content is JSON string, status_code is 200, error is None
+            - On 304 Not Modified (conditional request via If-None-Match /
+              If-Modified-Since headers): content is None, 'not_modified' is True
             - On error: content is None, status_code may be set, error contains message
         """
-        import json
-        
         try:
-            response = requests.get(
-                f"{self.base_url}{endpoint}",
-                headers=headers,
-                params=params,
-                timeout=timeout
-            )
-            response.raise_for_status()
-            
-            # Try to parse as JSON
-            try:
-                content = response.json()
-                return {
-                    'content': json.dumps(content, indent=2),
-                    'content_type': 'application/json',
-                    'status_code': response.status_code,
-                    'error': None
-                }
-            except json.JSONDecodeError as e:
-                logger.error(f"Error parsing JSON from {endpoint}: {e}")
-                return {
-                    'content': response.text,
-                    'content_type': response.headers.get('Content-Type', 'text/plain'),
-                    'status_code': response.status_code,
-                    'error': f"JSON decode error: {e}"
-                }
-                
+            response = self.request('GET', endpoint, timeout=timeout, headers=headers, params=params)
+            return self.response_details(response, endpoint)
         except requests.exceptions.RequestException as e:
             logger.error(f"Error while making GET request to {endpoint}: {e}")
-            status_code = None
-            if hasattr(e, 'response') and e.response is not None:
-                status_code = e.response.status_code
-            return {
-                'content': None,
-                'content_type': None,
-                'status_code': status_code,
-                'error': str(e)
-            }
+            return self.error_details(e)
         except Exception as e:
             logger.error(f"Unexpected error making GET request to {endpoint}: {e}")
+            return self.error_details(e)
+
+    @staticmethod
+    def response_details(response: requests.Response, endpoint: str = '') -> Dict:
+        """Detailed result dict (see get_with_details) of a successful or 304 response."""
+        validators = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        }
+        if response.status_code == 304:
             return {
                 'content': None,
                 'content_type': None,
-                'status_code': None,
-                'error': str(e)
+                'status_code': 304,
+                'error': None,
+                'not_modified': True,
+                **validators
             }
 
-    def post(self, endpoint, data, headers:Optional[dict] = None):
+        # Try to parse as JSON
+        try:
+            content = response.json()
+            return {
+                'content': json.dumps(content, indent=2),
+                'content_type': 'application/json',
+                'status_code': response.status_code,
+                'error': None,
+                **validators
+            }
+        except json.JSONDecodeError as e:
+            logger.error(f"Error parsing JSON from {endpoint}: {e}")
+            return {
+                'content': response.text,
+                'content_type': response.headers.get('Content-Type', 'text/plain'),
+                'status_code': response.status_code,
+                'error': f"JSON decode error: {e}",
+                **validators
+            }
+
+    @staticmethod
+    def error_details(error: Exception) -> Dict:
+        """Detailed result dict (see get_with_details) of a failed request."""
+        status_code = None
+        if getattr(error, 'response', None) is not None:
+            status_code = error.response.status_code
+        return {
+            'content': None,
+            'content_type': None,
+            'status_code': status_code,
+            'error': str(error)
+        }
+
+    def post(self, endpoint, data, headers: Optional[dict] = None, timeout: Optional[int] = DEFAULT_TIMEOUT):
         try:
-            response = requests.post(
-                f"{self.base_url}{endpoint}",
-                json=data,
-                headers=headers
-            )
-            response.raise_for_status()
-            return response.json()
+            return self.request('POST', endpoint, timeout=timeout, json=data, headers=headers).json()
         except requests.exceptions.RequestException as e:
             logger.error(f"Error while making POST request to {endpoint}: {e}")
             return None
 
-    def put(self, endpoint, data, headers: Optional[dict]=None):
+    def put(self, endpoint, data, headers: Optional[dict] = None, timeout: Optional[int] = DEFAULT_TIMEOUT):
         try:
-            response = requests.put(
-                f"{self.base_url}{endpoint}",
-                json=data,
-                headers=headers
-            )
-            response.raise_for_status()
-            return response.json()
+            return self.request('PUT', endpoint, timeout=timeout, json=data, headers=headers).json()
         except requests.exceptions.RequestException as e:
             logger.error(f"Error while making PUT request to {endpoint}: {e}")
             return None
 
-    def delete(self, endpoint, headers=None):
+    def delete(self, endpoint, headers=None, timeout: Optional[int] = DEFAULT_TIMEOUT):
         try:
-            response = requests.delete(
-                f"{self.base_url}{endpoint}",
-                headers=headers
-            )
-            response.raise_for_status()
-            return response.json()
+            return self.request('DELETE', endpoint, timeout=timeout, headers=headers).json()
         except requests.exceptions.RequestException as e:
             logger.error(f"Error while making DELETE request to {endpoint}: {e}")
             return None
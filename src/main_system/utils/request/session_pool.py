@@ -0,0 +1,276 @@
+"""
+Shared, pooled HTTP sessions.
+
+Module-level `requests.get(...)` opens a new TCP (+TLS) connection for every call.
+SessionPool keeps one `requests.Session` per origin (scheme://host:port) for the
+whole process, so every Client / ExternalHTTPClient / gateway talking to the same
+host reuses keep-alive connections from one urllib3 pool:
+
+- HTTP_CLIENT_POOL_CONNECTIONS: host pools kept per session
+- HTTP_CLIENT_POOL_MAXSIZE: keep-alive connections kept per host (the number of
+  threads that can talk to one host concurrently without opening extra connections)
+- HTTP_CLIENT_POOL_BLOCK: wait for a free connection instead of opening a
+  throwaway one when the pool is exhausted
+- HTTP_CLIENT_HTTP2: send requests over HTTP/2 (multiplexed on one connection);
+  needs the optional `httpx[http2]` package, otherwise HTTP/1.1 is used
+
+Sessions do not keep cookies, so sharing them between callers is equivalent to the
+stateless module-level calls they replace. Sessions are dropped in forked children
+(Celery prefork) so no socket is shared between processes.
+
+Connection reuse is exported as Prometheus counters (requests sent and connections
+opened per host); stats() returns the same numbers for the HTTP/1.1 pools.
+"""
+import logging
+import os
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict
+from urllib.parse import urlparse
+
+import requests
+from django.conf import settings
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+try:
+    from prometheus_client import Counter
+except ImportError:
+    Counter = None
+
+logger = logging.getLogger('django')
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+# Connection-specific headers are not allowed in HTTP/2 requests
+HOP_BY_HOP_HEADERS = {'connection', 'keep-alive', 'proxy-connection', 'transfer-encoding', 'upgrade'}
+
+
+def _safe_create_metric(metric_class, name, *args, **kwargs):
+    """Create a metric, returning None if prometheus_client is missing or it already exists."""
+    if not metric_class:
+        return None
+    try:
+        return metric_class(name, *args, **kwargs)
+    except ValueError:
+        return None
+
+
+http_client_requests_total = _safe_create_metric(
+    Counter,
+    'http_client_requests_total',
+    'Total number of outbound HTTP requests sent through pooled sessions',
+    ['host', 'http_version']
+)
+
+http_client_connections_opened_total = _safe_create_metric(
+    Counter,
+    'http_client_connections_opened_total',
+    'Total number of outbound HTTP connections opened by pooled sessions '
+    '(requests - connections = requests served on a reused keep-alive connection)',
+    ['host']
+)
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that counts requests sent and connections opened by its pools."""
+
+    def __init__(self, host: str, *args, **kwargs):
+        self.host = host
+        self.requests_sent = 0
+        self.connections_opened = 0
+        self._seen_connections = 0
+        self._stats_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, *args, **kwargs):
+        try:
+            return super().send(request, *args, **kwargs)
+        finally:
+            self._record_request()
+
+    def _record_request(self) -> None:
+        total = self._pool_connections_total()
+        with self._stats_lock:
+            # Pools evicted from the pool manager take their counts with them
+            opened = max(0, total - self._seen_connections)
+            self._seen_connections = total
+            self.requests_sent += 1
+            self.connections_opened += opened
+        if http_client_requests_total:
+            http_client_requests_total.labels(host=self.host, http_version='1.1').inc()
+        if http_client_connections_opened_total and opened:
+            http_client_connections_opened_total.labels(host=self.host).inc(opened)
+
+    def _pool_connections_total(self) -> int:
+        pools = self.poolmanager.pools
+        total = 0
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                total += pool.num_connections
+        return total
+
+
+class HTTP2Adapter(BaseAdapter):
+    """
+    Transport adapter sending requests over HTTP/2 with httpx.
+
+    Responses and errors are converted to their `requests` equivalents, so callers
+    (raise_for_status, exception handling, tenacity retry predicates) are unchanged.
+    """
+
+    def __init__(self, host: str, pool_maxsize: int):
+        import httpx  # Optional dependency: httpx[http2]
+
+        super().__init__()
+        self.host = host
+        self.requests_sent = 0
+        self._httpx = httpx
+        self._client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize),
+        )
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        httpx = self._httpx
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(None, connect=timeout[0], read=timeout[1])
+        try:
+            response = self._client.request(
+                request.method,
+                request.url,
+                headers={
+                    name: value for name, value in request.headers.items()
+                    if name.lower() not in HOP_BY_HOP_HEADERS
+                },
+                content=request.body,
+                timeout=timeout,
+                follow_redirects=False,
+            )
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e), request=request)
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e), request=request)
+        finally:
+            self.requests_sent += 1
+            if http_client_requests_total:
+                http_client_requests_total.labels(host=self.host, http_version='2').inc()
+        return self._build_response(request, response)
+
+    @staticmethod
+    def _build_response(request, httpx_response) -> requests.Response:
+        response = requests.Response()
+        response.status_code = httpx_response.status_code
+        response.headers = CaseInsensitiveDict(httpx_response.headers.items())
+        response._content = httpx_response.content
+        response.encoding = httpx_response.encoding
+        response.reason = httpx_response.reason_phrase
+        response.url = str(httpx_response.url)
+        response.request = request
+        return response
+
+    def close(self):
+        self._client.close()
+
+
+class SessionPool:
+    """Process-wide `requests.Session` per origin."""
+
+    _sessions: Dict[str, requests.Session] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def origin(url: str) -> str:
+        """scheme://host[:port] of a URL (the unit of connection reuse)."""
+        parsed = urlparse(url)
+        if not parsed.scheme or not parsed.netloc:
+            return url.rstrip('/')
+        return f"{parsed.scheme.lower()}://{parsed.netloc.lower()}"
+
+    @classmethod
+    def get(cls, base_url: str) -> requests.Session:
+        """
+        Shared session for the origin of `base_url`.
+
+        Args:
+            base_url: Any URL on the host (base URL or full request URL)
+
+        Returns:
+            Pooled keep-alive session
+        """
+        origin = cls.origin(base_url)
+        with cls._lock:
+            session = cls._sessions.get(origin)
+            if session is None:
+                session = cls._create_session(origin)
+                cls._sessions[origin] = session
+            return session
+
+    @classmethod
+    def stats(cls) -> Dict[str, Dict[str, int]]:
+        """
+        Connection reuse per origin.
+
+        Returns:
+            {origin: {'requests': sent, 'connections_opened': opened (HTTP/1.1 only),
+            'connections_reused': requests - connections_opened}}
+        """
+        with cls._lock:
+            sessions = dict(cls._sessions)
+        stats = {}
+        for origin, session in sessions.items():
+            adapter = session.get_adapter(f"{origin}/")
+            sent = getattr(adapter, 'requests_sent', 0)
+            opened = getattr(adapter, 'connections_opened', None)
+            stats[origin] = {
+                'requests': sent,
+                'connections_opened': opened,
+                'connections_reused': sent - opened if opened is not None else None,
+            }
+        return stats
+
+    @classmethod
+    def reset(cls) -> None:
+        """Close and drop all sessions (recreated from settings on next use)."""
+        with cls._lock:
+            sessions = list(cls._sessions.values())
+            cls._sessions.clear()
+        for session in sessions:
+            try:
+                session.close()
+            except Exception as e:
+                logger.debug(f"Error closing pooled session: {e}")
+
+    @classmethod
+    def _discard_after_fork(cls) -> None:
+        # The parent's sockets must not be used (or closed) by the child
+        cls._sessions = {}
+        cls._lock = threading.Lock()
+
+    @classmethod
+    def _create_session(cls, origin: str) -> requests.Session:
+        session = requests.Session()
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        session.mount(f"{origin}/", cls._create_adapter(origin))
+        return session
+
+    @staticmethod
+    def _create_adapter(origin: str) -> BaseAdapter:
+        host = urlparse(origin).netloc or origin
+        pool_maxsize = getattr(settings, 'HTTP_CLIENT_POOL_MAXSIZE', DEFAULT_POOL_MAXSIZE)
+        if getattr(settings, 'HTTP_CLIENT_HTTP2', False) and origin.startswith('https://'):
+            try:
+                return HTTP2Adapter(host, pool_maxsize=pool_maxsize)
+            except ImportError:
+                logger.warning("HTTP_CLIENT_HTTP2 is enabled but httpx[http2] is not installed; using HTTP/1.1")
+        return PooledHTTPAdapter(
+            host,
+            pool_connections=getattr(settings, 'HTTP_CLIENT_POOL_CONNECTIONS', DEFAULT_POOL_CONNECTIONS),
+            pool_maxsize=pool_maxsize,
+            pool_block=getattr(settings, 'HTTP_CLIENT_POOL_BLOCK', False),
+        )
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=SessionPool._discard_after_fork)
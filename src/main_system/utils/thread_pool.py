@@ -0,0 +1,25 @@
+"""
+Thread pool for work that touches the database.
+
+Django opens a DB connection per thread. Connections opened by pool worker threads
+are not closed by the request/task lifecycle, so every job run by DBThreadPoolExecutor
+closes its thread's connections when it finishes.
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+from django.db import connections
+
+
+def _run_closing_connections(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        connections.close_all()
+
+
+class DBThreadPoolExecutor(ThreadPoolExecutor):
+    """ThreadPoolExecutor whose jobs close their worker thread's DB connections."""
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        return super().submit(_run_closing_connections, fn, *args, **kwargs)
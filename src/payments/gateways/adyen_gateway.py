@@ -13,6 +13,7 @@ from decimal import Decimal
 from django.conf import settings
 from django.utils import timezone
 import requests
+from main_system.utils.request.session_pool import SessionPool
 from payments.gateways.base import BasePaymentGateway
 from payments.exceptions.payment_gateway_exceptions import (
     PaymentGatewayError,
@@ -101,9 +102,9 @@ class AdyenGateway(BasePaymentGateway):
         
         try:
             if method == 'GET':
-                response = requests.get(url, headers=headers, params=data, timeout=30)
+                response = SessionPool.get(url).get(url, headers=headers, params=data, timeout=30)
             elif method == 'POST':
-                response = requests.post(url, headers=headers, json=data, timeout=30)
+                response = SessionPool.get(url).post(url, headers=headers, json=data, timeout=30)
             else:
                 raise PaymentGatewayError(f"Unsupported HTTP method: {method}")
             
@@ -12,6 +12,7 @@ from decimal import Decimal
 from django.conf import settings
 from django.utils import timezone
 import requests
+from main_system.utils.request.session_pool import SessionPool
 from payments.gateways.base import BasePaymentGateway
 from payments.exceptions.payment_gateway_exceptions import (
     PaymentGatewayError,
@@ -84,7 +85,7 @@ class PayPalGateway(BasePaymentGateway):
             auth_bytes = auth_string.encode('utf-8')
             auth_b64 = base64.b64encode(auth_bytes).decode('utf-8')
             
-            response = requests.post(
+            response = SessionPool.get(self.base_url).post(
                 f"{self.base_url}/v1/oauth2/token",
                 headers={
                     'Authorization': f'Basic {auth_b64}',
@@ -148,11 +149,11 @@ class PayPalGateway(BasePaymentGateway):
         
         try:
             if method == 'GET':
-                response = requests.get(url, headers=headers, params=data, timeout=30)
+                response = SessionPool.get(url).get(url, headers=headers, params=data, timeout=30)
             elif method == 'POST':
-                response = requests.post(url, headers=headers, json=data, timeout=30)
+                response = SessionPool.get(url).post(url, headers=headers, json=data, timeout=30)
             elif method == 'PATCH':
-                response = requests.patch(url, headers=headers, json=data, timeout=30)
+                response = SessionPool.get(url).patch(url, headers=headers, json=data, timeout=30)
             else:
                 raise PaymentGatewayError(f"Unsupported HTTP method: {method}")
             
@@ -168,9 +169,11 @@ class PayPalGateway(BasePaymentGateway):
                 # Retry once
                 try:
                     if method == 'GET':
-                        response = requests.get(url, headers=headers, params=data, timeout=30)
+                        response = SessionPool.get(url).get(url, headers=headers, params=data, timeout=30)
                     elif method == 'POST':
-                        response = requests.post(url, headers=headers, json=data, timeout=30)
+                        response = SessionPool.get(url).post(url, headers=headers, json=data, timeout=30)
+                    elif method == 'PATCH':
+                        response = SessionPool.get(url).patch(url, headers=headers, json=data, timeout=30)
                     response.raise_for_status()
                     return response.json()
                 except:
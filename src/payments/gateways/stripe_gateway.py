@@ -11,6 +11,7 @@ from decimal import Decimal
 from django.conf import settings
 from django.utils import timezone
 from external_services.request.http_client import ExternalHTTPClient
+from main_system.utils.request.session_pool import SessionPool
 from payments.exceptions.payment_gateway_exceptions import (
     PaymentGatewayError,
     PaymentGatewayConfigurationError,
@@ -104,10 +105,10 @@ class StripeGateway(BasePaymentGateway):
             url = f"{self.API_BASE_URL}{endpoint}"
             
             if method == 'GET':
-                response = requests.get(url, headers=headers, params=data, timeout=30)
+                response = SessionPool.get(url).get(url, headers=headers, params=data, timeout=30)
             elif method == 'POST':
                 # Stripe expects form-encoded data
-                response = requests.post(url, headers=headers, data=data, timeout=30)
+                response = SessionPool.get(url).post(url, headers=headers, data=data, timeout=30)
             else:
                 raise PaymentGatewayError(f"Unsupported HTTP method: {method}")
             
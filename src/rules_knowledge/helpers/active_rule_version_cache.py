@@ -0,0 +1,142 @@
+"""
+Active Rule Version Cache
+
+Process-local cache of "which rule version is active for this visa type right now".
+
+Eligibility checks, document checklists, requirement matching and the AI call-context
+builder all resolve the active rule version (and then its requirements) for the same
+case within one request. Each resolution is a filtered, ordered query; this cache
+keeps a bounded LRU of read-only snapshots of the version plus its requirements.
+
+Entries are keyed by (visa_type_id, evaluation-date bucket) and carry:
+- the `rules_knowledge:rule_versions` namespace version (see main_system.utils.cache_utils);
+  rule version / requirement writes bump it, so every worker drops its entries on
+  the next lookup without a pub/sub channel
+- the date window the answer is valid for (up to the next scheduled effective_from or
+  the version's effective_to), so a version becoming effective mid-bucket is picked up
+"""
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+from django.db import transaction
+
+from main_system.utils.cache_utils import bump_namespace, get_namespace_version
+from rules_knowledge.helpers.metrics import track_cache_operation
+
+logger = logging.getLogger('django')
+
+NAMESPACE = 'rules_knowledge:rule_versions'
+
+
+@dataclass(frozen=True)
+class ActiveRuleVersionSnapshot:
+    """
+    Active rule version for a visa type over a date window.
+
+    `rule_version` is None when no version is active. Model instances are shared
+    between callers and must be treated as read-only.
+    """
+    visa_type_id: str
+    rule_version: Any
+    requirements: Tuple[Any, ...]
+    namespace_version: int
+    valid_from: datetime
+    valid_until: Optional[datetime] = None
+
+    def covers(self, evaluation_date: datetime) -> bool:
+        """Whether this snapshot is the answer for `evaluation_date`."""
+        if evaluation_date < self.valid_from:
+            return False
+        if self.valid_until is not None and evaluation_date >= self.valid_until:
+            return False
+        effective_to = getattr(self.rule_version, 'effective_to', None)
+        return effective_to is None or evaluation_date <= effective_to
+
+
+class ActiveRuleVersionCache:
+    """Bounded LRU of ActiveRuleVersionSnapshot."""
+
+    MAX_ENTRIES = 1000
+    BUCKET_SECONDS = 300
+
+    _entries: "OrderedDict[Tuple[str, int], ActiveRuleVersionSnapshot]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def _key(cls, visa_type_id, evaluation_date: datetime) -> Tuple[str, int]:
+        return (str(visa_type_id), int(evaluation_date.timestamp()) // cls.BUCKET_SECONDS)
+
+    @staticmethod
+    def namespace_version() -> int:
+        """Current invalidation counter (shared across workers through the Django cache)."""
+        return get_namespace_version(NAMESPACE)
+
+    @classmethod
+    def get(cls, visa_type_id, evaluation_date: datetime) -> Optional[ActiveRuleVersionSnapshot]:
+        """
+        Cached snapshot for a visa type at a date.
+
+        Returns:
+            ActiveRuleVersionSnapshot, or None on a miss (absent, stale or out of window)
+        """
+        key = cls._key(visa_type_id, evaluation_date)
+        with cls._lock:
+            snapshot = cls._entries.get(key)
+        if snapshot is None:
+            track_cache_operation('get', 'miss')
+            return None
+
+        if snapshot.namespace_version != cls.namespace_version() or not snapshot.covers(evaluation_date):
+            with cls._lock:
+                if cls._entries.get(key) is snapshot:
+                    del cls._entries[key]
+            track_cache_operation('get', 'miss')
+            return None
+
+        with cls._lock:
+            if key in cls._entries:
+                cls._entries.move_to_end(key)
+        track_cache_operation('get', 'hit')
+        return snapshot
+
+    @classmethod
+    def put(cls, snapshot: ActiveRuleVersionSnapshot) -> None:
+        """Store a snapshot under its visa type and valid_from bucket."""
+        key = cls._key(snapshot.visa_type_id, snapshot.valid_from)
+        with cls._lock:
+            cls._entries[key] = snapshot
+            cls._entries.move_to_end(key)
+            while len(cls._entries) > cls.MAX_ENTRIES:
+                cls._entries.popitem(last=False)
+        track_cache_operation('set', 'success')
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Invalidate every worker's snapshots after a rule version or requirement write.
+
+        Clears this process immediately and bumps the shared namespace now and again on
+        commit, so a worker that reloads between the write and the commit cannot keep
+        pre-commit data under the new namespace version.
+        """
+        cls.clear()
+        bump_namespace(NAMESPACE)
+        transaction.on_commit(lambda: bump_namespace(NAMESPACE))
+        track_cache_operation('delete', 'success')
+        logger.debug("Invalidated active rule version snapshots")
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all snapshots held by this process."""
+        with cls._lock:
+            cls._entries.clear()
+
+    @classmethod
+    def size(cls) -> int:
+        """Number of cached snapshots."""
+        with cls._lock:
+            return len(cls._entries)
@@ -0,0 +1,96 @@
+"""
+Compiled Expression Cache
+
+Process-local cache of compiled JSON Logic requirement expressions.
+
+Eligibility runs evaluate the same few hundred requirement expressions over and over;
+compiling each `condition_expression` once (see `json_logic.compile_logic`) removes the
+per-call dict walk and operator dispatch. Entries are keyed by
+(rule_version_id, requirement_id) and carry the requirement's `updated_at` so an edited
+requirement is recompiled even in workers that never saw the edit.
+"""
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Tuple
+
+from main_system.utils import json_logic
+from rules_knowledge.helpers.metrics import track_cache_operation
+
+logger = logging.getLogger('django')
+
+
+class CompiledExpressionCache:
+    """Bounded LRU of compiled requirement expressions."""
+
+    MAX_ENTRIES = 5000
+
+    _entries: "OrderedDict[Tuple[str, str], Tuple[Any, Callable[[Any], Any]]]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _key(rule_version_id, requirement_id) -> Tuple[str, str]:
+        return (str(rule_version_id), str(requirement_id))
+
+    @classmethod
+    def get_or_compile(cls, requirement) -> Callable[[Any], Any]:
+        """
+        Return the compiled callable for a VisaRequirement's condition_expression.
+
+        Args:
+            requirement: VisaRequirement instance (must have id and rule_version_id)
+
+        Returns:
+            Callable taking a facts dict and returning the JSON Logic result
+        """
+        key = cls._key(requirement.rule_version_id, requirement.id)
+        stamp = getattr(requirement, 'updated_at', None)
+
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                cls._entries.move_to_end(key)
+                track_cache_operation('get', 'hit')
+                return entry[1]
+
+        track_cache_operation('get', 'miss')
+        compiled = json_logic.compile_logic(requirement.condition_expression)
+
+        with cls._lock:
+            cls._entries[key] = (stamp, compiled)
+            cls._entries.move_to_end(key)
+            while len(cls._entries) > cls.MAX_ENTRIES:
+                cls._entries.popitem(last=False)
+        return compiled
+
+    @classmethod
+    def invalidate_rule_version(cls, rule_version_id) -> int:
+        """
+        Drop every compiled expression belonging to a rule version.
+
+        Called when a rule version is published or rolled back.
+
+        Returns:
+            Number of entries removed
+        """
+        version_key = str(rule_version_id)
+        with cls._lock:
+            stale = [key for key in cls._entries if key[0] == version_key]
+            for key in stale:
+                del cls._entries[key]
+        if stale:
+            track_cache_operation('delete', 'success')
+            logger.debug(f"Invalidated {len(stale)} compiled expressions for rule version {version_key}")
+        return len(stale)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all compiled expressions."""
+        with cls._lock:
+            cls._entries.clear()
+
+    @classmethod
+    def size(cls) -> int:
+        """Number of cached compiled expressions."""
+        with cls._lock:
+            return len(cls._entries)
@@ -0,0 +1,72 @@
+"""
+Expression Index
+
+Derives the persisted index fields of a JSON Logic expression:
+- referenced_variables: fact keys referenced through `var`, in first-seen order
+- expression_hash: sha256 of the canonical (sorted-keys) JSON form
+
+These are stored on VisaRequirement / VisaDocumentRequirement so the rule engine does
+not traverse expressions on every evaluation, and so "which requirements depend on
+fact X" can be answered from the stored variable lists.
+"""
+import hashlib
+import json
+from typing import Any, Dict, List
+
+
+class ExpressionIndex:
+    """Helpers for indexing JSON Logic expressions."""
+
+    @staticmethod
+    def extract_variables(expression: Any) -> List[str]:
+        """
+        Extract `var` names referenced in a JSON Logic expression.
+
+        Args:
+            expression: JSON Logic expression (dict or list)
+
+        Returns:
+            Unique variable names in first-seen order
+        """
+        variables: List[str] = []
+        seen = set()
+        stack = [expression]
+        while stack:
+            obj = stack.pop()
+            if isinstance(obj, dict):
+                if "var" in obj:
+                    var_name = obj["var"]
+                    if isinstance(var_name, str) and var_name not in seen:
+                        seen.add(var_name)
+                        variables.append(var_name)
+                # Reverse so traversal order matches a recursive walk
+                stack.extend(reversed(list(obj.values())))
+            elif isinstance(obj, list):
+                stack.extend(reversed(obj))
+        return variables
+
+    @staticmethod
+    def expression_hash(expression: Any) -> str:
+        """
+        Stable hash of an expression (key order independent).
+
+        Returns:
+            Hex sha256 digest, or '' for a None expression
+        """
+        if expression is None:
+            return ''
+        canonical = json.dumps(expression, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def index_fields(expression: Any) -> Dict[str, Any]:
+        """
+        Model field values for an expression.
+
+        Returns:
+            {'referenced_variables': [...], 'expression_hash': '...'}
+        """
+        return {
+            'referenced_variables': ExpressionIndex.extract_variables(expression) if expression else [],
+            'expression_hash': ExpressionIndex.expression_hash(expression),
+        }
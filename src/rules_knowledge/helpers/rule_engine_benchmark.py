@@ -0,0 +1,212 @@
+"""
+Rule Engine Benchmark Corpus
+
+Deterministic inputs for benchmarking the JSON Logic engine and RuleEngineService:
+- UKRuleCorpus: visa routes taken from the GOV.UK taxonomy (shipped as
+  rules_knowledge/data/uk_visa_routes.json, extracted from the taxonomy export
+  uk_ingestion.json) with requirements drawn from the standard requirement-code catalogue
+  (data_ingestion.helpers.requirement_codes), each code mapped to a JSON Logic
+  expression shaped like the rules the ingestion pipeline produces.
+- CaseFactGenerator: synthetic case facts covering every fact key the corpus
+  references, with configurable missing facts and string-typed numbers.
+
+Nothing here touches the database; see RuleEngineBenchmarkService.
+"""
+import json
+import random
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from data_ingestion.helpers.requirement_codes import get_codes_by_category
+
+ENGLISH_SPEAKING = ['US', 'CA', 'AU', 'NZ', 'IE', 'JM', 'BB', 'TT']
+TB_TEST_COUNTRIES = ['IN', 'PK', 'NG', 'BD', 'PH', 'KE', 'ZA', 'VN']
+RESTRICTED_NATIONALITIES = ['KP', 'SY']
+ELIGIBLE_SOC_CODES = ['2136', '2134', '2211', '2231', '2314', '3545', '5434', '6145']
+NATIONALITIES = ['US', 'IN', 'NG', 'PK', 'CN', 'BR', 'FR', 'DE', 'PH', 'KE', 'AU', 'SY']
+
+# Requirement categories exercised per route keyword (first match wins)
+ROUTE_PROFILES = [
+    ('work', ['salary', 'age', 'experience', 'sponsor', 'language', 'financial', 'employment', 'character', 'health']),
+    ('sponsor', ['sponsor', 'salary', 'employment', 'language']),
+    ('student', ['sponsor', 'language', 'financial', 'age', 'health', 'character']),
+    ('family', ['family', 'financial', 'language', 'age', 'character']),
+    ('visit', ['financial', 'nationality', 'character', 'health']),
+    ('settlement', ['language', 'character', 'financial', 'age']),
+    ('citizenship', ['language', 'character', 'age', 'nationality']),
+]
+DEFAULT_PROFILE = [
+    'salary', 'age', 'experience', 'sponsor', 'language', 'financial',
+    'nationality', 'health', 'character', 'employment', 'family',
+]
+
+
+def _category_expression(category: str, index: int) -> Dict[str, Any]:
+    """JSON Logic for the index-th code of a requirement category."""
+    if category == 'salary':
+        return {">=": [{"var": "salary"}, 25000 + 1000 * index]}
+    if category == 'age':
+        return {"and": [{">=": [{"var": "age"}, 18]}, {"<=": [{"var": "age"}, 65 - index]}]}
+    if category == 'experience':
+        return {">=": [{"var": "years_experience"}, 1 + index % 5]}
+    if category == 'sponsor':
+        if index % 2:
+            return {"and": [{"var": "has_sponsor"}, {"var": "sponsor_licensed"}]}
+        return {"==": [{"var": "has_sponsor"}, True]}
+    if category == 'language':
+        return {"or": [
+            {">=": [{"var": "ielts_score"}, 4.0 + 0.5 * (index % 5)]},
+            {"in": [{"var": "nationality"}, ENGLISH_SPEAKING]},
+        ]}
+    if category == 'financial':
+        return {">=": [{"var": "funds"}, {"+": [1270 + 100 * index, {"*": [{"var": "dependants"}, 285]}]}]}
+    if category == 'nationality':
+        return {"!": {"in": [{"var": "nationality"}, RESTRICTED_NATIONALITIES]}}
+    if category == 'health':
+        return {"or": [
+            {"==": [{"var": "tb_test_passed"}, True]},
+            {"!": {"in": [{"var": "nationality"}, TB_TEST_COUNTRIES]}},
+        ]}
+    if category == 'character':
+        return {"!": [{"var": "has_criminal_record"}]}
+    if category == 'employment':
+        return {"and": [{"var": "has_job_offer"}, {"in": [{"var": "soc_code"}, ELIGIBLE_SOC_CODES]}]}
+    if category == 'family':
+        return {"or": [
+            {"==": [{"var": "dependants"}, 0]},
+            {">=": [{"var": "funds"}, {"+": [1270, {"*": [{"var": "dependants"}, 315 + 10 * index]}]}]},
+        ]}
+    raise ValueError(f"No benchmark expression for category '{category}'")
+
+
+class UKRuleCorpus:
+    """Benchmark rule versions built from the UK taxonomy and requirement-code catalogue."""
+
+    # Routes extracted from the GOV.UK taxonomy export, shipped with the package
+    DEFAULT_PATH = Path(__file__).resolve().parents[1] / 'data' / 'uk_visa_routes.json'
+
+    @staticmethod
+    def load_routes(path: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        Visa routes from a route list or a GOV.UK taxonomy export.
+
+        In a taxonomy export, every taxon whose base_path mentions "visa",
+        "settlement" or "citizenship" becomes a route.
+
+        Args:
+            path: Route list (JSON array) or taxonomy export (JSON object);
+                defaults to the packaged route list
+
+        Returns:
+            List of {'code', 'name', 'base_path'} dicts
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        file_path = Path(path) if path else UKRuleCorpus.DEFAULT_PATH
+        with open(file_path, encoding='utf-8') as handle:
+            taxonomy = json.load(handle)
+        if isinstance(taxonomy, list):
+            return taxonomy
+
+        routes: List[Dict[str, str]] = []
+        seen = set()
+        stack = [taxonomy]
+        while stack:
+            taxon = stack.pop()
+            base_path = taxon.get('base_path') or ''
+            slug = base_path.rstrip('/').rsplit('/', 1)[-1]
+            if slug and re.search(r'visa|settlement|citizenship', slug, re.IGNORECASE) and slug not in seen:
+                seen.add(slug)
+                routes.append({
+                    'code': re.sub(r'[^A-Z0-9]+', '_', slug.upper()).strip('_'),
+                    'name': taxon.get('title') or slug,
+                    'base_path': base_path,
+                })
+            stack.extend(reversed(taxon.get('links', {}).get('child_taxons', [])))
+        return routes
+
+    @staticmethod
+    def categories_for_route(route: Dict[str, str]) -> List[str]:
+        slug = route['base_path'].lower()
+        for keyword, categories in ROUTE_PROFILES:
+            if keyword in slug:
+                return categories
+        return DEFAULT_PROFILE
+
+    @staticmethod
+    def build_requirements(route: Dict[str, str], codes_per_category: int = 3) -> List[Dict[str, Any]]:
+        """
+        Requirement specs for a route.
+
+        Returns:
+            List of {'requirement_code', 'rule_type', 'description', 'condition_expression'}
+        """
+        requirements = []
+        for category in UKRuleCorpus.categories_for_route(route):
+            for index, code in enumerate(get_codes_by_category(category)[:codes_per_category]):
+                requirements.append({
+                    'requirement_code': code,
+                    'rule_type': 'eligibility',
+                    'description': f"{route['name']}: {code.replace('_', ' ').lower()}",
+                    'condition_expression': _category_expression(category, index),
+                })
+        return requirements
+
+    @staticmethod
+    def build(path: Optional[str] = None, codes_per_category: int = 3,
+              max_routes: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Full corpus: one entry per route with its requirement specs.
+
+        Returns:
+            List of {'route': {...}, 'requirements': [...]}
+        """
+        routes = UKRuleCorpus.load_routes(path)
+        if max_routes:
+            routes = routes[:max_routes]
+        return [
+            {'route': route, 'requirements': UKRuleCorpus.build_requirements(route, codes_per_category)}
+            for route in routes
+        ]
+
+
+class CaseFactGenerator:
+    """Seeded generator of synthetic case facts."""
+
+    def __init__(self, seed: int = 0, missing_rate: float = 0.05, string_number_rate: float = 0.05):
+        self._random = random.Random(seed)
+        self.missing_rate = missing_rate
+        self.string_number_rate = string_number_rate
+
+    def _number(self, value):
+        # Facts captured from forms sometimes arrive as strings
+        if self._random.random() < self.string_number_rate:
+            return str(value)
+        return value
+
+    def generate(self) -> Dict[str, Any]:
+        """One case's facts."""
+        rnd = self._random
+        facts = {
+            'age': self._number(rnd.randint(16, 70)),
+            'salary': self._number(rnd.choice([0, rnd.randint(15000, 120000)])),
+            'years_experience': self._number(rnd.randint(0, 20)),
+            'has_sponsor': rnd.random() < 0.6,
+            'sponsor_licensed': rnd.random() < 0.9,
+            'ielts_score': self._number(round(rnd.uniform(3.0, 9.0) * 2) / 2),
+            'nationality': rnd.choice(NATIONALITIES),
+            'funds': self._number(rnd.randint(0, 20000)),
+            'dependants': rnd.choice([0, 0, 0, 1, 2, 3]),
+            'tb_test_passed': rnd.random() < 0.7,
+            'has_criminal_record': rnd.random() < 0.05,
+            'has_job_offer': rnd.random() < 0.6,
+            'soc_code': rnd.choice(ELIGIBLE_SOC_CODES + ['9999', '1115']),
+        }
+        if self.missing_rate:
+            facts = {key: value for key, value in facts.items() if rnd.random() >= self.missing_rate}
+        return facts
+
+    def generate_many(self, count: int) -> List[Dict[str, Any]]:
+        return [self.generate() for _ in range(count)]
@@ -0,0 +1,429 @@
+"""
+Vectorized JSON Logic Evaluation
+
+Columnar evaluation of a supported subset of JSON Logic over many case fact dicts at
+once, used for mass re-scoring (e.g. re-evaluating every open case when a rule version
+is published, or "what-if" threshold changes).
+
+Case facts are pivoted into columns (one per variable). Each column is factorized into
+its distinct values, so operations between a column and a literal (`==`, `in`, `<`, ...)
+are evaluated once per distinct value with the scalar engine and mapped back to rows.
+Numeric comparisons and arithmetic between columns run on NumPy arrays.
+
+Parity with the scalar engine (`main_system.utils.json_logic`) is a hard requirement:
+- Expressions outside the supported subset are rejected at compile time
+  (`compile_vectorized` returns None) and the caller uses the scalar engine.
+- Rows whose values cannot be handled exactly (e.g. comparing a non-numeric string
+  against an arithmetic result, division by zero) are flagged in a fallback mask and
+  must be re-evaluated by the caller with the scalar engine.
+
+Supported subset:
+- `var` with a plain (non-dotted) key, optionally with a literal default
+- primitive literals
+- `==`, `===`, `!=`, `!==`, `>`, `>=`, `<`, `<=`, `in`
+- `and`, `or` (over boolean operands), `!`, `!!`
+- `+`, `-`, `*`, `/` (inside comparisons)
+The expression root must evaluate to a boolean.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from main_system.utils import json_logic
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is in requirements.txt
+    np = None
+
+
+_PRIMITIVES = (str, int, float, bool)
+
+_COMPARISON_OPS = ('>', '>=', '<', '<=')
+_EQUALITY_OPS = ('==', '===', '!=', '!==')
+_ARITHMETIC_OPS = ('+', '-', '*', '/')
+
+
+class _Unsupported(Exception):
+    """Raised at compile time when an expression cannot be vectorized."""
+
+
+# ---------------------------------------------------------------------------
+# Columns
+# ---------------------------------------------------------------------------
+
+class FactColumn:
+    """
+    One variable pivoted across all rows, factorized into distinct values.
+
+    Attributes:
+        codes: int array mapping each row to an index in `uniques`
+        uniques: distinct values (unhashable values are kept per-row)
+        num: float array of `_to_number(value)` (NaN where not numeric)
+        numeric: bool mask where `_to_number(value)` is not None
+        is_none: bool mask where value is None
+        is_float: bool mask where value is a Python float
+    """
+
+    def __init__(self, values: List[Any]):
+        index: Dict[Tuple[type, Any], int] = {}
+        uniques: List[Any] = []
+        codes = np.empty(len(values), dtype=np.intp)
+        for row, value in enumerate(values):
+            try:
+                key = (type(value), value)
+                code = index.get(key)
+                if code is None:
+                    code = index[key] = len(uniques)
+                    uniques.append(value)
+            except TypeError:
+                # Unhashable (list/dict) values: one slot per row
+                code = len(uniques)
+                uniques.append(value)
+            codes[row] = code
+
+        self.codes = codes
+        self.uniques = uniques
+
+        u_num = []
+        u_numeric = []
+        for value in uniques:
+            n = json_logic._to_number(value)
+            u_numeric.append(n is not None)
+            u_num.append(np.nan if n is None else n)
+        self.num = np.asarray(u_num, dtype=np.float64)[codes] if uniques else np.empty(0)
+        self.numeric = np.asarray(u_numeric, dtype=bool)[codes] if uniques else np.empty(0, dtype=bool)
+        self.is_none = self.map_uniques(lambda v: v is None)
+        self.is_float = self.map_uniques(lambda v: isinstance(v, float))
+
+    def map_uniques(self, fn: Callable[[Any], bool]) -> "np.ndarray":
+        """Apply a scalar predicate once per distinct value and broadcast to rows."""
+        if not self.uniques:
+            return np.empty(0, dtype=bool)
+        return np.fromiter((bool(fn(v)) for v in self.uniques), dtype=bool, count=len(self.uniques))[self.codes]
+
+
+class FactColumns:
+    """Lazily pivots a list of case fact dicts into FactColumns."""
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.rows = rows
+        self.size = len(rows)
+        self._columns: Dict[Tuple[str, Any], FactColumn] = {}
+        self._present: Dict[str, "np.ndarray"] = {}
+
+    def column(self, key: str, default: Any = None) -> FactColumn:
+        cache_key = (key, default)
+        column = self._columns.get(cache_key)
+        if column is None:
+            column = FactColumn([row[key] if key in row else default for row in self.rows])
+            self._columns[cache_key] = column
+        return column
+
+    def present(self, key: str) -> "np.ndarray":
+        """Bool mask of rows that have `key`."""
+        mask = self._present.get(key)
+        if mask is None:
+            mask = np.fromiter((key in row for row in self.rows), dtype=bool, count=self.size)
+            self._present[key] = mask
+        return mask
+
+
+# ---------------------------------------------------------------------------
+# Node values
+# ---------------------------------------------------------------------------
+#
+# Compiled nodes return one of:
+#   ('lit', value)                  literal
+#   ('col', FactColumn)             raw variable column
+#   ('num', float array, is_float)  arithmetic result (never None)
+#   ('bool', bool array)            boolean result
+
+Node = Tuple[Any, ...]
+CompiledNode = Callable[[FactColumns, "np.ndarray"], Node]
+
+_SCALAR_BINARY: Dict[str, Callable[[Any], Any]] = {}
+
+
+def _scalar_binary(op: str) -> Callable[[Any, Any], Any]:
+    """Scalar engine semantics for a binary operator, applied to raw values."""
+    fn = _SCALAR_BINARY.get(op)
+    if fn is None:
+        fn = json_logic.compile_logic({op: [{"var": "l"}, {"var": "r"}]})
+        _SCALAR_BINARY[op] = fn
+    return lambda left, right: fn({"l": left, "r": right})
+
+
+def _numeric_parts(node: Node, size: int):
+    """(numbers, numeric mask, none mask) for a comparison operand."""
+    kind = node[0]
+    if kind == 'lit':
+        value = node[1]
+        n = json_logic._to_number(value)
+        return (
+            np.nan if n is None else n,
+            np.full(size, n is not None),
+            np.full(size, value is None),
+        )
+    if kind == 'col':
+        column = node[1]
+        return column.num, column.numeric, column.is_none
+    if kind == 'num':
+        return node[1], np.ones(size, dtype=bool), np.zeros(size, dtype=bool)
+    raise _Unsupported("boolean operand in numeric position")
+
+
+def _arithmetic_operand(node: Node, size: int):
+    """(numbers, is_float) with the scalar engine's `_to_number(x) or 0.0` coercion."""
+    kind = node[0]
+    if kind == 'lit':
+        value = node[1]
+        n = json_logic._to_number(value) or 0.0
+        return np.full(size, n, dtype=np.float64), np.full(size, isinstance(value, float))
+    if kind == 'col':
+        column = node[1]
+        return np.where(column.numeric, column.num, 0.0), column.is_float
+    if kind == 'num':
+        return node[1], node[2]
+    raise _Unsupported("boolean operand in arithmetic")
+
+
+def _as_bool(node: Node, size: int) -> "np.ndarray":
+    kind = node[0]
+    if kind == 'bool':
+        return node[1]
+    raise _Unsupported("non-boolean operand in boolean context")
+
+
+def _compile_operand(logic: Any, context_keys: Optional[frozenset]) -> CompiledNode:
+    if logic is None or isinstance(logic, _PRIMITIVES):
+        return lambda cols, fallback: ('lit', logic)
+    if not isinstance(logic, dict) or len(logic) != 1:
+        raise _Unsupported("unsupported literal")
+
+    op, values = next(iter(logic.items()))
+
+    if op == 'var':
+        default = None
+        key = values
+        if isinstance(values, list):
+            if len(values) not in (1, 2):
+                raise _Unsupported("var arity")
+            key = values[0]
+            default = values[1] if len(values) == 2 else None
+            if not (default is None or isinstance(default, _PRIMITIVES)):
+                raise _Unsupported("non-literal var default")
+        if not isinstance(key, str) or key == '' or '.' in key:
+            raise _Unsupported("only plain var keys are vectorized")
+        if context_keys is not None and key not in context_keys:
+            # Key is never in the evaluation context: always resolves to the default
+            return lambda cols, fallback: ('lit', default)
+        return lambda cols, fallback: ('col', cols.column(key, default))
+
+    args = values if isinstance(values, list) else [values]
+
+    if op in _COMPARISON_OPS or op in _EQUALITY_OPS or op == 'in':
+        if len(args) != 2:
+            raise _Unsupported(f"{op} arity")
+        return _compile_binary(op, args, context_keys)
+
+    if op in ('and', 'or'):
+        if not args:
+            raise _Unsupported(f"empty {op}")
+        compiled = [_compile_operand(a, context_keys) for a in args]
+        reducer = np.logical_and if op == 'and' else np.logical_or
+
+        def fn(cols, fallback):
+            result = _as_bool(compiled[0](cols, fallback), cols.size)
+            for operand in compiled[1:]:
+                result = reducer(result, _as_bool(operand(cols, fallback), cols.size))
+            return ('bool', result)
+        return fn
+
+    if op in ('!', '!!'):
+        if len(args) < 1:
+            raise _Unsupported(f"{op} arity")
+        operand = _compile_operand(args[0], context_keys)
+        negate = op == '!'
+
+        def fn(cols, fallback):
+            node = operand(cols, fallback)
+            kind = node[0]
+            if kind == 'bool':
+                truthy = node[1]
+            elif kind == 'col':
+                truthy = node[1].map_uniques(bool)
+            elif kind == 'num':
+                truthy = node[1] != 0
+            else:
+                truthy = np.full(cols.size, bool(node[1]))
+            return ('bool', ~truthy if negate else truthy)
+        return fn
+
+    if op in _ARITHMETIC_OPS:
+        return _compile_arithmetic(op, args, context_keys)
+
+    raise _Unsupported(f"operator {op} is not vectorized")
+
+
+def _compile_binary(op: str, args: List[Any], context_keys: Optional[frozenset]) -> CompiledNode:
+    left_fn = _compile_operand(args[0], context_keys)
+    if op == 'in' and isinstance(args[1], list):
+        # Literal haystack list: allow primitives only
+        if not all(v is None or isinstance(v, _PRIMITIVES) for v in args[1]):
+            raise _Unsupported("non-primitive in haystack")
+        haystack = list(args[1])
+        right_fn = lambda cols, fallback: ('lit', haystack)  # noqa: E731
+    else:
+        right_fn = _compile_operand(args[1], context_keys)
+    scalar = _scalar_binary(op)
+
+    def fn(cols, fallback):
+        left = left_fn(cols, fallback)
+        right = right_fn(cols, fallback)
+        size = cols.size
+
+        if left[0] == 'lit' and right[0] == 'lit':
+            return ('bool', np.full(size, bool(scalar(left[1], right[1]))))
+
+        # Column vs literal: evaluate once per distinct value
+        if left[0] == 'col' and right[0] == 'lit':
+            literal = right[1]
+            return ('bool', left[1].map_uniques(lambda v: scalar(v, literal)))
+        if left[0] == 'lit' and right[0] == 'col':
+            literal = left[1]
+            return ('bool', right[1].map_uniques(lambda v: scalar(literal, v)))
+
+        if op in _COMPARISON_OPS:
+            return ('bool', _numeric_compare(op, left, right, size, fallback))
+
+        if op in _EQUALITY_OPS and 'num' in (left[0], right[0]):
+            other = right if left[0] == 'num' else left
+            number = left if left[0] == 'num' else right
+            if other[0] == 'lit':
+                literal = other[1]
+                if isinstance(literal, (int, float)):  # includes bool
+                    equal = number[1] == float(literal)
+                else:
+                    equal = np.zeros(size, dtype=bool)
+                return ('bool', equal if op in ('==', '===') else ~equal)
+
+        raise _Unsupported(f"{op} between {left[0]} and {right[0]}")
+    return fn
+
+
+def _numeric_compare(op: str, left: Node, right: Node, size: int, fallback: "np.ndarray") -> "np.ndarray":
+    l_num, l_ok, l_none = _numeric_parts(left, size)
+    r_num, r_ok, r_none = _numeric_parts(right, size)
+    any_none = l_none | r_none
+    both_numeric = l_ok & r_ok & ~any_none
+    # Rows with non-numeric, non-None operands use Python comparison semantics
+    fallback |= ~(both_numeric | any_none)
+    with np.errstate(invalid='ignore'):
+        if op == '>':
+            result = l_num > r_num
+        elif op == '>=':
+            result = l_num >= r_num
+        elif op == '<':
+            result = l_num < r_num
+        else:
+            result = l_num <= r_num
+    return np.asarray(result, dtype=bool) & both_numeric
+
+
+def _compile_arithmetic(op: str, args: List[Any], context_keys: Optional[frozenset]) -> CompiledNode:
+    if not args or (op in ('/',) and len(args) < 2) or (op == '-' and len(args) > 2):
+        raise _Unsupported(f"{op} arity")
+    compiled = [_compile_operand(a, context_keys) for a in args]
+
+    def fn(cols, fallback):
+        size = cols.size
+        operands = [_arithmetic_operand(c(cols, fallback), size) for c in compiled]
+        with np.errstate(all='ignore'):
+            if op == '+':
+                total = np.zeros(size, dtype=np.float64)
+                has_float = np.zeros(size, dtype=bool)
+                for values, is_float in operands:
+                    total = total + values
+                    has_float = has_float | is_float
+                # The scalar engine returns int(total) without float operands
+                fallback |= ~has_float & ~np.isfinite(total)
+                truncated = np.trunc(np.where(np.isfinite(total), total, 0.0))
+                return ('num', np.where(has_float, total, truncated), has_float)
+            if op == '-':
+                if len(operands) == 1:
+                    return ('num', -operands[0][0], np.ones(size, dtype=bool))
+                return ('num', operands[0][0] - operands[1][0], np.ones(size, dtype=bool))
+            if op == '*':
+                product = np.ones(size, dtype=np.float64)
+                for values, _ in operands:
+                    product = product * values
+                return ('num', product, np.ones(size, dtype=bool))
+            # '/'
+            divisor = operands[1][0]
+            fallback |= divisor == 0  # scalar engine raises ZeroDivisionError
+            quotient = operands[0][0] / np.where(divisor == 0, 1.0, divisor)
+            return ('num', quotient, np.ones(size, dtype=bool))
+    return fn
+
+
+class VectorizedExpression:
+    """A compiled expression evaluable over FactColumns."""
+
+    def __init__(self, root: CompiledNode):
+        self._root = root
+
+    def evaluate(self, columns: FactColumns) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Evaluate over all rows.
+
+        Returns:
+            (results, fallback): bool result per row, and bool mask of rows that
+            must be re-evaluated with the scalar engine.
+        """
+        fallback = np.zeros(columns.size, dtype=bool)
+        node = self._root(columns, fallback)
+        return _as_bool(node, columns.size), fallback
+
+
+def is_available() -> bool:
+    """Whether NumPy is installed."""
+    return np is not None
+
+
+def compile_vectorized(expression: Any, context_keys=None) -> Optional[VectorizedExpression]:
+    """
+    Compile a JSON Logic expression for columnar evaluation.
+
+    The root must be a boolean-valued operator. Returns None when the expression (or
+    NumPy) is unsupported; callers should then use the scalar engine.
+
+    Args:
+        expression: JSON Logic expression
+        context_keys: Optional iterable of the fact keys present in the scalar
+            evaluation context. RuleEngineService evaluates against only the
+            variables it extracted, so a `var` outside that set resolves to its
+            default there and must do so here too.
+    """
+    if context_keys is not None:
+        context_keys = frozenset(context_keys)
+    if np is None:
+        return None
+    if not isinstance(expression, dict) or len(expression) != 1:
+        return None
+    op = next(iter(expression))
+    if op not in _COMPARISON_OPS + _EQUALITY_OPS + ('in', 'and', 'or', '!', '!!'):
+        return None
+    try:
+        root = _compile_operand(expression, context_keys)
+    except _Unsupported:
+        return None
+
+    vectorized = VectorizedExpression(root)
+    # Operand kinds are only known once evaluated; probe with an empty frame so
+    # shape errors (e.g. `and` over a raw column) surface here, not mid-run.
+    try:
+        vectorized.evaluate(FactColumns([]))
+    except _Unsupported:
+        return None
+    return vectorized
@@ -0,0 +1,2 @@
+# Management commands for rules_knowledge app
+
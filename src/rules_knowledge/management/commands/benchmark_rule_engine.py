@@ -0,0 +1,124 @@
+"""
+Management command to benchmark the rule engine against the UK benchmark corpus.
+
+Usage:
+    python manage.py benchmark_rule_engine
+    python manage.py benchmark_rule_engine --cases 1000 --output results.json
+    python manage.py benchmark_rule_engine --baseline previous.json --max-regression 0.2
+
+All benchmark data is written inside a rolled-back transaction. Run with
+--migrate against a fresh SQLite database to benchmark fully offline.
+"""
+
+import json
+import logging
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+from rules_knowledge.services.rule_engine_benchmark_service import RuleEngineBenchmarkService
+
+logger = logging.getLogger('django')
+
+
+class Command(BaseCommand):
+    help = 'Benchmark rule engine evaluation against the UK rule corpus'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--cases',
+            type=int,
+            default=200,
+            help='Number of synthetic cases to evaluate (default: 200)',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Seed for the synthetic case-fact generator (default: 0)',
+        )
+        parser.add_argument(
+            '--codes-per-category',
+            type=int,
+            default=3,
+            help='Requirement codes per category per route (default: 3)',
+        )
+        parser.add_argument(
+            '--max-routes',
+            type=int,
+            help='Limit the number of routes loaded from the corpus',
+        )
+        parser.add_argument(
+            '--corpus',
+            type=str,
+            help='Path to a route list or GOV.UK taxonomy export (default: packaged UK route list)',
+        )
+        parser.add_argument(
+            '--skip-db',
+            action='store_true',
+            help='Skip the run_eligibility_evaluation query-count benchmark',
+        )
+        parser.add_argument(
+            '--migrate',
+            action='store_true',
+            help='Apply migrations first (for a fresh SQLite database)',
+        )
+        parser.add_argument(
+            '--output',
+            type=str,
+            help='Write JSON results to this file instead of stdout',
+        )
+        parser.add_argument(
+            '--baseline',
+            type=str,
+            help='Previous JSON results to compare against; exits non-zero on regression',
+        )
+        parser.add_argument(
+            '--max-regression',
+            type=float,
+            default=0.2,
+            help='Allowed relative regression against --baseline (default: 0.2)',
+        )
+
+    def handle(self, *args, **options):
+        if options['cases'] < 1:
+            raise CommandError('--cases must be at least 1')
+
+        if options['migrate']:
+            call_command('migrate', interactive=False, verbosity=0)
+
+        report = RuleEngineBenchmarkService.run(
+            cases=options['cases'],
+            seed=options['seed'],
+            codes_per_category=options['codes_per_category'],
+            max_routes=options.get('max_routes'),
+            corpus_path=options.get('corpus'),
+            include_db=not options['skip_db'],
+        )
+
+        regressions = []
+        if options.get('baseline'):
+            try:
+                with open(options['baseline'], encoding='utf-8') as handle:
+                    baseline = json.load(handle)
+            except (OSError, ValueError) as e:
+                raise CommandError(f"Cannot read baseline '{options['baseline']}': {e}")
+            regressions = RuleEngineBenchmarkService.compare_with_baseline(
+                report['metrics'],
+                baseline.get('metrics', {}),
+                max_regression=options['max_regression'],
+            )
+            report['regressions'] = regressions
+
+        output = json.dumps(report, indent=2, default=str)
+        if options.get('output'):
+            with open(options['output'], 'w', encoding='utf-8') as handle:
+                handle.write(output)
+            self.stdout.write(self.style.SUCCESS(f"Benchmark results written to {options['output']}"))
+        else:
+            self.stdout.write(output)
+
+        if regressions:
+            for regression in regressions:
+                self.stderr.write(self.style.ERROR(f'Regression: {regression}'))
+            raise CommandError(f'{len(regressions)} benchmark metric(s) regressed')
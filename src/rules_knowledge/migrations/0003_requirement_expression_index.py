@@ -0,0 +1,104 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:39
+
+import hashlib
+import json
+
+from django.db import migrations, models
+
+
+# Frozen copy of rules_knowledge.helpers.expression_index as of this migration
+# (migrations must not depend on app code that may change later).
+def _extract_variables(expression):
+    variables = []
+    seen = set()
+    stack = [expression]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            if "var" in obj:
+                var_name = obj["var"]
+                if isinstance(var_name, str) and var_name not in seen:
+                    seen.add(var_name)
+                    variables.append(var_name)
+            stack.extend(reversed(list(obj.values())))
+        elif isinstance(obj, list):
+            stack.extend(reversed(obj))
+    return variables
+
+
+def _expression_hash(expression):
+    if expression is None:
+        return ""
+    canonical = json.dumps(expression, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def backfill_expression_index(apps, schema_editor):
+    # Index existing rows so the rule engine can rely on the stored variables.
+    for model_name, field in (
+        ("VisaRequirement", "condition_expression"),
+        ("VisaDocumentRequirement", "conditional_logic"),
+    ):
+        Model = apps.get_model("rules_knowledge", model_name)
+        batch = []
+        for obj in Model.objects.only("id", field).iterator(chunk_size=500):
+            expression = getattr(obj, field)
+            obj.referenced_variables = _extract_variables(expression) if expression else []
+            obj.expression_hash = _expression_hash(expression)
+            batch.append(obj)
+            if len(batch) >= 500:
+                Model.objects.bulk_update(batch, ["referenced_variables", "expression_hash"])
+                batch = []
+        if batch:
+            Model.objects.bulk_update(batch, ["referenced_variables", "expression_hash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("rules_knowledge", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="visadocumentrequirement",
+            name="expression_hash",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                default="",
+                help_text="SHA-256 of the normalized conditional_logic (empty until indexed)",
+                max_length=64,
+            ),
+        ),
+        migrations.AddField(
+            model_name="visadocumentrequirement",
+            name="referenced_variables",
+            field=models.JSONField(
+                blank=True,
+                default=list,
+                help_text="Fact keys referenced by conditional_logic (precomputed)",
+            ),
+        ),
+        migrations.AddField(
+            model_name="visarequirement",
+            name="expression_hash",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                default="",
+                help_text="SHA-256 of the normalized condition_expression (empty until indexed)",
+                max_length=64,
+            ),
+        ),
+        migrations.AddField(
+            model_name="visarequirement",
+            name="referenced_variables",
+            field=models.JSONField(
+                blank=True,
+                default=list,
+                help_text="Fact keys referenced by condition_expression (precomputed)",
+            ),
+        ),
+        migrations.RunPython(backfill_expression_index, migrations.RunPython.noop),
+    ]
@@ -39,6 +39,21 @@ class VisaDocumentRequirement(models.Model):
         help_text="Optional JSON Logic for conditional requirements (e.g., dependants)"
     )
     
+    # Expression index (maintained by the repository and at publish time)
+    referenced_variables = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="Fact keys referenced by conditional_logic (precomputed)"
+    )
+    
+    expression_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default='',
+        db_index=True,
+        help_text="SHA-256 of the normalized conditional_logic (empty until indexed)"
+    )
+    
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -53,6 +53,21 @@ class VisaRequirement(models.Model):
         help_text="Whether this requirement is mandatory"
     )
     
+    # Expression index (maintained by the repository and at publish time)
+    referenced_variables = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="Fact keys referenced by condition_expression (precomputed)"
+    )
+    
+    expression_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default='',
+        db_index=True,
+        help_text="SHA-256 of the normalized condition_expression (empty until indexed)"
+    )
+    
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
 
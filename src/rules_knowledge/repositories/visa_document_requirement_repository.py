@@ -2,6 +2,7 @@ from django.db import transaction
 from rules_knowledge.models.visa_document_requirement import VisaDocumentRequirement
 from rules_knowledge.models.visa_rule_version import VisaRuleVersion
 from rules_knowledge.models.document_type import DocumentType
+from rules_knowledge.helpers.expression_index import ExpressionIndex
 
 
 class VisaDocumentRequirementRepository:
@@ -16,7 +17,8 @@ class VisaDocumentRequirementRepository:
                 rule_version=rule_version,
                 document_type=document_type,
                 mandatory=mandatory,
-                conditional_logic=conditional_logic
+                conditional_logic=conditional_logic,
+                **ExpressionIndex.index_fields(conditional_logic)
             )
             doc_requirement.full_clean()
             doc_requirement.save()
@@ -29,6 +31,9 @@ class VisaDocumentRequirementRepository:
             for key, value in fields.items():
                 if hasattr(doc_requirement, key):
                     setattr(doc_requirement, key, value)
+            if 'conditional_logic' in fields:
+                for key, value in ExpressionIndex.index_fields(doc_requirement.conditional_logic).items():
+                    setattr(doc_requirement, key, value)
             doc_requirement.full_clean()
             doc_requirement.save()
             return doc_requirement
@@ -42,3 +47,25 @@ class VisaDocumentRequirementRepository:
             rule_version_id = doc_requirement.rule_version.id
             
             doc_requirement.delete()
+
+    @staticmethod
+    def reindex_rule_version(rule_version: VisaRuleVersion) -> int:
+        """
+        Recompute referenced_variables/expression_hash for every document requirement of a rule version.
+
+        Returns:
+            Number of document requirements whose index changed
+        """
+        changed = []
+        for doc_requirement in VisaDocumentRequirement.objects.filter(rule_version=rule_version).only(
+            'id', 'conditional_logic', 'referenced_variables', 'expression_hash'
+        ):
+            fields = ExpressionIndex.index_fields(doc_requirement.conditional_logic)
+            if (doc_requirement.expression_hash != fields['expression_hash']
+                    or doc_requirement.referenced_variables != fields['referenced_variables']):
+                doc_requirement.referenced_variables = fields['referenced_variables']
+                doc_requirement.expression_hash = fields['expression_hash']
+                changed.append(doc_requirement)
+        if changed:
+            VisaDocumentRequirement.objects.bulk_update(changed, ['referenced_variables', 'expression_hash'])
+        return len(changed)
@@ -3,6 +3,8 @@ from django.core.exceptions import ValidationError
 from rules_knowledge.models.visa_requirement import VisaRequirement
 from rules_knowledge.models.visa_rule_version import VisaRuleVersion
 from rules_knowledge.helpers.json_logic_validator import JSONLogicValidator
+from rules_knowledge.helpers.expression_index import ExpressionIndex
+from rules_knowledge.helpers.active_rule_version_cache import ActiveRuleVersionCache
 
 
 class VisaRequirementRepository:
@@ -33,10 +35,12 @@ class VisaRequirementRepository:
                 rule_type=rule_type,
                 description=description,
                 condition_expression=condition_expression,
-                is_mandatory=is_mandatory
+                is_mandatory=is_mandatory,
+                **ExpressionIndex.index_fields(condition_expression)
             )
             requirement.full_clean()
             requirement.save()
+            ActiveRuleVersionCache.invalidate()
             return requirement
 
     @staticmethod
@@ -62,8 +66,12 @@ class VisaRequirementRepository:
             for key, value in fields.items():
                 if hasattr(requirement, key):
                     setattr(requirement, key, value)
+            if 'condition_expression' in fields:
+                for key, value in ExpressionIndex.index_fields(requirement.condition_expression).items():
+                    setattr(requirement, key, value)
             requirement.full_clean()
             requirement.save()
+            ActiveRuleVersionCache.invalidate()
             return requirement
 
     @staticmethod
@@ -75,4 +83,26 @@ class VisaRequirementRepository:
             rule_version_id = requirement.rule_version.id
             
             requirement.delete()
+            ActiveRuleVersionCache.invalidate()
+
+    @staticmethod
+    def reindex_rule_version(rule_version: VisaRuleVersion) -> int:
+        """
+        Recompute referenced_variables/expression_hash for every requirement of a rule version.
 
+        Returns:
+            Number of requirements whose index changed
+        """
+        changed = []
+        for requirement in VisaRequirement.objects.filter(rule_version=rule_version).only(
+            'id', 'condition_expression', 'referenced_variables', 'expression_hash'
+        ):
+            fields = ExpressionIndex.index_fields(requirement.condition_expression)
+            if (requirement.expression_hash != fields['expression_hash']
+                    or requirement.referenced_variables != fields['referenced_variables']):
+                requirement.referenced_variables = fields['referenced_variables']
+                requirement.expression_hash = fields['expression_hash']
+                changed.append(requirement)
+        if changed:
+            VisaRequirement.objects.bulk_update(changed, ['referenced_variables', 'expression_hash'])
+        return len(changed)
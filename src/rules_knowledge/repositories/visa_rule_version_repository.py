@@ -5,6 +5,10 @@ from rules_knowledge.models.visa_rule_version import VisaRuleVersion
 from rules_knowledge.models.visa_type import VisaType
 from rules_knowledge.services.rule_version_conflict_service import RuleVersionConflictService
 from rules_knowledge.helpers.metrics import track_version_conflict
+from rules_knowledge.helpers.compiled_expression_cache import CompiledExpressionCache
+from rules_knowledge.helpers.active_rule_version_cache import ActiveRuleVersionCache
+from rules_knowledge.repositories.visa_requirement_repository import VisaRequirementRepository
+from rules_knowledge.repositories.visa_document_requirement_repository import VisaDocumentRequirementRepository
 
 
 class VisaRuleVersionRepository:
@@ -71,6 +75,7 @@ class VisaRuleVersionRepository:
             )
             rule_version.full_clean()
             rule_version.save()
+            ActiveRuleVersionCache.invalidate()
             return rule_version
 
     @staticmethod
@@ -145,6 +150,7 @@ class VisaRuleVersionRepository:
             rule_version.version = int(rule_version.version) + 1
             rule_version.full_clean()
             rule_version.save()
+            ActiveRuleVersionCache.invalidate()
             
             # Reload to get the updated version number
             rule_version.refresh_from_db()
@@ -190,6 +196,14 @@ class VisaRuleVersionRepository:
             rule_version.full_clean()
             rule_version.save()
             
+            # Refresh the precomputed expression index of the published requirements
+            VisaRequirementRepository.reindex_rule_version(rule_version)
+            VisaDocumentRequirementRepository.reindex_rule_version(rule_version)
+            
+            # Drop compiled expressions so the engine recompiles from the published state
+            CompiledExpressionCache.invalidate_rule_version(rule_version.id)
+            ActiveRuleVersionCache.invalidate()
+            
             # Reload to get the updated version number
             rule_version.refresh_from_db()
             return rule_version
@@ -219,3 +233,4 @@ class VisaRuleVersionRepository:
             rule_version.is_deleted = True
             rule_version.deleted_at = timezone.now()
             rule_version.save()
+            ActiveRuleVersionCache.invalidate()
@@ -1,5 +1,7 @@
+from typing import Dict, Iterable, List
 from rules_knowledge.models.visa_requirement import VisaRequirement
 from rules_knowledge.models.visa_rule_version import VisaRuleVersion
+from rules_knowledge.helpers.expression_index import ExpressionIndex
 
 
 class VisaRequirementSelector:
@@ -78,3 +80,30 @@ class VisaRequirementSelector:
             queryset = queryset.filter(created_at__lte=date_to)
         
         return queryset.order_by('requirement_code')
+
+    @staticmethod
+    def get_fact_key_index(rule_version: VisaRuleVersion) -> Dict[str, List[str]]:
+        """
+        Reverse index of fact key -> ids of the requirements whose expression references it.
+
+        Uses the precomputed referenced_variables; rows not yet indexed are
+        extracted on the fly.
+        """
+        index: Dict[str, List[str]] = {}
+        rows = VisaRequirement.objects.filter(rule_version=rule_version).values_list(
+            'id', 'condition_expression', 'referenced_variables', 'expression_hash'
+        )
+        for requirement_id, expression, referenced_variables, expression_hash in rows:
+            if not expression_hash:
+                referenced_variables = ExpressionIndex.extract_variables(expression) if expression else []
+            for fact_key in referenced_variables or []:
+                index.setdefault(fact_key, []).append(str(requirement_id))
+        return index
+
+    @staticmethod
+    def get_by_fact_keys(rule_version: VisaRuleVersion, fact_keys: Iterable[str]):
+        """Get requirements of a rule version that reference any of the given fact keys."""
+        fact_keys = set(fact_keys)
+        index = VisaRequirementSelector.get_fact_key_index(rule_version)
+        requirement_ids = {rid for key in fact_keys for rid in index.get(key, [])}
+        return VisaRequirementSelector.get_by_rule_version(rule_version).filter(id__in=requirement_ids)
@@ -1,7 +1,12 @@
+import logging
 from django.utils import timezone
 from django.db import models
 from rules_knowledge.models.visa_rule_version import VisaRuleVersion
 from rules_knowledge.models.visa_type import VisaType
+from rules_knowledge.selectors.visa_requirement_selector import VisaRequirementSelector
+from rules_knowledge.helpers.active_rule_version_cache import ActiveRuleVersionCache, ActiveRuleVersionSnapshot
+
+logger = logging.getLogger('django')
 
 
 class VisaRuleVersionSelector:
@@ -28,20 +33,78 @@ class VisaRuleVersionSelector:
     @staticmethod
     def get_current_by_visa_type(visa_type: VisaType, use_cache: bool = True):
         """Get current rule version for a visa type (excluding soft-deleted, with caching)."""
-        now = timezone.now()
-        version = VisaRuleVersion.objects.select_related(
-            'visa_type',
-            'source_document_version',
-            'source_document_version__source_document'
-        ).filter(
-            visa_type=visa_type,
-            effective_from__lte=now,
+        if visa_type is None:
+            return None
+        snapshot = VisaRuleVersionSelector.get_active_snapshot(visa_type.id, use_cache=use_cache)
+        return snapshot.rule_version
+
+    @staticmethod
+    def get_active_snapshot(visa_type_id, evaluation_date=None, use_cache: bool = True) -> ActiveRuleVersionSnapshot:
+        """
+        Get the active rule version and its requirements for a visa type at a date.
+
+        Active means published, not soft-deleted, effective_from <= date and
+        (effective_to IS NULL OR effective_to >= date); the latest effective_from wins.
+        Served from ActiveRuleVersionCache when possible.
+
+        Args:
+            visa_type_id: UUID of the visa type
+            evaluation_date: Date to resolve at (defaults to now)
+            use_cache: Read from / populate the process-local cache
+
+        Returns:
+            ActiveRuleVersionSnapshot (rule_version is None when nothing is active)
+        """
+        if evaluation_date is None:
+            evaluation_date = timezone.now()
+
+        if use_cache:
+            snapshot = ActiveRuleVersionCache.get(visa_type_id, evaluation_date)
+            if snapshot is not None:
+                return snapshot
+
+        # Read the namespace version before querying: a write landing mid-load leaves this entry stale
+        namespace_version = ActiveRuleVersionCache.namespace_version()
+        published = VisaRuleVersion.objects.filter(
+            visa_type_id=visa_type_id,
             is_published=True,
             is_deleted=False
-        ).filter(
-            models.Q(effective_to__isnull=True) | models.Q(effective_to__gte=now)
-        ).order_by('-effective_from').first()
-        return version
+        )
+        # Two rows are enough to detect overlapping versions without a separate count()
+        active_versions = list(
+            published.select_related(
+                'visa_type',
+                'source_document_version',
+                'source_document_version__source_document'
+            ).filter(
+                effective_from__lte=evaluation_date
+            ).filter(
+                models.Q(effective_to__isnull=True) | models.Q(effective_to__gte=evaluation_date)
+            ).order_by('-effective_from')[:2]
+        )
+        rule_version = active_versions[0] if active_versions else None
+        if len(active_versions) > 1:
+            logger.warning(
+                f"Multiple active rule versions found for visa type {visa_type_id}. "
+                f"Using most recent: {rule_version.id}"
+            )
+
+        requirements = tuple(VisaRequirementSelector.get_by_rule_version(rule_version)) if rule_version else ()
+        next_effective_from = published.filter(
+            effective_from__gt=evaluation_date
+        ).order_by('effective_from').values_list('effective_from', flat=True).first()
+
+        snapshot = ActiveRuleVersionSnapshot(
+            visa_type_id=str(visa_type_id),
+            rule_version=rule_version,
+            requirements=requirements,
+            namespace_version=namespace_version,
+            valid_from=evaluation_date,
+            valid_until=next_effective_from,
+        )
+        if use_cache:
+            ActiveRuleVersionCache.put(snapshot)
+        return snapshot
 
     @staticmethod
     def get_published():
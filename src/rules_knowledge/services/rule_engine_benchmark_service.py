@@ -0,0 +1,383 @@
+"""
+Rule Engine Benchmark Service
+
+Offline micro-benchmarks for the rule engine against the UK benchmark corpus
+(see rules_knowledge.helpers.rule_engine_benchmark). Measures:
+- JSON Logic interpreter vs compiled evaluations/sec
+- RuleEngineService.evaluate_requirement evaluations/sec and p50/p99 latency, overall
+  and per requirement code
+- bulk scalar vs vectorized cases/sec for one rule version
+- allocated bytes per evaluation (tracemalloc)
+- DB queries per run_eligibility_evaluation (first and repeat call)
+
+The corpus and the benchmark case are written inside a transaction that is always
+rolled back, so the benchmark can run against any configured database (SQLite or
+PostgreSQL) without leaving data behind.
+"""
+import gc
+import logging
+import platform
+import time
+import tracemalloc
+import uuid
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from main_system.utils import json_logic
+from rules_knowledge.helpers.rule_engine_benchmark import CaseFactGenerator, UKRuleCorpus
+from rules_knowledge.repositories.visa_requirement_repository import VisaRequirementRepository
+from rules_knowledge.repositories.visa_rule_version_repository import VisaRuleVersionRepository
+from rules_knowledge.repositories.visa_type_repository import VisaTypeRepository
+from rules_knowledge.selectors.visa_requirement_selector import VisaRequirementSelector
+from rules_knowledge.services.rule_engine_service import RuleEngineService
+
+logger = logging.getLogger('django')
+
+# Per-metric direction for baseline comparison: True when higher is better
+HIGHER_IS_BETTER = {
+    'interpreter_evals_per_sec': True,
+    'compiled_evals_per_sec': True,
+    'requirement_evals_per_sec': True,
+    'bulk_scalar_cases_per_sec': True,
+    'bulk_vectorized_cases_per_sec': True,
+    'requirement_p50_us': False,
+    'requirement_p99_us': False,
+    'bytes_per_evaluation': False,
+    'queries_per_evaluation_first': False,
+    'queries_per_evaluation_repeat': False,
+}
+
+
+class _Rollback(Exception):
+    """Raised to roll back the benchmark transaction."""
+
+
+def _percentile(sorted_values: List[float], percentile: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(percentile / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _rate(count: int, elapsed: float) -> float:
+    return round(count / elapsed, 1) if elapsed > 0 else 0.0
+
+
+class RuleEngineBenchmarkService:
+    """Runs rule engine micro-benchmarks and returns machine-readable results."""
+
+    @staticmethod
+    def run(
+        cases: int = 200,
+        seed: int = 0,
+        codes_per_category: int = 3,
+        max_routes: Optional[int] = None,
+        corpus_path: Optional[str] = None,
+        include_db: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Run the full benchmark suite.
+
+        Args:
+            cases: Number of synthetic cases to evaluate
+            seed: Seed for the case-fact generator
+            codes_per_category: Requirement codes taken per category per route
+            max_routes: Optional cap on the number of routes loaded
+            corpus_path: Optional route list or GOV.UK taxonomy export (defaults to the packaged UK routes)
+            include_db: Also measure DB queries per run_eligibility_evaluation
+
+        Returns:
+            JSON-serialisable dict with 'environment', 'corpus', 'metrics', 'requirements'
+            (latency per requirement code) and 'routes'
+        """
+        corpus = UKRuleCorpus.build(corpus_path, codes_per_category=codes_per_category, max_routes=max_routes)
+        facts = CaseFactGenerator(seed=seed).generate_many(cases)
+
+        report: Dict[str, Any] = {
+            'environment': {
+                'python': platform.python_version(),
+                'database': connection.vendor,
+                'timestamp': timezone.now().isoformat(),
+            },
+            'corpus': {
+                'routes': len(corpus),
+                'requirements': sum(len(entry['requirements']) for entry in corpus),
+                'cases': cases,
+                'seed': seed,
+            },
+        }
+
+        expressions = [req['condition_expression'] for entry in corpus for req in entry['requirements']]
+        metrics = RuleEngineBenchmarkService.benchmark_expressions(expressions, facts)
+
+        requirement_metrics: List[Dict[str, Any]] = []
+        route_metrics: List[Dict[str, Any]] = []
+        try:
+            with transaction.atomic():
+                rule_versions = RuleEngineBenchmarkService.persist_corpus(corpus)
+                requirement_result = RuleEngineBenchmarkService.benchmark_requirements(rule_versions, facts)
+                requirement_metrics = requirement_result.pop('requirements')
+                metrics.update(requirement_result)
+                route_metrics = [
+                    RuleEngineBenchmarkService.benchmark_bulk(rule_version, facts)
+                    for rule_version in rule_versions
+                ]
+                metrics.update(RuleEngineBenchmarkService.summarise_bulk(route_metrics, cases))
+                if include_db and rule_versions:
+                    metrics.update(RuleEngineBenchmarkService.benchmark_queries(rule_versions[0], facts[0]))
+                raise _Rollback()
+        except _Rollback:
+            pass
+
+        report['metrics'] = metrics
+        report['requirements'] = requirement_metrics
+        report['routes'] = route_metrics
+        return report
+
+    @staticmethod
+    def persist_corpus(corpus: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Create a visa type and published rule version per corpus route.
+
+        Must be called inside a transaction the caller rolls back.
+
+        Returns:
+            List of VisaRuleVersion instances
+        """
+        rule_versions = []
+        effective_from = timezone.now() - timezone.timedelta(hours=1)
+        suffix = uuid.uuid4().hex[:6].upper()
+        for entry in corpus:
+            route = entry['route']
+            visa_type = VisaTypeRepository.create_visa_type(
+                jurisdiction='UK',
+                code=f"BENCH_{route['code']}_{suffix}"[:50],
+                name=route['name'][:255],
+                description=f"Benchmark route {route['base_path']}",
+            )
+            rule_version = VisaRuleVersionRepository.create_rule_version(
+                visa_type=visa_type,
+                effective_from=effective_from,
+                is_published=False,
+                check_conflicts=False,
+            )
+            for spec in entry['requirements']:
+                VisaRequirementRepository.create_requirement(rule_version=rule_version, **spec)
+            rule_versions.append(VisaRuleVersionRepository.publish_rule_version(rule_version))
+        return rule_versions
+
+    @staticmethod
+    def benchmark_expressions(expressions: List[Any], facts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Raw JSON Logic throughput: interpreter vs compiled callables.
+
+        Facts are normalised the way RuleEngineService normalises them, so both
+        engines see the same inputs as in production.
+        """
+        normalized = [
+            {key: RuleEngineService.normalize_fact_value(value) for key, value in case.items()}
+            for case in facts
+        ]
+        compiled = [json_logic.compile_logic(expression) for expression in expressions]
+        evaluations = len(expressions) * len(normalized)
+
+        start = time.perf_counter()
+        for case in normalized:
+            for expression in expressions:
+                try:
+                    json_logic.jsonLogic(expression, case)
+                except Exception:
+                    pass
+        interpreter_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for case in normalized:
+            for function in compiled:
+                try:
+                    function(case)
+                except Exception:
+                    pass
+        compiled_elapsed = time.perf_counter() - start
+
+        return {
+            'interpreter_evals_per_sec': _rate(evaluations, interpreter_elapsed),
+            'compiled_evals_per_sec': _rate(evaluations, compiled_elapsed),
+        }
+
+    @staticmethod
+    def benchmark_requirements(rule_versions: List[Any], facts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        RuleEngineService.evaluate_requirement throughput, latency and allocations.
+
+        Returns:
+            Metrics dict including p50/p99 latency (microseconds) per requirement evaluation,
+            plus 'requirements': the same latencies per requirement code (a code is one
+            requirement group, evaluated once per route that uses it)
+        """
+        prepared = []
+        for rule_version in rule_versions:
+            for requirement in VisaRequirementSelector.get_by_rule_version(rule_version):
+                variables = RuleEngineService.get_indexed_variables(requirement, requirement.condition_expression)
+                RuleEngineService.get_compiled_expression(requirement)
+                prepared.append((requirement, variables))
+
+        latencies: List[int] = []
+        latencies_by_code: Dict[str, List[int]] = {}
+        perf_counter_ns = time.perf_counter_ns
+        evaluate = RuleEngineService.evaluate_requirement
+        start = time.perf_counter()
+        for case in facts:
+            for requirement, variables in prepared:
+                began = perf_counter_ns()
+                evaluate(requirement, case, required_variables=variables)
+                latency = perf_counter_ns() - began
+                latencies.append(latency)
+                latencies_by_code.setdefault(requirement.requirement_code, []).append(latency)
+        elapsed = time.perf_counter() - start
+
+        # Allocation pass kept separate so tracing overhead does not skew timings
+        sample = facts[:min(len(facts), 20)]
+        gc.collect()
+        tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            retained = []
+            for case in sample:
+                for requirement, variables in prepared:
+                    retained.append(evaluate(requirement, case, required_variables=variables))
+            after, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        sampled = len(sample) * len(prepared)
+
+        latencies.sort()
+        return {
+            'requirement_evaluations': len(latencies),
+            'requirement_evals_per_sec': _rate(len(latencies), elapsed),
+            'requirement_p50_us': round(_percentile(latencies, 50) / 1000.0, 2),
+            'requirement_p99_us': round(_percentile(latencies, 99) / 1000.0, 2),
+            'bytes_per_evaluation': round((after - before) / sampled, 1) if sampled else 0.0,
+            'peak_bytes_per_evaluation': round((peak - before) / sampled, 1) if sampled else 0.0,
+            'requirements': RuleEngineBenchmarkService.summarise_latencies(latencies_by_code),
+        }
+
+    @staticmethod
+    def summarise_latencies(latencies_by_code: Dict[str, List[int]]) -> List[Dict[str, Any]]:
+        """p50/p99 latency (microseconds) per requirement code, slowest p99 first."""
+        summary = []
+        for code, code_latencies in latencies_by_code.items():
+            code_latencies.sort()
+            summary.append({
+                'requirement_code': code,
+                'evaluations': len(code_latencies),
+                'p50_us': round(_percentile(code_latencies, 50) / 1000.0, 2),
+                'p99_us': round(_percentile(code_latencies, 99) / 1000.0, 2),
+            })
+        summary.sort(key=lambda entry: (-entry['p99_us'], entry['requirement_code']))
+        return summary
+
+    @staticmethod
+    def benchmark_bulk(rule_version: Any, facts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Scalar vs vectorized bulk evaluation of every case against one rule version."""
+        cases_facts = {f"case-{index}": case for index, case in enumerate(facts)}
+
+        start = time.perf_counter()
+        RuleEngineService.evaluate_cases_for_rule_version(rule_version, cases_facts)
+        scalar_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        RuleEngineService.evaluate_cases_for_rule_version(rule_version, cases_facts, vectorized=True)
+        vectorized_elapsed = time.perf_counter() - start
+
+        return {
+            'visa_type': rule_version.visa_type.code,
+            'requirements': rule_version.requirements.count(),
+            'bulk_scalar_seconds': round(scalar_elapsed, 6),
+            'bulk_vectorized_seconds': round(vectorized_elapsed, 6),
+        }
+
+    @staticmethod
+    def summarise_bulk(route_metrics: List[Dict[str, Any]], cases: int) -> Dict[str, Any]:
+        """Cases/sec across every route (one case = evaluation against all routes)."""
+        scalar = sum(route['bulk_scalar_seconds'] for route in route_metrics)
+        vectorized = sum(route['bulk_vectorized_seconds'] for route in route_metrics)
+        return {
+            'bulk_scalar_cases_per_sec': _rate(cases, scalar),
+            'bulk_vectorized_cases_per_sec': _rate(cases, vectorized),
+        }
+
+    @staticmethod
+    def benchmark_queries(rule_version: Any, case_facts: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        DB queries issued by run_eligibility_evaluation for a paid benchmark case.
+
+        The first call runs with cold selectors/caches, the repeat call shows what
+        caching saves. Must be called inside a transaction the caller rolls back.
+        """
+        from immigration_cases.models.case import Case
+        from immigration_cases.models.case_fact import CaseFact
+        from payments.models.payment import Payment
+        from users_access.models.user import User
+
+        user = User.objects.create_user(email=f"benchmark-{uuid.uuid4().hex[:12]}@example.com")
+        case = Case.objects.create(user=user, jurisdiction='UK', status='draft')
+        Payment.objects.create(
+            user=user,
+            case=case,
+            amount=Decimal('100.00'),
+            status='completed',
+            payment_provider='stripe',
+            purpose='case_fee',
+            plan='basic',
+        )
+        # bulk_create skips the CaseFact signals: the case is new (no cached facts
+        # snapshot to invalidate) and has no eligibility result to re-check
+        CaseFact.objects.bulk_create([
+            CaseFact(case=case, fact_key=key, fact_value=value, source='user')
+            for key, value in case_facts.items()
+        ])
+
+        counts = []
+        for _ in range(2):
+            with CaptureQueriesContext(connection) as queries:
+                RuleEngineService.run_eligibility_evaluation(str(case.id), str(rule_version.visa_type_id))
+            counts.append(len(queries.captured_queries))
+
+        return {
+            'queries_per_evaluation_first': counts[0],
+            'queries_per_evaluation_repeat': counts[1],
+        }
+
+    @staticmethod
+    def compare_with_baseline(
+        metrics: Dict[str, Any],
+        baseline: Dict[str, Any],
+        max_regression: float = 0.2
+    ) -> List[str]:
+        """
+        Compare metrics with a previous report's metrics.
+
+        Args:
+            metrics: Current 'metrics' dict
+            baseline: Baseline 'metrics' dict
+            max_regression: Allowed relative regression (0.2 = 20%)
+
+        Returns:
+            Human-readable regression messages (empty when within budget)
+        """
+        regressions = []
+        for name, higher_is_better in HIGHER_IS_BETTER.items():
+            current = metrics.get(name)
+            previous = baseline.get(name)
+            if not isinstance(current, (int, float)) or not isinstance(previous, (int, float)) or previous <= 0:
+                continue
+            change = (current - previous) / previous
+            regressed = change < -max_regression if higher_is_better else change > max_regression
+            if regressed:
+                regressions.append(f"{name}: {previous} -> {current} ({change:+.0%})")
+        return regressions
@@ -9,16 +9,19 @@ This service follows the design pattern from implementation.md Section 6.2.
 """
 import logging
 import time
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from datetime import date, datetime
+from django.conf import settings
 from django.utils import timezone
-from django.db.models import Q
 from main_system.utils import json_logic
 from rules_knowledge.helpers.metrics import (
     rule_engine_evaluations_total,
     rule_engine_evaluation_duration_seconds,
     rule_engine_requirements_evaluated
 )
+from rules_knowledge.helpers.active_rule_version_cache import ActiveRuleVersionSnapshot
+from rules_knowledge.helpers.compiled_expression_cache import CompiledExpressionCache
+from rules_knowledge.helpers.expression_index import ExpressionIndex
 
 from immigration_cases.models.case import Case
 from immigration_cases.selectors.case_fact_selector import CaseFactSelector
@@ -49,6 +52,7 @@ class RuleEngineEvaluationResult:
         self.rule_effective_from: Optional[datetime] = None
         self.evaluation_date: Optional[datetime] = None
         self.warnings: List[str] = []  # Additional warnings/notes
+        self.evaluation_results: List[Dict[str, Any]] = []  # Every per-requirement result (for incremental re-evaluation)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API responses."""
@@ -116,29 +120,16 @@ class RuleEngineService:
             logger.warning(f"Case facts loading blocked for case {case_id}: {error}")
             raise ValueError(error)
         
-        # Get all facts for the case, ordered by created_at DESC (most recent first)
-        facts = CaseFactSelector.get_by_case(case)
+        # Latest value per fact key, in one query (cached until the next fact write)
+        facts_dict = CaseFactSelector.get_latest_facts(case.id)
         
         # Edge case: No facts for case
-        if not facts.exists():
+        if not facts_dict:
             logger.warning(f"Case {case_id} has no facts")
             return {}
         
-        # Convert to dictionary, handling duplicates (latest wins)
-        facts_dict = {}
-        null_facts = []  # Track facts with null values
-        
-        for fact in facts:
-            # Only keep the first occurrence (most recent due to DESC ordering)
-            if fact.fact_key not in facts_dict:
-                # Edge case: Handle null/None fact values
-                if fact.fact_value is None:
-                    null_facts.append(fact.fact_key)
-                    logger.debug(f"Fact {fact.fact_key} has null value for case {case_id}")
-                    # Store None anyway, JSON Logic can handle it
-                    facts_dict[fact.fact_key] = None
-                else:
-                    facts_dict[fact.fact_key] = fact.fact_value
+        # Edge case: null/None fact values are kept, JSON Logic can handle them
+        null_facts = [fact_key for fact_key, fact_value in facts_dict.items() if fact_value is None]
         
         if null_facts:
             logger.debug(f"Case {case_id} has {len(null_facts)} facts with null values: {null_facts}")
@@ -161,50 +152,47 @@ class RuleEngineService:
         Raises:
             ValueError: If visa type not found
         """
-        if evaluation_date is None:
-            evaluation_date = timezone.now()
+        return RuleEngineService.load_active_snapshot(visa_type_id, evaluation_date).rule_version
+    
+    @staticmethod
+    def load_active_snapshot(visa_type_id: str, evaluation_date: Optional[datetime] = None) -> ActiveRuleVersionSnapshot:
+        """
+        Load the active rule version together with its requirements.
         
-        visa_type = VisaTypeSelector.get_by_id(visa_type_id)
-        if not visa_type:
-            raise ValueError(f"Visa type with ID '{visa_type_id}' not found")
+        Active means: published, not deleted, effective_from <= evaluation_date AND
+        (effective_to IS NULL OR effective_to >= evaluation_date). Served from the
+        process-local ActiveRuleVersionCache, which rule version and requirement
+        writes invalidate.
         
-        # Edge case: Check if visa type is active (if there's an is_active field)
-        # Note: This assumes visa types might have an is_active field
-        # If not, this check can be removed
-        if hasattr(visa_type, 'is_active') and not visa_type.is_active:
-            logger.warning(f"Visa type {visa_type_id} is not active")
-            # Still proceed, but log warning
+        Args:
+            visa_type_id: UUID of the visa type
+            evaluation_date: Date to evaluate against (defaults to now)
+            
+        Returns:
+            ActiveRuleVersionSnapshot (rule_version is None if no version is active)
+            
+        Raises:
+            ValueError: If visa type not found
+        """
+        if evaluation_date is None:
+            evaluation_date = timezone.now()
         
-        # Query for active rule version
-        # Active means: effective_from <= evaluation_date AND (effective_to IS NULL OR effective_to >= evaluation_date)
-        # AND is_published = True
-        active_versions = VisaRuleVersion.objects.select_related(
-            'visa_type',
-            'source_document_version'
-        ).filter(
-            visa_type=visa_type,
-            is_published=True,
-            effective_from__lte=evaluation_date
-        ).filter(
-            Q(effective_to__isnull=True) | Q(effective_to__gte=evaluation_date)
-        ).order_by('-effective_from')
-        
-        rule_version = active_versions.first()
+        snapshot = VisaRuleVersionSelector.get_active_snapshot(visa_type_id, evaluation_date)
+        rule_version = snapshot.rule_version
         
         if not rule_version:
+            # Only distinguish "unknown visa type" from "nothing active" when there is no version
+            if not VisaTypeSelector.get_by_id(visa_type_id):
+                raise ValueError(f"Visa type with ID '{visa_type_id}' not found")
             logger.warning(f"No active rule version found for visa type {visa_type_id} on {evaluation_date}")
-            return None
+            return snapshot
         
-        # Handle edge case: multiple active versions (shouldn't happen with proper versioning)
-        version_count = active_versions.count()
-        if version_count > 1:
-            logger.warning(
-                f"Multiple active rule versions found for visa type {visa_type_id} "
-                f"({version_count} versions). Using most recent: {rule_version.id}"
-            )
+        if not rule_version.visa_type.is_active:
+            logger.warning(f"Visa type {visa_type_id} is not active")
+            # Still proceed, but log warning
         
         logger.debug(f"Loaded active rule version {rule_version.id} for visa type {visa_type_id}")
-        return rule_version
+        return snapshot
     
     @staticmethod
     def extract_variables_from_expression(expression: Dict[str, Any]) -> List[str]:
@@ -217,25 +205,26 @@ class RuleEngineService:
         Returns:
             List of variable names (e.g., ["salary", "age"])
         """
-        variables = []
-        
-        def traverse(obj):
-            """Recursively traverse JSON Logic expression to find variables."""
-            if isinstance(obj, dict):
-                # Check for {"var": "variable_name"} pattern
-                if "var" in obj:
-                    var_name = obj["var"]
-                    if isinstance(var_name, str) and var_name not in variables:
-                        variables.append(var_name)
-                # Recursively check all values
-                for value in obj.values():
-                    traverse(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    traverse(item)
-        
-        traverse(expression)
-        return variables
+        return ExpressionIndex.extract_variables(expression)
+    
+    @staticmethod
+    def get_indexed_variables(indexed_object: Any, expression: Any) -> List[str]:
+        """
+        Variables of a requirement's expression, from its precomputed index when available.
+        
+        Args:
+            indexed_object: VisaRequirement or VisaDocumentRequirement carrying
+                referenced_variables/expression_hash
+            expression: The object's expression (used when it has not been indexed yet)
+            
+        Returns:
+            List of variable names
+        """
+        if getattr(indexed_object, 'expression_hash', ''):
+            referenced = getattr(indexed_object, 'referenced_variables', None)
+            if isinstance(referenced, list):
+                return referenced
+        return RuleEngineService.extract_variables_from_expression(expression)
     
     @staticmethod
     def validate_expression_structure(expression: Any) -> Tuple[bool, Optional[str]]:
@@ -308,7 +297,9 @@ class RuleEngineService:
     @staticmethod
     def evaluate_expression(
         expression: Dict[str, Any],
-        case_facts: Dict[str, Any]
+        case_facts: Dict[str, Any],
+        required_variables: Optional[List[str]] = None,
+        three_valued: Optional[bool] = None
     ) -> Dict[str, Any]:
         """
         Evaluate a JSON Logic expression against case facts.
@@ -319,6 +310,10 @@ class RuleEngineService:
         Args:
             expression: JSON Logic expression (dict or list)
             case_facts: Dictionary of case facts
+            required_variables: Optional pre-extracted variables of the expression
+                (e.g. a document requirement's referenced_variables)
+            three_valued: Decide the result from the facts present when missing ones
+                cannot change it (defaults to settings.RULE_ENGINE_THREE_VALUED)
             
         Returns:
             Dictionary with evaluation result:
@@ -345,7 +340,8 @@ class RuleEngineService:
                 return result
             
             # Extract variables from expression
-            required_variables = RuleEngineService.extract_variables_from_expression(expression)
+            if required_variables is None:
+                required_variables = RuleEngineService.extract_variables_from_expression(expression)
             
             # Edge case: Expression has no variables (constant expression)
             if not required_variables:
@@ -360,6 +356,16 @@ class RuleEngineService:
             
             # Check for missing variables
             missing_vars = [var for var in required_variables if var not in case_facts]
+            if missing_vars and RuleEngineService.is_three_valued(three_valued):
+                partial, _ = RuleEngineService.evaluate_with_missing_facts(
+                    expression, case_facts, required_variables, missing_vars
+                )
+                if partial is not None and partial.determined:
+                    result["result"] = partial.value
+                    result["passed"] = bool(partial.value)
+                    return result
+                if partial is not None and partial.missing:
+                    missing_vars = list(partial.missing)
             if missing_vars:
                 result["missing_facts"] = missing_vars
                 logger.debug(f"Cannot evaluate expression: missing facts: {missing_vars}")
@@ -407,10 +413,68 @@ class RuleEngineService:
             logger.error(f"Unexpected error in expression evaluation: {e}", exc_info=True)
             return result
     
+    @staticmethod
+    def is_three_valued(three_valued: Optional[bool] = None) -> bool:
+        """Resolve the three-valued evaluation flag (explicit value or setting)."""
+        if three_valued is not None:
+            return three_valued
+        return bool(getattr(settings, 'RULE_ENGINE_THREE_VALUED', False))
+    
+    @staticmethod
+    def evaluate_with_missing_facts(
+        expression: Any,
+        case_facts: Dict[str, Any],
+        required_variables: List[str],
+        missing_vars: List[str]
+    ) -> Tuple[Optional[json_logic.PartialResult], Dict[str, Any]]:
+        """
+        Three-valued evaluation of an expression with some facts missing.
+        
+        Args:
+            expression: JSON Logic expression
+            case_facts: Dictionary of case facts
+            required_variables: Variables referenced by the expression
+            missing_vars: Referenced variables absent from case_facts
+            
+        Returns:
+            Tuple of (PartialResult, or None if evaluation raised; facts used).
+            A determined result holds whatever values the missing facts take; an
+            undetermined one lists only the missing facts that would decide it.
+        """
+        facts_used = {
+            var: RuleEngineService.normalize_fact_value(case_facts[var])
+            for var in required_variables
+            if var in case_facts
+        }
+        try:
+            return json_logic.evaluate_partial(expression, facts_used, missing_keys=missing_vars), facts_used
+        except Exception as e:
+            logger.debug(f"Three-valued evaluation failed, reporting all missing facts: {e}")
+            return None, facts_used
+    
+    @staticmethod
+    def get_compiled_expression(requirement: VisaRequirement):
+        """
+        Get the compiled JSON Logic callable for a requirement.
+        
+        Compiled expressions are cached per (rule_version_id, requirement_id) and
+        invalidated when the rule version is published or rolled back.
+        
+        Args:
+            requirement: VisaRequirement whose condition_expression to compile
+            
+        Returns:
+            Callable taking a facts dict and returning the evaluation result
+        """
+        return CompiledExpressionCache.get_or_compile(requirement)
+    
     @staticmethod
     def evaluate_requirement(
         requirement: VisaRequirement,
-        case_facts: Dict[str, Any]
+        case_facts: Dict[str, Any],
+        required_variables: Optional[List[str]] = None,
+        compiled_expression=None,
+        three_valued: Optional[bool] = None
     ) -> Dict[str, Any]:
         """
         Step 3: Evaluate a single requirement against case facts.
@@ -418,6 +482,13 @@ class RuleEngineService:
         Args:
             requirement: VisaRequirement to evaluate
             case_facts: Dictionary of case facts
+            required_variables: Optional pre-extracted variables of the expression
+                (skips re-traversing the expression when evaluating many cases)
+            compiled_expression: Optional compiled callable to use instead of the
+                cached one (e.g. for what-if expression overrides)
+            three_valued: Decide the requirement from the facts present when missing
+                ones cannot change the result; otherwise report only the facts that
+                would decide it (defaults to settings.RULE_ENGINE_THREE_VALUED)
             
         Returns:
             Dictionary with evaluation result:
@@ -460,9 +531,10 @@ class RuleEngineService:
                 return result
             
             # Extract variables from expression
-            required_variables = RuleEngineService.extract_variables_from_expression(
-                requirement.condition_expression
-            )
+            if required_variables is None:
+                required_variables = RuleEngineService.get_indexed_variables(
+                    requirement, requirement.condition_expression
+                )
             
             # Edge case: Expression has no variables (constant expression)
             if not required_variables:
@@ -471,10 +543,9 @@ class RuleEngineService:
                 )
                 # Evaluate as constant expression
                 try:
-                    evaluation_result = json_logic.jsonLogic(
-                        requirement.condition_expression,
-                        {}
-                    )
+                    if compiled_expression is None:
+                        compiled_expression = RuleEngineService.get_compiled_expression(requirement)
+                    evaluation_result = compiled_expression({})
                     result["passed"] = bool(evaluation_result)
                     result["evaluation_details"]["result"] = evaluation_result
                     result["evaluation_details"]["facts_used"] = {}
@@ -486,6 +557,19 @@ class RuleEngineService:
             
             # Check for missing variables
             missing_vars = [var for var in required_variables if var not in case_facts]
+            if missing_vars and RuleEngineService.is_three_valued(three_valued):
+                partial, facts_used = RuleEngineService.evaluate_with_missing_facts(
+                    requirement.condition_expression, case_facts, required_variables, missing_vars
+                )
+                if partial is not None and partial.determined:
+                    # Short-circuited: the missing facts cannot change the outcome
+                    result["passed"] = bool(partial.value)
+                    result["evaluation_details"]["facts_used"] = facts_used
+                    result["evaluation_details"]["result"] = partial.value
+                    result["evaluation_details"]["undetermined_facts"] = missing_vars
+                    return result
+                if partial is not None and partial.missing:
+                    missing_vars = list(partial.missing)
             if missing_vars:
                 result["missing_facts"] = missing_vars
                 result["evaluation_details"]["result"] = "missing_facts"
@@ -506,12 +590,11 @@ class RuleEngineService:
             
             result["evaluation_details"]["facts_used"] = facts_for_evaluation
             
-            # Evaluate JSON Logic expression
+            # Evaluate JSON Logic expression (compiled once per requirement/rule version)
             try:
-                evaluation_result = json_logic.jsonLogic(
-                    requirement.condition_expression,
-                    facts_for_evaluation
-                )
+                if compiled_expression is None:
+                    compiled_expression = RuleEngineService.get_compiled_expression(requirement)
+                evaluation_result = compiled_expression(facts_for_evaluation)
                 
                 # Edge case: Handle None result from JSON Logic
                 if evaluation_result is None:
@@ -587,7 +670,8 @@ class RuleEngineService:
     @staticmethod
     def evaluate_all_requirements(
         rule_version: VisaRuleVersion,
-        case_facts: Dict[str, Any]
+        case_facts: Dict[str, Any],
+        requirements: Optional[Sequence[VisaRequirement]] = None
     ) -> List[Dict[str, Any]]:
         """
         Evaluate all requirements for a rule version.
@@ -595,15 +679,18 @@ class RuleEngineService:
         Args:
             rule_version: VisaRuleVersion to evaluate
             case_facts: Dictionary of case facts
+            requirements: Optional already-loaded requirements of the rule version
+                (e.g. from an ActiveRuleVersionSnapshot); loaded when omitted
             
         Returns:
             List of evaluation results for each requirement
         """
         # Load all requirements for the rule version
-        requirements = VisaRequirementSelector.get_by_rule_version(rule_version)
+        if requirements is None:
+            requirements = list(VisaRequirementSelector.get_by_rule_version(rule_version))
         
         # Edge case: No requirements for rule version
-        if not requirements.exists():
+        if not requirements:
             logger.warning(
                 f"Rule version {rule_version.id} has no requirements"
             )
@@ -619,6 +706,183 @@ class RuleEngineService:
         )
         return evaluation_results
     
+    @staticmethod
+    def reevaluate_requirements(
+        rule_version: VisaRuleVersion,
+        case_facts: Dict[str, Any],
+        previous_results: List[Dict[str, Any]],
+        changed_fact_keys: List[str],
+        changed_since: Optional[datetime] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Incrementally re-evaluate a rule version after case facts changed.
+        
+        Only requirements whose expression references one of the changed fact keys
+        (see VisaRequirementSelector.get_fact_key_index) are evaluated again; the
+        previous per-requirement results are reused for the rest. Requirements with
+        no previous result, or edited after `changed_since`, are always re-evaluated.
+        
+        Args:
+            rule_version: VisaRuleVersion the previous results were produced against
+            case_facts: Current case facts
+            previous_results: Per-requirement results of the last evaluation
+                (RuleEngineEvaluationResult.evaluation_results)
+            changed_fact_keys: Fact keys added, updated or removed since then
+            changed_since: When the previous results were produced
+            
+        Returns:
+            Tuple of (evaluation results for every requirement, in evaluate_all_requirements
+            order; number of requirements re-evaluated)
+        """
+        previous_by_id = {
+            str(previous["requirement_id"]): previous
+            for previous in previous_results or []
+            if isinstance(previous, dict) and previous.get("requirement_id")
+        }
+        
+        fact_key_index = VisaRequirementSelector.get_fact_key_index(rule_version)
+        stale_ids = {
+            requirement_id
+            for fact_key in set(changed_fact_keys or [])
+            for requirement_id in fact_key_index.get(fact_key, [])
+        }
+        
+        current = [
+            (str(requirement_id), updated_at)
+            for requirement_id, updated_at in VisaRequirementSelector.get_by_rule_version(
+                rule_version
+            ).values_list('id', 'updated_at')
+        ]
+        for requirement_id, updated_at in current:
+            if requirement_id not in previous_by_id:
+                stale_ids.add(requirement_id)
+            elif changed_since is not None and updated_at and updated_at > changed_since:
+                stale_ids.add(requirement_id)
+        
+        reevaluated: Dict[str, Dict[str, Any]] = {}
+        if stale_ids:
+            for requirement in VisaRequirementSelector.get_by_rule_version(rule_version).filter(id__in=stale_ids):
+                reevaluated[str(requirement.id)] = RuleEngineService.evaluate_requirement(requirement, case_facts)
+        
+        evaluation_results = [
+            reevaluated[requirement_id] if requirement_id in reevaluated else previous_by_id[requirement_id]
+            for requirement_id, _ in current
+        ]
+        
+        logger.info(
+            f"Incrementally re-evaluated {len(reevaluated)}/{len(current)} requirements "
+            f"for rule version {rule_version.id} (changed facts: {sorted(set(changed_fact_keys or []))})"
+        )
+        return evaluation_results, len(reevaluated)
+    
+    @staticmethod
+    def build_empty_result(rule_version: VisaRuleVersion, warning: str) -> RuleEngineEvaluationResult:
+        """
+        Build an 'unlikely' result for a case that could not be evaluated.
+        
+        Args:
+            rule_version: Rule version the case was evaluated against
+            warning: Reason recorded in result.warnings
+        """
+        result = RuleEngineEvaluationResult()
+        result.rule_version_id = rule_version.id
+        result.rule_effective_from = rule_version.effective_from
+        result.evaluation_date = timezone.now()
+        result.warnings.append(warning)
+        result.outcome = "unlikely"
+        result.confidence = 0.0
+        return result
+    
+    @staticmethod
+    def evaluate_cases_for_rule_version(
+        rule_version: VisaRuleVersion,
+        cases_facts: Dict[str, Dict[str, Any]],
+        vectorized: bool = False,
+        expression_overrides: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, RuleEngineEvaluationResult]:
+        """
+        Evaluate many cases against one rule version in a single pass.
+        
+        Requirements are loaded with one query, compiled once and their variables
+        extracted once; each case then only pays for expression evaluation and
+        aggregation. Intended for re-scoring every open case when a rule version
+        is published.
+        
+        Payment validation is the caller's responsibility (facts are passed in).
+        
+        Args:
+            rule_version: VisaRuleVersion to evaluate against
+            cases_facts: Mapping of case_id -> case facts dictionary
+            vectorized: Evaluate supported expressions column-wise over NumPy arrays
+                (see VectorizedRuleEngineService); results are identical
+            expression_overrides: Optional mapping of requirement_code -> JSON Logic
+                expression to evaluate instead of the stored one ("what-if" runs).
+                Implies vectorized mode.
+            
+        Returns:
+            Mapping of case_id -> RuleEngineEvaluationResult
+        """
+        if vectorized or expression_overrides:
+            from rules_knowledge.services.vectorized_rule_engine_service import VectorizedRuleEngineService
+            return VectorizedRuleEngineService.evaluate_cases_for_rule_version(
+                rule_version,
+                cases_facts,
+                expression_overrides=expression_overrides
+            )
+        
+        start_time = time.time()
+        visa_type_code = getattr(rule_version.visa_type, 'code', 'unknown') or 'unknown'
+        
+        requirements = list(VisaRequirementSelector.get_by_rule_version(rule_version))
+        
+        # Prepare each requirement once: validate, extract variables, compile
+        prepared: List[Tuple[VisaRequirement, Optional[List[str]]]] = []
+        for requirement in requirements:
+            is_valid, _ = RuleEngineService.validate_expression_structure(requirement.condition_expression)
+            if not is_valid:
+                # evaluate_requirement reports the structural error per case
+                prepared.append((requirement, None))
+                continue
+            variables = RuleEngineService.get_indexed_variables(requirement, requirement.condition_expression)
+            try:
+                RuleEngineService.get_compiled_expression(requirement)
+            except Exception as e:
+                logger.error(f"Error compiling requirement {requirement.requirement_code}: {e}", exc_info=True)
+            prepared.append((requirement, variables))
+        
+        results: Dict[str, RuleEngineEvaluationResult] = {}
+        for case_id, case_facts in cases_facts.items():
+            if not case_facts:
+                results[str(case_id)] = RuleEngineService.build_empty_result(rule_version, "Case has no facts")
+                continue
+            
+            if not prepared:
+                results[str(case_id)] = RuleEngineService.build_empty_result(
+                    rule_version, "Rule version has no requirements"
+                )
+                continue
+            
+            evaluation_results = [
+                RuleEngineService.evaluate_requirement(requirement, case_facts, required_variables=variables)
+                for requirement, variables in prepared
+            ]
+            results[str(case_id)] = RuleEngineService.aggregate_results(evaluation_results, rule_version)
+        
+        # Track metrics
+        for result in results.values():
+            if rule_engine_evaluations_total:
+                rule_engine_evaluations_total.labels(visa_type=visa_type_code, outcome=result.outcome).inc()
+        if rule_engine_evaluation_duration_seconds:
+            rule_engine_evaluation_duration_seconds.labels(visa_type=visa_type_code).observe(
+                time.time() - start_time
+            )
+        
+        logger.info(
+            f"Bulk evaluated {len(results)} cases against rule version {rule_version.id} "
+            f"({len(prepared)} requirements) in {time.time() - start_time:.3f}s"
+        )
+        return results
+    
     @staticmethod
     def aggregate_results(
         evaluation_results: List[Dict[str, Any]],
@@ -638,6 +902,7 @@ class RuleEngineService:
         result.rule_version_id = rule_version.id
         result.rule_effective_from = rule_version.effective_from
         result.evaluation_date = timezone.now()
+        result.evaluation_results = evaluation_results
         
         # Edge case: No evaluation results (no requirements)
         if not evaluation_results:
@@ -754,7 +1019,11 @@ class RuleEngineService:
     def run_eligibility_evaluation(
         case_id: str,
         visa_type_id: str,
-        evaluation_date: Optional[datetime] = None
+        evaluation_date: Optional[datetime] = None,
+        case_facts: Optional[Dict[str, Any]] = None,
+        case: Optional[Any] = None,
+        visa_type: Optional[Any] = None,
+        payment_validated: bool = False
     ) -> Optional[RuleEngineEvaluationResult]:
         """
         Main orchestration method: Run complete eligibility evaluation.
@@ -772,6 +1041,12 @@ class RuleEngineService:
             case_id: UUID of the case
             visa_type_id: UUID of the visa type to evaluate
             evaluation_date: Optional date to evaluate against (defaults to now)
+            case_facts: Optional already-loaded case facts (e.g. shared across several
+                visa types); loaded from the case when omitted
+            case: Optional already-loaded case (skips the case lookup)
+            visa_type: Optional already-loaded visa type (used for metrics labels)
+            payment_validated: True only if the caller has already validated the case's
+                payment (skips the payment check)
             
         Returns:
             RuleEngineEvaluationResult or None if evaluation cannot be performed
@@ -784,14 +1059,16 @@ class RuleEngineService:
         
         # Validate payment requirement early (defense in depth)
         # This ensures payment validation even if called directly, not through EligibilityCheckService
-        case = CaseSelector.get_by_id(case_id)
-        if not case:
-            raise ValueError(f"Case with ID '{case_id}' not found")
+        if case is None:
+            case = CaseSelector.get_by_id(case_id)
+            if not case:
+                raise ValueError(f"Case with ID '{case_id}' not found")
         
-        is_valid, error = PaymentValidator.validate_case_has_payment(case, operation_name="eligibility evaluation")
-        if not is_valid:
-            logger.warning(f"Eligibility evaluation blocked for case {case_id}: {error}")
-            raise ValueError(error)
+        if not payment_validated:
+            is_valid, error = PaymentValidator.validate_case_has_payment(case, operation_name="eligibility evaluation")
+            if not is_valid:
+                logger.warning(f"Eligibility evaluation blocked for case {case_id}: {error}")
+                raise ValueError(error)
         
         start_time = time.time()
         visa_type_code = 'unknown'
@@ -799,13 +1076,15 @@ class RuleEngineService:
         try:
             # Get visa type code for metrics
             try:
-                visa_type = VisaTypeSelector.get_by_id(visa_type_id)
+                if visa_type is None:
+                    visa_type = VisaTypeSelector.get_by_id(visa_type_id)
                 visa_type_code = visa_type.code if visa_type else 'unknown'
             except Exception:
                 pass  # Use default if can't get visa type
             
             # Step 1: Load case facts
-            case_facts = RuleEngineService.load_case_facts(case_id)
+            if case_facts is None:
+                case_facts = RuleEngineService.load_case_facts(case_id)
             
             # Edge case: Case has no facts
             if not case_facts:
@@ -826,8 +1105,9 @@ class RuleEngineService:
                 
                 return result
             
-            # Step 2: Load active rule version
-            rule_version = RuleEngineService.load_active_rule_version(visa_type_id, evaluation_date)
+            # Step 2: Load active rule version (and its requirements)
+            snapshot = RuleEngineService.load_active_snapshot(visa_type_id, evaluation_date)
+            rule_version = snapshot.rule_version
             if not rule_version:
                 logger.warning(
                     f"No active rule version found for visa type {visa_type_id}. "
@@ -838,7 +1118,8 @@ class RuleEngineService:
             # Step 3: Evaluate all requirements
             evaluation_results = RuleEngineService.evaluate_all_requirements(
                 rule_version,
-                case_facts
+                case_facts,
+                requirements=snapshot.requirements
             )
             
             # Edge case: No requirements to evaluate
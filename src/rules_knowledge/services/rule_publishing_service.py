@@ -12,6 +12,7 @@ import logging
 import time
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
+from django.conf import settings
 from django.utils import timezone
 from django.db import transaction
 from django.db.models import Q
@@ -22,6 +23,7 @@ from rules_knowledge.helpers.metrics import (
 
 from data_ingestion.models.parsed_rule import ParsedRule
 from data_ingestion.selectors.parsed_rule_selector import ParsedRuleSelector
+from data_ingestion.selectors.document_version_selector import DocumentVersionSelector
 from rules_knowledge.models.visa_rule_version import VisaRuleVersion
 from rules_knowledge.models.visa_requirement import VisaRequirement
 from rules_knowledge.models.visa_type import VisaType
@@ -464,76 +466,120 @@ class RulePublishingService:
         )
     
     @staticmethod
-    def _update_vector_db_for_document_version(
+    def index_document_version(
         document_version,
         visa_code: Optional[str] = None,
         jurisdiction: Optional[str] = None
-    ):
+    ) -> int:
         """
-        Update pgvector with embeddings for a document version.
+        Chunk, embed and store a document version in pgvector (for RAG retrieval).
         
         This method:
         1. Chunks the document text
-        2. Generates embeddings
+        2. Generates embeddings (only for chunks that differ from the previous version)
         3. Stores chunks with embeddings in pgvector (PostgreSQL)
         
+        Skipped when the version has no text or already has chunks, so it is safe to
+        call more than once (e.g. from the ingestion pipeline's embed stage).
+        
         Args:
             document_version: DocumentVersion instance
             visa_code: Optional visa code for metadata filtering
             jurisdiction: Optional jurisdiction for metadata filtering
-        """
-        try:
-            if not document_version or not document_version.raw_text:
-                logger.warning(f"No text content for document version {document_version.id if document_version else 'None'}")
-                return
             
-            # Check if chunks already exist
-            existing_chunks = PgVectorService.get_chunks_by_document_version(document_version)
-            if existing_chunks:
-                logger.info(
-                    f"Chunks already exist for document version {document_version.id}, skipping embedding generation"
-                )
-                return
-            
-            # Step 1: Chunk the document text
-            chunks = EmbeddingService.chunk_document(document_version.raw_text)
-            if not chunks:
-                logger.warning(f"No chunks generated for document version {document_version.id}")
-                return
-            
-            # Step 2: Generate embeddings
-            chunk_texts = [chunk['text'] for chunk in chunks]
-            embeddings = EmbeddingService.generate_embeddings(chunk_texts)
+        Returns:
+            Number of chunks stored (0 when skipped)
             
-            if len(embeddings) != len(chunks):
-                logger.error(
-                    f"Mismatch: {len(chunks)} chunks but {len(embeddings)} embeddings for "
-                    f"document version {document_version.id}"
-                )
-                return
-            
-            # Step 3: Add metadata to chunks
-            for chunk, embedding in zip(chunks, embeddings):
-                chunk_metadata = chunk.get('metadata', {})
-                if visa_code:
-                    chunk_metadata['visa_code'] = visa_code
-                if jurisdiction:
-                    chunk_metadata['jurisdiction'] = jurisdiction
-                chunk_metadata['document_version_id'] = str(document_version.id)
-                chunk_metadata['source_url'] = document_version.source_document.source_url
-                chunk['metadata'] = chunk_metadata
-            
-            # Step 4: Store in pgvector (PostgreSQL)
-            PgVectorService.store_chunks(
-                document_version=document_version,
-                chunks=chunks,
-                embeddings=embeddings
+        Raises:
+            ValueError: If the number of embeddings does not match the chunks
+            Exception: If embedding generation or storage fails
+        """
+        if not document_version or not document_version.raw_text:
+            logger.warning(f"No text content for document version {document_version.id if document_version else 'None'}")
+            return 0
+        
+        # Check if chunks already exist
+        existing_chunks = PgVectorService.get_chunks_by_document_version(document_version)
+        if existing_chunks:
+            logger.info(
+                f"Chunks already exist for document version {document_version.id}, skipping embedding generation"
             )
-            
+            return 0
+        
+        # Step 1: Chunk the document text (with DOCUMENT_CHUNKING_MODE='content_defined'
+        # boundaries stay stable under local edits, so most chunks match the previous version's)
+        content_defined = getattr(settings, 'DOCUMENT_CHUNKING_MODE', 'fixed') == 'content_defined'
+        chunks = EmbeddingService.chunk_document(document_version.raw_text, content_defined=content_defined)
+        if not chunks:
+            logger.warning(f"No chunks generated for document version {document_version.id}")
+            return 0
+        
+        # Step 2: Generate embeddings, carrying over those of unchanged chunks
+        # from the previous version of the same source document
+        previous_version = DocumentVersionSelector.get_previous_with_chunks(document_version)
+        previous_chunks = (
+            PgVectorService.get_chunks_by_document_version(previous_version) if previous_version else []
+        )
+        embeddings, reused = EmbeddingService.embed_chunks(chunks, previous_chunks=previous_chunks)
+        if previous_version:
             logger.info(
-                f"Successfully stored {len(chunks)} chunks with embeddings for document version {document_version.id}"
+                f"Document version {document_version.id}: reused {reused} of {len(chunks)} chunk "
+                f"embeddings from previous version {previous_version.id}"
+            )
+        
+        if len(embeddings) != len(chunks):
+            raise ValueError(
+                f"Mismatch: {len(chunks)} chunks but {len(embeddings)} embeddings for "
+                f"document version {document_version.id}"
+            )
+        
+        # Step 3: Add metadata to chunks (the embedding space decides later reuse)
+        embedding_model = EmbeddingService.embedding_space()
+        for chunk, embedding in zip(chunks, embeddings):
+            chunk_metadata = chunk.get('metadata', {})
+            if visa_code:
+                chunk_metadata['visa_code'] = visa_code
+            if jurisdiction:
+                chunk_metadata['jurisdiction'] = jurisdiction
+            chunk_metadata['document_version_id'] = str(document_version.id)
+            chunk_metadata['source_url'] = document_version.source_document.source_url
+            chunk_metadata['embedding_model'] = embedding_model
+            chunk['metadata'] = chunk_metadata
+        
+        # Step 4: Store in pgvector (PostgreSQL)
+        PgVectorService.store_chunks(
+            document_version=document_version,
+            chunks=chunks,
+            embeddings=embeddings
+        )
+        
+        logger.info(
+            f"Successfully stored {len(chunks)} chunks with embeddings for document version {document_version.id}"
+        )
+        return len(chunks)
+    
+    @staticmethod
+    def _update_vector_db_for_document_version(
+        document_version,
+        visa_code: Optional[str] = None,
+        jurisdiction: Optional[str] = None
+    ):
+        """
+        Update pgvector with embeddings for a document version (see index_document_version).
+        
+        Errors are logged, not raised, so rule publishing does not fail on them.
+        
+        Args:
+            document_version: DocumentVersion instance
+            visa_code: Optional visa code for metadata filtering
+            jurisdiction: Optional jurisdiction for metadata filtering
+        """
+        try:
+            RulePublishingService.index_document_version(
+                document_version,
+                visa_code=visa_code,
+                jurisdiction=jurisdiction
             )
-            
         except Exception as e:
             # Don't fail rule publishing if pgvector update fails
             logger.error(
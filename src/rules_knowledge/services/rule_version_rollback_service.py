@@ -11,6 +11,8 @@ from rules_knowledge.models.visa_rule_version import VisaRuleVersion
 from rules_knowledge.selectors.visa_rule_version_selector import VisaRuleVersionSelector
 from rules_knowledge.repositories.visa_rule_version_repository import VisaRuleVersionRepository
 from rules_knowledge.services.rule_version_conflict_service import RuleVersionConflictService
+from rules_knowledge.helpers.compiled_expression_cache import CompiledExpressionCache
+from rules_knowledge.helpers.active_rule_version_cache import ActiveRuleVersionCache
 
 logger = logging.getLogger('django')
 
@@ -111,6 +113,11 @@ class RuleVersionRollbackService:
                     )
                     previous_reopened = True
                 
+                # Compiled expressions and active-version snapshots are stale after a rollback
+                CompiledExpressionCache.invalidate_rule_version(current_version.id)
+                CompiledExpressionCache.invalidate_rule_version(previous_version.id)
+                ActiveRuleVersionCache.invalidate()
+                
                 logger.info(
                     f"Rolled back rule version {current_version_id} to {rollback_to_version_id} "
                     f"by user {rollback_by.id if rollback_by else 'system'}"
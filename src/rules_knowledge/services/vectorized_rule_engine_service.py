@@ -0,0 +1,181 @@
+"""
+Vectorized Rule Engine Service
+
+Mass re-scoring of many cases against one rule version. Case facts are pivoted into
+columns and each requirement is evaluated in one columnar pass (see
+rules_knowledge.helpers.vectorized_json_logic). Requirements outside the vectorizable
+operator subset, and individual rows the columnar path cannot decide exactly, fall
+back to RuleEngineService.evaluate_requirement, so results are identical to the
+scalar engine.
+"""
+import copy
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from main_system.utils import json_logic
+from rules_knowledge.helpers.metrics import (
+    rule_engine_evaluations_total,
+    rule_engine_evaluation_duration_seconds,
+)
+from rules_knowledge.helpers.vectorized_json_logic import FactColumns, compile_vectorized, is_available
+from rules_knowledge.models.visa_requirement import VisaRequirement
+from rules_knowledge.models.visa_rule_version import VisaRuleVersion
+from rules_knowledge.selectors.visa_requirement_selector import VisaRequirementSelector
+from rules_knowledge.services.rule_engine_service import RuleEngineService, RuleEngineEvaluationResult
+
+logger = logging.getLogger('django')
+
+
+class VectorizedRuleEngineService:
+    """Columnar evaluation of one rule version over many cases."""
+
+    @staticmethod
+    def evaluate_cases_for_rule_version(
+        rule_version: VisaRuleVersion,
+        cases_facts: Dict[str, Dict[str, Any]],
+        expression_overrides: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, RuleEngineEvaluationResult]:
+        """
+        Evaluate many cases against a rule version, column-wise.
+
+        Args:
+            rule_version: VisaRuleVersion to evaluate against
+            cases_facts: Mapping of case_id -> case facts dictionary
+            expression_overrides: Optional mapping of requirement_code -> JSON Logic
+                expression replacing the stored condition ("what-if" runs, e.g. a
+                different salary threshold). Nothing is persisted.
+
+        Returns:
+            Mapping of case_id -> RuleEngineEvaluationResult
+        """
+        start_time = time.time()
+        visa_type_code = getattr(rule_version.visa_type, 'code', 'unknown') or 'unknown'
+        expression_overrides = expression_overrides or {}
+
+        if not is_available():
+            logger.warning("NumPy not available, using scalar bulk evaluation")
+
+        case_ids = [str(case_id) for case_id in cases_facts]
+        rows = [cases_facts[case_id] or {} for case_id in cases_facts]
+        columns = FactColumns(rows)
+
+        requirements = list(VisaRequirementSelector.get_by_rule_version(rule_version))
+        per_case: List[List[Dict[str, Any]]] = [[] for _ in rows]
+        vectorized_count = 0
+
+        for requirement in requirements:
+            compiled_expression = None
+            override = expression_overrides.get(requirement.requirement_code)
+            if override is not None:
+                # Evaluate a detached copy so the override never reaches the compile cache
+                requirement = copy.copy(requirement)
+                requirement.condition_expression = override
+                requirement.expression_hash = ''
+                requirement.referenced_variables = []
+                compiled_expression = json_logic.compile_logic(override)
+
+            evaluations, was_vectorized = VectorizedRuleEngineService.evaluate_requirement_columnar(
+                requirement, rows, columns, compiled_expression=compiled_expression
+            )
+            vectorized_count += int(was_vectorized)
+            for index, evaluation in enumerate(evaluations):
+                per_case[index].append(evaluation)
+
+        results: Dict[str, RuleEngineEvaluationResult] = {}
+        for case_id, row, evaluation_results in zip(case_ids, rows, per_case):
+            if not row:
+                results[case_id] = RuleEngineService.build_empty_result(rule_version, "Case has no facts")
+            elif not evaluation_results:
+                results[case_id] = RuleEngineService.build_empty_result(
+                    rule_version, "Rule version has no requirements"
+                )
+            else:
+                results[case_id] = RuleEngineService.aggregate_results(evaluation_results, rule_version)
+
+        # Track metrics
+        for result in results.values():
+            if rule_engine_evaluations_total:
+                rule_engine_evaluations_total.labels(visa_type=visa_type_code, outcome=result.outcome).inc()
+        if rule_engine_evaluation_duration_seconds:
+            rule_engine_evaluation_duration_seconds.labels(visa_type=visa_type_code).observe(
+                time.time() - start_time
+            )
+
+        logger.info(
+            f"Vectorized evaluation of {len(results)} cases against rule version {rule_version.id}: "
+            f"{vectorized_count}/{len(requirements)} requirements vectorized, "
+            f"{time.time() - start_time:.3f}s"
+        )
+        return results
+
+    @staticmethod
+    def evaluate_requirement_columnar(
+        requirement: VisaRequirement,
+        rows: List[Dict[str, Any]],
+        columns: FactColumns,
+        compiled_expression=None
+    ):
+        """
+        Evaluate one requirement over every row.
+
+        Args:
+            requirement: VisaRequirement to evaluate
+            rows: Case fact dicts, in column order
+            columns: FactColumns built from `rows`
+            compiled_expression: Optional scalar compiled callable for fallback rows
+
+        Returns:
+            Tuple of (per-row evaluation dicts in RuleEngineService.evaluate_requirement
+            format, whether the columnar path was used)
+        """
+        expression = requirement.condition_expression
+        is_valid, _ = RuleEngineService.validate_expression_structure(expression)
+        variables = RuleEngineService.get_indexed_variables(requirement, expression) if is_valid else None
+        vectorized = compile_vectorized(expression, context_keys=variables) if variables else None
+
+        if vectorized is None:
+            return [
+                RuleEngineService.evaluate_requirement(
+                    requirement, row, required_variables=variables, compiled_expression=compiled_expression
+                )
+                for row in rows
+            ], False
+
+        values, fallback = vectorized.evaluate(columns)
+        for variable in variables:
+            fallback |= ~columns.present(variable)
+        values = values.tolist()
+        fallback = fallback.tolist()
+
+        base = {
+            "requirement_id": str(requirement.id),
+            "requirement_code": requirement.requirement_code,
+            "description": requirement.description,
+            "rule_type": requirement.rule_type,
+            "is_mandatory": requirement.is_mandatory,
+        }
+        evaluations = []
+        for index, row in enumerate(rows):
+            if fallback[index]:
+                # Missing facts, or a value the columnar path cannot decide exactly
+                evaluations.append(RuleEngineService.evaluate_requirement(
+                    requirement, row, required_variables=variables, compiled_expression=compiled_expression
+                ))
+                continue
+            passed = values[index]
+            evaluation = dict(base)
+            evaluation.update({
+                "passed": passed,
+                "missing_facts": [],
+                "evaluation_details": {
+                    "expression": expression,
+                    "facts_used": {
+                        var: RuleEngineService.normalize_fact_value(row[var]) for var in variables
+                    },
+                    "result": passed
+                },
+                "error": None
+            })
+            evaluations.append(evaluation)
+        return evaluations, True
@@ -0,0 +1,97 @@
+"""
+Tests for the rule engine benchmark corpus and RuleEngineBenchmarkService.
+
+Sizes are kept tiny: these check the harness produces complete, rolled-back,
+machine-readable results, not performance.
+"""
+
+import json
+
+import pytest
+
+from main_system.utils import json_logic
+from rules_knowledge.helpers.rule_engine_benchmark import CaseFactGenerator, UKRuleCorpus
+from rules_knowledge.models.visa_type import VisaType
+from rules_knowledge.services.rule_engine_benchmark_service import RuleEngineBenchmarkService
+
+
+class TestBenchmarkCorpus:
+    def test_routes_loaded_from_uk_taxonomy(self):
+        routes = UKRuleCorpus.load_routes()
+        codes = {route["code"] for route in routes}
+        assert "WORK_AND_INVESTOR_VISAS" in codes
+        assert "STUDENT_VISAS" in codes
+
+    def test_routes_extracted_from_taxonomy_export(self, tmp_path):
+        export = tmp_path / "taxonomy.json"
+        export.write_text(json.dumps({
+            "base_path": "/entering-staying-uk",
+            "title": "Entering and staying in the UK",
+            "links": {"child_taxons": [
+                {"base_path": "/entering-staying-uk/student-visas", "title": "Student visas"},
+                {"base_path": "/entering-staying-uk/travel-documents", "title": "Travel documents"},
+            ]},
+        }))
+        assert UKRuleCorpus.load_routes(str(export)) == [
+            {"code": "STUDENT_VISAS", "name": "Student visas", "base_path": "/entering-staying-uk/student-visas"}
+        ]
+
+    def test_requirement_expressions_evaluate_on_generated_facts(self):
+        corpus = UKRuleCorpus.build(codes_per_category=2)
+        facts = CaseFactGenerator(seed=3, missing_rate=0, string_number_rate=0).generate_many(5)
+        for entry in corpus:
+            codes = [req["requirement_code"] for req in entry["requirements"]]
+            assert len(codes) == len(set(codes))
+            for req in entry["requirements"]:
+                for case in facts:
+                    assert isinstance(json_logic.jsonLogic(req["condition_expression"], case), bool)
+
+    def test_generator_is_deterministic(self):
+        assert CaseFactGenerator(seed=7).generate_many(3) == CaseFactGenerator(seed=7).generate_many(3)
+
+
+@pytest.mark.django_db
+class TestRuleEngineBenchmarkService:
+    def test_run_reports_metrics_and_rolls_back(self):
+        report = RuleEngineBenchmarkService.run(cases=3, codes_per_category=1, max_routes=2)
+
+        json.dumps(report)
+        assert report["corpus"]["routes"] == 2
+        for name in (
+            "compiled_evals_per_sec",
+            "requirement_p50_us",
+            "requirement_p99_us",
+            "bytes_per_evaluation",
+            "bulk_vectorized_cases_per_sec",
+            "queries_per_evaluation_first",
+        ):
+            assert name in report["metrics"]
+        assert report["metrics"]["queries_per_evaluation_first"] > 0
+        assert "requirements" not in report["metrics"]
+        by_code = {entry["requirement_code"]: entry for entry in report["requirements"]}
+        assert len(by_code) == len(report["requirements"])
+        assert sum(entry["evaluations"] for entry in by_code.values()) == (
+            report["metrics"]["requirement_evaluations"]
+        )
+        assert all(entry["p50_us"] <= entry["p99_us"] for entry in by_code.values())
+        assert not VisaType.objects.filter(code__startswith="BENCH_").exists()
+
+    def test_summarise_latencies_per_requirement_code(self):
+        summary = RuleEngineBenchmarkService.summarise_latencies({
+            "AGE_MIN": [1000, 3000, 2000],
+            "SALARY_MIN": [9000, 8000],
+        })
+        assert summary == [
+            {"requirement_code": "SALARY_MIN", "evaluations": 2, "p50_us": 8.0, "p99_us": 9.0},
+            {"requirement_code": "AGE_MIN", "evaluations": 3, "p50_us": 2.0, "p99_us": 3.0},
+        ]
+
+    def test_compare_with_baseline(self):
+        baseline = {"compiled_evals_per_sec": 1000.0, "requirement_p99_us": 10.0}
+        assert RuleEngineBenchmarkService.compare_with_baseline(
+            {"compiled_evals_per_sec": 950.0, "requirement_p99_us": 11.0}, baseline
+        ) == []
+        regressions = RuleEngineBenchmarkService.compare_with_baseline(
+            {"compiled_evals_per_sec": 500.0, "requirement_p99_us": 20.0}, baseline
+        )
+        assert len(regressions) == 2
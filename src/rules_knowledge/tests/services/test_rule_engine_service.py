@@ -10,6 +10,7 @@ We avoid cross-app DB dependencies by focusing on deterministic methods:
 """
 
 import pytest
+from django.utils import timezone
 
 from rules_knowledge.services.rule_engine_service import RuleEngineService, RuleEngineEvaluationResult
 
@@ -46,6 +47,23 @@ class TestRuleEngineServicePure:
         vars_ = RuleEngineService.extract_variables_from_expression(expr)
         assert set(vars_) == {"age", "country", "has_sponsor", "has_job_offer"}
 
+    def test_extract_variables_preserves_first_seen_order(self):
+        expr = {"or": [{"var": "b"}, {"and": [{"var": "a"}, {"var": "b"}]}, {"var": "c"}]}
+        assert RuleEngineService.extract_variables_from_expression(expr) == ["b", "a", "c"]
+
+    def test_get_indexed_variables_prefers_stored_index(self, visa_requirement):
+        # Not indexed: falls back to extraction
+        visa_requirement.expression_hash = ""
+        assert RuleEngineService.get_indexed_variables(
+            visa_requirement, visa_requirement.condition_expression
+        ) == ["age"]
+
+        visa_requirement.referenced_variables = ["indexed_age"]
+        visa_requirement.expression_hash = "x" * 64
+        assert RuleEngineService.get_indexed_variables(
+            visa_requirement, visa_requirement.condition_expression
+        ) == ["indexed_age"]
+
     def test_evaluate_expression_missing_facts(self):
         expr = {">=": [{"var": "age"}, 18]}
         out = RuleEngineService.evaluate_expression(expr, case_facts={})
@@ -116,3 +134,293 @@ class TestRuleEngineServicePure:
         assert result.outcome in ("possible", "unlikely")
         assert result.requirements_failed >= 1
 
+    def test_loaded_case_still_requires_payment_unless_validated(self, monkeypatch):
+        from types import SimpleNamespace
+        from unittest.mock import MagicMock
+
+        validate = MagicMock(return_value=(False, "Payment required"))
+        monkeypatch.setattr("payments.helpers.payment_validator.PaymentValidator.validate_case_has_payment", validate)
+        case = SimpleNamespace(id="case-1")
+
+        with pytest.raises(ValueError, match="Payment required"):
+            RuleEngineService.run_eligibility_evaluation("case-1", "visa-1", case_facts={}, case=case)
+        validate.assert_called_once()
+
+        result = RuleEngineService.run_eligibility_evaluation(
+            "case-1", "visa-1", case_facts={}, case=case, payment_validated=True
+        )
+        assert "Case has no facts" in result.warnings
+        validate.assert_called_once()
+
+
+
+@pytest.mark.django_db
+class TestCompiledExpressions:
+    @pytest.mark.parametrize(
+        "expr,facts",
+        [
+            ({">=": [{"var": "salary"}, 38700]}, {"salary": "40000"}),
+            ({"and": [{"var": "a"}, {"or": [{"var": "b"}, {"var": ["c", 5]}]}]}, {"a": 1, "b": 0}),
+            ({"if": [{"<": [{"var": "x"}, 1]}, "low", {"<": [{"var": "x"}, 3]}, "mid", "high"]}, {"x": 2}),
+            ({"+": [1, {"var": "x"}, 2.5]}, {"x": "3"}),
+            ({"in": [{"var": "nationality"}, ["NG", "GH"]]}, {"nationality": "NG"}),
+            ({"missing": ["a", "b.c"]}, {"a": None, "b": {"c": 1}}),
+            ({"reduce": [{"var": "arr"}, {"+": [{"var": "current"}, {"var": "accumulator"}]}, 0]}, {"arr": [1, 2]}),
+            ({"method": [{"var": "s"}, "upper"]}, {"s": "abc"}),
+        ],
+    )
+    def test_compile_logic_matches_interpreter(self, expr, facts):
+        from main_system.utils.json_logic import compile_logic, jsonLogic
+
+        assert compile_logic(expr)(facts) == jsonLogic(expr, facts)
+
+    def test_compile_logic_defers_errors_to_evaluation(self):
+        from main_system.utils.json_logic import compile_logic
+
+        compiled = compile_logic({"if": [True, 1, {"unknown_op": []}]})
+        assert compiled({}) == 1
+        with pytest.raises(ValueError):
+            compile_logic({"unknown_op": []})({})
+
+    def test_compiled_expression_is_cached_per_requirement(self, visa_requirement):
+        from rules_knowledge.helpers.compiled_expression_cache import CompiledExpressionCache
+
+        CompiledExpressionCache.clear()
+        first = RuleEngineService.get_compiled_expression(visa_requirement)
+        second = RuleEngineService.get_compiled_expression(visa_requirement)
+        assert first is second
+        assert CompiledExpressionCache.size() == 1
+
+        out = RuleEngineService.evaluate_requirement(visa_requirement, case_facts={"age": 30})
+        assert out["passed"] is True
+
+    def test_publish_invalidates_compiled_expressions(self, visa_requirement, visa_rule_version_service):
+        from rules_knowledge.helpers.compiled_expression_cache import CompiledExpressionCache
+
+        CompiledExpressionCache.clear()
+        RuleEngineService.get_compiled_expression(visa_requirement)
+        assert CompiledExpressionCache.size() == 1
+
+        visa_rule_version_service.publish_rule_version(str(visa_requirement.rule_version_id))
+        assert CompiledExpressionCache.size() == 0
+
+    def test_publish_indexes_requirement_expressions(self, visa_requirement, visa_rule_version_service):
+        type(visa_requirement).objects.filter(id=visa_requirement.id).update(
+            referenced_variables=[], expression_hash=""
+        )
+
+        visa_rule_version_service.publish_rule_version(str(visa_requirement.rule_version_id))
+        visa_requirement.refresh_from_db()
+        assert visa_requirement.referenced_variables == ["age"]
+        assert len(visa_requirement.expression_hash) == 64
+
+
+@pytest.mark.django_db
+class TestActiveRuleVersionCache:
+    def test_snapshot_served_from_cache_without_queries(
+        self, rule_version_published_current, visa_requirement_service, django_assert_num_queries
+    ):
+        visa_requirement_service.create_visa_requirement(
+            rule_version_id=str(rule_version_published_current.id),
+            requirement_code="MIN_AGE",
+            description="Applicant must be at least 18",
+            condition_expression={">=": [{"var": "age"}, 18]},
+            is_active=True,
+        )
+        visa_type_id = str(rule_version_published_current.visa_type_id)
+
+        first = RuleEngineService.load_active_snapshot(visa_type_id)
+        assert first.rule_version.id == rule_version_published_current.id
+        assert [r.requirement_code for r in first.requirements] == ["MIN_AGE"]
+
+        with django_assert_num_queries(0):
+            second = RuleEngineService.load_active_snapshot(visa_type_id)
+        assert second is first
+
+    def test_requirement_write_invalidates_snapshot(self, rule_version_published_current, visa_requirement_service):
+        visa_type_id = str(rule_version_published_current.visa_type_id)
+        assert RuleEngineService.load_active_snapshot(visa_type_id).requirements == ()
+
+        visa_requirement_service.create_visa_requirement(
+            rule_version_id=str(rule_version_published_current.id),
+            requirement_code="MIN_AGE",
+            description="Applicant must be at least 18",
+            condition_expression={">=": [{"var": "age"}, 18]},
+            is_active=True,
+        )
+        assert len(RuleEngineService.load_active_snapshot(visa_type_id).requirements) == 1
+
+    def test_namespace_bump_from_another_worker_invalidates_snapshot(self, rule_version_published_current):
+        from main_system.utils.cache_utils import bump_namespace
+        from rules_knowledge.helpers.active_rule_version_cache import NAMESPACE
+
+        visa_type_id = str(rule_version_published_current.visa_type_id)
+        first = RuleEngineService.load_active_snapshot(visa_type_id)
+        bump_namespace(NAMESPACE)
+        assert RuleEngineService.load_active_snapshot(visa_type_id) is not first
+
+    def test_scheduled_version_becomes_active_within_bucket(self, rule_version_published_current):
+        from datetime import timedelta
+
+        from rules_knowledge.models.visa_rule_version import VisaRuleVersion
+
+        visa_type_id = str(rule_version_published_current.visa_type_id)
+        now = timezone.now()
+        # Simulate a version published earlier that takes effect in a few seconds
+        upcoming = VisaRuleVersion.objects.create(
+            visa_type_id=visa_type_id,
+            effective_from=now + timedelta(seconds=5),
+            is_published=True,
+        )
+
+        assert RuleEngineService.load_active_rule_version(visa_type_id, now).id == rule_version_published_current.id
+        later = RuleEngineService.load_active_rule_version(visa_type_id, now + timedelta(seconds=10))
+        assert later.id == upcoming.id
+
+
+@pytest.mark.django_db
+class TestBulkEvaluation:
+    def test_evaluate_cases_for_rule_version(self, visa_requirement, rule_version_unpublished):
+        results = RuleEngineService.evaluate_cases_for_rule_version(
+            rule_version_unpublished,
+            {
+                "case-pass": {"age": 30},
+                "case-fail": {"age": 16},
+                "case-missing": {"salary": 40000},
+                "case-empty": {},
+            },
+        )
+        assert set(results) == {"case-pass", "case-fail", "case-missing", "case-empty"}
+        assert results["case-pass"].requirements_passed == 1
+        assert results["case-pass"].outcome == "likely"
+        assert results["case-fail"].requirements_failed == 1
+        assert results["case-missing"].missing_facts == ["age"]
+        assert "Case has no facts" in results["case-empty"].warnings
+        assert all(r.rule_version_id == rule_version_unpublished.id for r in results.values())
+
+    def test_evaluate_cases_for_rule_version_no_requirements(self, rule_version_unpublished):
+        results = RuleEngineService.evaluate_cases_for_rule_version(rule_version_unpublished, {"c1": {"age": 30}})
+        assert results["c1"].outcome == "unlikely"
+        assert "Rule version has no requirements" in results["c1"].warnings
+
+
+@pytest.mark.django_db
+class TestIncrementalEvaluation:
+    def test_reevaluate_only_requirements_referencing_changed_facts(
+        self, visa_requirement, visa_requirement_service, rule_version_unpublished
+    ):
+        salary = visa_requirement_service.create_requirement(
+            str(rule_version_unpublished.id), "MIN_SALARY", "eligibility", "Salary",
+            {">=": [{"var": "salary"}, 30000]}
+        )
+        previous = RuleEngineService.evaluate_all_requirements(rule_version_unpublished, {"age": 30, "salary": 100})
+        assert [r["passed"] for r in previous] == [True, False]
+        # Marker proving the age result is reused rather than recomputed
+        previous[0]["evaluation_details"]["reused"] = True
+
+        results, reevaluated = RuleEngineService.reevaluate_requirements(
+            rule_version_unpublished, {"age": 30, "salary": 50000}, previous, ["salary"]
+        )
+        assert reevaluated == 1
+        assert [r["requirement_id"] for r in results] == [str(visa_requirement.id), str(salary.id)]
+        assert results[0]["evaluation_details"]["reused"] is True
+        assert results[1]["passed"] is True
+        assert RuleEngineService.aggregate_results(results, rule_version_unpublished).outcome == "likely"
+
+    def test_reevaluate_requirements_without_previous_result(self, visa_requirement, rule_version_unpublished):
+        results, reevaluated = RuleEngineService.reevaluate_requirements(
+            rule_version_unpublished, {"age": 12}, [], ["unrelated"]
+        )
+        assert reevaluated == 1
+        assert results[0]["passed"] is False
+
+
+@pytest.mark.django_db
+class TestThreeValuedEvaluation:
+    @pytest.mark.parametrize(
+        "expr,facts,expected",
+        [
+            ({"or": [{"var": "a"}, {">": [{"var": "b"}, 1]}]}, {"b": 5}, (True, True, ())),
+            ({"and": [{"var": "a"}, {">": [{"var": "b"}, 1]}]}, {"b": 0}, (True, False, ())),
+            ({"and": [{"var": "a"}, {">": [{"var": "b"}, 1]}]}, {"b": 5}, (False, None, ("a",))),
+            ({"or": [{"var": "a"}, {"var": "b"}]}, {"b": False}, (False, None, ("a",))),
+            ({"if": [{"var": "a"}, {"var": "b"}, True]}, {"a": False}, (True, True, ())),
+            ({"!": [{"==": [{"var": "a"}, 1]}]}, {}, (False, None, ("a",))),
+            ({"var": ["a", 3]}, {}, (True, 3, ())),
+        ],
+    )
+    def test_evaluate_partial(self, expr, facts, expected):
+        from main_system.utils import json_logic
+
+        assert tuple(json_logic.evaluate_partial(expr, facts)) == expected
+
+    def test_evaluate_partial_matches_interpreter_with_complete_data(self):
+        from main_system.utils import json_logic
+
+        expr = {"and": [{">=": [{"+": [{"var": "a"}, 1.5]}, 3]}, {"in": [{"var": "c"}, ["UK", "US"]]}]}
+        facts = {"a": 2, "c": "UK"}
+        assert json_logic.evaluate_partial(expr, facts).value == json_logic.jsonLogic(expr, facts)
+
+    @pytest.mark.parametrize(
+        "expr",
+        [
+            {"and": [{">=": [{"var": "a"}]}, False]},
+            {"or": [{"!": [{"in": [{"var": "a"}]}]}, True]},
+            {"and": [{"==": [{"var": "a"}, {"unknown_op": [1]}]}, False]},
+            {"and": [{"some": [{"var": "a"}]}, False]},
+            {"and": [{"missing_some": [{"var": "a"}, ["b"]]}, False]},
+        ],
+    )
+    def test_skipped_malformed_operand_is_undetermined(self, expr):
+        from main_system.utils import json_logic
+
+        # The interpreter evaluates the unknown operand first and raises on it
+        with pytest.raises(Exception):
+            json_logic.jsonLogic(expr, {})
+        assert tuple(json_logic.evaluate_partial(expr, {})) == (False, None, ("a",))
+
+    def test_negation_without_operand_raises_like_interpreter(self):
+        from main_system.utils import json_logic
+
+        for expr in ({"!!": []}, {"or": [{"var": "a"}, {"!": []}]}):
+            with pytest.raises(IndexError):
+                json_logic.jsonLogic(expr, {"a": False})
+            with pytest.raises(IndexError):
+                json_logic.evaluate_partial(expr, {"a": False})
+
+    def test_unevaluated_malformed_operand_does_not_block_short_circuit(self):
+        from main_system.utils import json_logic
+
+        # The malformed `>=` sits behind a short-circuit in both evaluators
+        expr = {"and": [{">=": [{"var": "a"}, 1]}, {"and": [False, {">=": [1]}]}]}
+        assert json_logic.jsonLogic(expr, {}) is False
+        assert tuple(json_logic.evaluate_partial(expr, {})) == (True, False, ())
+
+    def test_evaluate_requirement_short_circuits_missing_facts(self, visa_requirement):
+        visa_requirement.condition_expression = {
+            "or": [{">=": [{"var": "age"}, 18]}, {"==": [{"var": "has_guardian"}, True]}]
+        }
+        visa_requirement.expression_hash = ""
+
+        two_valued = RuleEngineService.evaluate_requirement(
+            visa_requirement, {"age": 30}, three_valued=False
+        )
+        assert two_valued["missing_facts"] == ["has_guardian"]
+
+        three_valued = RuleEngineService.evaluate_requirement(visa_requirement, {"age": 30}, three_valued=True)
+        assert three_valued["passed"] is True
+        assert three_valued["missing_facts"] == []
+        assert three_valued["evaluation_details"]["undetermined_facts"] == ["has_guardian"]
+
+        undetermined = RuleEngineService.evaluate_requirement(visa_requirement, {"age": 12}, three_valued=True)
+        assert undetermined["passed"] is False
+        assert undetermined["missing_facts"] == ["has_guardian"]
+
+    def test_evaluate_expression_reports_only_deciding_facts(self, settings):
+        settings.RULE_ENGINE_THREE_VALUED = True
+        expr = {"and": [{"var": "a"}, {"or": [{"var": "b"}, {"var": "c"}]}]}
+        result = RuleEngineService.evaluate_expression(expr, {"a": True, "b": True})
+        assert result["passed"] is True
+
+        result = RuleEngineService.evaluate_expression(expr, {"a": True, "b": False})
+        assert result["missing_facts"] == ["c"]
@@ -76,3 +76,33 @@ class TestVisaRequirementService:
         ok2 = visa_requirement_service.delete_requirement(str(visa_requirement.id))
         assert ok2 is False
 
+    def test_create_and_update_maintain_expression_index(self, visa_requirement_service, rule_version_unpublished):
+        from rules_knowledge.helpers.expression_index import ExpressionIndex
+
+        expression = {"and": [{">=": [{"var": "salary"}, 30000]}, {"==": [{"var": "country"}, "UK"]}]}
+        req = visa_requirement_service.create_requirement(
+            str(rule_version_unpublished.id), "SALARY_UK", "eligibility", "Salary and country", expression
+        )
+        assert req.referenced_variables == ["salary", "country"]
+        assert req.expression_hash == ExpressionIndex.expression_hash(expression)
+
+        updated = visa_requirement_service.update_requirement(
+            str(req.id), condition_expression={">=": [{"var": "age"}, 21]}
+        )
+        assert updated.referenced_variables == ["age"]
+        assert updated.expression_hash != ExpressionIndex.expression_hash(expression)
+
+    def test_fact_key_index(self, visa_requirement_service, visa_requirement, rule_version_unpublished):
+        from rules_knowledge.selectors.visa_requirement_selector import VisaRequirementSelector
+
+        other = visa_requirement_service.create_requirement(
+            str(rule_version_unpublished.id), "MIN_SALARY", "eligibility", "Salary",
+            {">=": [{"var": "salary"}, 30000]}
+        )
+        # Rows not indexed yet (e.g. before the backfill) are extracted on the fly
+        type(visa_requirement).objects.filter(id=visa_requirement.id).update(expression_hash="")
+        index = VisaRequirementSelector.get_fact_key_index(rule_version_unpublished)
+        assert index == {"age": [str(visa_requirement.id)], "salary": [str(other.id)]}
+
+        matched = VisaRequirementSelector.get_by_fact_keys(rule_version_unpublished, ["salary", "unrelated"])
+        assert [r.id for r in matched] == [other.id]